@@ -0,0 +1,75 @@
+"""Benchmark of batch marshaling and parsing across numbers of workers.
+
+Run it from the root of the repository::
+
+    $ python -m benchmarks.batches
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from benchmarks.entities import create_item
+
+
+def _measure(function, executor_class, workers):
+    """Measure time of the function with an executor.
+
+    :param function: function that accepts an executor.
+    :param executor_class: class of the executor or None to run without executor.
+    :param workers: number of workers in the executor.
+    :returns: time in seconds.
+    """
+    if executor_class is None:
+        start = time.perf_counter()
+        function(None)
+        return time.perf_counter() - start
+
+    with executor_class(max_workers=workers) as executor:
+        # warm up workers, so that their start is not measured.
+        function(executor)
+        start = time.perf_counter()
+        function(executor)
+        return time.perf_counter() - start
+
+
+def main(number_of_entities=5000, chunk_size=250):
+    """Print time to marshal and parse entities with different executors.
+
+    :param number_of_entities: number of entities in the batch.
+    :param chunk_size: number of entities in a chunk.
+    """
+    marshaler = JSONMarshaler()
+    parser = JSONParser()
+    entities = [create_item(index) for index in range(number_of_entities)]
+    datas = marshaler.marshal_many(entities)
+
+    operations = {
+        "marshal_many": lambda executor: marshaler.marshal_many(
+            entities,
+            executor=executor,
+            chunk_size=chunk_size,
+            ),
+        "parse_many": lambda executor: parser.parse_many(
+            datas,
+            executor=executor,
+            chunk_size=chunk_size,
+            ),
+        }
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for operation_name, operation in operations.items():
+        print("{0} of {1} entities".format(operation_name, number_of_entities))
+        duration = _measure(operation, None, None)
+        print("    {0:<30} {1:8.2f} ms".format("sequential", duration * 1000))
+        for executor_class in (ThreadPoolExecutor, ProcessPoolExecutor):
+            for workers in worker_counts:
+                duration = _measure(operation, executor_class, workers)
+                name = "{0} x{1}".format(executor_class.__name__, workers)
+                print("    {0:<30} {1:8.2f} ms".format(name, duration * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark of CBOR transports against JSON on size and speed.
+
+Run it from the root of the repository::
+
+    $ python -m benchmarks.cbor
+"""
+
+import timeit
+
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.codec import StandardCodec, create_default_codec
+from lila.serialization.cbor.marshaler import CBORMarshaler
+from lila.serialization.cbor.parser import CBORParser
+from lila.serialization.cbor.dictionary import DictionaryMarshaler, DictionaryParser
+from benchmarks.entities import create_wide_entity, create_deep_entity
+
+
+ENTITIES = {
+    "wide (1000 items)": create_wide_entity(1000),
+    "deep (100 levels)": create_deep_entity(100),
+    }
+
+
+def main(number=10):
+    """Print size of encoded sample entities and time to marshal and parse them.
+
+    :param number: number of executions for each measurement.
+    """
+    # pylint: disable=cell-var-from-loop
+    transports = [
+        ("json", JSONMarshaler(codec=StandardCodec()), JSONParser(codec=StandardCodec())),
+        ("cbor", CBORMarshaler(), CBORParser()),
+        ("dictionary", DictionaryMarshaler(), DictionaryParser()),
+        ]
+    default_codec = create_default_codec()
+    if default_codec.name != StandardCodec.name:
+        transports.insert(1, (
+            default_codec.name,
+            JSONMarshaler(codec=default_codec),
+            JSONParser(codec=default_codec),
+            ))
+
+    for entity_name, entity in ENTITIES.items():
+        print("Entity: {0}".format(entity_name))
+        for transport_name, marshaler, parser in transports:
+            if isinstance(marshaler, JSONMarshaler):
+                marshal, parse = marshaler.marshal_entity_bytes, parser.parse_entity_bytes
+            else:
+                marshal, parse = marshaler.marshal_entity, parser.parse_entity
+
+            encoded_entity = marshal(entity)
+            print("    {0:<20} {1:8d} bytes".format(transport_name + " size", len(encoded_entity)))
+
+            measurements = (
+                ("marshal", lambda: marshal(entity)),
+                ("parse", lambda: parse(encoded_entity)),
+                )
+            for measurement_name, function in measurements:
+                duration = min(timeit.repeat(function, number=number, repeat=3))
+                print("    {0:<20} {1:8.2f} ms".format(
+                    "{0} {1}".format(transport_name, measurement_name),
+                    duration / number * 1000,
+                    ))
+
+
+if __name__ == "__main__":
+    main()
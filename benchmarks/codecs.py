@@ -0,0 +1,57 @@
+"""Benchmark of JSON codecs on the bytes-to-entity-to-bytes path.
+
+Run it from the root of the repository::
+
+    $ python -m benchmarks.codecs
+"""
+
+import timeit
+
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.fused import FusedJSONParser
+from lila.serialization.json.codec import CODEC_CLASSES
+from benchmarks.entities import create_wide_entity, create_deep_entity
+
+
+ENTITIES = {
+    "wide (1000 items)": create_wide_entity(1000),
+    "deep (100 levels)": create_deep_entity(100),
+    }
+
+
+def main(number=10):
+    """Print time to parse and marshal sample entities with each installed codec.
+
+    :param number: number of executions for each measurement.
+    """
+    # pylint: disable=cell-var-from-loop
+    codecs = [codec_class() for codec_class in CODEC_CLASSES if codec_class.is_available()]
+    for entity_name, entity in ENTITIES.items():
+        print("Entity: {0}".format(entity_name))
+        for codec in codecs:
+            marshaler = JSONMarshaler(codec=codec)
+            parser = JSONParser(codec=codec)
+            fused_parser = FusedJSONParser(codec=codec)
+            encoded_entity = marshaler.marshal_entity_bytes(entity)
+
+            measurements = (
+                ("encode", lambda: codec.encode(marshaler.marshal_entity(entity))),
+                ("decode", lambda: codec.decode(encoded_entity)),
+                ("roundtrip", lambda: marshaler.marshal_entity_bytes(
+                    parser.parse_entity_bytes(encoded_entity),
+                    )),
+                ("fused roundtrip", lambda: marshaler.marshal_entity_bytes(
+                    fused_parser.parse_entity_bytes(encoded_entity),
+                    )),
+                )
+            for measurement_name, function in measurements:
+                duration = min(timeit.repeat(function, number=number, repeat=3))
+                print("    {0:<20} {1:8.2f} ms".format(
+                    "{0} {1}".format(codec.name, measurement_name),
+                    duration / number * 1000,
+                    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Module with sample Siren entities for benchmarks."""
+
+from lila.core.field import Field, InputType
+from lila.core.action import Action, Method
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+
+
+def create_item(index):
+    """Create an embedded representation of a collection item.
+
+    :param index: index of the item.
+    :returns: :class:`EmbeddedRepresentation <lila.core.entity.EmbeddedRepresentation>`.
+    """
+    return EmbeddedRepresentation(
+        relations=["item"],
+        classes=["order"],
+        properties={"orderNumber": index, "itemCount": 3, "status": "pending"},
+        entities=[
+            EmbeddedLink(
+                relations=["http://x.io/rels/customer"],
+                classes=["info", "customer"],
+                target="http://api.x.io/customers/{0}".format(index),
+                ),
+            ],
+        links=[
+            Link(relations=["self"], target="http://api.x.io/orders/{0}".format(index)),
+            ],
+        actions=[
+            Action(
+                name="add-item",
+                title="Add Item",
+                method=Method.POST,
+                target="http://api.x.io/orders/{0}/items".format(index),
+                fields=[
+                    Field(name="orderNumber", input_type=InputType.HIDDEN, value=index),
+                    Field(name="productCode", input_type=InputType.TEXT),
+                    Field(name="quantity", input_type=InputType.NUMBER),
+                    ],
+                ),
+            ],
+        )
+
+
+def create_wide_entity(width):
+    """Create a collection entity with many items.
+
+    :param width: number of items in the collection.
+    :returns: :class:`Entity <lila.core.entity.Entity>`.
+    """
+    return Entity(
+        classes=["orders", "collection"],
+        properties={"count": width},
+        entities=[create_item(index) for index in range(width)],
+        links=[Link(relations=["self"], target="http://api.x.io/orders")],
+        )
+
+
+def create_deep_entity(depth):
+    """Create an entity with nested embedded representations.
+
+    :param depth: number of nested levels.
+    :returns: :class:`Entity <lila.core.entity.Entity>`.
+    """
+    entities = []
+    for level in range(depth):
+        entities = [
+            EmbeddedRepresentation(
+                relations=["child"],
+                properties={"level": level},
+                entities=entities,
+                links=[Link(relations=["self"], target="http://api.x.io/levels/{0}".format(level))],
+                ),
+            create_item(level),
+            ]
+
+    return Entity(classes=["tree"], entities=entities)
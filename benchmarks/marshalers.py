@@ -0,0 +1,55 @@
+"""Benchmark of marshalers on wide and deep entities.
+
+Run it from the root of the repository::
+
+    $ python -m benchmarks.marshalers
+"""
+
+import json
+import timeit
+
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.compiled import CompiledJSONMarshaler
+from lila.serialization.json.stream import JSONStreamMarshaler
+from benchmarks.entities import create_wide_entity, create_deep_entity
+
+
+ENTITIES = {
+    "wide (1000 items)": create_wide_entity(1000),
+    "deep (100 levels)": create_deep_entity(100),
+    }
+
+
+def _create_marshal_functions():
+    """Create functions to benchmark.
+
+    :returns: dictionary with names and functions that marshal an entity into bytes.
+    """
+    json_marshaler = JSONMarshaler()
+    compiled_marshaler = CompiledJSONMarshaler()
+    stream_marshaler = JSONStreamMarshaler()
+
+    return {
+        "JSONMarshaler": lambda entity: json.dumps(json_marshaler.marshal_entity(entity)),
+        "CompiledJSONMarshaler": lambda entity: json.dumps(
+            compiled_marshaler.marshal_entity(entity),
+            ),
+        "JSONStreamMarshaler": stream_marshaler.marshal_entity,
+        }
+
+
+def main(number=10):
+    """Print time to marshal sample entities with each marshaler.
+
+    :param number: number of executions for each measurement.
+    """
+    functions = _create_marshal_functions()
+    for entity_name, entity in ENTITIES.items():
+        print("Entity: {0}".format(entity_name))
+        for function_name, function in functions.items():
+            duration = min(timeit.repeat(lambda: function(entity), number=number, repeat=3))
+            print("    {0:<30} {1:8.2f} ms".format(function_name, duration / number * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 
 import json
 
+from lila.core.raw import RawJSON
+
 
 def adjust_classes(classes):
     """Adjust classes to Siren protocol.
@@ -34,6 +36,7 @@ def adjust_properties(properties):
 
     :param properties: dictionary or iterable with dictionary items.
     :returns: dictionary with strings as values (property names) and json serializable values.
+        Values of type :class:`RawJSON <lila.core.raw.RawJSON>` are kept as is.
     :raises: :class:ValueError.
     """
     try:
@@ -44,6 +47,10 @@ def adjust_properties(properties):
     adjusted_properties = {}
     for name, value in properties_dictionary.items():
         adjusted_name = str(name)
+        if isinstance(value, RawJSON):
+            adjusted_properties[adjusted_name] = value
+            continue
+
         # ensure that value is a valid JSON object by dumping and loading it.
         try:
             adjusted_value = json.loads(json.dumps(value))
@@ -86,3 +86,33 @@ class EmbeddedRepresentation(Entity):
     def relations(self):
         """Relationship between the representation and parent entity."""
         return tuple(self._relations)
+
+
+class StreamingEntity(Entity):
+    """Class to work with Siren entities, which sub-entities are produced lazily.
+
+    Sub-entities are taken from an iterable, e.g. a database cursor, and validated one by one
+    while they are iterated over, so the collection is never kept in memory as a whole.
+    :class:`JSONStreamMarshaler <lila.serialization.json.stream.JSONStreamMarshaler>` encodes
+    such an entity with bounded memory. If an iterator is passed, the entity can be marshaled
+    only once.
+    """
+
+    def __init__(self, entities, title=None, classes=(), properties=(), links=(), actions=()):
+        # pylint: disable=too-many-arguments
+        super(StreamingEntity, self).__init__(
+            title=title,
+            classes=classes,
+            properties=properties,
+            links=links,
+            actions=actions,
+            )
+        self._entities = entities
+
+    @property
+    def entities(self):
+        """Iterator over subentities of the entity."""
+        for entity in self._entities:
+            if not isinstance(entity, (EmbeddedLink, EmbeddedRepresentation)):
+                raise ValueError("Some of the entities are of incompatible type")
+            yield entity
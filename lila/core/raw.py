@@ -0,0 +1,62 @@
+"""Module to work with pre-encoded JSON values."""
+
+import json
+
+
+class RawJSON:
+    """Class for a pre-encoded JSON value of a property.
+
+    The document is embedded verbatim into output of :class:`JSONStreamMarshaler
+    <lila.serialization.json.stream.JSONStreamMarshaler>`, other marshalers decode it.
+    """
+
+    def __init__(self, document, validate=False):
+        if isinstance(document, (bytes, bytearray)):
+            try:
+                document = bytes(document).decode("utf-8")
+            except UnicodeDecodeError as error:
+                raise ValueError("Raw JSON document must be encoded in UTF-8") from error
+        else:
+            document = str(document)
+
+        self._document = document
+
+        if validate:
+            self.load()
+
+    @property
+    def document(self):
+        """String with JSON document."""
+        return self._document
+
+    def load(self):
+        """Decode JSON document.
+
+        :returns: decoded value.
+        :raises: :class:ValueError if the document is not a valid JSON.
+        """
+        try:
+            return json.loads(self._document)
+        except ValueError as error:
+            raise ValueError("Invalid raw JSON document") from error
+
+    def __deepcopy__(self, memo):
+        # Raw values can't be changed, so they are not copied.
+        return self
+
+
+def load_raw_json(value):
+    """Decode a raw JSON value for the default hook of :func:`json.dumps`.
+
+    :param value: value that json can't serialize.
+    :returns: decoded value of :class:`RawJSON`.
+    :raises: :class:TypeError if the value is not a valid raw JSON.
+    """
+    if not isinstance(value, RawJSON):
+        type_name = type(value).__name__
+        raise TypeError("Object of type '{0}' is not JSON serializable".format(type_name))
+
+    try:
+        return value.load()
+    except ValueError as error:
+        raise TypeError("Invalid raw JSON document") from error
@@ -0,0 +1,187 @@
+"""Module with cache for marshaled fragments of Siren objects."""
+
+import threading
+from collections import OrderedDict
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class FragmentCache:
+    """Class for size-bounded LRU cache of marshaled immutable Siren components.
+
+    Only instances of the core classes :class:`Link <lila.core.link.Link>`,
+    :class:`EmbeddedLink <lila.core.link.EmbeddedLink>` and :class:`Action
+    <lila.core.action.Action>` (with core fields) are cached, since they can't be changed after
+    creation. Components are identified either by identity or by a fingerprint of their values,
+    so that equal components created for each request could share the same fragment.
+
+    The cache can be shared between threads.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, fingerprint=False):
+        max_size = int(max_size)
+        if max_size <= 0:
+            raise ValueError("Size of the cache must be positive")
+
+        self._max_size = max_size
+        self._fingerprint = bool(fingerprint)
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self):
+        """Maximum number of cached fragments."""
+        return self._max_size
+
+    @property
+    def size(self):
+        """Number of cached fragments."""
+        return len(self._fragments)
+
+    @property
+    def hits(self):
+        """Number of successful lookups."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of lookups of fragments that were not cached."""
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """Ratio of successful lookups to all lookups of cacheable components."""
+        lookups = self._hits + self._misses
+        if not lookups:
+            return 0.0
+
+        return self._hits / lookups
+
+    def lookup(self, namespace, component):
+        """Find a fragment for the component.
+
+        :param namespace: hashable object to distinguish fragments of different marshalers.
+        :param component: Siren component.
+        :returns: cached fragment or None if the fragment is not cached or component can't be
+            cached.
+        """
+        key = self._create_key(namespace, component)
+        if key is None:
+            return None
+
+        with self._lock:
+            try:
+                fragment = self._fragments[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            self._fragments.move_to_end(key)
+            self._hits += 1
+
+        return fragment[1]
+
+    def store(self, namespace, component, fragment):
+        """Store a fragment for the component.
+
+        :param namespace: hashable object to distinguish fragments of different marshalers.
+        :param component: Siren component.
+        :param fragment: marshaled component. It must not be changed after it's stored.
+        """
+        key = self._create_key(namespace, component)
+        if key is None:
+            return
+
+        with self._lock:
+            fragments = self._fragments
+            # component is kept in the cache, so that its id can't be reused by another object.
+            fragments[key] = (component, fragment)
+            fragments.move_to_end(key)
+            while len(fragments) > self._max_size:
+                fragments.popitem(last=False)
+
+    def clear(self):
+        """Remove all fragments and reset statistics."""
+        with self._lock:
+            self._fragments.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __getstate__(self):
+        # Cached fragments and the lock are not transferred to other processes.
+        return {"max_size": self._max_size, "fingerprint": self._fingerprint}
+
+    def __setstate__(self, state):
+        self.__init__(max_size=state["max_size"], fingerprint=state["fingerprint"])
+
+    def _create_key(self, namespace, component):
+        """Create a key for the component.
+
+        :param namespace: hashable object to distinguish fragments of different marshalers.
+        :param component: Siren component.
+        :returns: hashable key or None if the component can't be cached.
+        """
+        if not is_immutable(component):
+            return None
+
+        if self._fingerprint:
+            return (namespace, create_fingerprint(component))
+
+        return (namespace, id(component))
+
+
+def is_immutable(component):
+    """Check if the component can't be changed after creation.
+
+    :param component: Siren component.
+    :returns: True if the component is an instance of the immutable core class.
+    """
+    component_class = type(component)
+    if component_class is Link or component_class is EmbeddedLink:
+        return True
+
+    if component_class is Action:
+        # pylint: disable=unidiomatic-typecheck
+        return all(type(field) is Field for field in component.fields)
+
+    return False
+
+
+def create_fingerprint(component):
+    """Create a fingerprint of the immutable component.
+
+    :param component: link, embedded link or action.
+    :returns: hashable tuple with values of the component.
+    """
+    # pylint: disable=protected-access
+    if type(component) is Action:   # pylint: disable=unidiomatic-typecheck
+        fields = tuple(
+            (field._name, field._classes, field._input_type, field._value, field._title)
+            for field in component._fields
+            )
+        return (
+            Action,
+            component._name,
+            component._classes,
+            component._method,
+            component._target,
+            component._title,
+            component._media_type,
+            fields,
+            )
+
+    return (
+        type(component),
+        component._relations,
+        component._classes,
+        component._target,
+        component._title,
+        component._target_media_type,
+        )
@@ -0,0 +1 @@
+"""Package to work with Siren protocol over CBOR."""
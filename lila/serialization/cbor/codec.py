@@ -0,0 +1,389 @@
+"""Module with pure Python codec of `CBOR <https://tools.ietf.org/html/rfc8949>`_.
+
+Only data that can be represented in JSON and byte strings are supported. Integers out of 64-bit
+range are encoded as bignums, floats are always encoded with double precision. The decoder
+accepts items of indefinite length, half and single precision floats and ignores unknown tags
+unless they are requested to be kept as :class:`Tag` instances.
+"""
+
+import math
+import struct
+from collections import namedtuple
+
+
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_FLOAT32 = struct.Struct(">f")
+_FLOAT64 = struct.Struct(">d")
+
+_MAJOR_UNSIGNED = 0
+_MAJOR_NEGATIVE = 1
+_MAJOR_BYTES = 2
+_MAJOR_TEXT = 3
+_MAJOR_ARRAY = 4
+_MAJOR_MAP = 5
+_MAJOR_TAG = 6
+_MAJOR_SIMPLE = 7
+
+_TAG_POSITIVE_BIGNUM = 2
+_TAG_NEGATIVE_BIGNUM = 3
+
+_FALSE = 0xf4
+_TRUE = 0xf5
+_NULL = 0xf6
+_FLOAT64_HEAD = 0xfb
+_BREAK = 0xff
+
+_INDEFINITE_LENGTH = 31
+
+_MAX_UINT64 = 0xffffffffffffffff
+
+
+Tag = namedtuple("Tag", "tag value")
+Tag.__doc__ = """Tagged data item."""
+
+
+class _Break:
+    """Marker of the end of an item of indefinite length."""
+
+
+_BREAK_MARKER = _Break()
+
+
+def encode(data):
+    """Encode data into CBOR.
+
+    :param data: JSON serializable data or bytes.
+    :returns: bytes with encoded data.
+    :raises: :class:ValueError.
+    """
+    buffer = bytearray()
+    try:
+        _encode_value(data, buffer)
+    except (RecursionError, ValueError) as error:
+        raise ValueError("Failed to encode CBOR data") from error
+
+    return bytes(buffer)
+
+
+def decode(encoded_data, tags=()):
+    """Decode data from CBOR.
+
+    :param encoded_data: bytes with a single encoded item.
+    :param tags: numbers of tags to keep as :class:`Tag` instances.
+    :returns: decoded data.
+    :raises: :class:ValueError.
+    """
+    try:
+        data = bytes(encoded_data)
+        value, position = _decode_value(data, 0, frozenset(tags))
+    except (IndexError, TypeError, RecursionError, ValueError, struct.error) as error:
+        raise ValueError("Failed to decode CBOR data") from error
+
+    if value is _BREAK_MARKER or position != len(data):
+        raise ValueError("Failed to decode CBOR data")
+
+    return value
+
+
+def _encode_head(major_type, argument, buffer):
+    """Encode the head of an item.
+
+    :param major_type: major type of the item.
+    :param argument: unsigned integer argument of the head.
+    :param buffer: bytearray to write into.
+    """
+    major_bits = major_type << 5
+    if argument < 24:
+        buffer.append(major_bits | argument)
+    elif argument <= 0xff:
+        buffer.append(major_bits | 24)
+        buffer.append(argument)
+    elif argument <= 0xffff:
+        buffer.append(major_bits | 25)
+        buffer += _UINT16.pack(argument)
+    elif argument <= 0xffffffff:
+        buffer.append(major_bits | 26)
+        buffer += _UINT32.pack(argument)
+    else:
+        buffer.append(major_bits | 27)
+        buffer += _UINT64.pack(argument)
+
+
+def _encode_value(value, buffer):
+    """Encode a value.
+
+    :param value: value to encode.
+    :param buffer: bytearray to write into.
+    :raises: :class:ValueError.
+    """
+    # pylint: disable=too-many-branches
+    if isinstance(value, str):
+        encoded_text = value.encode("utf-8")
+        _encode_head(_MAJOR_TEXT, len(encoded_text), buffer)
+        buffer += encoded_text
+    elif value is None:
+        buffer.append(_NULL)
+    elif value is True:
+        buffer.append(_TRUE)
+    elif value is False:
+        buffer.append(_FALSE)
+    elif isinstance(value, int):
+        _encode_integer(value, buffer)
+    elif isinstance(value, float):
+        buffer.append(_FLOAT64_HEAD)
+        buffer += _FLOAT64.pack(value)
+    elif isinstance(value, dict):
+        _encode_head(_MAJOR_MAP, len(value), buffer)
+        for key, item in value.items():
+            _encode_value(key, buffer)
+            _encode_value(item, buffer)
+    elif isinstance(value, Tag):
+        _encode_head(_MAJOR_TAG, value.tag, buffer)
+        _encode_value(value.value, buffer)
+    elif isinstance(value, (list, tuple)):
+        _encode_head(_MAJOR_ARRAY, len(value), buffer)
+        for item in value:
+            _encode_value(item, buffer)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value)
+        _encode_head(_MAJOR_BYTES, len(value), buffer)
+        buffer += value
+    else:
+        raise ValueError("Object of type '{0}' can't be encoded".format(type(value).__name__))
+
+
+def _encode_integer(value, buffer):
+    """Encode an integer.
+
+    :param value: integer to encode.
+    :param buffer: bytearray to write into.
+    """
+    major_type, tag = _MAJOR_UNSIGNED, _TAG_POSITIVE_BIGNUM
+    if value < 0:
+        major_type, tag = _MAJOR_NEGATIVE, _TAG_NEGATIVE_BIGNUM
+        value = -1 - value
+
+    if value <= _MAX_UINT64:
+        _encode_head(major_type, value, buffer)
+        return
+
+    _encode_head(_MAJOR_TAG, tag, buffer)
+    _encode_value(value.to_bytes((value.bit_length() + 7) // 8, "big"), buffer)
+
+
+def _decode_argument(data, position, additional_information):
+    """Decode the argument of a head.
+
+    :param data: bytes with encoded data.
+    :param position: position after the initial byte of the head.
+    :param additional_information: lower 5 bits of the initial byte.
+    :returns: tuple with the argument and the position after the head.
+    :raises: :class:ValueError.
+    """
+    if additional_information < 24:
+        return additional_information, position
+
+    if additional_information == 24:
+        return data[position], position + 1
+
+    if additional_information == 25:
+        return _UINT16.unpack_from(data, position)[0], position + 2
+
+    if additional_information == 26:
+        return _UINT32.unpack_from(data, position)[0], position + 4
+
+    if additional_information == 27:
+        return _UINT64.unpack_from(data, position)[0], position + 8
+
+    raise ValueError("Invalid additional information '{0}'".format(additional_information))
+
+
+def _decode_value(data, position, tags):
+    """Decode a single item.
+
+    :param data: bytes with encoded data.
+    :param position: position of the item.
+    :param tags: frozenset with numbers of tags to keep.
+    :returns: tuple with the decoded value and the position after the item.
+    :raises: :class:ValueError.
+    """
+    # pylint: disable=too-many-return-statements,too-many-branches
+    initial_byte = data[position]
+    position += 1
+    major_type = initial_byte >> 5
+    additional_information = initial_byte & 0x1f
+
+    if major_type == _MAJOR_SIMPLE:
+        return _decode_simple(data, position, additional_information)
+
+    if additional_information == _INDEFINITE_LENGTH:
+        return _decode_indefinite(data, position, major_type, tags)
+
+    argument, position = _decode_argument(data, position, additional_information)
+
+    if major_type == _MAJOR_UNSIGNED:
+        return argument, position
+
+    if major_type == _MAJOR_NEGATIVE:
+        return -1 - argument, position
+
+    if major_type == _MAJOR_BYTES:
+        end = position + argument
+        _check_end(data, end)
+        return data[position:end], end
+
+    if major_type == _MAJOR_TEXT:
+        end = position + argument
+        _check_end(data, end)
+        return data[position:end].decode("utf-8"), end
+
+    if major_type == _MAJOR_ARRAY:
+        items = []
+        for _ in range(argument):
+            item, position = _decode_item(data, position, tags)
+            items.append(item)
+        return items, position
+
+    if major_type == _MAJOR_MAP:
+        mapping = {}
+        for _ in range(argument):
+            key, position = _decode_item(data, position, tags)
+            mapping[key], position = _decode_item(data, position, tags)
+        return mapping, position
+
+    # The only remaining major type is a tag.
+    value, position = _decode_item(data, position, tags)
+    if argument in (_TAG_POSITIVE_BIGNUM, _TAG_NEGATIVE_BIGNUM):
+        if not isinstance(value, bytes):
+            raise ValueError("Bignum is not a byte string")
+
+        value = int.from_bytes(value, "big")
+        if argument == _TAG_NEGATIVE_BIGNUM:
+            value = -1 - value
+    elif argument in tags:
+        value = Tag(argument, value)
+
+    return value, position
+
+
+def _decode_item(data, position, tags):
+    """Decode an item, which is not a break marker.
+
+    :param data: bytes with encoded data.
+    :param position: position of the item.
+    :param tags: frozenset with numbers of tags to keep.
+    :returns: tuple with the decoded value and the position after the item.
+    :raises: :class:ValueError.
+    """
+    value, position = _decode_value(data, position, tags)
+    if value is _BREAK_MARKER:
+        raise ValueError("Unexpected break marker")
+
+    return value, position
+
+
+def _decode_simple(data, position, additional_information):
+    """Decode a simple value or a float.
+
+    :param data: bytes with encoded data.
+    :param position: position after the initial byte.
+    :param additional_information: lower 5 bits of the initial byte.
+    :returns: tuple with the decoded value and the position after the item.
+    :raises: :class:ValueError.
+    """
+    # pylint: disable=too-many-return-statements
+    if additional_information == 20:
+        return False, position
+
+    if additional_information == 21:
+        return True, position
+
+    if additional_information in (22, 23):
+        # Both null and undefined are decoded as None.
+        return None, position
+
+    if additional_information == 25:
+        return _decode_half_float(_UINT16.unpack_from(data, position)[0]), position + 2
+
+    if additional_information == 26:
+        return _FLOAT32.unpack_from(data, position)[0], position + 4
+
+    if additional_information == 27:
+        return _FLOAT64.unpack_from(data, position)[0], position + 8
+
+    if additional_information == _INDEFINITE_LENGTH:
+        return _BREAK_MARKER, position
+
+    raise ValueError("Unsupported simple value '{0}'".format(additional_information))
+
+
+def _decode_half_float(half):
+    """Decode a half precision float as described in the appendix D of RFC 8949.
+
+    The format character of :mod:`struct` for half precision floats is not available in
+    Python 3.5.
+
+    :param half: integer with the bits of the float.
+    :returns: decoded float.
+    """
+    exponent = (half >> 10) & 0x1f
+    mantissa = half & 0x3ff
+    if exponent == 0:
+        value = math.ldexp(mantissa, -24)
+    elif exponent != 31:
+        value = math.ldexp(mantissa + 1024, exponent - 25)
+    elif mantissa == 0:
+        value = math.inf
+    else:
+        value = math.nan
+
+    return -value if half & 0x8000 else value
+
+
+def _decode_indefinite(data, position, major_type, tags):
+    """Decode an item of indefinite length.
+
+    :param data: bytes with encoded data.
+    :param position: position after the initial byte.
+    :param major_type: major type of the item.
+    :param tags: frozenset with numbers of tags to keep.
+    :returns: tuple with the decoded value and the position after the break marker.
+    :raises: :class:ValueError.
+    """
+    if major_type in (_MAJOR_BYTES, _MAJOR_TEXT):
+        chunks = []
+        while data[position] != _BREAK:
+            if data[position] >> 5 != major_type:
+                raise ValueError("Chunk of a string is of incompatible type")
+            chunk, position = _decode_item(data, position, tags)
+            chunks.append(chunk)
+        return (b"" if major_type == _MAJOR_BYTES else "").join(chunks), position + 1
+
+    if major_type == _MAJOR_ARRAY:
+        items = []
+        while data[position] != _BREAK:
+            item, position = _decode_item(data, position, tags)
+            items.append(item)
+        return items, position + 1
+
+    if major_type == _MAJOR_MAP:
+        mapping = {}
+        while data[position] != _BREAK:
+            key, position = _decode_item(data, position, tags)
+            mapping[key], position = _decode_item(data, position, tags)
+        return mapping, position + 1
+
+    raise ValueError("Major type '{0}' can't have indefinite length".format(major_type))
+
+
+def _check_end(data, end):
+    """Check that data are not truncated.
+
+    :param data: bytes with encoded data.
+    :param end: position of the end of an item.
+    :raises: :class:ValueError.
+    """
+    if end > len(data):
+        raise ValueError("Data are truncated")
@@ -0,0 +1,557 @@
+"""Module with dictionary-coded binary format of Siren objects.
+
+A document is a CBOR array of 4 items: the version of the format, the table of distinct strings,
+the table of distinct components and the encoded object itself. Each string is written into the
+table once and is referenced by its index: keys of maps are plain indices, string values are
+indices tagged with :data:`STRING_TAG`. Links, embedded links, actions and fields are written
+into the table of components once and are referenced by indices tagged with
+:data:`COMPONENT_TAG`. Components are referenced only in links, actions, fields and sub-entities,
+an action can reference only the fields that precede it in the table.
+"""
+
+import copy
+
+from lila.serialization.marshaler import Marshaler
+from lila.serialization.parser import Parser
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.cbor import codec
+from lila.serialization import tracing
+
+
+FORMAT_VERSION = 1
+
+STRING_TAG = 6
+COMPONENT_TAG = 7
+
+DEFAULT_MAX_EXPANDED_SIZE = 64 * 1024 * 1024
+
+
+class DictionaryMarshaler(Marshaler):
+    """Class to marshal Siren objects into dictionary-coded binary format.
+
+    Objects are converted into the same data as with :class:`JSONMarshaler
+    <lila.serialization.json.marshaler.JSONMarshaler>`, so they are validated in the same way.
+
+    :param marshaler: optional JSON marshaler to convert Siren objects into data.
+    """
+
+    def __init__(self, marshaler=None):
+        if marshaler is None:
+            marshaler = JSONMarshaler()
+
+        self._marshaler = marshaler
+
+    def marshal_field(self, field):
+        """Marshal Siren field.
+
+        :param field: Siren Field.
+        :returns: bytes with encoded field.
+        """
+        return self._encode("field", self._marshaler.marshal_field(field))
+
+    def marshal_action(self, action):
+        """Marshal Siren action.
+
+        :param action: Siren Action.
+        :returns: bytes with encoded action.
+        """
+        return self._encode("action", self._marshaler.marshal_action(action))
+
+    def marshal_link(self, link):
+        """Marshal Siren link.
+
+        :param link: Siren Link.
+        :returns: bytes with encoded link.
+        """
+        return self._encode("link", self._marshaler.marshal_link(link))
+
+    def marshal_embedded_link(self, embedded_link):
+        """Marshal embedded Siren link.
+
+        :param embedded_link: embedded Siren Link.
+        :returns: bytes with encoded embedded link.
+        """
+        return self._encode(
+            "embedded_link",
+            self._marshaler.marshal_embedded_link(embedded_link),
+            )
+
+    def marshal_embedded_representation(self, embedded_representation):
+        """Marshal Siren embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :returns: bytes with encoded embedded representation.
+        """
+        return self._encode(
+            "embedded_representation",
+            self._marshaler.marshal_embedded_representation(embedded_representation),
+            )
+
+    def marshal_entity(self, entity):
+        """Marshal Siren entity.
+
+        :param entity: Siren entity.
+        :returns: bytes with encoded entity.
+        """
+        return self._encode("entity", self._marshaler.marshal_entity(entity))
+
+    def _encode(self, kind, data):
+        """Encode marshaled data of a component into a document.
+
+        :param kind: kind of the component.
+        :param data: marshaled data.
+        :returns: bytes with the document.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to encode %s data with string table", kind)
+
+        try:
+            encoded_data = _DocumentEncoder().encode(kind, data)
+        except Exception:
+            tracing.error(__name__, "Failed to encode %s data with string table", kind)
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully encoded %s data with string table", kind)
+        return encoded_data
+
+
+class DictionaryParser(Parser):
+    """Class to parse Siren objects from dictionary-coded binary format.
+
+    Decoded data are parsed with :class:`JSONParser
+    <lila.serialization.json.parser.JSONParser>`, so they are validated in the same way. Each
+    distinct string and component of a document is decoded into a single object, which is shared
+    by all references to it, and each distinct component is parsed once.
+
+    References to components are only allowed in links, actions, fields and sub-entities. Since
+    parsers copy properties, the size of a document with all references expanded is limited.
+
+    :param parser: optional JSON parser to create Siren objects from decoded data.
+    :param max_expanded_size: maximum number of values and characters of strings in a document
+        with expanded references.
+    """
+
+    def __init__(self, parser=None, max_expanded_size=DEFAULT_MAX_EXPANDED_SIZE):
+        if parser is None:
+            parser = JSONParser()
+
+        self._parser = parser
+        self._max_expanded_size = max_expanded_size
+
+    def parse_field(self, data):
+        """Parse serialized Siren field.
+
+        :param data: bytes with encoded field.
+        :returns: parsed field.
+        """
+        return self._create_shared_parser().parse_field(self._decode("field", data))
+
+    def parse_action(self, data):
+        """Parse serialized Siren action.
+
+        :param data: bytes with encoded action.
+        :returns: parsed action.
+        """
+        return self._create_shared_parser().parse_action(self._decode("action", data))
+
+    def parse_link(self, data):
+        """Parse serialized Siren link.
+
+        :param data: bytes with encoded link.
+        :returns: parsed link.
+        """
+        return self._create_shared_parser().parse_link(self._decode("link", data))
+
+    def parse_embedded_link(self, data):
+        """Parse serialized Siren embedded link.
+
+        :param data: bytes with encoded embedded link.
+        :returns: parsed embedded link.
+        """
+        return self._create_shared_parser().parse_embedded_link(
+            self._decode("embedded link", data),
+            )
+
+    def parse_embedded_representation(self, data):
+        """Parse serialized Siren embedded representation.
+
+        :param data: bytes with encoded embedded representation.
+        :returns: parsed embedded representation.
+        """
+        return self._create_shared_parser().parse_embedded_representation(
+            self._decode("embedded representation", data, is_entity=True),
+            )
+
+    def parse_entity(self, data):
+        """Parse serialized Siren entity.
+
+        :param data: bytes with encoded entity.
+        :returns: parsed entity.
+        """
+        return self._create_shared_parser().parse_entity(
+            self._decode("entity", data, is_entity=True),
+            )
+
+    def _decode(self, kind, encoded_data, is_entity=False):
+        """Decode data of a component from a document.
+
+        :param kind: human readable kind of the component.
+        :param encoded_data: bytes with the document.
+        :param is_entity: True if the component is an entity or an embedded representation.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to decode %s data with string table", kind)
+
+        try:
+            data = _decode_document(encoded_data, is_entity, self._max_expanded_size)
+        except Exception:
+            tracing.error(__name__, "Failed to decode %s data with string table", kind)
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully decoded %s data with string table", kind)
+        return data
+
+    def _create_shared_parser(self):
+        """Create a copy of the JSON parser that parses each shared component once.
+
+        :returns: JSON parser.
+        """
+        shared_parser = copy.copy(self._parser)
+        parsed_components = {}
+        for method_name in ("parse_field", "parse_action", "parse_link", "parse_embedded_link"):
+            parse = _parse_once(getattr(shared_parser, method_name), parsed_components)
+            setattr(shared_parser, method_name, parse)
+
+        return shared_parser
+
+
+class _DocumentEncoder:
+    """Encoder of a single document, which collects tables of strings and components."""
+
+    def __init__(self):
+        self._strings = []
+        self._string_indices = {}
+        self._components = []
+        self._component_indices = {}
+
+    def encode(self, kind, data):
+        """Encode marshaled data into a document.
+
+        :param kind: kind of the component.
+        :param data: marshaled data.
+        :returns: bytes with the document.
+        :raises: :class:ValueError.
+        """
+        if kind in ("entity", "embedded_representation"):
+            root = self._encode_entity(data)
+        else:
+            root = self._encode_component(kind, data)
+
+        return codec.encode([FORMAT_VERSION, self._strings, self._components, root])
+
+    def _reference_string(self, value):
+        """Get the index of a string in the table.
+
+        :param value: string.
+        :returns: index of the string.
+        :raises: :class:ValueError.
+        """
+        if not isinstance(value, str):
+            raise ValueError("Key of type '{0}' can't be encoded".format(type(value).__name__))
+
+        string_indices = self._string_indices
+        index = string_indices.get(value)
+        if index is None:
+            index = string_indices[value] = len(self._strings)
+            self._strings.append(value)
+
+        return index
+
+    def _encode_value(self, value):
+        """Replace strings of a value with references.
+
+        :param value: JSON serializable value.
+        :returns: value with references to the table of strings.
+        """
+        if isinstance(value, str):
+            return codec.Tag(STRING_TAG, self._reference_string(value))
+
+        if isinstance(value, dict):
+            encode_value = self._encode_value
+            reference_string = self._reference_string
+            return {reference_string(key): encode_value(item) for key, item in value.items()}
+
+        if isinstance(value, (list, tuple)):
+            return [self._encode_value(item) for item in value]
+
+        return value
+
+    def _encode_entity(self, data):
+        """Replace strings and components of entity data with references.
+
+        :param data: marshaled data of an entity or an embedded representation.
+        :returns: encoded data.
+        """
+        encoded_data = {}
+        for key, value in data.items():
+            if key == "entities":
+                value = [
+                    self._encode_component("embedded_link", sub_entity)
+                    if "href" in sub_entity else self._encode_entity(sub_entity)
+                    for sub_entity in value
+                    ]
+            elif key == "links":
+                value = [self._encode_component("link", link) for link in value]
+            elif key == "actions":
+                value = [self._encode_component("action", action) for action in value]
+            else:
+                value = self._encode_value(value)
+
+            encoded_data[self._reference_string(key)] = value
+
+        return encoded_data
+
+    def _encode_component(self, kind, data):
+        """Write a component into the table once and reference it.
+
+        :param kind: kind of the component.
+        :param data: marshaled data of the component.
+        :returns: :class:`Tag <lila.serialization.cbor.codec.Tag>` with the index of the
+            component.
+        """
+        if kind == "action" and "fields" in data:
+            data = dict(data)
+            fields = [self._encode_component("field", field) for field in data.pop("fields")]
+            encoded_data = self._encode_value(data)
+            encoded_data[self._reference_string("fields")] = fields
+        else:
+            encoded_data = self._encode_value(data)
+
+        # Equal components are encoded into equal bytes.
+        key = codec.encode(encoded_data)
+        component_indices = self._component_indices
+        index = component_indices.get(key)
+        if index is None:
+            index = component_indices[key] = len(self._components)
+            self._components.append(encoded_data)
+
+        return codec.Tag(COMPONENT_TAG, index)
+
+
+def _decode_document(encoded_data, is_entity, max_expanded_size):
+    """Decode a document and resolve its references.
+
+    :param encoded_data: bytes with the document.
+    :param is_entity: True if the document contains an entity or an embedded representation.
+    :param max_expanded_size: maximum size of the document with expanded references.
+    :returns: decoded data, which share objects of equal strings and components.
+    :raises: :class:ValueError.
+    """
+    document = codec.decode(encoded_data, tags=(STRING_TAG, COMPONENT_TAG))
+    if not isinstance(document, list) or len(document) != 4:
+        raise ValueError("Document is not an array of 4 items")
+
+    version, strings, components, root = document
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported version of the format: '{0}'".format(version))
+
+    if not isinstance(strings, list) or not all(isinstance(value, str) for value in strings):
+        raise ValueError("Table of strings is invalid")
+
+    if not isinstance(components, list):
+        raise ValueError("Table of components is invalid")
+
+    resolver = _ReferenceResolver(strings, max_expanded_size)
+    try:
+        for component in components:
+            resolver.add_component(component)
+
+        if is_entity:
+            return resolver.resolve_entity(root)
+        return resolver.resolve_slot(root)
+    except (IndexError, TypeError) as error:
+        raise ValueError("Document has invalid references") from error
+    except RecursionError as error:
+        raise ValueError("Document is nested too deeply") from error
+
+
+class _ReferenceResolver:
+    """Resolver of references of a single document.
+
+    References to components are resolved only in links, actions, fields and sub-entities.
+    The size of data with expanded references is counted, so that shared values that are copied
+    by parsers can't make the data arbitrary large.
+
+    :param strings: table of strings.
+    :param max_expanded_size: maximum size of data with expanded references.
+    """
+
+    def __init__(self, strings, max_expanded_size):
+        self._strings = strings
+        self._components = []
+        self._component_sizes = []
+        self._size_left = max_expanded_size
+
+    def add_component(self, component):
+        """Resolve the next component of the table.
+
+        The size of the component is counted on each reference to it.
+
+        :param component: decoded component.
+        :raises: :class:ValueError, :class:IndexError or :class:TypeError.
+        """
+        size_left = self._size_left
+        resolved_component = self.resolve_component(component)
+        self._component_sizes.append(size_left - self._size_left)
+        self._size_left = size_left
+        self._components.append(resolved_component)
+
+    def resolve_entity(self, data):
+        """Resolve references of data of an entity or an embedded representation.
+
+        :param data: decoded data.
+        :returns: resolved data.
+        :raises: :class:ValueError, :class:IndexError or :class:TypeError.
+        """
+        if not isinstance(data, dict):
+            return self.resolve_value(data)
+
+        resolved_data = {}
+        for key, value in data.items():
+            key = self._resolve_key(key)
+            if key == "entities" and isinstance(value, list):
+                resolve_entity = self.resolve_entity
+                resolve_slot = self.resolve_slot
+                value = [
+                    resolve_entity(item) if isinstance(item, dict) else resolve_slot(item)
+                    for item in value
+                    ]
+            elif key in ("links", "actions") and isinstance(value, list):
+                value = [self.resolve_slot(item) for item in value]
+            else:
+                value = self.resolve_value(value)
+            resolved_data[key] = value
+
+        return resolved_data
+
+    def resolve_component(self, data):
+        """Resolve references of data of a link, an embedded link, an action or a field.
+
+        :param data: decoded data.
+        :returns: resolved data.
+        :raises: :class:ValueError, :class:IndexError or :class:TypeError.
+        """
+        if not isinstance(data, dict):
+            return self.resolve_value(data)
+
+        resolved_data = {}
+        for key, value in data.items():
+            key = self._resolve_key(key)
+            if key == "fields" and isinstance(value, list):
+                value = [self.resolve_slot(item) for item in value]
+            else:
+                value = self.resolve_value(value)
+            resolved_data[key] = value
+
+        return resolved_data
+
+    def resolve_value(self, value):
+        """Resolve references to strings of a value.
+
+        :param value: decoded value.
+        :returns: value with strings instead of references.
+        :raises: :class:ValueError, :class:IndexError or :class:TypeError.
+        """
+        if isinstance(value, codec.Tag):
+            if value.tag == COMPONENT_TAG:
+                raise ValueError(
+                    "Components can be referenced only in links, actions, fields and sub-entities"
+                    )
+            string = _get_item(self._strings, value.value)
+            self._count(len(string))
+            return string
+
+        self._count(1)
+        if isinstance(value, dict):
+            resolve_value = self.resolve_value
+            return {self._resolve_key(key): resolve_value(item) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [self.resolve_value(item) for item in value]
+
+        return value
+
+    def resolve_slot(self, value):
+        """Resolve an item of links, actions, fields or sub-entities or the root component.
+
+        :param value: reference to a component or inline data of the component.
+        :returns: resolved data of the component.
+        :raises: :class:ValueError, :class:IndexError or :class:TypeError.
+        """
+        if isinstance(value, codec.Tag) and value.tag == COMPONENT_TAG:
+            component = _get_item(self._components, value.value)
+            self._count(self._component_sizes[value.value])
+            return component
+
+        return self.resolve_component(value)
+
+    def _resolve_key(self, key):
+        """Resolve a key of a map.
+
+        :param key: index of the string.
+        :returns: string.
+        :raises: :class:ValueError or :class:IndexError.
+        """
+        string = _get_item(self._strings, key)
+        self._count(len(string))
+        return string
+
+    def _count(self, size):
+        """Count the size of resolved data.
+
+        :param size: size of a resolved value.
+        :raises: :class:ValueError if the data are too large.
+        """
+        self._size_left -= size
+        if self._size_left < 0:
+            raise ValueError("Document is too large with expanded references")
+
+
+def _get_item(table, index):
+    """Get an item of a table by its index.
+
+    :param table: list with items.
+    :param index: non-negative integer index.
+    :returns: item of the table.
+    :raises: :class:IndexError.
+    """
+    if isinstance(index, bool) or not isinstance(index, int) or index < 0:
+        raise IndexError("Invalid index '{0}'".format(index))
+
+    return table[index]
+
+
+def _parse_once(parse, parsed_components):
+    """Wrap a method of a parser to parse data of each shared component once.
+
+    :param parse: bound method of the parser.
+    :param parsed_components: dictionary with parsed components of a single document.
+    :returns: function to parse data of a component.
+    """
+    name = parse.__name__
+
+    def _parse(data):
+        # Data of the same component are the same object, which lives while the data are parsed.
+        key = (name, id(data))
+        if key not in parsed_components:
+            parsed_components[key] = parse(data)
+
+        return parsed_components[key]
+
+    return _parse
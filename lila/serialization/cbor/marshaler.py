@@ -0,0 +1,98 @@
+"""Module with CBOR marshaler for Siren objects."""
+
+from lila.serialization.marshaler import Marshaler
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.cbor import codec
+from lila.serialization import tracing
+
+
+class CBORMarshaler(Marshaler):
+    """Class to marshal Siren objects into CBOR.
+
+    Objects are converted into the same data as with :class:`JSONMarshaler
+    <lila.serialization.json.marshaler.JSONMarshaler>`, so they are validated in the same way,
+    and the data are encoded straight into CBOR without JSON text.
+
+    :param marshaler: optional JSON marshaler to convert Siren objects into data.
+    """
+
+    def __init__(self, marshaler=None):
+        if marshaler is None:
+            marshaler = JSONMarshaler()
+
+        self._marshaler = marshaler
+
+    def marshal_field(self, field):
+        """Marshal Siren field.
+
+        :param field: Siren Field.
+        :returns: bytes with encoded field data.
+        """
+        return self._encode("field", self._marshaler.marshal_field(field))
+
+    def marshal_action(self, action):
+        """Marshal Siren action.
+
+        :param action: Siren Action.
+        :returns: bytes with encoded action data.
+        """
+        return self._encode("action", self._marshaler.marshal_action(action))
+
+    def marshal_link(self, link):
+        """Marshal Siren link.
+
+        :param link: Siren Link.
+        :returns: bytes with encoded link data.
+        """
+        return self._encode("link", self._marshaler.marshal_link(link))
+
+    def marshal_embedded_link(self, embedded_link):
+        """Marshal embedded Siren link.
+
+        :param embedded_link: embedded Siren Link.
+        :returns: bytes with encoded embedded link data.
+        """
+        return self._encode(
+            "embedded link",
+            self._marshaler.marshal_embedded_link(embedded_link),
+            )
+
+    def marshal_embedded_representation(self, embedded_representation):
+        """Marshal Siren embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :returns: bytes with encoded embedded representation data.
+        """
+        return self._encode(
+            "embedded representation",
+            self._marshaler.marshal_embedded_representation(embedded_representation),
+            )
+
+    def marshal_entity(self, entity):
+        """Marshal Siren entity.
+
+        :param entity: Siren entity.
+        :returns: bytes with encoded entity data.
+        """
+        return self._encode("entity", self._marshaler.marshal_entity(entity))
+
+    def _encode(self, kind, data):
+        """Encode marshaled data of a component into CBOR.
+
+        :param kind: human readable kind of the component.
+        :param data: marshaled data.
+        :returns: bytes with encoded data.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to encode %s data", kind)
+
+        try:
+            encoded_data = codec.encode(data)
+        except Exception:
+            tracing.error(__name__, "Failed to encode %s data", kind)
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully encoded %s data", kind)
+        return encoded_data
@@ -0,0 +1,93 @@
+"""Module with CBOR parser for Siren objects."""
+
+from lila.serialization.parser import Parser
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.cbor import codec
+from lila.serialization import tracing
+
+
+class CBORParser(Parser):
+    """Class to parse Siren objects from CBOR.
+
+    Decoded data are parsed with :class:`JSONParser
+    <lila.serialization.json.parser.JSONParser>`, so they are validated in the same way.
+
+    :param parser: optional JSON parser to create Siren objects from decoded data.
+    """
+
+    def __init__(self, parser=None):
+        if parser is None:
+            parser = JSONParser()
+
+        self._parser = parser
+
+    def parse_field(self, data):
+        """Parse serialized Siren field.
+
+        :param data: bytes with encoded field.
+        :returns: parsed field.
+        """
+        return self._parser.parse_field(self._decode("field", data))
+
+    def parse_action(self, data):
+        """Parse serialized Siren action.
+
+        :param data: bytes with encoded action.
+        :returns: parsed action.
+        """
+        return self._parser.parse_action(self._decode("action", data))
+
+    def parse_link(self, data):
+        """Parse serialized Siren link.
+
+        :param data: bytes with encoded link.
+        :returns: parsed link.
+        """
+        return self._parser.parse_link(self._decode("link", data))
+
+    def parse_embedded_link(self, data):
+        """Parse serialized Siren embedded link.
+
+        :param data: bytes with encoded embedded link.
+        :returns: parsed embedded link.
+        """
+        return self._parser.parse_embedded_link(self._decode("embedded link", data))
+
+    def parse_embedded_representation(self, data):
+        """Parse serialized Siren embedded representation.
+
+        :param data: bytes with encoded embedded representation.
+        :returns: parsed embedded representation.
+        """
+        return self._parser.parse_embedded_representation(
+            self._decode("embedded representation", data),
+            )
+
+    def parse_entity(self, data):
+        """Parse serialized Siren entity.
+
+        :param data: bytes with encoded entity.
+        :returns: parsed entity.
+        """
+        return self._parser.parse_entity(self._decode("entity", data))
+
+    def _decode(self, kind, encoded_data):
+        """Decode data of a component from CBOR.
+
+        :param kind: human readable kind of the component.
+        :param encoded_data: bytes with encoded data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to decode %s data", kind)
+
+        try:
+            data = codec.decode(encoded_data)
+        except Exception:
+            tracing.error(__name__, "Failed to decode %s data", kind)
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully decoded %s data", kind)
+        return data
@@ -1,8 +1,7 @@
 """Module with default marshaler for an action."""
 
-import logging
-
 from lila.core.action import Action, Method
+from lila.serialization import tracing
 
 
 class ActionMarshaler:
@@ -18,8 +17,8 @@ class ActionMarshaler:
         :returns: dictionary with action data.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an action")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an action")
 
         action_data = {
             "name": self.marshal_name(),
@@ -31,7 +30,8 @@ class ActionMarshaler:
             "fields": self.marshal_fields(),
             }
 
-        logger.info("Successfully marshaled an action")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an action")
         return action_data
 
     def marshal_name(self):
@@ -44,7 +44,7 @@ class ActionMarshaler:
         try:
             name = action.name
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get action's name")
+            tracing.error(__name__, "Failed to get action's name")
             raise ValueError("Failed to get action's name") from error
 
         return str(name)
@@ -55,16 +55,14 @@ class ActionMarshaler:
         :returns: list with string names of action's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         action = self._action
         try:
             classes = list(str(class_) for class_ in action.classes)
         except AttributeError as error:
-            logger.error("Failed to get action's classes")
+            tracing.error(__name__, "Failed to get action's classes")
             raise ValueError("Failed to get action's classes") from error
         except TypeError as error:
-            logger.error("Failed to iterate over action's classes")
+            tracing.error(__name__, "Failed to iterate over action's classes")
             raise ValueError("Failed to iterate over action's classes") from error
 
         return classes
@@ -75,19 +73,17 @@ class ActionMarshaler:
         :returns: string value of action's method.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         action = self._action
         try:
             method = str(action.method)
         except AttributeError as error:
-            logger.error("Failed to get action's method")
+            tracing.error(__name__, "Failed to get action's method")
             raise ValueError("Failed to get action's method") from error
 
         try:
             method = Method(method)
         except ValueError as error:
-            logger.error("Action's method is not supported")
+            tracing.error(__name__, "Action's method is not supported")
             raise ValueError("Action's method is not supported") from error
 
         return method.value
@@ -102,7 +98,7 @@ class ActionMarshaler:
         try:
             target = action.target
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get action's target")
+            tracing.error(__name__, "Failed to get action's target")
             raise ValueError("Failed to get action's target") from error
 
         return str(target)
@@ -117,7 +113,7 @@ class ActionMarshaler:
         try:
             title = action.title
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get action's title")
+            tracing.error(__name__, "Failed to get action's title")
             raise ValueError("Failed to get action's title") from error
 
         if title is not None:
@@ -135,7 +131,7 @@ class ActionMarshaler:
         try:
             media_type = action.media_type
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get action's media type")
+            tracing.error(__name__, "Failed to get action's media type")
             raise ValueError("Failed to get action's media type") from error
 
         if media_type is not None:
@@ -149,16 +145,14 @@ class ActionMarshaler:
         :returns: list with marshaled data of action's fields.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         action = self._action
         try:
             action_fields = list(action.fields)
         except AttributeError as error:
-            logger.error("Failed to get action's fields")
+            tracing.error(__name__, "Failed to get action's fields")
             raise ValueError("Failed to get action's fields") from error
         except TypeError as error:
-            logger.error("Failed to iterate over action's fields")
+            tracing.error(__name__, "Failed to iterate over action's fields")
             raise ValueError("Failed to iterate over action's fields") from error
 
         marshal_field = self._marshaler.marshal_field
@@ -168,7 +162,7 @@ class ActionMarshaler:
             try:
                 field_data = marshal_field(field)
             except Exception as error:
-                logger.error("Failed to marshal action's fields")
+                tracing.error(__name__, "Failed to marshal action's fields")
                 raise ValueError("Failed to marshal action's fields") from error
 
             marshaled_fields.append(field_data)
@@ -189,8 +183,8 @@ class ActionParser:
         :returns: :class:`Action <lila.core.action.Action>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an action")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an action")
 
         action_name = self.parse_name()
         action_classes = self.parse_classes()
@@ -211,10 +205,11 @@ class ActionParser:
                 fields=action_fields,
                 )
         except Exception as error:
-            logger.error("Failed to create an action with provided data")
+            tracing.error(__name__, "Failed to create an action with provided data")
             raise ValueError("Failed to create an action with provided data") from error
         else:
-            logger.info("Successfully parsed an action")
+            if tracing.enabled:
+                tracing.info(__name__, "Successfully parsed an action")
 
         return action
 
@@ -224,15 +219,13 @@ class ActionParser:
         :returns: string name of the action.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_name = self._data["name"]
         except TypeError as error:
-            logger.error("Failed to get name from action data")
+            tracing.error(__name__, "Failed to get name from action data")
             raise ValueError("Failed to get name from action data") from error
         except KeyError as error:
-            logger.error("Action data do not have required 'name' key")
+            tracing.error(__name__, "Action data do not have required 'name' key")
             raise ValueError("Action data do not have required 'name' key") from error
 
         return str(action_name)
@@ -243,12 +236,10 @@ class ActionParser:
         :returns: list with string names of action's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_classes = self._data["class"]
         except TypeError as error:
-            logger.error("Failed to get classes from action data")
+            tracing.error(__name__, "Failed to get classes from action data")
             raise ValueError("Failed to get classes from action data") from error
         except KeyError:
             action_classes = ()
@@ -256,7 +247,7 @@ class ActionParser:
         try:
             action_classes = tuple(str(class_) for class_ in action_classes)
         except TypeError as error:
-            logger.error("Failed to iterate over classes from action data")
+            tracing.error(__name__, "Failed to iterate over classes from action data")
             raise ValueError("Failed to iterate over classes from action data") from error
 
         return action_classes
@@ -267,12 +258,10 @@ class ActionParser:
         :returns: :class:`Method <lila.core.action.Method>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_method = self._data["method"]
         except TypeError as error:
-            logger.error("Failed to get method from action data")
+            tracing.error(__name__, "Failed to get method from action data")
             raise ValueError("Failed to get method from action data") from error
         except KeyError:
             action_method = Method.GET.value
@@ -280,7 +269,7 @@ class ActionParser:
         try:
             action_method = Method(action_method)
         except ValueError as error:
-            logger.error("Action data contain not supported method")
+            tracing.error(__name__, "Action data contain not supported method")
             raise ValueError("Action data contain not supported method") from error
 
         return action_method
@@ -291,15 +280,13 @@ class ActionParser:
         :returns: string target of the action.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_target = self._data["href"]
         except TypeError as error:
-            logger.error("Failed to get target from action data")
+            tracing.error(__name__, "Failed to get target from action data")
             raise ValueError("Failed to get target from action data") from error
         except KeyError as error:
-            logger.error("Action data do not have required 'href' key")
+            tracing.error(__name__, "Action data do not have required 'href' key")
             raise ValueError("Action data do not have required 'href' key") from error
 
         return str(action_target)
@@ -310,12 +297,10 @@ class ActionParser:
         :returns: string title of the action or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_title = self._data["title"]
         except TypeError as error:
-            logger.error("Failed to get title from action data")
+            tracing.error(__name__, "Failed to get title from action data")
             raise ValueError("Failed to get title from action data") from error
         except KeyError:
             action_title = None
@@ -331,12 +316,10 @@ class ActionParser:
         :returns: string value of action's media type or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_media_type = self._data["type"]
         except TypeError as error:
-            logger.error("Failed to get media type from action data")
+            tracing.error(__name__, "Failed to get media type from action data")
             raise ValueError("Failed to get media type from action data") from error
         except KeyError:
             action_media_type = None
@@ -354,12 +337,10 @@ class ActionParser:
         :returns: list with parsed action's fields.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             action_fields_data = self._data["fields"]
         except TypeError as error:
-            logger.error("Failed to get fields data from action data")
+            tracing.error(__name__, "Failed to get fields data from action data")
             raise ValueError("Failed to get fields data from action data") from error
         except KeyError:
             action_fields_data = ()
@@ -367,7 +348,7 @@ class ActionParser:
         try:
             action_fields_data = list(action_fields_data)
         except TypeError as error:
-            logger.error("Failed to iterate over fields data from action data")
+            tracing.error(__name__, "Failed to iterate over fields data from action data")
             raise ValueError("Failed to iterate over fields data from action data") from error
 
         parse_field = self._parser.parse_field
@@ -377,7 +358,7 @@ class ActionParser:
             try:
                 field = parse_field(data)
             except Exception as error:
-                logger.error("Failed to parse action's fields")
+                tracing.error(__name__, "Failed to parse action's fields")
                 raise ValueError("Failed to parse action's fields") from error
 
             action_fields.append(field)
@@ -0,0 +1,257 @@
+"""Module with helpers to marshal and parse Siren entities in asyncio applications.
+
+Sub-entities, links and actions at the top level of an entity are processed in chunks and the
+control is passed back to the event loop after each chunk, so that a large entity doesn't block
+the loop. Entities with too many components can be processed in an executor instead.
+Sub-entities of a :class:`StreamingEntity <lila.core.entity.StreamingEntity>` are taken from its
+iterator chunk by chunk, so they are never kept in memory as a whole before marshaling.
+"""
+
+import asyncio
+import itertools
+
+from lila.core.entity import Entity, StreamingEntity
+from lila.serialization.json.entity import EntityMarshaler, EntityParser
+from lila.serialization.json.compact import compact_data
+from lila.serialization import tracing
+
+
+DEFAULT_YIELD_INTERVAL = 100
+
+_ENTITY_MEMBERS = ("entities", "links", "actions")
+
+
+class _Members:
+    """Entity-like object with a part of members of an entity."""
+
+    def __init__(self, entities=(), links=(), actions=()):
+        self.entities = entities
+        self.links = links
+        self.actions = actions
+
+
+async def marshal_entity(
+        marshaler,
+        entity,
+        yield_interval=DEFAULT_YIELD_INTERVAL,
+        executor_threshold=None,
+        executor=None,
+    ):
+    # pylint: disable=too-many-arguments
+    """Marshal Siren entity without blocking the event loop.
+
+    The result and errors are the same as of :meth:`JSONMarshaler.marshal_entity
+    <lila.serialization.json.marshaler.JSONMarshaler.marshal_entity>`.
+
+    :param marshaler: JSON marshaler.
+    :param entity: Siren entity.
+    :param yield_interval: number of components to marshal before the control is passed back
+        to the event loop.
+    :param executor_threshold: optional number of components at the top level of the entity,
+        above which the entity is marshaled in the executor. Sub-entities of a streaming entity
+        are not counted.
+    :param executor: optional :class:`concurrent.futures.Executor`. The default executor of the
+        loop is used if it's not passed. Entities with custom marshalers can't be split into
+        chunks, so they are always marshaled in the executor.
+    :returns: dictionary with entity data.
+    :raises: :class:ValueError.
+    """
+    entity_marshaler = marshaler.create_entity_marshaler(entity)
+    if type(entity_marshaler) is not EntityMarshaler:    # pylint: disable=unidiomatic-typecheck
+        # Custom marshalers can't be split into steps.
+        return await _run_in_executor(marshaler.marshal_entity, entity, executor)
+
+    try:
+        members = {name: _get_members(entity, name) for name in _ENTITY_MEMBERS}
+    except (AttributeError, TypeError):
+        # Let the marshaler raise the proper error.
+        return marshaler.marshal_entity(entity)
+
+    size = sum(len(values) for values in members.values() if isinstance(values, list))
+    if executor_threshold is not None and size > executor_threshold:
+        return await _run_in_executor(marshaler.marshal_entity, entity, executor)
+
+    classes = entity_marshaler.marshal_classes()
+    properties = entity_marshaler.marshal_properties()
+
+    marshaled_members = {}
+    for name in _ENTITY_MEMBERS:
+        marshaled_values = []
+        for chunk in _split(members[name], yield_interval):
+            chunk_marshaler = marshaler.create_entity_marshaler(_Members(**{name: chunk}))
+            marshaled_values.extend(getattr(chunk_marshaler, "marshal_" + name)())
+            await asyncio.sleep(0)
+        marshaled_members[name] = marshaled_values
+
+    entity_data = {
+        "class": classes,
+        "properties": properties,
+        "entities": marshaled_members["entities"],
+        "links": marshaled_members["links"],
+        "actions": marshaled_members["actions"],
+        "title": entity_marshaler.marshal_title(),
+        }
+    if marshaler.compact:
+        entity_data = compact_data("entity", entity_data)
+
+    return entity_data
+
+
+async def parse_entity(
+        parser,
+        data,
+        yield_interval=DEFAULT_YIELD_INTERVAL,
+        executor_threshold=None,
+        executor=None,
+    ):
+    # pylint: disable=too-many-arguments
+    """Parse Siren entity without blocking the event loop.
+
+    The result and errors are the same as of :meth:`JSONParser.parse_entity
+    <lila.serialization.json.parser.JSONParser.parse_entity>`.
+
+    :param parser: JSON parser.
+    :param data: serialized entity.
+    :param yield_interval: number of components to parse before the control is passed back
+        to the event loop.
+    :param executor_threshold: optional number of components at the top level of the entity,
+        above which the entity is parsed in the executor.
+    :param executor: optional :class:`concurrent.futures.Executor`. The default executor of the
+        loop is used if it's not passed. Data for custom parsers can't be split into chunks, so
+        they are always parsed in the executor.
+    :returns: parsed entity.
+    :raises: :class:ValueError.
+    """
+    entity_parser = parser.create_entity_parser(data)
+    if type(entity_parser) is not EntityParser:  # pylint: disable=unidiomatic-typecheck
+        # Custom parsers can't be split into steps.
+        return await _run_in_executor(parser.parse_entity, data, executor)
+
+    try:
+        members = {name: _get_members_data(data, name) for name in _ENTITY_MEMBERS}
+    except TypeError:
+        # Let the parser raise the proper error.
+        return parser.parse_entity(data)
+
+    size = sum(len(values) for values in members.values())
+    if executor_threshold is not None and size > executor_threshold:
+        return await _run_in_executor(parser.parse_entity, data, executor)
+
+    classes = entity_parser.parse_classes()
+    properties = entity_parser.parse_properties()
+
+    parsed_members = {}
+    for name in _ENTITY_MEMBERS:
+        parsed_values = []
+        for chunk in _split(members[name], yield_interval):
+            chunk_parser = parser.create_entity_parser({name: chunk})
+            parsed_values.extend(getattr(chunk_parser, "parse_" + name)())
+            await asyncio.sleep(0)
+        parsed_members[name] = parsed_values
+
+    title = entity_parser.parse_title()
+
+    try:
+        entity = Entity(
+            classes=classes,
+            properties=properties,
+            entities=parsed_members["entities"],
+            links=parsed_members["links"],
+            actions=parsed_members["actions"],
+            title=title,
+            )
+    except Exception as error:
+        tracing.error(__name__, "Failed to create an entity with provided data")
+        raise ValueError("Failed to create an entity with provided data") from error
+
+    return entity
+
+
+async def write_entity(marshaler, entity, writer, chunk_size):
+    """Marshal Siren entity and write it into an asyncio stream.
+
+    :param marshaler: JSON stream marshaler.
+    :param entity: Siren entity.
+    :param writer: :class:`asyncio.StreamWriter`.
+    :param chunk_size: approximate number of characters in a chunk.
+    :raises: :class:ValueError.
+    """
+    for chunk in marshaler.iter_marshal_entity(entity, chunk_size=chunk_size):
+        writer.write(chunk)
+        # drain waits only if the buffer of the transport is full, so the control is passed
+        # to the loop explicitly.
+        await writer.drain()
+        await asyncio.sleep(0)
+
+
+async def _run_in_executor(function, argument, executor):
+    """Run the function in the executor.
+
+    :param function: function to call.
+    :param argument: argument of the function.
+    :param executor: optional :class:`concurrent.futures.Executor`.
+    :returns: result of the function.
+    """
+    # get_running_loop appeared in Python 3.7.
+    loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+    return await loop.run_in_executor(executor, function, argument)
+
+
+def _get_members(entity, name):
+    """Get members of the entity.
+
+    Sub-entities of a streaming entity are returned as an iterator, other members as a list.
+
+    :param entity: Siren entity.
+    :param name: name of the members.
+    :returns: list or iterator with the members.
+    :raises: :class:AttributeError, :class:TypeError.
+    """
+    if name == "entities" and isinstance(entity, StreamingEntity):
+        return _iterate_sub_entities(entity)
+
+    return list(getattr(entity, name))
+
+
+def _iterate_sub_entities(entity):
+    """Iterate over sub-entities of the streaming entity.
+
+    :param entity: streaming entity.
+    :returns: iterator over sub-entities.
+    :raises: :class:ValueError.
+    """
+    try:
+        yield from entity.entities
+    except TypeError as error:
+        tracing.error(__name__, "Failed to iterate over sub-entities of the entity")
+        raise ValueError("Failed to iterate over sub-entities of the entity") from error
+
+
+def _get_members_data(data, name):
+    """Get a list with data of entity members.
+
+    :param data: serialized entity.
+    :param name: name of the members.
+    :returns: list with data of the members.
+    :raises: :class:TypeError.
+    """
+    try:
+        return list(data[name])
+    except KeyError:
+        return []
+
+
+def _split(values, chunk_size):
+    """Split values into chunks.
+
+    :param values: iterable with values.
+    :param chunk_size: number of values in a chunk.
+    :returns: iterator over lists of values.
+    :raises: :class:ValueError.
+    """
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ValueError("Interval to yield must be positive")
+
+    iterator = iter(values)
+    return iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
@@ -0,0 +1,110 @@
+"""Module with helpers to marshal and parse Siren entities in batches."""
+
+import json
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+
+DEFAULT_CHUNK_SIZE = 100
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def marshal_entities(marshaler, entities, executor=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Marshal Siren entities.
+
+    :param marshaler: JSON marshaler.
+    :param entities: iterable with Siren entities.
+    :param executor: optional :class:`concurrent.futures.Executor` to marshal chunks of entities.
+    :param chunk_size: number of entities in a chunk.
+    :returns: list with data of the entities in the same order.
+    """
+    if executor is None:
+        return _marshal_chunk(marshaler, entities)
+
+    if isinstance(executor, ProcessPoolExecutor):
+        encoded_chunks = _map_chunks(
+            _marshal_encoded_chunk,
+            marshaler,
+            entities,
+            executor,
+            chunk_size,
+            )
+        chunks = (json.loads(encoded_chunk.decode("utf-8")) for encoded_chunk in encoded_chunks)
+    else:
+        chunks = _map_chunks(_marshal_chunk, marshaler, entities, executor, chunk_size)
+
+    return list(itertools.chain.from_iterable(chunks))
+
+
+def parse_entities(parser, datas, executor=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parse Siren entities.
+
+    :param parser: JSON parser.
+    :param datas: iterable with data of the entities.
+    :param executor: optional :class:`concurrent.futures.Executor` to parse chunks of data.
+    :param chunk_size: number of entities in a chunk.
+    :returns: list with parsed entities in the same order.
+    """
+    if executor is None:
+        return _parse_chunk(parser, datas)
+
+    # Unlike marshaled data, parsed entities are sent back from worker processes pickled.
+    # Rebuilding them from compact JSON would repeat the whole parsing in this process, while
+    # the pickle is both smaller and several times faster to load.
+    chunks = _map_chunks(_parse_chunk, parser, datas, executor, chunk_size)
+    return list(itertools.chain.from_iterable(chunks))
+
+
+def _map_chunks(function, instance, items, executor, chunk_size):
+    """Apply the function to chunks of items with the executor.
+
+    :param function: function to apply to the instance and a chunk of items.
+    :param instance: marshaler or parser.
+    :param items: iterable with items.
+    :param executor: :class:`concurrent.futures.Executor`.
+    :param chunk_size: number of items in a chunk.
+    :returns: iterator over results of the function in the same order as the chunks.
+    """
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ValueError("Size of a chunk must be positive")
+
+    iterator = iter(items)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+    return executor.map(function, itertools.repeat(instance), chunks)
+
+
+def _marshal_chunk(marshaler, entities):
+    """Marshal a chunk of entities.
+
+    :param marshaler: JSON marshaler.
+    :param entities: iterable with Siren entities.
+    :returns: list with data of the entities.
+    """
+    marshal_entity = marshaler.marshal_entity
+    return [marshal_entity(entity) for entity in entities]
+
+
+def _marshal_encoded_chunk(marshaler, entities):
+    """Marshal a chunk of entities into compact JSON.
+
+    The function is used in worker processes to reduce the amount of data sent back.
+
+    :param marshaler: JSON marshaler.
+    :param entities: iterable with Siren entities.
+    :returns: bytes with JSON encoded list of entity data.
+    """
+    data = _marshal_chunk(marshaler, entities)
+    return json.dumps(data, separators=_COMPACT_SEPARATORS).encode("utf-8")
+
+
+def _parse_chunk(parser, datas):
+    """Parse a chunk of entities.
+
+    :param parser: JSON parser.
+    :param datas: iterable with data of the entities.
+    :returns: list with parsed entities.
+    """
+    parse_entity = parser.parse_entity
+    return [parse_entity(data) for data in datas]
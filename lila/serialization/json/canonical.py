@@ -0,0 +1,126 @@
+"""Module with the encoder of canonical JSON.
+
+The output follows the rules of `JSON Canonicalization Scheme
+<https://tools.ietf.org/html/rfc8785>`_: keys of objects are sorted by UTF-16 code units, numbers
+are formatted as in ECMAScript and there is no insignificant whitespace. Equal data are always
+encoded into the same bytes regardless of the order, in which dictionaries were filled, or of the
+type of integral numbers.
+"""
+
+import math
+from decimal import Decimal
+from json.encoder import encode_basestring
+
+
+def encode_canonical(data):
+    """Encode JSON data into canonical form.
+
+    :param data: JSON serializable data.
+    :returns: string with canonical JSON document.
+    :raises: :class:ValueError.
+    """
+    parts = []
+    _encode_value(data, parts.append)
+    return "".join(parts)
+
+
+def format_number(number):
+    """Format a number as ECMAScript does.
+
+    :param number: int or float.
+    :returns: string with the formatted number.
+    :raises: :class:ValueError.
+    """
+    if isinstance(number, int):
+        return int.__repr__(number)
+
+    if math.isnan(number) or math.isinf(number):
+        raise ValueError("Number '{0}' can't be encoded".format(number))
+
+    if number == 0:
+        # Negative zero is encoded as zero.
+        return "0"
+
+    # repr gives the shortest digits that are parsed back into the same number.
+    sign, digits, exponent = Decimal(float.__repr__(number)).normalize().as_tuple()
+    sign = "-" if sign else ""
+    digits = "".join(str(digit) for digit in digits)
+    # The number is 0.digits * 10 ** position.
+    position = exponent + len(digits)
+
+    if len(digits) <= position <= 21:
+        return sign + digits + "0" * (position - len(digits))
+
+    if 0 < position <= 21:
+        return sign + digits[:position] + "." + digits[position:]
+
+    if -6 < position <= 0:
+        return sign + "0." + "0" * -position + digits
+
+    exponent = position - 1
+    exponent_sign = "+" if exponent > 0 else "-"
+    mantissa = digits[0]
+    if len(digits) > 1:
+        mantissa += "." + digits[1:]
+
+    return sign + mantissa + "e" + exponent_sign + str(abs(exponent))
+
+
+def _encode_value(value, write):
+    """Encode a JSON value.
+
+    :param value: JSON serializable value.
+    :param write: function to write encoded parts.
+    :raises: :class:ValueError.
+    """
+    if isinstance(value, str):
+        write(encode_basestring(value))
+    elif value is None:
+        write("null")
+    elif value is True:
+        write("true")
+    elif value is False:
+        write("false")
+    elif isinstance(value, (int, float)):
+        write(format_number(value))
+    elif isinstance(value, dict):
+        _encode_object(value, write)
+    elif isinstance(value, (list, tuple)):
+        write("[")
+        for index, item in enumerate(value):
+            if index:
+                write(",")
+            _encode_value(item, write)
+        write("]")
+    else:
+        raise ValueError("Object of type '{0}' can't be encoded".format(type(value).__name__))
+
+
+def _encode_object(value, write):
+    """Encode a JSON object with sorted keys.
+
+    :param value: dictionary with string keys.
+    :param write: function to write encoded parts.
+    :raises: :class:ValueError.
+    """
+    for key in value:
+        if not isinstance(key, str):
+            raise ValueError("Key of type '{0}' can't be encoded".format(type(key).__name__))
+
+    write("{")
+    for index, key in enumerate(sorted(value, key=_get_sort_key)):
+        if index:
+            write(",")
+        write(encode_basestring(key))
+        write(":")
+        _encode_value(value[key], write)
+    write("}")
+
+
+def _get_sort_key(key):
+    """Get a key to sort keys of an object by UTF-16 code units.
+
+    :param key: string key of an object.
+    :returns: bytes with big-endian UTF-16 code units of the key.
+    """
+    return key.encode("utf-16-be", "surrogatepass")
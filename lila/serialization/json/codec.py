@@ -0,0 +1,282 @@
+"""Module with codecs to convert JSON data to bytes and back.
+
+The standard :mod:`json` module is always available. Faster backends are used automatically by
+:func:`create_default_codec` if they are installed.
+"""
+
+import json
+import math
+
+from lila.serialization.json.canonical import encode_canonical
+
+try:
+    import orjson
+except ImportError:     # pragma: no cover
+    orjson = None   # pylint: disable=invalid-name
+
+try:
+    import ujson
+except ImportError:     # pragma: no cover
+    ujson = None    # pylint: disable=invalid-name
+
+
+ENCODING = "utf-8"
+
+
+class Codec:
+    """Base class for JSON codecs."""
+
+    name = None
+
+    def encode(self, data):
+        """Encode JSON data into bytes.
+
+        :param data: JSON serializable data.
+        :returns: bytes with encoded data.
+        :raises: :class:ValueError.
+        """
+        raise NotImplementedError("Codec does not support encoding")
+
+    def decode(self, encoded_data):
+        """Decode JSON data from bytes.
+
+        :param encoded_data: bytes with encoded data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        raise NotImplementedError("Codec does not support decoding")
+
+    @classmethod
+    def is_available(cls):
+        """Check if the backend of the codec is installed.
+
+        :returns: True if the codec can be used.
+        """
+        return True
+
+
+class StandardCodec(Codec):
+    """Codec based on the standard json module."""
+
+    name = "json"
+
+    def __init__(self):
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def encode(self, data):
+        """Encode JSON data into compact UTF-8 bytes.
+
+        :param data: JSON serializable data.
+        :returns: bytes with encoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return self._encode(data).encode(ENCODING)
+        except (RecursionError, TypeError, ValueError) as error:
+            raise ValueError("Failed to encode JSON data") from error
+
+    def decode(self, encoded_data):
+        """Decode JSON data from UTF-8 bytes.
+
+        :param encoded_data: bytes with encoded data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return json.loads(_decode_text(encoded_data))
+        except (RecursionError, TypeError, ValueError) as error:
+            raise ValueError("Failed to decode JSON data") from error
+
+    def __getstate__(self):
+        # Encoder is recreated in other processes.
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+
+class OrjsonCodec(Codec):
+    """Codec based on `orjson <https://github.com/ijl/orjson>`_.
+
+    Data that orjson doesn't support, e.g. integers beyond 64 bits or non-finite floats, are
+    encoded and decoded by :class:`StandardCodec`, so the result doesn't depend on the backend.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        self._fallback_codec = StandardCodec()
+
+    def encode(self, data):
+        """Encode JSON data into compact UTF-8 bytes.
+
+        :param data: JSON serializable data.
+        :returns: bytes with encoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            encoded_data = orjson.dumps(data)
+        except TypeError:
+            return self._fallback_codec.encode(data)
+
+        # orjson silently encodes non-finite floats as null.
+        if b"null" in encoded_data and _has_non_finite_float(data):
+            return self._fallback_codec.encode(data)
+
+        return encoded_data
+
+    def decode(self, encoded_data):
+        """Decode JSON data from UTF-8 bytes.
+
+        :param encoded_data: bytes with encoded data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return orjson.loads(encoded_data)
+        except (TypeError, ValueError):
+            return self._fallback_codec.decode(encoded_data)
+
+    @classmethod
+    def is_available(cls):
+        """Check if orjson is installed.
+
+        :returns: True if the codec can be used.
+        """
+        return orjson is not None
+
+
+class UjsonCodec(Codec):
+    """Codec based on `ujson <https://github.com/ultrajson/ultrajson>`_."""
+
+    name = "ujson"
+
+    def encode(self, data):
+        """Encode JSON data into compact UTF-8 bytes.
+
+        :param data: JSON serializable data.
+        :returns: bytes with encoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return ujson.dumps(data, ensure_ascii=False).encode(ENCODING)
+        except (TypeError, ValueError, OverflowError) as error:
+            raise ValueError("Failed to encode JSON data") from error
+
+    def decode(self, encoded_data):
+        """Decode JSON data from UTF-8 bytes.
+
+        :param encoded_data: bytes with encoded data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return ujson.loads(_decode_text(encoded_data))
+        except (TypeError, ValueError) as error:
+            raise ValueError("Failed to decode JSON data") from error
+
+    @classmethod
+    def is_available(cls):
+        """Check if ujson is installed.
+
+        :returns: True if the codec can be used.
+        """
+        return ujson is not None
+
+
+class CanonicalCodec(Codec):
+    """Codec to encode data into canonical JSON.
+
+    Keys of objects are sorted and numbers are normalized while data are encoded, so that equal
+    data are always encoded into the same bytes.
+    """
+
+    name = "canonical"
+
+    def encode(self, data):
+        """Encode JSON data into canonical UTF-8 bytes.
+
+        :param data: JSON serializable data.
+        :returns: bytes with encoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return encode_canonical(data).encode(ENCODING)
+        except (RecursionError, ValueError) as error:
+            raise ValueError("Failed to encode JSON data") from error
+
+    def decode(self, encoded_data):
+        """Decode JSON data from UTF-8 bytes.
+
+        :param encoded_data: bytes with encoded data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        try:
+            return json.loads(_decode_text(encoded_data))
+        except (RecursionError, TypeError, ValueError) as error:
+            raise ValueError("Failed to decode JSON data") from error
+
+
+# Codecs in the order of preference.
+CODEC_CLASSES = (OrjsonCodec, UjsonCodec, StandardCodec, CanonicalCodec)
+
+
+def create_codec(name):
+    """Create a codec by the name of its backend.
+
+    :param name: name of the backend, e.g. "json" or "orjson".
+    :returns: :class:`Codec`.
+    :raises: :class:ValueError if the backend is unknown or not installed.
+    """
+    for codec_class in CODEC_CLASSES:
+        if codec_class.name == name:
+            if not codec_class.is_available():
+                raise ValueError("Backend '{0}' is not installed".format(name))
+            return codec_class()
+
+    raise ValueError("Unknown backend '{0}'".format(name))
+
+
+def create_default_codec():
+    """Create a codec with the fastest installed backend.
+
+    :returns: :class:`Codec`.
+    """
+    for codec_class in CODEC_CLASSES:
+        if codec_class.is_available():
+            return codec_class()
+
+    return StandardCodec()
+
+
+def _has_non_finite_float(data):
+    """Check if JSON data contain infinite or NaN floats.
+
+    :param data: JSON serializable data.
+    :returns: True if there is a non-finite float.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+    return False
+
+
+def _decode_text(encoded_data):
+    """Decode text of JSON document.
+
+    :param encoded_data: bytes or string with JSON document.
+    :returns: string with JSON document.
+    """
+    if isinstance(encoded_data, str):
+        return encoded_data
+
+    return bytes(encoded_data).decode(ENCODING)
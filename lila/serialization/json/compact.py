@@ -0,0 +1,47 @@
+"""Module with rules to leave out absent and default members of marshaled Siren objects.
+
+Parsers treat missing keys as absent or default values, so compact data are parsed into the same
+objects as complete ones. Required members and properties of entities are always kept.
+"""
+
+# Values of members that can be left out for each kind of components.
+DEFAULTS = {
+    "field": {"class": [], "type": "text", "value": None, "title": None},
+    "action": {"class": [], "method": "GET", "title": None, "type": None, "fields": []},
+    "link": {"class": [], "title": None, "type": None},
+    "embedded_link": {"class": [], "title": None, "type": None},
+    "embedded_representation": {
+        "class": [],
+        "properties": {},
+        "entities": [],
+        "links": [],
+        "actions": [],
+        "title": None,
+        },
+    "entity": {
+        "class": [],
+        "properties": {},
+        "entities": [],
+        "links": [],
+        "actions": [],
+        "title": None,
+        },
+    }
+
+
+def compact_data(kind, data):
+    """Leave out members with absent or default values.
+
+    Only members of the component itself are checked, nested components are expected to be
+    compacted already.
+
+    :param kind: kind of the component, one of the keys of :data:`DEFAULTS`.
+    :param data: dictionary with marshaled data of the component.
+    :returns: dictionary without absent and default members.
+    """
+    defaults = DEFAULTS[kind]
+    missing = object()
+    return {
+        key: value for key, value in data.items()
+        if defaults.get(key, missing) != value
+        }
@@ -0,0 +1,343 @@
+"""Module with JSON marshaler that uses generated functions for each class of components."""
+
+import json
+import threading
+
+from lila.core.base import Component
+from lila.core.field import Field, InputType
+from lila.core.action import Action, Method
+from lila.core.link import Link
+from lila.core.entity import Entity, EmbeddedRepresentation, StreamingEntity
+from lila.core.raw import load_raw_json
+from lila.serialization.marshaler import Marshaler
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.fragment import (
+    RawEmbeddedRepresentation,
+    RawEmbeddedRepresentationMarshaler,
+    )
+from lila.serialization import tracing
+
+
+# Members of marshaled components. Each member is described by a key in marshaled data,
+# the name of the attribute, the core class that defines the attribute, an expression to get
+# the value directly from the core class and an expression to get it from an arbitrary object.
+_SCHEMAS = {
+    "field": (
+        ("name", "name", Field, "obj._name", "str(obj.name)"),
+        ("class", "classes", Component, "list(obj._classes)", "_strings(obj.classes)"),
+        ("type", "input_type", Field, "obj._input_type.value", "_input_type(obj.input_type)"),
+        ("value", "value", Field, "obj._value", "_optional_string(obj.value)"),
+        ("title", "title", Component, "obj._title", "_optional_string(obj.title)"),
+        ),
+    "action": (
+        ("name", "name", Action, "obj._name", "str(obj.name)"),
+        ("class", "classes", Component, "list(obj._classes)", "_strings(obj.classes)"),
+        ("method", "method", Action, "obj._method.value", "_method(obj.method)"),
+        ("href", "target", Action, "obj._target", "str(obj.target)"),
+        ("title", "title", Component, "obj._title", "_optional_string(obj.title)"),
+        ("type", "media_type", Action, "obj._media_type", "_optional_string(obj.media_type)"),
+        (
+            "fields",
+            "fields",
+            Action,
+            "[marshal_field(field) for field in obj._fields]",
+            "[marshal_field(field) for field in list(obj.fields)]",
+            ),
+        ),
+    "link": (
+        ("rel", "relations", Link, "list(obj._relations)", "_strings(obj.relations)"),
+        ("class", "classes", Component, "list(obj._classes)", "_strings(obj.classes)"),
+        ("href", "target", Link, "obj._target", "str(obj.target)"),
+        ("title", "title", Component, "obj._title", "_optional_string(obj.title)"),
+        (
+            "type",
+            "target_media_type",
+            Link,
+            "obj._target_media_type",
+            "_optional_string(obj.target_media_type)",
+            ),
+        ),
+    "entity": (
+        ("class", "classes", Component, "list(obj._classes)", "_strings(obj.classes)"),
+        ("properties", "properties", Entity, "_copy(obj._properties)", "_copy(obj.properties)"),
+        (
+            "entities",
+            "entities",
+            Entity,
+            "[marshal_sub_entity(sub_entity) for sub_entity in obj._entities]",
+            "[marshal_sub_entity(sub_entity) for sub_entity in list(obj.entities)]",
+            ),
+        (
+            "links",
+            "links",
+            Entity,
+            "[marshal_link(link) for link in obj._links]",
+            "[marshal_link(link) for link in list(obj.links)]",
+            ),
+        (
+            "actions",
+            "actions",
+            Entity,
+            "[marshal_action(action) for action in obj._actions]",
+            "[marshal_action(action) for action in list(obj.actions)]",
+            ),
+        ("title", "title", Component, "obj._title", "_optional_string(obj.title)"),
+        ),
+    }
+
+_SCHEMAS["embedded_link"] = _SCHEMAS["link"]
+_SCHEMAS["embedded_representation"] = (
+    (
+        "rel",
+        "relations",
+        EmbeddedRepresentation,
+        "list(obj._relations)",
+        "_strings(obj.relations)",
+        ),
+    ) + _SCHEMAS["entity"]
+
+
+class CompiledJSONMarshaler(Marshaler):
+    """Class to marshal Siren objects into JSON with generated functions.
+
+    A flat function is generated and cached for every class of marshaled components, including
+    user sub-classes. Attributes that are not redefined in a sub-class are read directly, since
+    the core classes already keep them adjusted. The output is the same as the one of
+    :class:`JSONMarshaler <lila.serialization.json.marshaler.JSONMarshaler>`. If a generated
+    function fails, the component is marshaled with JSONMarshaler to raise the same error.
+    Streaming entities are always marshaled with JSONMarshaler, since their sub-entities can be
+    iterated over only once.
+    """
+
+    def __init__(self):
+        self._functions = {kind: {} for kind in _SCHEMAS}
+        self._lock = threading.Lock()
+        self._fallback = JSONMarshaler()
+
+        self._marshal_field = self._create_dispatcher("field")
+        self._marshal_action = self._create_dispatcher("action")
+        self._marshal_link = self._create_dispatcher("link")
+        self._marshal_embedded_link = self._create_dispatcher("embedded_link")
+        self._marshal_embedded_representation = self._create_dispatcher("embedded_representation")
+        self._marshal_entity = self._create_dispatcher("entity")
+
+    def marshal_field(self, field):
+        """Marshal Siren field.
+
+        :param field: Siren Field.
+        :returns: dictionary with field data.
+        """
+        return self._marshal(self._marshal_field, self._fallback.marshal_field, field)
+
+    def marshal_action(self, action):
+        """Marshal Siren action.
+
+        :param action: Siren Action.
+        :returns: dictionary with action data.
+        """
+        return self._marshal(self._marshal_action, self._fallback.marshal_action, action)
+
+    def marshal_link(self, link):
+        """Marshal Siren link.
+
+        :param link: Siren Link.
+        :returns: dictionary with link data.
+        """
+        return self._marshal(self._marshal_link, self._fallback.marshal_link, link)
+
+    def marshal_embedded_link(self, embedded_link):
+        """Marshal embedded Siren link.
+
+        :param embedded_link: embedded Siren Link.
+        :returns: dictionary with embedded link data.
+        """
+        return self._marshal(
+            self._marshal_embedded_link,
+            self._fallback.marshal_embedded_link,
+            embedded_link,
+            )
+
+    def marshal_embedded_representation(self, embedded_representation):
+        """Marshal Siren embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :returns: dictionary with embedded representation data.
+        """
+        return self._marshal(
+            self._marshal_embedded_representation,
+            self._fallback.marshal_embedded_representation,
+            embedded_representation,
+            )
+
+    def marshal_entity(self, entity):
+        """Marshal Siren entity.
+
+        :param entity: Siren entity.
+        :returns: dictionary with entity data.
+        """
+        if isinstance(entity, StreamingEntity):
+            return self._fallback.marshal_entity(entity)
+
+        return self._marshal(self._marshal_entity, self._fallback.marshal_entity, entity)
+
+    @staticmethod
+    def _marshal(marshal, fallback, component):
+        """Marshal a component with a generated function.
+
+        :param marshal: dispatcher of generated functions.
+        :param fallback: method of JSONMarshaler to marshal the component.
+        :param component: Siren component.
+        :returns: dictionary with component data.
+        """
+        try:
+            return marshal(component)
+        except Exception:   # pylint: disable=broad-except
+            if tracing.enabled:
+                tracing.debug(
+                    __name__,
+                    "Generated function failed, marshal the component '%s' with JSONMarshaler",
+                    component,
+                    )
+
+        return fallback(component)
+
+    def _create_dispatcher(self, kind):
+        """Create a function to marshal components with functions generated for their classes.
+
+        :param kind: kind of components.
+        :returns: function to marshal a component.
+        """
+        functions = self._functions[kind]
+        compile_function = self._compile
+
+        def _dispatch(component):
+            component_class = type(component)
+            try:
+                function = functions[component_class]
+            except KeyError:
+                function = compile_function(kind, component_class)
+
+            return function(component)
+
+        return _dispatch
+
+    def _compile(self, kind, component_class):
+        """Generate a function to marshal components of the class.
+
+        :param kind: kind of components.
+        :param component_class: class of components.
+        :returns: generated function.
+        """
+        with self._lock:
+            functions = self._functions[kind]
+            if component_class in functions:
+                return functions[component_class]
+
+            members = []
+            for key, attribute, core_class, direct_expression, expression in _SCHEMAS[kind]:
+                if _is_inherited(component_class, attribute, core_class):
+                    expression = direct_expression
+                members.append("{0!r}: {1}".format(key, expression))
+
+            source = "def marshal(obj):\n    return {{{0}}}\n".format(", ".join(members))
+            if tracing.enabled:
+                tracing.debug(
+                    __name__,
+                    "Generate a function to marshal %s of class '%s':\n%s",
+                    kind,
+                    component_class,
+                    source,
+                    )
+
+            namespace = {
+                "_strings": _strings,
+                "_optional_string": _optional_string,
+                "_input_type": _input_type,
+                "_method": _method,
+                "_copy": _copy,
+                "marshal_field": self._marshal_field,
+                "marshal_action": self._marshal_action,
+                "marshal_link": self._marshal_link,
+                "marshal_sub_entity": self._marshal_sub_entity,
+                }
+            filename = "<{0} marshaler for {1}>".format(kind, component_class.__qualname__)
+            exec(compile(source, filename, "exec"), namespace)  # pylint: disable=exec-used
+
+            function = functions[component_class] = namespace["marshal"]
+            return function
+
+    def _marshal_sub_entity(self, sub_entity):
+        """Marshal the sub-entity.
+
+        :param sub_entity: either embedded link or embedded representation.
+        :returns: dictionary with sub-entity data.
+        """
+        if hasattr(sub_entity, "target"):
+            return self._marshal_embedded_link(sub_entity)
+
+        if isinstance(sub_entity, RawEmbeddedRepresentation):
+            return RawEmbeddedRepresentationMarshaler(sub_entity).marshal()
+
+        return self._marshal_embedded_representation(sub_entity)
+
+
+def _is_inherited(component_class, attribute, core_class):
+    """Check if the class uses the attribute of the core class.
+
+    :param component_class: class of components.
+    :param attribute: name of the attribute.
+    :param core_class: core class that defines the attribute.
+    :returns: True if the attribute is not redefined in the class.
+    """
+    if not issubclass(component_class, core_class):
+        return False
+
+    return getattr(component_class, attribute) is getattr(core_class, attribute)
+
+
+def _strings(values):
+    """Convert values to a list of strings.
+
+    :param values: iterable with values.
+    :returns: list of strings.
+    """
+    return [str(value) for value in values]
+
+
+def _optional_string(value):
+    """Convert a value to a string unless it is None.
+
+    :param value: value to convert.
+    :returns: string or None.
+    """
+    if value is None:
+        return None
+
+    return str(value)
+
+
+def _input_type(input_type):
+    """Get string value of the input type.
+
+    :param input_type: input type of a field.
+    :returns: string value of the input type.
+    """
+    return InputType(str(input_type)).value
+
+
+def _method(method):
+    """Get string value of the method.
+
+    :param method: method of an action.
+    :returns: string value of the method.
+    """
+    return Method(str(method)).value
+
+
+def _copy(properties):
+    """Copy properties.
+
+    :param properties: JSON serializable properties.
+    :returns: copy of the properties.
+    """
+    return json.loads(json.dumps(properties, default=load_raw_json))
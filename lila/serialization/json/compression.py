@@ -0,0 +1,216 @@
+"""Module with zlib compression of Siren documents with a preset dictionary.
+
+Small documents don't repeat their vocabulary, so generic compression gains little on them. A
+preset dictionary provides the vocabulary in advance. The default dictionary contains keys and
+common values of Siren, a dictionary tuned for particular entities can be trained from samples::
+
+    from lila.serialization.json.compression import CompressedCodec, Compressor, train_dictionary
+
+    dictionary = train_dictionary(marshaler.marshal_entity_bytes(entity) for entity in samples)
+    codec = CompressedCodec(compressor=Compressor(dictionary))
+
+    marshaler = JSONMarshaler(codec=codec)
+    parser = JSONParser(codec=codec)
+
+The same dictionary must be used to compress and decompress data.
+"""
+
+import re
+import zlib
+import collections
+
+from lila.serialization.json.codec import Codec, create_default_codec
+
+
+DEFAULT_DICTIONARY_SIZE = 16 * 1024
+DEFAULT_LEVEL = 6
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_MIN_FREQUENCY = 2
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+# The most frequent content is placed at the end to be the closest to compressed data.
+DEFAULT_DICTIONARY = b"".join((
+    b'"method":"POST","method":"PUT","method":"DELETE","method":"PATCH",',
+    b'"type":"application/x-www-form-urlencoded","type":"application/json",',
+    b'"type":"number","type":"hidden","type":"text","value":null,',
+    b'"rel":["next"],"rel":["prev"],"rel":["first"],"rel":["last"],"rel":["collection"],',
+    b'"rel":["item"],"fields":[{"name":"',
+    b'"actions":[{"name":"',
+    b'"entities":[{"rel":["item"],"class":[],"href":"',
+    b'"title":null,"type":null}],"actions":[],"title":null}',
+    b'{"class":[],"properties":{},"entities":[],"links":[{"rel":["self"],"class":[],"href":"',
+    ))
+
+_TOKEN_PATTERN = re.compile(br'"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|[{}\[\]:,]+|\w+')
+_MAX_NGRAM = 4
+
+
+class Compressor:
+    """Class to compress data with zlib and a preset dictionary.
+
+    :param dictionary: bytes with the preset dictionary.
+    :param level: level of compression from 0 to 9.
+    :param max_size: maximum size of decompressed data in bytes.
+    """
+
+    def __init__(
+            self,
+            dictionary=DEFAULT_DICTIONARY,
+            level=DEFAULT_LEVEL,
+            max_size=DEFAULT_MAX_SIZE,
+        ):
+        dictionary = bytes(dictionary)
+        if len(dictionary) > MAX_DICTIONARY_SIZE:
+            raise ValueError("Dictionary is larger than {0} bytes".format(MAX_DICTIONARY_SIZE))
+
+        level = int(level)
+        if not 0 <= level <= 9:
+            raise ValueError("Level of compression must be from 0 to 9")
+
+        max_size = int(max_size)
+        if max_size <= 0:
+            raise ValueError("Maximum size of decompressed data must be positive")
+
+        self._dictionary = dictionary
+        self._level = level
+        self._max_size = max_size
+
+    @property
+    def dictionary(self):
+        """Bytes with the preset dictionary."""
+        return self._dictionary
+
+    def compress(self, data):
+        """Compress data.
+
+        :param data: bytes to compress.
+        :returns: bytes with compressed data in zlib format.
+        """
+        compressor = zlib.compressobj(self._level, zdict=self._dictionary)
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, compressed_data):
+        """Decompress data.
+
+        :param compressed_data: bytes with compressed data in zlib format.
+        :returns: bytes with decompressed data.
+        :raises: :class:ValueError if data are invalid, compressed with another dictionary or
+            larger than the maximum size.
+        """
+        max_size = self._max_size
+        decompressor = zlib.decompressobj(zdict=self._dictionary)
+        try:
+            # Output is limited, so that a small bomb can't exhaust the memory.
+            data = decompressor.decompress(compressed_data, max_size + 1)
+            if len(data) <= max_size and not decompressor.unconsumed_tail:
+                data += decompressor.flush()
+        except (TypeError, zlib.error) as error:
+            raise ValueError("Failed to decompress data") from error
+
+        if len(data) > max_size or decompressor.unconsumed_tail:
+            raise ValueError("Decompressed data are larger than {0} bytes".format(max_size))
+
+        if not decompressor.eof or decompressor.unused_data:
+            raise ValueError("Failed to decompress data")
+
+        return data
+
+
+class CompressedCodec(Codec):
+    """Codec that compresses data encoded by another codec.
+
+    The codec can be passed to :class:`JSONMarshaler
+    <lila.serialization.json.marshaler.JSONMarshaler>` and :class:`JSONParser
+    <lila.serialization.json.parser.JSONParser>`, so that their byte-level methods produce and
+    consume compressed documents. Compressed documents are not JSON, so the codec is not suitable
+    for templates and NDJSON.
+
+    :param codec: optional codec to encode data before compression. The default codec is used
+        if it's not passed.
+    :param compressor: optional :class:`Compressor`. A compressor with the default dictionary is
+        used if it's not passed.
+    """
+
+    name = "compressed"
+
+    def __init__(self, codec=None, compressor=None):
+        if codec is None:
+            codec = create_default_codec()
+
+        if compressor is None:
+            compressor = Compressor()
+
+        self._codec = codec
+        self._compressor = compressor
+
+    def encode(self, data):
+        """Encode JSON data and compress it.
+
+        :param data: JSON serializable data.
+        :returns: bytes with compressed data.
+        :raises: :class:ValueError.
+        """
+        return self._compressor.compress(self._codec.encode(data))
+
+    def decode(self, encoded_data):
+        """Decompress data and decode JSON data.
+
+        :param encoded_data: bytes with compressed data.
+        :returns: decoded data.
+        :raises: :class:ValueError.
+        """
+        return self._codec.decode(self._compressor.decompress(encoded_data))
+
+
+def train_dictionary(
+        samples,
+        size=DEFAULT_DICTIONARY_SIZE,
+        min_frequency=DEFAULT_MIN_FREQUENCY,
+    ):
+    """Train a preset dictionary from sample documents.
+
+    Documents are split into JSON tokens. Sequences of up to 4 tokens, which occur in at least
+    ``min_frequency`` samples, are scored by the number of samples and their length. The best
+    sequences are put into the dictionary, the most valuable ones at its end.
+
+    :param samples: iterable with bytes of sample documents, e.g. marshaled entities.
+    :param size: maximal size of the dictionary in bytes.
+    :param min_frequency: minimal number of samples that contain a sequence.
+    :returns: bytes with the dictionary.
+    :raises: :class:ValueError.
+    """
+    size = int(size)
+    if not 0 < size <= MAX_DICTIONARY_SIZE:
+        raise ValueError("Size of a dictionary must be from 1 to {0}".format(MAX_DICTIONARY_SIZE))
+
+    frequencies = collections.Counter()
+    for sample in samples:
+        tokens = _TOKEN_PATTERN.findall(bytes(sample))
+        sequences = set()
+        for length in range(1, _MAX_NGRAM + 1):
+            for start in range(len(tokens) - length + 1):
+                sequences.add(b"".join(tokens[start:start + length]))
+        frequencies.update(sequences)
+
+    candidates = sorted(
+        (
+            (frequency * len(sequence), sequence)
+            for sequence, frequency in frequencies.items()
+            if frequency >= min_frequency and len(sequence) > 2
+            ),
+        reverse=True,
+        )
+
+    selected_sequences = []
+    total_size = 0
+    for _, sequence in candidates:
+        if total_size + len(sequence) > size:
+            continue
+
+        if any(sequence in selected_sequence for selected_sequence in selected_sequences):
+            continue
+
+        selected_sequences.append(sequence)
+        total_size += len(sequence)
+
+    return b"".join(reversed(selected_sequences))
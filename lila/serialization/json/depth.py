@@ -0,0 +1,127 @@
+"""Module to limit the depth of embedded representations of marshaled entities.
+
+Embedded representations, which are nested deeper than the limit, are replaced with embedded
+links to their self links. Sub-entities of the replaced representations are not visited.
+"""
+
+from lila.core.link import EmbeddedLink
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+from lila.serialization import tracing
+
+
+def limit_depth(entity, max_depth):
+    """Create an entity-like view with embedded representations limited by depth.
+
+    :param entity: Siren entity.
+    :param max_depth: number of levels of embedded representations to keep. Representations of
+        the entity itself are replaced with embedded links if it's 0.
+    :returns: object with the same attributes as the entity.
+    :raises: :class:ValueError.
+    """
+    max_depth = int(max_depth)
+    if max_depth < 0:
+        raise ValueError("Depth of embedded representations must not be negative")
+
+    return _DepthLimitedEntity(entity, max_depth)
+
+
+def collapse_representation(embedded_representation):
+    """Create an embedded link to the self link of an embedded representation.
+
+    :param embedded_representation: Siren embedded representation.
+    :returns: :class:`EmbeddedLink <lila.core.link.EmbeddedLink>` with relations, classes and
+        title of the representation.
+    :raises: :class:ValueError.
+    """
+    if tracing.enabled:
+        tracing.debug(
+            __name__,
+            "Try to collapse an embedded representation '%s'",
+            embedded_representation,
+            )
+
+    try:
+        self_links = [
+            link for link in embedded_representation.links if "self" in link.relations
+            ]
+    except Exception as error:
+        tracing.error(__name__, "Failed to get links of the embedded representation")
+        raise ValueError("Failed to get links of the embedded representation") from error
+
+    if not self_links:
+        tracing.error(__name__, "Embedded representation has no self link")
+        raise ValueError("Embedded representation has no self link")
+
+    self_link = self_links[0]
+    try:
+        embedded_link = EmbeddedLink(
+            relations=embedded_representation.relations,
+            target=self_link.target,
+            classes=embedded_representation.classes,
+            title=embedded_representation.title,
+            target_media_type=self_link.target_media_type,
+            )
+    except Exception as error:
+        tracing.error(__name__, "Failed to collapse an embedded representation")
+        raise ValueError("Failed to collapse an embedded representation") from error
+
+    if tracing.enabled:
+        tracing.info(__name__, "Successfully collapsed an embedded representation")
+    return embedded_link
+
+
+class _DepthLimitedEntity:
+    """Entity-like view with embedded representations limited by depth."""
+
+    def __init__(self, entity, max_depth):
+        self._entity = entity
+        self._max_depth = max_depth
+
+    @property
+    def classes(self):
+        """Classes of the entity."""
+        return self._entity.classes
+
+    @property
+    def properties(self):
+        """Properties of the entity."""
+        return self._entity.properties
+
+    @property
+    def entities(self):
+        """Sub-entities of the entity with embedded representations limited by depth."""
+        max_depth = self._max_depth
+        for sub_entity in self._entity.entities:
+            if hasattr(sub_entity, "target"):
+                yield sub_entity
+            elif max_depth == 0:
+                yield collapse_representation(sub_entity)
+            elif isinstance(sub_entity, RawEmbeddedRepresentation):
+                # Pre-serialized data are embedded as they are.
+                yield sub_entity
+            else:
+                yield _DepthLimitedEmbeddedRepresentation(sub_entity, max_depth - 1)
+
+    @property
+    def links(self):
+        """Links of the entity."""
+        return self._entity.links
+
+    @property
+    def actions(self):
+        """Actions of the entity."""
+        return self._entity.actions
+
+    @property
+    def title(self):
+        """Title of the entity."""
+        return self._entity.title
+
+
+class _DepthLimitedEmbeddedRepresentation(_DepthLimitedEntity):
+    """Representation-like view with nested representations limited by depth."""
+
+    @property
+    def relations(self):
+        """Relations of the embedded representation."""
+        return self._entity.relations
@@ -0,0 +1,115 @@
+"""Module with engine to parse and marshal nested components without recursion.
+
+Parsing or marshaling of a component that contains other components of arbitrary depth, e.g. an
+embedded representation, is written as a generator of steps. When a nested component has to be
+processed, the generator yields the steps of the nested component and gets back its result.
+If the nested component fails, its error is thrown into the generator at the same place, so
+errors are wrapped in the same way as with nested calls.
+
+The steps are run with an explicit stack, so the depth of nesting is limited by memory only and
+doesn't depend on the recursion limit of Python.
+"""
+
+
+def runs_steps(steps_name):
+    """Create a decorator for a method, which only runs the steps returned by another method.
+
+    The method can be overridden in a subclass or replaced in an instance. In that case
+    :func:`get_steps` doesn't return the steps and the overriding method is called.
+
+    :param steps_name: name of the method that returns the steps.
+    :returns: decorator.
+    """
+    def _decorate(method):
+        method.steps_name = steps_name
+        return method
+
+    return _decorate
+
+
+def get_steps(obj, method_name, *args):
+    """Get the steps of the method of the object.
+
+    :param obj: object with the method.
+    :param method_name: name of the method.
+    :param args: arguments of the method.
+    :returns: generator with the steps or None if the method doesn't run the steps.
+    """
+    # Attributes of the function are available through the bound method.
+    method = getattr(obj, method_name, None)
+    steps_name = getattr(method, "steps_name", None)
+    if not isinstance(steps_name, str):
+        return None
+
+    return getattr(obj, steps_name)(*args)
+
+
+def call(obj, method_name, *args):
+    """Call the method of the same component as a step.
+
+    The steps of the method are delegated to with ``yield from`` if the method runs them,
+    otherwise the method is called directly. The function is used with ``yield from`` too.
+
+    :param obj: object with the method.
+    :param method_name: name of the method.
+    :param args: arguments of the method.
+    :returns: generator that returns the result of the method.
+    """
+    steps = get_steps(obj, method_name, *args)
+    if steps is None:
+        return getattr(obj, method_name)(*args)
+
+    return (yield from steps)
+
+
+def call_nested(obj, method_name, *args):
+    """Call the method of a nested component as a step.
+
+    The steps of the method are passed to the engine if the method runs them, so that they are
+    put onto the stack, otherwise the method is called directly. The function is used with
+    ``yield from``.
+
+    :param obj: object with the method.
+    :param method_name: name of the method.
+    :param args: arguments of the method.
+    :returns: generator that returns the result of the method.
+    """
+    steps = get_steps(obj, method_name, *args)
+    if steps is None:
+        return getattr(obj, method_name)(*args)
+
+    return (yield steps)
+
+
+def run(steps):
+    """Run the steps and the steps of all nested components.
+
+    :param steps: generator with the steps.
+    :returns: result of the steps.
+    :raises: the error of the steps.
+    """
+    # pylint: disable=broad-except
+    stack = [steps]
+    result = None
+    error = None
+    while stack:
+        steps = stack[-1]
+        try:
+            if error is None:
+                nested_steps = steps.send(result)
+            else:
+                nested_steps = steps.throw(error)
+        except StopIteration as stop:
+            stack.pop()
+            result, error = stop.value, None
+        except Exception as steps_error:
+            stack.pop()
+            result, error = None, steps_error
+        else:
+            stack.append(nested_steps)
+            result, error = None, None
+
+    if error is not None:
+        raise error
+
+    return result
@@ -1,9 +1,11 @@
 """Module with default marshaler for an entity."""
 
-import logging
 import json
 
 from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.core.raw import load_raw_json
+from lila.serialization.json import engine
+from lila.serialization import tracing
 
 
 class EntityMarshaler:
@@ -13,25 +15,34 @@ class EntityMarshaler:
         self._entity = entity
         self._marshaler = marshaler
 
+    @engine.runs_steps("marshal_steps")
     def marshal(self):
         """Marshal the entity.
 
         :returns: dictionary with entity data.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an entity")
+        return engine.run(self.marshal_steps())
+
+    def marshal_steps(self):
+        """Get steps to marshal the entity.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an entity")
 
         entity_data = {
             "class": self.marshal_classes(),
             "properties": self.marshal_properties(),
-            "entities": self.marshal_entities(),
+            "entities": (yield from engine.call(self, "marshal_entities")),
             "links": self.marshal_links(),
             "actions": self.marshal_actions(),
             "title": self.marshal_title(),
             }
 
-        logger.info("Successfully marshaled an entity")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an entity")
         return entity_data
 
     def marshal_classes(self):
@@ -40,16 +51,17 @@ class EntityMarshaler:
         :returns: list with string names of entity's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         entity = self._entity
         try:
             classes = list(str(class_) for class_ in entity.classes)
         except AttributeError as error:
-            logger.error("Failed to get entity's classes")
+            tracing.error(__name__, "Failed to get entity's classes")
             raise ValueError("Failed to get entity's classes") from error
         except TypeError as error:
-            logger.error("Failed to marshal an entity: failed to iterate over entity's classes")
+            tracing.error(
+                __name__,
+                "Failed to marshal an entity: failed to iterate over entity's classes",
+                )
             raise ValueError("Failed to iterate over entity's classes") from error
 
         return classes
@@ -60,47 +72,50 @@ class EntityMarshaler:
         :returns: JSON serializable object with entity's properties.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         entity = self._entity
         try:
-            properties = json.loads(json.dumps(entity.properties))
+            properties = json.loads(json.dumps(entity.properties, default=load_raw_json))
         except AttributeError as error:
-            logger.error("Failed to get entity's")
+            tracing.error(__name__, "Failed to get entity's")
             raise ValueError("Failed to get entity's properties") from error
         except TypeError as error:
-            logger.error("Failed to marshal entity's properties")
+            tracing.error(__name__, "Failed to marshal entity's properties")
             raise ValueError("Failed to marshal entity's properties") from error
 
         return properties
 
+    @engine.runs_steps("marshal_entities_steps")
     def marshal_entities(self):
         """Marshal entity's sub-entities.
 
         :returns: list with marshaled data of entity's sub-entities.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
+        return engine.run(self.marshal_entities_steps())
+
+    def marshal_entities_steps(self):
+        """Get steps to marshal sub-entities of the entity.
 
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
         entity = self._entity
         try:
             entity_sub_entities = list(entity.entities)
         except AttributeError as error:
-            logger.error("Failed to get sub-entities of the entity")
+            tracing.error(__name__, "Failed to get sub-entities of the entity")
             raise ValueError("Failed to get sub-entities of the entity") from error
         except TypeError as error:
-            logger.error("Failed to iterate over sub-entities of the entity")
+            tracing.error(__name__, "Failed to iterate over sub-entities of the entity")
             raise ValueError("Failed to iterate over sub-entities of the entity") from error
 
         marshaler = self._marshaler
-        marshal_sub_entity = lambda sub_entity: _marshal_sub_entity(sub_entity, marshaler)
 
         marshaled_sub_entities = []
         for sub_entity in entity_sub_entities:
             try:
-                sub_entity_data = marshal_sub_entity(sub_entity)
+                sub_entity_data = yield from _marshal_sub_entity(sub_entity, marshaler)
             except Exception as error:
-                logger.error("Failed to marshal sub-entities of the entity")
+                tracing.error(__name__, "Failed to marshal sub-entities of the entity")
                 raise ValueError("Failed to marshal sub-entities of the entity") from error
 
             marshaled_sub_entities.append(sub_entity_data)
@@ -113,16 +128,14 @@ class EntityMarshaler:
         :returns: list with marshaled data of entity's links.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         entity = self._entity
         try:
             entity_links = list(entity.links)
         except AttributeError as error:
-            logger.error("Failed to get entity's links")
+            tracing.error(__name__, "Failed to get entity's links")
             raise ValueError("Failed to get entity's links") from error
         except TypeError as error:
-            logger.error("Failed to iterate over entity's links")
+            tracing.error(__name__, "Failed to iterate over entity's links")
             raise ValueError("Failed to iterate over entity's links") from error
 
         marshal_link = self._marshaler.marshal_link
@@ -132,7 +145,7 @@ class EntityMarshaler:
             try:
                 link_data = marshal_link(link)
             except Exception as error:
-                logger.error("Failed to marshal entity's links")
+                tracing.error(__name__, "Failed to marshal entity's links")
                 raise ValueError("Failed to marshal entity's links") from error
 
             marshaled_links.append(link_data)
@@ -145,16 +158,14 @@ class EntityMarshaler:
         :returns: list with marshaled data of entity's actions.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         entity = self._entity
         try:
             entity_actions = list(entity.actions)
         except AttributeError as error:
-            logger.error("Failed to get entity's actions")
+            tracing.error(__name__, "Failed to get entity's actions")
             raise ValueError("Failed to get entity's actions") from error
         except TypeError as error:
-            logger.error("Failed to iterate over entity's actions")
+            tracing.error(__name__, "Failed to iterate over entity's actions")
             raise ValueError("Failed to iterate over entity's actions") from error
 
         marshal_action = self._marshaler.marshal_action
@@ -163,7 +174,7 @@ class EntityMarshaler:
             try:
                 action_data = marshal_action(action)
             except Exception as error:
-                logger.error("Failed to marshal entity's actions")
+                tracing.error(__name__, "Failed to marshal entity's actions")
                 raise ValueError("Failed to marshal entity's actions") from error
 
             marshaled_actions.append(action_data)
@@ -180,7 +191,7 @@ class EntityMarshaler:
         try:
             title = entity.title
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get entity's title")
+            tracing.error(__name__, "Failed to get entity's title")
             raise ValueError("Failed to get entity's title") from error
 
         if title is not None:
@@ -196,26 +207,35 @@ class EmbeddedRepresentationMarshaler:
         self._embedded_representation = embedded_representation
         self._marshaler = marshaler
 
+    @engine.runs_steps("marshal_steps")
     def marshal(self):
         """Marshal the embedded representation.
 
         :returns: dictionary with entity data.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an embeddded representation")
+        return engine.run(self.marshal_steps())
+
+    def marshal_steps(self):
+        """Get steps to marshal the embedded representation.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an embeddded representation")
 
         representation_data = {
             "rel": self.marshal_relations(),
             "class": self.marshal_classes(),
             "properties": self.marshal_properties(),
-            "entities": self.marshal_entities(),
+            "entities": (yield from engine.call(self, "marshal_entities")),
             "links": self.marshal_links(),
             "actions": self.marshal_actions(),
             "title": self.marshal_title(),
             }
 
-        logger.info("Successfully marshaled an embedded representation")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an embedded representation")
         return representation_data
 
     def marshal_relations(self):
@@ -224,16 +244,17 @@ class EmbeddedRepresentationMarshaler:
         :returns: list of string relations of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_representation = self._embedded_representation
         try:
             relations = list(str(relation) for relation in embedded_representation.relations)
         except AttributeError as error:
-            logger.error("Failed to get relations of the embedded representation")
+            tracing.error(__name__, "Failed to get relations of the embedded representation")
             raise ValueError("Failed to get relations of the embedded representation") from error
         except TypeError as error:
-            logger.error("Failed to iterate over relations of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to iterate over relations of the embedded representation",
+                )
             raise ValueError(
                 "Failed to iterate over relations of the embedded representation",
                 ) from error
@@ -246,16 +267,14 @@ class EmbeddedRepresentationMarshaler:
         :returns: list with string names of classes of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_representation = self._embedded_representation
         try:
             classes = list(str(class_) for class_ in embedded_representation.classes)
         except AttributeError as error:
-            logger.error("Failed to get classes of the embedded representation")
+            tracing.error(__name__, "Failed to get classes of the embedded representation")
             raise ValueError("Failed to get classes of the embedded representation") from error
         except TypeError as error:
-            logger.error("Failed to iterate over classes of the embedded representation")
+            tracing.error(__name__, "Failed to iterate over classes of the embedded representation")
             raise ValueError(
                 "Failed to iterate over classes of the embedded representation",
                 ) from error
@@ -268,51 +287,62 @@ class EmbeddedRepresentationMarshaler:
         :returns: JSON serializable object with properties of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_representation = self._embedded_representation
         try:
-            properties = json.loads(json.dumps(embedded_representation.properties))
+            properties = json.loads(
+                json.dumps(embedded_representation.properties, default=load_raw_json),
+                )
         except AttributeError as error:
-            logger.error("Failed to get properties of the embedded representation")
+            tracing.error(__name__, "Failed to get properties of the embedded representation")
             raise ValueError("Failed to get properties of the embedded representation") from error
         except TypeError as error:
-            logger.error("Failed to marshal properties of the embedded representation")
+            tracing.error(__name__, "Failed to marshal properties of the embedded representation")
             raise ValueError(
                 "Failed to marshal properties of the embedded representation",
                 ) from error
 
         return properties
 
+    @engine.runs_steps("marshal_entities_steps")
     def marshal_entities(self):
         """Marshal sub-entities of the embedded representation.
 
         :returns: list with marshaled data of sub-entities of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
+        return engine.run(self.marshal_entities_steps())
 
+    def marshal_entities_steps(self):
+        """Get steps to marshal sub-entities of the embedded representation.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
         embedded_representation = self._embedded_representation
         try:
             representation_sub_entities = list(embedded_representation.entities)
         except AttributeError as error:
-            logger.error("Failed to get sub-entities of the embedded representation")
+            tracing.error(__name__, "Failed to get sub-entities of the embedded representation")
             raise ValueError("Failed to get sub-entities of the embedded representation") from error
         except TypeError as error:
-            logger.error("Failed to iterate over sub-entities of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to iterate over sub-entities of the embedded representation",
+                )
             raise ValueError(
                 "Failed to iterate over sub-entities of the embedded representation",
                 ) from error
 
         marshaler = self._marshaler
-        marshal_sub_entity = lambda sub_entity: _marshal_sub_entity(sub_entity, marshaler)
 
         marshaled_sub_entities = []
         for sub_entity in representation_sub_entities:
             try:
-                sub_entity_data = marshal_sub_entity(sub_entity)
+                sub_entity_data = yield from _marshal_sub_entity(sub_entity, marshaler)
             except Exception as error:
-                logger.error("Failed to marshal sub-entities of the embedded representation")
+                tracing.error(
+                    __name__,
+                    "Failed to marshal sub-entities of the embedded representation",
+                    )
                 raise ValueError(
                     "Failed to marshal sub-entities of the embedded representation",
                     ) from error
@@ -327,16 +357,14 @@ class EmbeddedRepresentationMarshaler:
         :returns: list with marshaled data of links of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_representation = self._embedded_representation
         try:
             representation_links = list(embedded_representation.links)
         except AttributeError as error:
-            logger.error("Failed to get links of the embedded representation")
+            tracing.error(__name__, "Failed to get links of the embedded representation")
             raise ValueError("Failed to get links of the embedded representation") from error
         except TypeError as error:
-            logger.error("Failed to iterate over links of the embedded representation")
+            tracing.error(__name__, "Failed to iterate over links of the embedded representation")
             raise ValueError(
                 "Failed to iterate over links of the embedded representation",
                 ) from error
@@ -348,7 +376,7 @@ class EmbeddedRepresentationMarshaler:
             try:
                 link_data = marshal_link(link)
             except Exception as error:
-                logger.error("Failed to marshal links of the embedded representation")
+                tracing.error(__name__, "Failed to marshal links of the embedded representation")
                 raise ValueError(
                     "Failed to marshal links of the embedded representation",
                     ) from error
@@ -363,16 +391,14 @@ class EmbeddedRepresentationMarshaler:
         :returns: list with marshaled data of actions of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_representation = self._embedded_representation
         try:
             representation_actions = list(embedded_representation.actions)
         except AttributeError as error:
-            logger.error("Failed to get actions of the embedded representation")
+            tracing.error(__name__, "Failed to get actions of the embedded representation")
             raise ValueError("Failed to get actions of the embedded representation") from error
         except TypeError as error:
-            logger.error("Failed to iterate over actions of the embedded representation")
+            tracing.error(__name__, "Failed to iterate over actions of the embedded representation")
             raise ValueError(
                 "Failed to iterate over actions of the embedded representation",
                 ) from error
@@ -384,7 +410,7 @@ class EmbeddedRepresentationMarshaler:
             try:
                 action_data = marshal_action(action)
             except Exception as error:
-                logger.error("Failed to marshal actions of the embedded representation")
+                tracing.error(__name__, "Failed to marshal actions of the embedded representation")
                 raise ValueError(
                     "Failed to marshal actions of the embedded representation",
                     ) from error
@@ -403,7 +429,7 @@ class EmbeddedRepresentationMarshaler:
         try:
             title = embedded_representation.title
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get title of the embedded representation")
+            tracing.error(__name__, "Failed to get title of the embedded representation")
             raise ValueError("Failed to get title of the embedded representation") from error
 
         if title is not None:
@@ -419,18 +445,26 @@ class EntityParser:
         self._data = data
         self._parser = parser
 
+    @engine.runs_steps("parse_steps")
     def parse(self):
         """Parse the entity.
 
         :returns: :class:`Entity <lila.core.entity.Entity>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an entity")
+        return engine.run(self.parse_steps())
+
+    def parse_steps(self):
+        """Get steps to parse the entity.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an entity")
 
         entity_classes = self.parse_classes()
         entity_properties = self.parse_properties()
-        entity_entities = self.parse_entities()
+        entity_entities = yield from engine.call(self, "parse_entities")
         entity_links = self.parse_links()
         entity_actions = self.parse_actions()
         entity_title = self.parse_title()
@@ -445,10 +479,11 @@ class EntityParser:
                 title=entity_title,
                 )
         except Exception as error:
-            logger.error("Failed to create an entity with provided data")
+            tracing.error(__name__, "Failed to create an entity with provided data")
             raise ValueError("Failed to create an entity with provided data") from error
         else:
-            logger.info("Successfully parsed an entity")
+            if tracing.enabled:
+                tracing.info(__name__, "Successfully parsed an entity")
 
         return entity
 
@@ -458,12 +493,10 @@ class EntityParser:
         :returns: list with string names of entity's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             entity_classes = self._data["class"]
         except TypeError as error:
-            logger.error("Failed to get classes from entity data")
+            tracing.error(__name__, "Failed to get classes from entity data")
             raise ValueError("Failed to get classes from entity data") from error
         except KeyError:
             entity_classes = ()
@@ -471,7 +504,7 @@ class EntityParser:
         try:
             entity_classes = tuple(str(class_) for class_ in entity_classes)
         except TypeError as error:
-            logger.error("Failed to iterate over classes from entity data")
+            tracing.error(__name__, "Failed to iterate over classes from entity data")
             raise ValueError("Failed to iterate over classes from entity data") from error
 
         return entity_classes
@@ -482,12 +515,10 @@ class EntityParser:
         :returns: JSON object with entity's properties.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             entity_properties = self._data["properties"]
         except TypeError as error:
-            logger.error("Failed to get properties from entity data")
+            tracing.error(__name__, "Failed to get properties from entity data")
             raise ValueError("Failed to get properties from entity data") from error
         except KeyError:
             entity_properties = {}
@@ -495,23 +526,29 @@ class EntityParser:
         try:
             entity_properties = json.loads(json.dumps(entity_properties))
         except TypeError as error:
-            logger.error("Failed to parse entity's properties")
+            tracing.error(__name__, "Failed to parse entity's properties")
             raise ValueError("Failed to parse entity's properties") from error
 
         return entity_properties
 
+    @engine.runs_steps("parse_entities_steps")
     def parse_entities(self):
         """Parse entity's sub-entities.
 
         :returns: list with parsed entity's sub-entities.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
+        return engine.run(self.parse_entities_steps())
 
+    def parse_entities_steps(self):
+        """Get steps to parse sub-entities of the entity.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
         try:
             entity_sub_entities_data = self._data["entities"]
         except TypeError as error:
-            logger.error("Failed to get sub-entities data from entity data")
+            tracing.error(__name__, "Failed to get sub-entities data from entity data")
             raise ValueError("Failed to get sub-entities data from entity data") from error
         except KeyError:
             entity_sub_entities_data = ()
@@ -519,18 +556,17 @@ class EntityParser:
         try:
             entity_sub_entities_data = list(entity_sub_entities_data)
         except TypeError as error:
-            logger.error("Failed to iterate over sub-entities data from entity data")
+            tracing.error(__name__, "Failed to iterate over sub-entities data from entity data")
             raise ValueError("Failed to iterate over sub-entities data from entity data") from error
 
         parser = self._parser
-        parse_sub_entity = lambda data: _parse_sub_entity(data, parser)
 
         entity_sub_entities = []
         for data in entity_sub_entities_data:
             try:
-                sub_entity = parse_sub_entity(data)
+                sub_entity = yield from _parse_sub_entity(data, parser)
             except Exception as error:
-                logger.error("Failed to parse entity's sub-entities")
+                tracing.error(__name__, "Failed to parse entity's sub-entities")
                 raise ValueError("Failed to parse entity's sub-entities") from error
 
             entity_sub_entities.append(sub_entity)
@@ -543,12 +579,10 @@ class EntityParser:
         :returns: list with parsed entity's links.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             entity_links_data = self._data["links"]
         except TypeError as error:
-            logger.error("Failed to get links data from entity data")
+            tracing.error(__name__, "Failed to get links data from entity data")
             raise ValueError("Failed to get links data from entity data") from error
         except KeyError:
             entity_links_data = ()
@@ -556,7 +590,7 @@ class EntityParser:
         try:
             entity_links_data = list(entity_links_data)
         except TypeError as error:
-            logger.error("Failed to iterate over links data from entity data")
+            tracing.error(__name__, "Failed to iterate over links data from entity data")
             raise ValueError("Failed to iterate over links data from entity data") from error
 
         parse_link = self._parser.parse_link
@@ -566,7 +600,7 @@ class EntityParser:
             try:
                 link = parse_link(data)
             except Exception as error:
-                logger.error("Failed to parse entity's links")
+                tracing.error(__name__, "Failed to parse entity's links")
                 raise ValueError("Failed to parse entity's links") from error
 
             entity_links.append(link)
@@ -579,12 +613,10 @@ class EntityParser:
         :returns: list with parsed entity's actions.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             entity_actions_data = self._data["actions"]
         except TypeError as error:
-            logger.error("Failed to get actions data from entity data")
+            tracing.error(__name__, "Failed to get actions data from entity data")
             raise ValueError("Failed to get actions data from entity data") from error
         except KeyError:
             entity_actions_data = ()
@@ -592,7 +624,7 @@ class EntityParser:
         try:
             entity_actions_data = list(entity_actions_data)
         except TypeError as error:
-            logger.error("Failed to iterate over actions data from entity data")
+            tracing.error(__name__, "Failed to iterate over actions data from entity data")
             raise ValueError("Failed to iterate over actions data from entity data") from error
 
         parse_action = self._parser.parse_action
@@ -602,7 +634,7 @@ class EntityParser:
             try:
                 action = parse_action(data)
             except Exception as error:
-                logger.error("Failed to parse entity's actions")
+                tracing.error(__name__, "Failed to parse entity's actions")
                 raise ValueError("Failed to parse entity's actions") from error
 
             entity_actions.append(action)
@@ -615,12 +647,10 @@ class EntityParser:
         :returns: string title of the entity or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             entity_title = self._data["title"]
         except TypeError as error:
-            logger.error("Failed to get title from entity data")
+            tracing.error(__name__, "Failed to get title from entity data")
             raise ValueError("Failed to get title from entity data") from error
         except KeyError:
             entity_title = None
@@ -638,19 +668,27 @@ class EmbeddedRepresentationParser:
         self._data = data
         self._parser = parser
 
+    @engine.runs_steps("parse_steps")
     def parse(self):
         """Parse the embedded representation.
 
         :returns: :class:`EmbeddedRepresentation <lila.core.entity.EmbeddedRepresentation>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an embedded representation")
+        return engine.run(self.parse_steps())
+
+    def parse_steps(self):
+        """Get steps to parse the embedded representation.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an embedded representation")
 
         representation_relations = self.parse_relations()
         representation_classes = self.parse_classes()
         representation_properties = self.parse_properties()
-        representation_entities = self.parse_entities()
+        representation_entities = yield from engine.call(self, "parse_entities")
         representation_links = self.parse_links()
         representation_actions = self.parse_actions()
         representation_title = self.parse_title()
@@ -666,12 +704,16 @@ class EmbeddedRepresentationParser:
                 title=representation_title,
                 )
         except Exception as error:
-            logger.error("Failed to create an embedded representation with provided data")
+            tracing.error(
+                __name__,
+                "Failed to create an embedded representation with provided data",
+                )
             raise ValueError(
                 "Failed to create an embedded representation with provided data",
                 ) from error
         else:
-            logger.info("Successfully parsed an embedded representation")
+            if tracing.enabled:
+                tracing.info(__name__, "Successfully parsed an embedded representation")
 
         return representation
 
@@ -681,17 +723,21 @@ class EmbeddedRepresentationParser:
         :returns: list of string relations of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             representation_relations = self._data["rel"]
         except TypeError as error:
-            logger.error("Failed to get relations from data of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to get relations from data of the embedded representation",
+                )
             raise ValueError(
                 "Failed to get relations from data of the embedded representation",
                 ) from error
         except KeyError as error:
-            logger.error("Data of the embedded representation do not have required 'rel' key")
+            tracing.error(
+                __name__,
+                "Data of the embedded representation do not have required 'rel' key",
+                )
             raise ValueError(
                 "Data of the embedded representation do not have required 'rel' key",
                 ) from error
@@ -699,7 +745,8 @@ class EmbeddedRepresentationParser:
         try:
             representation_relations = tuple(str(relation) for relation in representation_relations)
         except TypeError as error:
-            logger.error(
+            tracing.error(
+                __name__,
                 "Failed to iterate over relations from data of the embedded representation",
                 )
             raise ValueError(
@@ -714,12 +761,13 @@ class EmbeddedRepresentationParser:
         :returns: list with string names of classes of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             representation_classes = self._data["class"]
         except TypeError as error:
-            logger.error("Failed to get classes from data of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to get classes from data of the embedded representation",
+                )
             raise ValueError(
                 "Failed to get classes from data of the embedded representation",
                 ) from error
@@ -729,7 +777,10 @@ class EmbeddedRepresentationParser:
         try:
             representation_classes = tuple(str(class_) for class_ in representation_classes)
         except TypeError as error:
-            logger.error("Failed to iterate over classes from data of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to iterate over classes from data of the embedded representation",
+                )
             raise ValueError(
                 "Failed to iterate over classes from data of the embedded representation",
                 ) from error
@@ -742,12 +793,13 @@ class EmbeddedRepresentationParser:
         :returns: JSON object with properties of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             representation_properties = self._data["properties"]
         except TypeError as error:
-            logger.error("Failed to get properties from data of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to get properties from data of the embedded representation",
+                )
             raise ValueError(
                 "Failed to get properties from data of the embedded representation",
                 ) from error
@@ -757,23 +809,32 @@ class EmbeddedRepresentationParser:
         try:
             representation_properties = json.loads(json.dumps(representation_properties))
         except TypeError as error:
-            logger.error("Failed to parse properties of the embedded representation")
+            tracing.error(__name__, "Failed to parse properties of the embedded representation")
             raise ValueError("Failed to parse properties of the embedded representation") from error
 
         return representation_properties
 
+    @engine.runs_steps("parse_entities_steps")
     def parse_entities(self):
         """Parse sub-entities of the embedded representation.
 
         :returns: list with parsed sub-entities of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
+        return engine.run(self.parse_entities_steps())
 
+    def parse_entities_steps(self):
+        """Get steps to parse sub-entities of the embedded representation.
+
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
         try:
             representation_sub_entities_data = self._data["entities"]
         except TypeError as error:
-            logger.error("Failed to get sub-entities data from data of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to get sub-entities data from data of the embedded representation",
+                )
             raise ValueError(
                 "Failed to get sub-entities data from data of the embedded representation",
                 ) from error
@@ -783,7 +844,8 @@ class EmbeddedRepresentationParser:
         try:
             representation_sub_entities_data = list(representation_sub_entities_data)
         except TypeError as error:
-            logger.error(
+            tracing.error(
+                __name__,
                 "Failed to iterate over sub-entities data from data of the embedded representation",
                 )
             raise ValueError(
@@ -791,14 +853,16 @@ class EmbeddedRepresentationParser:
                 ) from error
 
         parser = self._parser
-        parse_sub_entity = lambda data: _parse_sub_entity(data, parser)
 
         representation_sub_entities = []
         for data in representation_sub_entities_data:
             try:
-                sub_entity = parse_sub_entity(data)
+                sub_entity = yield from _parse_sub_entity(data, parser)
             except Exception as error:
-                logger.error("Failed to parse sub-entities of the embedded representation")
+                tracing.error(
+                    __name__,
+                    "Failed to parse sub-entities of the embedded representation",
+                    )
                 raise ValueError(
                     "Failed to parse sub-entities of the embedded representation",
                     ) from error
@@ -813,12 +877,13 @@ class EmbeddedRepresentationParser:
         :returns: list with parsed links of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             representation_links_data = self._data["links"]
         except TypeError as error:
-            logger.error("Failed to get links data from data of the embedded representation")
+            tracing.error(
+                __name__,
+                "Failed to get links data from data of the embedded representation",
+                )
             raise ValueError(
                 "Failed to get links data from data of the embedded representation",
                 ) from error
@@ -828,7 +893,8 @@ class EmbeddedRepresentationParser:
         try:
             representation_links_data = list(representation_links_data)
         except TypeError as error:
-            logger.error(
+            tracing.error(
+                __name__,
                 "Failed to iterate over links data from data of the embedded representation",
                 )
             raise ValueError(
@@ -842,7 +908,7 @@ class EmbeddedRepresentationParser:
             try:
                 link = parse_link(data)
             except Exception as error:
-                logger.error("Failed to parse links of the embedded representation")
+                tracing.error(__name__, "Failed to parse links of the embedded representation")
                 raise ValueError("Failed to parse links of the embedded representation") from error
 
             representation_links.append(link)
@@ -855,12 +921,11 @@ class EmbeddedRepresentationParser:
         :returns: list with parsed actions of the embedded representation.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             representation_actions_data = self._data["actions"]
         except TypeError as error:
-            logger.error(
+            tracing.error(
+                __name__,
                 "Failed to get actions data from data of the embedded representation",
                 )
             raise ValueError(
@@ -872,7 +937,8 @@ class EmbeddedRepresentationParser:
         try:
             representation_actions_data = list(representation_actions_data)
         except TypeError as error:
-            logger.error(
+            tracing.error(
+                __name__,
                 "Failed to iterate over actions data from data of the embedded representation",
                 )
             raise ValueError(
@@ -886,7 +952,7 @@ class EmbeddedRepresentationParser:
             try:
                 action = parse_action(data)
             except Exception as error:
-                logger.error("Failed to parse actions of the embedded representation")
+                tracing.error(__name__, "Failed to parse actions of the embedded representation")
                 raise ValueError(
                     "Failed to parse actions of the embedded representation",
                     ) from error
@@ -901,12 +967,10 @@ class EmbeddedRepresentationParser:
         :returns: string title of the embedded representation or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             representation_title = self._data["title"]
         except TypeError as error:
-            logger.error("Failed to get title from data of the embedded representation")
+            tracing.error(__name__, "Failed to get title from data of the embedded representation")
             raise ValueError(
                 "Failed to get title from data of the embedded representation",
                 ) from error
@@ -920,40 +984,48 @@ class EmbeddedRepresentationParser:
 
 
 def _marshal_sub_entity(sub_entity, marshaler):
-    """Marshal the sub-entity.
+    """Get steps to marshal the sub-entity.
 
     :param sub_entity: either embedded link or embedded representation.
     :param marshaler: marshaller for the Siren entities.
-    :returns: dictionary with sub-entity data.
+    :returns: generator with steps, which returns dictionary with sub-entity data.
     :raises: :class:ValueError.
     """
-    logger = logging.getLogger(__name__)
-
     if hasattr(sub_entity, "target"):
-        logger.debug("Marshal sub-entity as an embedded link")
+        if tracing.enabled:
+            tracing.debug(__name__, "Marshal sub-entity as an embedded link")
         marshaled_sub_entity = marshaler.marshal_embedded_link(sub_entity)
     else:
-        logger.debug("Marshal sub-entity as an embedded representation")
-        marshaled_sub_entity = marshaler.marshal_embedded_representation(sub_entity)
+        if tracing.enabled:
+            tracing.debug(__name__, "Marshal sub-entity as an embedded representation")
+        marshaled_sub_entity = yield from engine.call_nested(
+            marshaler,
+            "marshal_embedded_representation",
+            sub_entity,
+            )
 
     return marshaled_sub_entity
 
 
 def _parse_sub_entity(data, parser):
-    """Parse the sub-entity.
+    """Get steps to parse the sub-entity.
 
     :param data: dictionary with sub-entity data.
     :param parser: parser of the Siren entities.
-    :returns: parsed sub-entity.
+    :returns: generator with steps, which returns parsed sub-entity.
     :raises: :class:ValueError.
     """
-    logger = logging.getLogger(__name__)
-
     if "href" in data:
-        logger.debug("Parse data as for an embedded representation")
+        if tracing.enabled:
+            tracing.debug(__name__, "Parse data as for an embedded representation")
         parsed_sub_entity = parser.parse_embedded_link(data)
     else:
-        logger.debug("Parse data as for an embedded link")
-        parsed_sub_entity = parser.parse_embedded_representation(data)
+        if tracing.enabled:
+            tracing.debug(__name__, "Parse data as for an embedded link")
+        parsed_sub_entity = yield from engine.call_nested(
+            parser,
+            "parse_embedded_representation",
+            data,
+            )
 
     return parsed_sub_entity
@@ -1,8 +1,7 @@
 """Module with default marshaler and parser for a field."""
 
-import logging
-
 from lila.core.field import Field, InputType
+from lila.serialization import tracing
 
 
 class FieldMarshaler:
@@ -16,8 +15,8 @@ class FieldMarshaler:
 
         :returns: dictionary with field data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal a field")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal a field")
 
         field_data = {
             "name": self.marshal_name(),
@@ -27,7 +26,8 @@ class FieldMarshaler:
             "title": self.marshal_title(),
             }
 
-        logger.info("Successfully marshaled a field")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled a field")
         return field_data
 
     def marshal_name(self):
@@ -40,7 +40,7 @@ class FieldMarshaler:
         try:
             name = field.name
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get field's name")
+            tracing.error(__name__, "Failed to get field's name")
             raise ValueError("Failed to get field's name") from error
 
         return str(name)
@@ -51,16 +51,14 @@ class FieldMarshaler:
         :returns: list with string names of field's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         field = self._field
         try:
             classes = list(str(class_) for class_ in field.classes)
         except AttributeError as error:
-            logger.error("Failed to get field's classes")
+            tracing.error(__name__, "Failed to get field's classes")
             raise ValueError("Failed to get field's classes") from error
         except TypeError as error:
-            logger.error("Failed to iterate over field's classes")
+            tracing.error(__name__, "Failed to iterate over field's classes")
             raise ValueError("Failed to iterate over field's classes") from error
 
         return classes
@@ -71,19 +69,17 @@ class FieldMarshaler:
         :returns: string value of field's input type.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         field = self._field
         try:
             input_type = str(field.input_type)
         except AttributeError as error:
-            logger.error("Failed to get field's input type")
+            tracing.error(__name__, "Failed to get field's input type")
             raise ValueError("Failed to get field's input type") from error
 
         try:
             input_type = InputType(input_type)
         except ValueError as error:
-            logger.error("Field's input type is not supported")
+            tracing.error(__name__, "Field's input type is not supported")
             raise ValueError("Field's input type is not supported") from error
 
         return input_type.value
@@ -98,7 +94,7 @@ class FieldMarshaler:
         try:
             value = field.value
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get field's value")
+            tracing.error(__name__, "Failed to get field's value")
             raise ValueError("Failed to get field's value") from error
 
         if value is not None:
@@ -116,7 +112,7 @@ class FieldMarshaler:
         try:
             title = field.title
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get field's title")
+            tracing.error(__name__, "Failed to get field's title")
             raise ValueError("Failed to get field's title") from error
 
         if title is not None:
@@ -137,8 +133,8 @@ class FieldParser:
         :returns: :class:`Field <lila.core.field.Field>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse a field")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse a field")
 
         field_name = self.parse_name()
         field_classes = self.parse_classes()
@@ -155,10 +151,11 @@ class FieldParser:
                 title=field_title,
                 )
         except Exception as error:
-            logger.error("Failed to create a field with provided data")
+            tracing.error(__name__, "Failed to create a field with provided data")
             raise ValueError("Failed to create a field with provided data") from error
         else:
-            logger.info("Successfully parsed a field")
+            if tracing.enabled:
+                tracing.info(__name__, "Successfully parsed a field")
 
         return field
 
@@ -168,15 +165,13 @@ class FieldParser:
         :returns: string name of the field.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             field_name = self._data["name"]
         except TypeError as error:
-            logger.error("Failed to get name from field data")
+            tracing.error(__name__, "Failed to get name from field data")
             raise ValueError("Failed to get name from field data") from error
         except KeyError as error:
-            logger.error("Field data do not have required 'name' key")
+            tracing.error(__name__, "Field data do not have required 'name' key")
             raise ValueError("Field data do not have required 'name' key") from error
 
         return str(field_name)
@@ -187,12 +182,10 @@ class FieldParser:
         :returns: list with string names of field's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             field_classes = self._data["class"]
         except TypeError as error:
-            logger.error("Failed to get classes from field data")
+            tracing.error(__name__, "Failed to get classes from field data")
             raise ValueError("Failed to get classes from field data") from error
         except KeyError:
             field_classes = ()
@@ -200,7 +193,7 @@ class FieldParser:
         try:
             field_classes = tuple(str(class_) for class_ in field_classes)
         except TypeError as error:
-            logger.error("Failed to iterate over classes from field data")
+            tracing.error(__name__, "Failed to iterate over classes from field data")
             raise ValueError("Failed to iterate over classes from field data") from error
 
         return field_classes
@@ -211,12 +204,10 @@ class FieldParser:
         :returns: :class:`InputType <lila.core.field.InputType>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             field_input_type = self._data["type"]
         except TypeError as error:
-            logger.error("Failed to get input type from field data")
+            tracing.error(__name__, "Failed to get input type from field data")
             raise ValueError("Failed to get input type from field data") from error
         except KeyError:
             field_input_type = InputType.TEXT.value
@@ -224,7 +215,7 @@ class FieldParser:
         try:
             field_input_type = InputType(field_input_type)
         except ValueError as error:
-            logger.error("Field data contain not supported input type")
+            tracing.error(__name__, "Field data contain not supported input type")
             raise ValueError("Field data contain not supported input type") from error
 
         return field_input_type
@@ -235,12 +226,10 @@ class FieldParser:
         :returns: string value or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             field_value = self._data["value"]
         except TypeError as error:
-            logger.error("Failed to get value from field data")
+            tracing.error(__name__, "Failed to get value from field data")
             raise ValueError("Failed to get value from field data") from error
         except KeyError:
             field_value = None
@@ -256,12 +245,10 @@ class FieldParser:
         :returns: string title of the field or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             field_title = self._data["title"]
         except TypeError as error:
-            logger.error("Failed to get title from field data")
+            tracing.error(__name__, "Failed to get title from field data")
             raise ValueError("Failed to get title from field data") from error
         except KeyError:
             field_title = None
@@ -0,0 +1,102 @@
+"""Module with embedded representation built from a pre-serialized JSON fragment."""
+
+from lila.core.entity import EmbeddedRepresentation
+from lila.core.raw import RawJSON
+from lila.serialization.json.parser import JSONParser
+from lila.serialization import tracing
+
+
+class RawEmbeddedRepresentation(EmbeddedRepresentation):
+    """Class for an embedded representation with pre-serialized JSON data.
+
+    The fragment is embedded verbatim into output of :class:`JSONStreamMarshaler
+    <lila.serialization.json.stream.JSONStreamMarshaler>`, other JSON marshalers decode it
+    without creating Siren objects. Attributes of the representation are parsed from the fragment
+    on the first access.
+
+    The fragment is passed as a string or UTF-8 bytes. It's parsed right away if validate flag
+    is set, so that invalid fragments are rejected on creation. An optional :class:`JSONParser
+    <lila.serialization.json.parser.JSONParser>` can be passed to parse the fragment.
+    """
+
+    # pylint: disable=super-init-not-called
+    _PARSED_ATTRIBUTES = frozenset((
+        "_relations",
+        "_classes",
+        "_title",
+        "_properties",
+        "_entities",
+        "_links",
+        "_actions",
+        ))
+
+    def __init__(self, fragment, validate=False, parser=None):
+        self._raw = RawJSON(fragment)
+        self._parser = parser
+
+        if validate:
+            self._parse()
+
+    @property
+    def fragment(self):
+        """String with JSON data of the embedded representation."""
+        return self._raw.document
+
+    def load(self):
+        """Decode the fragment.
+
+        :returns: dictionary with data of the embedded representation.
+        :raises: :class:ValueError.
+        """
+        return self._raw.load()
+
+    def _parse(self):
+        """Parse the fragment and set attributes of the embedded representation.
+
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Parse a fragment of an embedded representation")
+
+        parser = self._parser
+        if parser is None:
+            parser = JSONParser()
+
+        embedded_representation = parser.parse_embedded_representation(self.load())
+        for name in self._PARSED_ATTRIBUTES:
+            setattr(self, name, getattr(embedded_representation, name))
+
+    def __getattr__(self, name):
+        # The method is called only if the attribute is not set yet.
+        if name not in self._PARSED_ATTRIBUTES:
+            raise AttributeError(name)
+
+        self._parse()
+        return object.__getattribute__(self, name)
+
+
+class RawEmbeddedRepresentationMarshaler:
+    """Class to marshal an embedded representation with pre-serialized JSON data."""
+
+    def __init__(self, embedded_representation):
+        self._embedded_representation = embedded_representation
+
+    def marshal(self):
+        """Marshal the embedded representation.
+
+        :returns: dictionary with decoded data of the fragment.
+        :raises: :class:ValueError.
+        """
+        try:
+            data = self._embedded_representation.load()
+        except ValueError as error:
+            tracing.error(__name__, "Failed to decode the fragment of the embedded representation")
+            raise ValueError(
+                "Failed to decode the fragment of the embedded representation",
+                ) from error
+
+        if not isinstance(data, dict):
+            tracing.error(__name__, "Fragment of the embedded representation is not an object")
+            raise ValueError("Fragment of the embedded representation is not an object")
+
+        return data
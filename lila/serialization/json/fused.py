@@ -0,0 +1,275 @@
+"""Module with JSON parser that builds Siren entities from decoded data in a single pass.
+
+:class:`JSONParser <lila.serialization.json.parser.JSONParser>` parses each member of each
+component with a separate method and then passes the parsed values to the constructors of core
+classes, which validate them once again. The parser of this module walks decoded data once and
+creates core objects directly, since the data have already been checked while they were walked.
+
+Data, which need any of the rarely used conversions of the regular parser, e.g. classes passed
+as a string or a link without relations, and data nested deeper than the recursion limit are
+parsed by the regular parser, so the results and errors are always the same.
+"""
+
+from lila.core.field import Field, InputType
+from lila.core.action import Action, Method
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.parser import JSONParser
+from lila.serialization import tracing
+
+
+_INPUT_TYPES = {input_type.value: input_type for input_type in InputType}
+_METHODS = {method.value: method for method in Method}
+
+_DEFAULT_MEDIA_TYPE = "application/x-www-form-urlencoded"
+
+
+class FusedJSONParser(JSONParser):
+    """Class to parse Siren entities from JSON bytes in a single pass.
+
+    Only :meth:`parse_entity_bytes` is optimized, other methods are inherited from
+    :class:`JSONParser <lila.serialization.json.parser.JSONParser>`. Factory methods of the
+    parser are not used by the single pass.
+    """
+
+    def parse_entity_bytes(self, encoded_data):
+        """Parse Siren entity from JSON bytes with the codec of the parser.
+
+        :param encoded_data: bytes with serialized entity.
+        :returns: parsed entity.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to decode entity data with codec '%s'", self._codec.name)
+
+        try:
+            data = self._codec.decode(encoded_data)
+        except Exception:
+            tracing.error(__name__, "Failed to decode entity data")
+            raise
+
+        resolve = None
+        if self._url_resolver is not None:
+            resolve = self._url_resolver.resolve
+
+        # Decoded data are not shared with anyone, so objects of properties are reused.
+        # The single pass is recursive, deeply nested data are parsed by the regular parser.
+        try:
+            entity = _build_entity(data, resolve)
+        except (_Fallback, RecursionError):
+            if tracing.enabled:
+                tracing.debug(__name__, "Parse entity data with the regular parser")
+            return self.parse_entity(data)
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed an entity in a single pass")
+        return entity
+
+
+class _Fallback(Exception):
+    """Exception to pass the data to the regular parser."""
+
+
+def _get_strings(data, key):
+    """Get a tuple of strings from the data.
+
+    :param data: dictionary with component data.
+    :param key: key of the list with strings.
+    :returns: tuple with strings.
+    :raises: :class:`_Fallback` if the value is not a list.
+    """
+    if key not in data:
+        return ()
+
+    values = data[key]
+    if values.__class__ is not list:
+        raise _Fallback()
+
+    return tuple(str(value) for value in values)
+
+
+def _get_optional_string(data, key):
+    """Get an optional string from the data.
+
+    :param data: dictionary with component data.
+    :param key: key of the value.
+    :returns: string or None.
+    """
+    value = data.get(key)
+    if value is not None:
+        value = str(value)
+
+    return value
+
+
+def _get_target(data, resolve):
+    """Get the target from the data.
+
+    :param data: dictionary with data of a link, an embedded link or an action.
+    :param resolve: optional function to resolve the target against the base URL.
+    :returns: string target.
+    :raises: :class:`_Fallback` if the target is missing.
+    """
+    if "href" not in data:
+        raise _Fallback()
+
+    target = str(data["href"])
+    if resolve is not None:
+        target = resolve(target)
+
+    return target
+
+
+def _get_list(data, key):
+    """Get a list of component data from the data.
+
+    :param data: dictionary with component data.
+    :param key: key of the list.
+    :returns: list with dictionaries.
+    :raises: :class:`_Fallback` if the value is not a list of dictionaries.
+    """
+    values = data.get(key, [])
+    if values.__class__ is not list:
+        raise _Fallback()
+
+    for value in values:
+        if value.__class__ is not dict:
+            raise _Fallback()
+
+    return values
+
+
+def _build_field(data):
+    """Create a field from the data.
+
+    :param data: dictionary with field data.
+    :returns: :class:`Field <lila.core.field.Field>`.
+    :raises: :class:`_Fallback`.
+    """
+    # pylint: disable=protected-access
+    if "name" not in data:
+        raise _Fallback()
+
+    input_type = data.get("type", InputType.TEXT.value)
+    if input_type.__class__ is not str or input_type not in _INPUT_TYPES:
+        raise _Fallback()
+
+    field = Field.__new__(Field)
+    field._name = str(data["name"])
+    field._classes = _get_strings(data, "class")
+    field._input_type = _INPUT_TYPES[input_type]
+    field._value = _get_optional_string(data, "value")
+    field._title = _get_optional_string(data, "title")
+    return field
+
+
+def _build_action(data, resolve):
+    """Create an action from the data.
+
+    :param data: dictionary with action data.
+    :param resolve: optional function to resolve the target against the base URL.
+    :returns: :class:`Action <lila.core.action.Action>`.
+    :raises: :class:`_Fallback`.
+    """
+    # pylint: disable=protected-access
+    if "name" not in data:
+        raise _Fallback()
+
+    method = data.get("method", Method.GET.value)
+    if method.__class__ is not str or method not in _METHODS:
+        raise _Fallback()
+
+    fields = tuple(_build_field(field_data) for field_data in _get_list(data, "fields"))
+    if len(set(field._name for field in fields)) != len(fields):
+        raise _Fallback()
+
+    media_type = _get_optional_string(data, "type")
+    if media_type is None and fields:
+        media_type = _DEFAULT_MEDIA_TYPE
+
+    action = Action.__new__(Action)
+    action._name = str(data["name"])
+    action._classes = _get_strings(data, "class")
+    action._method = _METHODS[method]
+    action._target = _get_target(data, resolve)
+    action._title = _get_optional_string(data, "title")
+    action._media_type = media_type
+    action._fields = fields
+    return action
+
+
+def _build_link(data, resolve, link_class=Link):
+    """Create a link or an embedded link from the data.
+
+    :param data: dictionary with data of the link.
+    :param resolve: optional function to resolve the target against the base URL.
+    :param link_class: :class:`Link <lila.core.link.Link>` or :class:`EmbeddedLink
+        <lila.core.link.EmbeddedLink>`.
+    :returns: created link.
+    :raises: :class:`_Fallback`.
+    """
+    # pylint: disable=protected-access
+    if "rel" not in data:
+        raise _Fallback()
+
+    relations = _get_strings(data, "rel")
+    if not relations and link_class is EmbeddedLink:
+        raise _Fallback()
+
+    link = link_class.__new__(link_class)
+    link._relations = relations
+    link._classes = _get_strings(data, "class")
+    link._target = _get_target(data, resolve)
+    link._title = _get_optional_string(data, "title")
+    link._target_media_type = _get_optional_string(data, "type")
+    return link
+
+
+def _build_entity(data, resolve, entity_class=Entity):
+    """Create an entity or an embedded representation from the data.
+
+    :param data: dictionary with data of the entity.
+    :param resolve: optional function to resolve targets against the base URL.
+    :param entity_class: :class:`Entity <lila.core.entity.Entity>` or
+        :class:`EmbeddedRepresentation <lila.core.entity.EmbeddedRepresentation>`.
+    :returns: created entity.
+    :raises: :class:`_Fallback`.
+    """
+    # pylint: disable=protected-access
+    if data.__class__ is not dict:
+        raise _Fallback()
+
+    entity = entity_class.__new__(entity_class)
+    if entity_class is EmbeddedRepresentation:
+        if "rel" not in data:
+            raise _Fallback()
+
+        entity._relations = _get_strings(data, "rel")
+        if not entity._relations:
+            raise _Fallback()
+
+    properties = data.get("properties", {})
+    if properties.__class__ is not dict:
+        raise _Fallback()
+
+    actions = tuple(
+        _build_action(action_data, resolve) for action_data in _get_list(data, "actions")
+        )
+    if len(set(action._name for action in actions)) != len(actions):
+        raise _Fallback()
+
+    sub_entities = []
+    for sub_entity_data in _get_list(data, "entities"):
+        if "href" in sub_entity_data:
+            sub_entity = _build_link(sub_entity_data, resolve, EmbeddedLink)
+        else:
+            sub_entity = _build_entity(sub_entity_data, resolve, EmbeddedRepresentation)
+        sub_entities.append(sub_entity)
+
+    entity._classes = _get_strings(data, "class")
+    entity._properties = properties
+    entity._entities = tuple(sub_entities)
+    entity._links = tuple(_build_link(link_data, resolve) for link_data in _get_list(data, "links"))
+    entity._actions = actions
+    entity._title = _get_optional_string(data, "title")
+    return entity
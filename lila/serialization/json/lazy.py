@@ -0,0 +1,210 @@
+"""Module with entities that parse their members on the first access.
+
+A lazy entity parses its classes and title at once. Properties, sub-entities, links and actions
+are parsed when they are accessed for the first time and the parsed values are cached, so
+members that are never accessed are never parsed::
+
+    entity = JSONParser().parse_entity_lazily(data)
+    next_link = next(link for link in entity.links if "next" in link.relations)
+
+Errors of a member are raised on its first access with the same messages as by
+:class:`JSONParser <lila.serialization.json.parser.JSONParser>`. Embedded representations are
+lazy as well. Data of a lazy entity must not be changed while the entity is used.
+"""
+
+import lila.core.common as common
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.entity import EntityParser, EmbeddedRepresentationParser
+from lila.serialization import tracing
+
+
+def parse_entity(parser, data):
+    """Parse Siren entity lazily.
+
+    :param parser: JSON parser to parse links, actions and sub-entities.
+    :param data: serialized entity.
+    :returns: :class:`LazyEntity`.
+    :raises: :class:ValueError.
+    """
+    return LazyEntity(data=data, parser=parser)
+
+
+def _lazy_member(name, parse):
+    """Create a property that parses the member on the first access.
+
+    :param name: name of the member.
+    :param parse: function to parse the member of the lazy entity.
+    :returns: property with the parsed member.
+    """
+    def _get_member(self):
+        members = self._members     # pylint: disable=protected-access
+        if name not in members:
+            members[name] = parse(self)
+
+        return members[name]
+
+    return property(_get_member)
+
+
+def _parse_properties(entity):
+    """Parse properties of the lazy entity.
+
+    :param entity: lazy entity.
+    :returns: dictionary with properties.
+    :raises: :class:ValueError.
+    """
+    # pylint: disable=protected-access
+    properties = entity._entity_parser.parse_properties()
+    try:
+        properties = common.adjust_properties(properties)
+    except Exception as error:
+        entity._raise_creation_error(error)
+
+    return properties
+
+
+def _parse_entities(entity):
+    """Parse sub-entities of the lazy entity.
+
+    :param entity: lazy entity.
+    :returns: tuple with embedded links and lazy embedded representations.
+    :raises: :class:ValueError.
+    """
+    return entity._lazy_entity_parser.parse_entities()  # pylint: disable=protected-access
+
+
+def _parse_links(entity):
+    """Parse links of the lazy entity.
+
+    :param entity: lazy entity.
+    :returns: tuple with links.
+    :raises: :class:ValueError.
+    """
+    return entity._entity_parser.parse_links()  # pylint: disable=protected-access
+
+
+def _parse_actions(entity):
+    """Parse actions of the lazy entity.
+
+    :param entity: lazy entity.
+    :returns: tuple with actions.
+    :raises: :class:ValueError.
+    """
+    actions = entity._entity_parser.parse_actions()     # pylint: disable=protected-access
+    if len(set(action.name for action in actions)) != len(actions):
+        error = ValueError("Some of the actions have the same name")
+        entity._raise_creation_error(error)     # pylint: disable=protected-access
+
+    return actions
+
+
+class LazyEntity(Entity):
+    """Entity that parses its members on the first access.
+
+    :param data: serialized entity.
+    :param parser: JSON parser to parse links, actions and sub-entities.
+    """
+
+    _creation_error_message = "Failed to create an entity with provided data"
+
+    def __init__(self, data, parser):
+        # pylint: disable=super-init-not-called
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an entity lazily")
+
+        self._members = {}
+        self._entity_parser = self._create_entity_parser(data, parser)
+        self._lazy_entity_parser = self._create_entity_parser(data, _LazyParser(parser))
+
+        self._parse_top_level()
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed top level of an entity")
+
+    _properties = _lazy_member("properties", _parse_properties)
+    _entities = _lazy_member("entities", _parse_entities)
+    _links = _lazy_member("links", _parse_links)
+    _actions = _lazy_member("actions", _parse_actions)
+
+    @staticmethod
+    def _create_entity_parser(data, parser):
+        """Create a parser for the data of the entity.
+
+        :param data: serialized entity.
+        :param parser: JSON parser.
+        :returns: :class:`EntityParser <lila.serialization.json.entity.EntityParser>`.
+        """
+        return EntityParser(data=data, parser=parser)
+
+    def _parse_top_level(self):
+        """Parse classes and title of the entity.
+
+        :raises: :class:ValueError.
+        """
+        self._classes = self._entity_parser.parse_classes()
+        self._title = self._entity_parser.parse_title()
+
+    def _raise_creation_error(self, error):
+        """Raise the error of the parser, which failed to create an entity.
+
+        :param error: original error.
+        :raises: :class:ValueError.
+        """
+        tracing.error(__name__, self._creation_error_message)
+        raise ValueError(self._creation_error_message) from error
+
+
+class LazyEmbeddedRepresentation(LazyEntity, EmbeddedRepresentation):
+    """Embedded representation that parses its members on the first access.
+
+    :param data: serialized embedded representation.
+    :param parser: JSON parser to parse links, actions and sub-entities.
+    """
+
+    _creation_error_message = "Failed to create an embedded representation with provided data"
+
+    @staticmethod
+    def _create_entity_parser(data, parser):
+        """Create a parser for the data of the embedded representation.
+
+        :param data: serialized embedded representation.
+        :param parser: JSON parser.
+        :returns: :class:`EmbeddedRepresentationParser
+            <lila.serialization.json.entity.EmbeddedRepresentationParser>`.
+        """
+        return EmbeddedRepresentationParser(data=data, parser=parser)
+
+    def _parse_top_level(self):
+        """Parse relations, classes and title of the embedded representation.
+
+        :raises: :class:ValueError.
+        """
+        self._relations = self._entity_parser.parse_relations()
+        super(LazyEmbeddedRepresentation, self)._parse_top_level()
+
+        if not self._relations:
+            error = ValueError("No relations are passed to create an embedded representation")
+            self._raise_creation_error(error)
+
+
+class _LazyParser:
+    """Parser of sub-entities that parses embedded representations lazily."""
+
+    def __init__(self, parser):
+        self._parser = parser
+
+    def parse_embedded_link(self, data):
+        """Parse embedded link with JSON parser.
+
+        :param data: serialized embedded link.
+        :returns: parsed embedded link.
+        """
+        return self._parser.parse_embedded_link(data)
+
+    def parse_embedded_representation(self, data):
+        """Parse embedded representation lazily.
+
+        :param data: serialized embedded representation.
+        :returns: :class:`LazyEmbeddedRepresentation`.
+        """
+        return LazyEmbeddedRepresentation(data=data, parser=self._parser)
@@ -1,8 +1,7 @@
 """Module with default marshaler and parser for a link and embedded link."""
 
-import logging
-
 from lila.core.link import Link, EmbeddedLink
+from lila.serialization import tracing
 
 
 class LinkMarshaler:
@@ -17,8 +16,8 @@ class LinkMarshaler:
         :returns: dictionary with link data.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal a link")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal a link")
 
         link_data = {
             "rel": self.marshal_relations(),
@@ -28,7 +27,8 @@ class LinkMarshaler:
             "type": self.marshal_target_media_type(),
             }
 
-        logger.info("Successfully marshaled a link")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled a link")
         return link_data
 
     def marshal_relations(self):
@@ -37,16 +37,14 @@ class LinkMarshaler:
         :returns: list of string relations of the link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         link = self._link
         try:
             relations = list(str(relation) for relation in link.relations)
         except AttributeError as error:
-            logger.error("Failed to get link's relations")
+            tracing.error(__name__, "Failed to get link's relations")
             raise ValueError("Failed to get link's relations") from error
         except TypeError as error:
-            logger.error("Failed to iterate over link's relations")
+            tracing.error(__name__, "Failed to iterate over link's relations")
             raise ValueError("Failed to iterate over link's relations") from error
 
         return relations
@@ -57,16 +55,14 @@ class LinkMarshaler:
         :returns: list with string names of link's classes.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         link = self._link
         try:
             classes = list(str(class_) for class_ in link.classes)
         except AttributeError as error:
-            logger.error("Failed to get link's classes")
+            tracing.error(__name__, "Failed to get link's classes")
             raise ValueError("Failed to get link's classes") from error
         except TypeError as error:
-            logger.error("Failed to iterate over link's classes")
+            tracing.error(__name__, "Failed to iterate over link's classes")
             raise ValueError("Failed to iterate over link's classes") from error
 
         return classes
@@ -81,7 +77,7 @@ class LinkMarshaler:
         try:
             target = link.target
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get link's target")
+            tracing.error(__name__, "Failed to get link's target")
             raise ValueError("Failed to get link's target") from error
 
         return str(target)
@@ -96,7 +92,7 @@ class LinkMarshaler:
         try:
             title = link.title
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get link's title")
+            tracing.error(__name__, "Failed to get link's title")
             raise ValueError("Failed to get link's title") from error
 
         if title is not None:
@@ -114,7 +110,7 @@ class LinkMarshaler:
         try:
             target_media_type = link.target_media_type
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get link's target media type")
+            tracing.error(__name__, "Failed to get link's target media type")
             raise ValueError("Failed to get link's target media type") from error
 
         if target_media_type is not None:
@@ -135,8 +131,8 @@ class EmbeddedLinkMarshaler:
         :returns: dictionary with data of the embedded link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an embedded link")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an embedded link")
 
         embedded_link_data = {
             "rel": self.marshal_relations(),
@@ -146,7 +142,8 @@ class EmbeddedLinkMarshaler:
             "type": self.marshal_target_media_type(),
             }
 
-        logger.info("Successfully marshaled an embedded link")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an embedded link")
         return embedded_link_data
 
     def marshal_relations(self):
@@ -155,16 +152,14 @@ class EmbeddedLinkMarshaler:
         :returns: list of string relations of the embedded link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_link = self._embedded_link
         try:
             relations = list(str(relation) for relation in embedded_link.relations)
         except AttributeError as error:
-            logger.error("Failed to get relations of the embedded link")
+            tracing.error(__name__, "Failed to get relations of the embedded link")
             raise ValueError("Failed to get relations of the embedded link") from error
         except TypeError as error:
-            logger.error("Failed to iterate over relations of the embedded link")
+            tracing.error(__name__, "Failed to iterate over relations of the embedded link")
             raise ValueError("Failed to iterate over relations of the embedded link") from error
 
         return relations
@@ -175,16 +170,14 @@ class EmbeddedLinkMarshaler:
         :returns: list with string names of classes of the embedded link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         embedded_link = self._embedded_link
         try:
             classes = list(str(class_) for class_ in embedded_link.classes)
         except AttributeError as error:
-            logger.error("Failed to get classes of the embedded link")
+            tracing.error(__name__, "Failed to get classes of the embedded link")
             raise ValueError("Failed to get classes of the embedded link") from error
         except TypeError as error:
-            logger.error("Failed to iterate over classes of the embedded link")
+            tracing.error(__name__, "Failed to iterate over classes of the embedded link")
             raise ValueError("Failed to iterate over classes of the embedded link") from error
 
         return classes
@@ -199,7 +192,7 @@ class EmbeddedLinkMarshaler:
         try:
             target = embedded_link.target
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get target of the embedded link")
+            tracing.error(__name__, "Failed to get target of the embedded link")
             raise ValueError("Failed to get target of the embedded link") from error
 
         return str(target)
@@ -214,7 +207,7 @@ class EmbeddedLinkMarshaler:
         try:
             title = embedded_link.title
         except AttributeError as error:
-            logging.getLogger(__name__).error("Failed to get title of the embedded link")
+            tracing.error(__name__, "Failed to get title of the embedded link")
             raise ValueError("Failed to get title of the embedded link") from error
 
         if title is not None:
@@ -232,7 +225,8 @@ class EmbeddedLinkMarshaler:
         try:
             target_media_type = embedded_link.target_media_type
         except AttributeError as error:
-            logging.getLogger(__name__).error(
+            tracing.error(
+                __name__,
                 "Failed to get target media type of the embedded link",
                 )
             raise ValueError("Failed to get target media type of the embedded link") from error
@@ -255,8 +249,8 @@ class LinkParser:
         :returns: :class:`Link <lila.core.link.Link>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse a link")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse a link")
 
         link_relations = self.parse_relations()
         link_classes = self.parse_classes()
@@ -273,10 +267,11 @@ class LinkParser:
                 target_media_type=link_target_media_type,
                 )
         except Exception as error:
-            logger.error("Failed to create a link with provided data")
+            tracing.error(__name__, "Failed to create a link with provided data")
             raise ValueError("Failed to create a link with provided data") from error
         else:
-            logger.info("Successfully parsed a link")
+            if tracing.enabled:
+                tracing.info(__name__, "Successfully parsed a link")
 
         return link
 
@@ -286,21 +281,19 @@ class LinkParser:
         :returns: list of string relations of the link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             link_relations = self._data["rel"]
         except TypeError as error:
-            logger.error("Failed to get relations from link data")
+            tracing.error(__name__, "Failed to get relations from link data")
             raise ValueError("Failed to get relations from link data") from error
         except KeyError as error:
-            logger.error("Link data do not have required 'rel' key")
+            tracing.error(__name__, "Link data do not have required 'rel' key")
             raise ValueError("Link data do not have required 'rel' key") from error
 
         try:
             link_relations = tuple(str(relation) for relation in link_relations)
         except TypeError as error:
-            logger.error("Failed to iterate over relations from link data")
+            tracing.error(__name__, "Failed to iterate over relations from link data")
             raise ValueError("Failed to iterate over relations from link data") from error
 
         return link_relations
@@ -310,12 +303,10 @@ class LinkParser:
 
         :returns: list with string names of link's classes.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             link_classes = self._data["class"]
         except TypeError as error:
-            logger.error("Failed to get classes from link data")
+            tracing.error(__name__, "Failed to get classes from link data")
             raise ValueError("Failed to get classes from link data") from error
         except KeyError:
             link_classes = ()
@@ -323,7 +314,7 @@ class LinkParser:
         try:
             link_classes = tuple(str(class_) for class_ in link_classes)
         except TypeError as error:
-            logger.error("Failed to iterate over classes from link data")
+            tracing.error(__name__, "Failed to iterate over classes from link data")
             raise ValueError("Failed to iterate over classes from link data") from error
 
         return link_classes
@@ -334,15 +325,13 @@ class LinkParser:
         :returns: string target of the link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             link_target = self._data["href"]
         except TypeError as error:
-            logger.error("Failed to get target from link data")
+            tracing.error(__name__, "Failed to get target from link data")
             raise ValueError("Failed to get target from link data") from error
         except KeyError as error:
-            logger.error("Link data do not have required 'href' key")
+            tracing.error(__name__, "Link data do not have required 'href' key")
             raise ValueError("Link data do not have required 'href' key") from error
 
         return str(link_target)
@@ -353,12 +342,10 @@ class LinkParser:
         :returns: string title of the link or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             link_title = self._data["title"]
         except TypeError as error:
-            logger.error("Failed to get title from link data")
+            tracing.error(__name__, "Failed to get title from link data")
             raise ValueError("Failed to get title from link data") from error
         except KeyError:
             link_title = None
@@ -374,12 +361,10 @@ class LinkParser:
         :returns: string value of link's target media type or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             link_target_media_type = self._data["type"]
         except TypeError as error:
-            logger.error("Failed to get target media type from link data")
+            tracing.error(__name__, "Failed to get target media type from link data")
             raise ValueError("Failed to get target media type from link data") from error
         except KeyError:
             link_target_media_type = None
@@ -402,8 +387,8 @@ class EmbeddedLinkParser:
         :returns: :class:`EmbeddedLink <lila.core.link.Link>`.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an embedded link")
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an embedded link")
 
         embedded_link_relations = self.parse_relations()
         embedded_link_classes = self.parse_classes()
@@ -420,10 +405,11 @@ class EmbeddedLinkParser:
                 target_media_type=embedded_link_target_media_type,
                 )
         except Exception as error:
-            logger.error("Failed to create an embedded link with provided data")
+            tracing.error(__name__, "Failed to create an embedded link with provided data")
             raise ValueError("Failed to create an embedded link with provided data") from error
         else:
-            logger.info("Successfully parsed an embedded link")
+            if tracing.enabled:
+                tracing.info(__name__, "Successfully parsed an embedded link")
 
         return embedded_link
 
@@ -433,21 +419,22 @@ class EmbeddedLinkParser:
         :returns: list of string relations of the embedded link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             embedded_link_relations = self._data["rel"]
         except TypeError as error:
-            logger.error("Failed to get relations from data of the embedded link")
+            tracing.error(__name__, "Failed to get relations from data of the embedded link")
             raise ValueError("Failed to get relations from data of the embedded link") from error
         except KeyError as error:
-            logger.error("Data of the embedded link do not have required 'rel' key")
+            tracing.error(__name__, "Data of the embedded link do not have required 'rel' key")
             raise ValueError("Data of the embedded link do not have required 'rel' key") from error
 
         try:
             embedded_link_relations = tuple(str(relation) for relation in embedded_link_relations)
         except TypeError as error:
-            logger.error("Failed to iterate over relations from data of the embedded link")
+            tracing.error(
+                __name__,
+                "Failed to iterate over relations from data of the embedded link",
+                )
             raise ValueError(
                 "Failed to iterate over relations from data of the embedded link",
                 ) from error
@@ -459,12 +446,10 @@ class EmbeddedLinkParser:
 
         :returns: list with string names of classes of the embedded link.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             embedded_link_classes = self._data["class"]
         except TypeError as error:
-            logger.error("Failed to get classes from data of the embedded link")
+            tracing.error(__name__, "Failed to get classes from data of the embedded link")
             raise ValueError("Failed to get classes from data of the embedded link") from error
         except KeyError:
             embedded_link_classes = ()
@@ -472,7 +457,7 @@ class EmbeddedLinkParser:
         try:
             embedded_link_classes = tuple(str(class_) for class_ in embedded_link_classes)
         except TypeError as error:
-            logger.error("Failed to iterate over classes from data of the embedded link")
+            tracing.error(__name__, "Failed to iterate over classes from data of the embedded link")
             raise ValueError(
                 "Failed to iterate over classes from data of the embedded link",
                 ) from error
@@ -485,15 +470,13 @@ class EmbeddedLinkParser:
         :returns: string target of the embedded link.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             embedded_link_target = self._data["href"]
         except TypeError as error:
-            logger.error("Failed to get target from data of the embedded link")
+            tracing.error(__name__, "Failed to get target from data of the embedded link")
             raise ValueError("Failed to get target from data of the embedded link") from error
         except KeyError as error:
-            logger.error("Data of the embedded link do not have required 'href' key")
+            tracing.error(__name__, "Data of the embedded link do not have required 'href' key")
             raise ValueError("Data of the embedded link do not have required 'href' key") from error
 
         return str(embedded_link_target)
@@ -504,12 +487,10 @@ class EmbeddedLinkParser:
         :returns: string title of the embedded link or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             embedded_link_title = self._data["title"]
         except TypeError as error:
-            logger.error("Failed to get title from data of the embedded link")
+            tracing.error(__name__, "Failed to get title from data of the embedded link")
             raise ValueError("Failed to get title from data of the embedded link") from error
         except KeyError:
             embedded_link_title = None
@@ -525,12 +506,13 @@ class EmbeddedLinkParser:
         :returns: string value of target media type of the embedded link or None.
         :raises: :class:ValueError.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             embedded_link_target_media_type = self._data["type"]
         except TypeError as error:
-            logger.error("Failed to get target media type from data of the embedded link")
+            tracing.error(
+                __name__,
+                "Failed to get target media type from data of the embedded link",
+                )
             raise ValueError(
                 "Failed to get target media type from data of the embedded link",
                 ) from error
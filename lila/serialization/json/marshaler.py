@@ -1,21 +1,104 @@
 """Module with JSON marshaler for Siren objects."""
 
-import logging
-
 from lila.serialization.marshaler import Marshaler
+from lila.serialization.json import aio, batch, depth, engine, projection
+from lila.serialization.json.codec import CanonicalCodec, create_default_codec
+from lila.serialization.json.compact import compact_data
+from lila.serialization.json.url import URLResolver
 from lila.serialization.json.field import FieldMarshaler
 from lila.serialization.json.action import ActionMarshaler
 from lila.serialization.json.link import LinkMarshaler, EmbeddedLinkMarshaler
 from lila.serialization.json.entity import EntityMarshaler, EmbeddedRepresentationMarshaler
+from lila.serialization.json.fragment import (
+    RawEmbeddedRepresentation,
+    RawEmbeddedRepresentationMarshaler,
+    )
+from lila.serialization import tracing
 
 
 class JSONMarshaler(Marshaler):
-    """Class to marshal Siren objects into JSON."""
+    """Class to marshal Siren objects into JSON.
+
+    Embedded representations of entities, which are nested deeper than the optional embedding
+    depth, are marshaled as embedded links to their self links. Targets of links, embedded links
+    and actions are written relative to the optional base URL.
+
+    Entities are encoded into bytes in canonical form if canonical flag is set, so that the same
+    logical entity is always encoded into the same bytes.
+    """
 
     create_field_marshaler = FieldMarshaler
     create_link_marshaler = LinkMarshaler
     create_embedded_link_marshaler = EmbeddedLinkMarshaler
 
+    def __init__(
+            self,
+            fragment_cache=None,
+            codec=None,
+            compact=False,
+            embedding_depth=None,
+            base_url=None,
+            canonical=False,
+        ):
+        # pylint: disable=too-many-arguments
+        if canonical:
+            if codec is not None:
+                raise ValueError("Codec can't be passed in canonical mode")
+            codec = CanonicalCodec()
+        elif codec is None:
+            codec = create_default_codec()
+
+        if embedding_depth is not None:
+            embedding_depth = int(embedding_depth)
+            if embedding_depth < 0:
+                raise ValueError("Depth of embedded representations must not be negative")
+
+        compact = bool(compact)
+
+        self._fragment_cache = fragment_cache
+        # Cached data of actions contain marshaled fields, which depend on the compact mode.
+        self._cache_namespace = (type(self), compact)
+        self._codec = codec
+        self._compact = compact
+        self._embedding_depth = embedding_depth
+
+        self._url_resolver = None
+        if base_url is not None:
+            self._url_resolver = URLResolver(base_url)
+
+    @property
+    def fragment_cache(self):
+        """Cache for marshaled data of immutable links, embedded links and actions or None."""
+        return self._fragment_cache
+
+    @property
+    def compact(self):
+        """Flag to leave out absent and default members of marshaled components."""
+        return self._compact
+
+    @property
+    def embedding_depth(self):
+        """Number of levels of embedded representations to marshal or None."""
+        return self._embedding_depth
+
+    @property
+    def base_url(self):
+        """Base URL of relative targets or None."""
+        if self._url_resolver is None:
+            return None
+
+        return self._url_resolver.base_url
+
+    @property
+    def canonical(self):
+        """Flag to encode entities in canonical form."""
+        return isinstance(self._codec, CanonicalCodec)
+
+    @property
+    def codec(self):
+        """:class:`Codec <lila.serialization.json.codec.Codec>` to encode marshaled data."""
+        return self._codec
+
     def create_action_marshaler(self, action):
         """Factory method to create a marshaler for an action.
 
@@ -30,6 +113,9 @@ class JSONMarshaler(Marshaler):
         :param entity: Siren entity to marshal.
         :returns: :class:`EntityMarshaler <lila.serialization.json.entity.EntityMarshaler>`.
         """
+        if self._embedding_depth is not None:
+            entity = depth.limit_depth(entity, self._embedding_depth)
+
         return EntityMarshaler(entity=entity, marshaler=self)
 
     def create_embedded_representation_marshaler(self, embedded_representation):
@@ -37,8 +123,14 @@ class JSONMarshaler(Marshaler):
 
         :param embedded_representation: Siren embedded representation to marshal.
         :returns: :class:`EmbeddedRepresentationMarshaler
-            <lila.serialization.json.entity.EmbeddedRepresentationMarshaler>`.
+            <lila.serialization.json.entity.EmbeddedRepresentationMarshaler>` or
+            :class:`RawEmbeddedRepresentationMarshaler
+            <lila.serialization.json.fragment.RawEmbeddedRepresentationMarshaler>` for
+            pre-serialized representations.
         """
+        if isinstance(embedded_representation, RawEmbeddedRepresentation):
+            return RawEmbeddedRepresentationMarshaler(embedded_representation)
+
         return EmbeddedRepresentationMarshaler(
             embedded_representation=embedded_representation,
             marshaler=self,
@@ -50,18 +142,19 @@ class JSONMarshaler(Marshaler):
         :param field: Siren Field.
         :returns: dictionary with field data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal a field '%s'", field)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal a field '%s'", field)
 
         marshaler = self.create_field_marshaler(field)
         try:
             marshaled_field = marshaler.marshal()
         except Exception:
-            logger.error("Failed to marshal a field")
+            tracing.error(__name__, "Failed to marshal a field")
             raise
 
-        logger.info("Successfully marshaled a field")
-        return marshaled_field
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled a field")
+        return self._finalize_data("field", marshaled_field)
 
     def marshal_action(self, action):
         """Marshal Siren action.
@@ -69,18 +162,30 @@ class JSONMarshaler(Marshaler):
         :param action: Siren Action.
         :returns: dictionary with action data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an action '%s'", action)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an action '%s'", action)
+
+        cache = self._fragment_cache
+        if cache is not None:
+            cached_data = cache.lookup(self._cache_namespace, action)
+            if cached_data is not None:
+                if tracing.enabled:
+                    tracing.info(__name__, "Use cached data of an action")
+                return self._finalize_data("action", _copy_data(cached_data))
 
         marshaler = self.create_action_marshaler(action)
         try:
             marshaled_action = marshaler.marshal()
         except Exception:
-            logger.error("Failed to marshal an action")
+            tracing.error(__name__, "Failed to marshal an action")
             raise
 
-        logger.info("Successfully marshaled an action")
-        return marshaled_action
+        if cache is not None:
+            cache.store(self._cache_namespace, action, _copy_data(marshaled_action))
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an action")
+        return self._finalize_data("action", marshaled_action)
 
     def marshal_link(self, link):
         """Marshal Siren link.
@@ -88,18 +193,30 @@ class JSONMarshaler(Marshaler):
         :param link: Siren Link.
         :returns: dictionary with link data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal a link '%s'", link)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal a link '%s'", link)
+
+        cache = self._fragment_cache
+        if cache is not None:
+            cached_data = cache.lookup(self._cache_namespace, link)
+            if cached_data is not None:
+                if tracing.enabled:
+                    tracing.info(__name__, "Use cached data of a link")
+                return self._finalize_data("link", _copy_data(cached_data))
 
         marshaler = self.create_link_marshaler(link)
         try:
             marshaled_link = marshaler.marshal()
         except Exception:
-            logger.error("Failed to marshal a link")
+            tracing.error(__name__, "Failed to marshal a link")
             raise
 
-        logger.info("Successfully marshaled a link")
-        return marshaled_link
+        if cache is not None:
+            cache.store(self._cache_namespace, link, _copy_data(marshaled_link))
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled a link")
+        return self._finalize_data("link", marshaled_link)
 
     def marshal_embedded_link(self, embedded_link):
         """Marshal embedded Siren link.
@@ -107,37 +224,63 @@ class JSONMarshaler(Marshaler):
         :param embedded_link: embedded Siren Link.
         :returns: dictionary with embedded link data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an embedded link '%s'", embedded_link)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an embedded link '%s'", embedded_link)
+
+        cache = self._fragment_cache
+        if cache is not None:
+            cached_data = cache.lookup(self._cache_namespace, embedded_link)
+            if cached_data is not None:
+                if tracing.enabled:
+                    tracing.info(__name__, "Use cached data of an embedded link")
+                return self._finalize_data("embedded_link", _copy_data(cached_data))
 
         marshaler = self.create_embedded_link_marshaler(embedded_link)
         try:
             marshaled_link = marshaler.marshal()
         except Exception:
-            logger.error("Failed to marshal an embedded link")
+            tracing.error(__name__, "Failed to marshal an embedded link")
             raise
 
-        logger.info("Successfully marshaled an embedded link")
-        return marshaled_link
+        if cache is not None:
+            cache.store(self._cache_namespace, embedded_link, _copy_data(marshaled_link))
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an embedded link")
+        return self._finalize_data("embedded_link", marshaled_link)
 
+    @engine.runs_steps("marshal_embedded_representation_steps")
     def marshal_embedded_representation(self, embedded_representation):
         """Marshal Siren embedded representation.
 
         :param embedded_representation: Siren embedded representation.
         :returns: dictionary with embedded representation data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an embedded representation '%s'", embedded_representation)
+        return engine.run(self.marshal_embedded_representation_steps(embedded_representation))
+
+    def marshal_embedded_representation_steps(self, embedded_representation):
+        """Get steps to marshal Siren embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
+        if tracing.enabled:
+            tracing.debug(
+                __name__,
+                "Try to marshal an embedded representation '%s'",
+                embedded_representation,
+                )
 
         marshaler = self.create_embedded_representation_marshaler(embedded_representation)
         try:
-            marshaled_representation = marshaler.marshal()
+            marshaled_representation = yield from engine.call(marshaler, "marshal")
         except Exception:
-            logger.error("Failed to marshal an embedded representation")
+            tracing.error(__name__, "Failed to marshal an embedded representation")
             raise
 
-        logger.info("Successfully marshaled an embedded representation")
-        return marshaled_representation
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an embedded representation")
+        return self._finalize_data("embedded_representation", marshaled_representation)
 
     def marshal_entity(self, entity):
         """Marshal Siren entity.
@@ -145,15 +288,176 @@ class JSONMarshaler(Marshaler):
         :param entity: Siren entity.
         :returns: dictionary with entity data.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to marshal an entity '%s'", entity)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an entity '%s'", entity)
 
         marshaler = self.create_entity_marshaler(entity)
         try:
             marshaled_entity = marshaler.marshal()
         except Exception:
-            logger.error("Failed to marshal an entity")
+            tracing.error(__name__, "Failed to marshal an entity")
             raise
 
-        logger.info("Successfully marshaled an entity")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an entity")
+        return self._finalize_data("entity", marshaled_entity)
+
+    def marshal_entity_bytes(self, entity):
+        """Marshal Siren entity into JSON bytes with the codec of the marshaler.
+
+        :param entity: Siren entity.
+        :returns: bytes with encoded entity data.
+        :raises: :class:ValueError.
+        """
+        marshaled_entity = self.marshal_entity(entity)
+
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to encode entity data with codec '%s'", self._codec.name)
+
+        try:
+            encoded_entity = self._codec.encode(marshaled_entity)
+        except Exception:
+            tracing.error(__name__, "Failed to encode entity data")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully encoded entity data")
+        return encoded_entity
+
+    def marshal_sparse_entity(self, entity, entity_projection):
+        """Marshal only requested parts of Siren entity.
+
+        Members, properties, sub-entities and actions that are not requested by the projection
+        are neither visited nor marshaled.
+
+        :param entity: Siren entity.
+        :param entity_projection: :class:`Projection
+            <lila.serialization.json.projection.Projection>`.
+        :returns: dictionary with data of requested parts of the entity.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal requested parts of an entity '%s'", entity)
+
+        try:
+            marshaled_entity = projection.marshal_entity(
+                marshaler=self,
+                entity=entity,
+                projection=entity_projection,
+                )
+        except Exception:
+            tracing.error(__name__, "Failed to marshal requested parts of an entity")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled requested parts of an entity")
         return marshaled_entity
+
+    async def marshal_entity_async(
+            self,
+            entity,
+            yield_interval=aio.DEFAULT_YIELD_INTERVAL,
+            executor_threshold=None,
+            executor=None,
+        ):
+        """Marshal Siren entity without blocking the event loop.
+
+        Sub-entities, links and actions of the entity are marshaled in chunks and the control is
+        passed back to the loop after each chunk. If the entity has more of them than the
+        threshold, it's marshaled in the executor instead. Entities with custom marshalers are
+        always marshaled in the executor.
+
+        :param entity: Siren entity.
+        :param yield_interval: number of components to marshal before the control is passed
+            back to the loop.
+        :param executor_threshold: optional number of components to marshal the entity in the
+            executor.
+        :param executor: optional :class:`concurrent.futures.Executor`. The default executor of
+            the loop is used if it's not passed.
+        :returns: dictionary with entity data.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an entity '%s' asynchronously", entity)
+
+        try:
+            marshaled_entity = await aio.marshal_entity(
+                marshaler=self,
+                entity=entity,
+                yield_interval=yield_interval,
+                executor_threshold=executor_threshold,
+                executor=executor,
+                )
+        except Exception:
+            tracing.error(__name__, "Failed to marshal an entity asynchronously")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an entity asynchronously")
+        return marshaled_entity
+
+    def _finalize_data(self, kind, data):
+        """Prepare marshaled data of a component to be returned.
+
+        :param kind: kind of the component.
+        :param data: dictionary with marshaled data.
+        :returns: data with the relative target if the base URL is set, compact data if the
+            marshaler is compact, otherwise the same data.
+        """
+        url_resolver = self._url_resolver
+        if url_resolver is not None and kind in _TARGET_KINDS:
+            data = dict(data, href=url_resolver.relativize(data["href"]))
+
+        if self._compact:
+            return compact_data(kind, data)
+
+        return data
+
+    def marshal_many(self, entities, executor=None, chunk_size=batch.DEFAULT_CHUNK_SIZE):
+        """Marshal several Siren entities.
+
+        Entities are split into chunks that are marshaled with the executor. Threads of a thread
+        pool share the marshaler and its fragment cache. A process pool gets a copy of the
+        marshaler with an empty cache, so the marshaler must be picklable; data are sent back
+        from the processes as compact JSON.
+
+        :param entities: iterable with Siren entities.
+        :param executor: optional :class:`concurrent.futures.Executor`. Entities are marshaled
+            in the current thread if it's not passed.
+        :param chunk_size: number of entities to marshal in a single task of the executor.
+        :returns: list with entity data in the same order as entities.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal several entities with executor '%s'", executor)
+
+        try:
+            marshaled_entities = batch.marshal_entities(
+                marshaler=self,
+                entities=entities,
+                executor=executor,
+                chunk_size=chunk_size,
+                )
+        except Exception:
+            tracing.error(__name__, "Failed to marshal several entities")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled %d entities", len(marshaled_entities))
+        return marshaled_entities
+
+
+# Kinds of components with targets.
+_TARGET_KINDS = frozenset(("action", "link", "embedded_link"))
+
+
+def _copy_data(data):
+    """Copy marshaled data.
+
+    :param data: JSON serializable data.
+    :returns: copy of the data that doesn't share dictionaries and lists with the original.
+    """
+    if isinstance(data, dict):
+        return {key: _copy_data(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [_copy_data(value) for value in data]
+
+    return data
@@ -0,0 +1,196 @@
+"""Module with helpers to write and read sequences of Siren entities as NDJSON.
+
+Each entity is encoded into a single line of compact JSON, so a sequence can be written and read
+one entity at a time::
+
+    from lila.serialization.json import ndjson
+
+    with open("export.ndjson", "wb") as stream:
+        ndjson.write_entities(JSONMarshaler(), entities, stream)
+
+    with open("export.ndjson", "rb") as stream:
+        for entity in ndjson.read_entities(JSONParser(), stream, errors=ndjson.ERRORS_SKIP):
+            process(entity)
+
+Lines can be decoded with an executor. Only a limited number of chunks of lines are read ahead,
+so memory usage doesn't depend on the size of the stream.
+"""
+
+import io
+import itertools
+import collections
+
+from lila.serialization import tracing
+
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_MAX_PENDING_CHUNKS = 4
+
+ERRORS_RAISE = "raise"
+ERRORS_SKIP = "skip"
+
+_LINE_SEPARATOR = b"\n"
+
+
+def encode_entities(marshaler, entities):
+    """Encode Siren entities into lines of NDJSON.
+
+    :param marshaler: JSON marshaler.
+    :param entities: iterable with Siren entities.
+    :returns: generator of bytes with encoded lines including line separators.
+    :raises: :class:ValueError.
+    """
+    marshal_entity_bytes = marshaler.marshal_entity_bytes
+    for entity in entities:
+        yield marshal_entity_bytes(entity) + _LINE_SEPARATOR
+
+
+def write_entities(marshaler, entities, stream):
+    """Write Siren entities into a file object as NDJSON.
+
+    :param marshaler: JSON marshaler.
+    :param entities: iterable with Siren entities.
+    :param stream: binary or text file object.
+    :returns: number of written entities.
+    :raises: :class:ValueError.
+    """
+    if tracing.enabled:
+        tracing.debug(__name__, "Try to write entities into a stream '%s'", stream)
+
+    write = stream.write
+    is_text_stream = isinstance(stream, io.TextIOBase)
+
+    count = 0
+    for line in encode_entities(marshaler, entities):
+        if is_text_stream:
+            line = line.decode("utf-8")
+        write(line)
+        count += 1
+
+    if tracing.enabled:
+        tracing.info(__name__, "Successfully wrote %d entities", count)
+    return count
+
+
+def read_entities(
+        parser,
+        stream,
+        errors=ERRORS_RAISE,
+        executor=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        max_pending_chunks=DEFAULT_MAX_PENDING_CHUNKS,
+    ):
+    # pylint: disable=too-many-arguments
+    """Read Siren entities from NDJSON lines.
+
+    Blank lines are ignored.
+
+    :param parser: JSON parser.
+    :param stream: binary or text file object or any iterable with lines.
+    :param errors: policy for lines that can't be parsed: :data:`ERRORS_RAISE` to raise
+        :class:ValueError, :data:`ERRORS_SKIP` to skip the lines or a callable, which is called
+        with the number of the line and the error, before the line is skipped.
+    :param executor: optional :class:`concurrent.futures.Executor` to decode chunks of lines.
+        A process pool gets a copy of the parser, so the parser must be picklable.
+    :param chunk_size: number of lines to decode in a single task of the executor.
+    :param max_pending_chunks: maximal number of chunks submitted to the executor at once.
+    :returns: generator of parsed entities in the same order as lines.
+    :raises: :class:ValueError.
+    """
+    if errors not in (ERRORS_RAISE, ERRORS_SKIP) and not callable(errors):
+        raise ValueError("Unknown policy for errors: '{0}'".format(errors))
+
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ValueError("Size of a chunk must be positive")
+
+    max_pending_chunks = int(max_pending_chunks)
+    if max_pending_chunks <= 0:
+        raise ValueError("Number of pending chunks must be positive")
+
+    numbered_lines = (
+        (line_number, line) for line_number, line in enumerate(stream, start=1) if line.strip()
+        )
+
+    if executor is None:
+        results = (_parse_line(parser, line_number, line) for line_number, line in numbered_lines)
+    else:
+        results = _parse_in_executor(
+            parser,
+            numbered_lines,
+            executor,
+            chunk_size,
+            max_pending_chunks,
+            )
+
+    return _handle_results(results, errors)
+
+
+def _handle_results(results, errors):
+    """Apply the policy for errors to the results of parsing.
+
+    :param results: iterable with tuples of a line number, an entity and an error.
+    :param errors: policy for errors.
+    :returns: generator of parsed entities.
+    :raises: :class:ValueError.
+    """
+    for line_number, entity, error in results:
+        if error is None:
+            yield entity
+        elif errors == ERRORS_RAISE:
+            tracing.error(__name__, "Failed to parse line %d", line_number)
+            raise ValueError("Failed to parse line {0}".format(line_number)) from error
+        elif errors == ERRORS_SKIP:
+            if tracing.enabled:
+                tracing.info(__name__, "Skip invalid line %d", line_number)
+        else:
+            errors(line_number, error)
+
+
+def _parse_line(parser, line_number, line):
+    """Parse a line with an entity.
+
+    :param parser: JSON parser.
+    :param line_number: number of the line.
+    :param line: bytes or string with the line.
+    :returns: tuple with the line number, the parsed entity or None and the error or None.
+    """
+    try:
+        return line_number, parser.parse_entity_bytes(line), None
+    except ValueError as error:
+        return line_number, None, error
+
+
+def _parse_chunk(parser, numbered_lines):
+    """Parse a chunk of lines.
+
+    :param parser: JSON parser.
+    :param numbered_lines: list with tuples of a line number and a line.
+    :returns: list with results of parsing of the lines.
+    """
+    return [_parse_line(parser, line_number, line) for line_number, line in numbered_lines]
+
+
+def _parse_in_executor(parser, numbered_lines, executor, chunk_size, max_pending_chunks):
+    """Parse chunks of lines with the executor.
+
+    :param parser: JSON parser.
+    :param numbered_lines: iterator over tuples of a line number and a line.
+    :param executor: :class:`concurrent.futures.Executor`.
+    :param chunk_size: number of lines in a chunk.
+    :param max_pending_chunks: maximal number of submitted chunks.
+    :returns: generator of results of parsing of the lines in the same order.
+    """
+    chunks = iter(lambda: list(itertools.islice(numbered_lines, chunk_size)), [])
+    pending_futures = collections.deque()
+    try:
+        for chunk in chunks:
+            pending_futures.append(executor.submit(_parse_chunk, parser, chunk))
+            if len(pending_futures) >= max_pending_chunks:
+                yield from pending_futures.popleft().result()
+
+        while pending_futures:
+            yield from pending_futures.popleft().result()
+    finally:
+        for future in pending_futures:
+            future.cancel()
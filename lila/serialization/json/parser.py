@@ -1,21 +1,50 @@
 """Module with JSON parser for Siren objects."""
 
-import logging
-
 from lila.serialization.parser import Parser
+from lila.serialization.json import aio, batch, engine, lazy
+from lila.serialization.json.codec import create_default_codec
+from lila.serialization.json.url import URLResolver
 from lila.serialization.json.field import FieldParser
 from lila.serialization.json.action import ActionParser
 from lila.serialization.json.link import LinkParser, EmbeddedLinkParser
 from lila.serialization.json.entity import EntityParser, EmbeddedRepresentationParser
+from lila.serialization import tracing
 
 
 class JSONParser(Parser):
-    """Class to parse Siren objects from JSON."""
+    """Class to parse Siren objects from JSON.
+
+    Targets of links, embedded links and actions are resolved against the optional base URL.
+    """
 
     create_field_parser = FieldParser
     create_link_parser = LinkParser
     create_embedded_link_parser = EmbeddedLinkParser
 
+    def __init__(self, codec=None, base_url=None):
+        if codec is None:
+            codec = create_default_codec()
+
+        url_resolver = None
+        if base_url is not None:
+            url_resolver = URLResolver(base_url)
+
+        self._codec = codec
+        self._url_resolver = url_resolver
+
+    @property
+    def codec(self):
+        """:class:`Codec <lila.serialization.json.codec.Codec>` to decode serialized data."""
+        return self._codec
+
+    @property
+    def base_url(self):
+        """Base URL to resolve relative targets or None."""
+        if self._url_resolver is None:
+            return None
+
+        return self._url_resolver.base_url
+
     def create_action_parser(self, data):
         """Factory method to create a parser for an action.
 
@@ -47,17 +76,18 @@ class JSONParser(Parser):
         :param data: serialized field.
         :returns: parsed field.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse a field from data '%s'", data)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse a field from data '%s'", data)
 
         parser = self.create_field_parser(data)
         try:
             parsed_field = parser.parse()
         except Exception:
-            logger.error("Failed to parse a field")
+            tracing.error(__name__, "Failed to parse a field")
             raise
 
-        logger.info("Successfully parsed a field")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed a field")
         return parsed_field
 
     def parse_action(self, data):
@@ -66,17 +96,19 @@ class JSONParser(Parser):
         :param data: serialized action.
         :returns: parsed action.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an action from data '%s'", data)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an action from data '%s'", data)
 
+        data = self._resolve_target(data)
         parser = self.create_action_parser(data)
         try:
             parsed_action = parser.parse()
         except Exception:
-            logger.error("Failed to parse an action")
+            tracing.error(__name__, "Failed to parse an action")
             raise
 
-        logger.info("Successfully parsed an action")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed an action")
         return parsed_action
 
     def parse_link(self, data):
@@ -85,17 +117,19 @@ class JSONParser(Parser):
         :param data: serialized link.
         :returns: parsed link.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse a link from data '%s'", data)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse a link from data '%s'", data)
 
+        data = self._resolve_target(data)
         parser = self.create_link_parser(data)
         try:
             parsed_link = parser.parse()
         except Exception:
-            logger.error("Failed to parse a link")
+            tracing.error(__name__, "Failed to parse a link")
             raise
 
-        logger.info("Successfully parsed a link")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed a link")
         return parsed_link
 
     def parse_embedded_link(self, data):
@@ -104,36 +138,48 @@ class JSONParser(Parser):
         :param data: serialized embedded link.
         :returns: parsed embedded link.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an embedded link from data '%s'", data)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an embedded link from data '%s'", data)
 
+        data = self._resolve_target(data)
         parser = self.create_embedded_link_parser(data)
         try:
             parsed_embedded_link = parser.parse()
         except Exception:
-            logger.error("Failed to parse an embedded link")
+            tracing.error(__name__, "Failed to parse an embedded link")
             raise
 
-        logger.info("Successfully parsed an embedded link")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed an embedded link")
         return parsed_embedded_link
 
+    @engine.runs_steps("parse_embedded_representation_steps")
     def parse_embedded_representation(self, data):
         """Parse serialized Siren embedded representation.
 
         :param data: serialized embedded representation.
         :returns: parsed embedded representation.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an embedded representation from data '%s'", data)
+        return engine.run(self.parse_embedded_representation_steps(data))
+
+    def parse_embedded_representation_steps(self, data):
+        """Get steps to parse serialized Siren embedded representation.
+
+        :param data: serialized embedded representation.
+        :returns: generator with steps for :func:`run <lila.serialization.json.engine.run>`.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an embedded representation from data '%s'", data)
 
         parser = self.create_embedded_representation_parser(data)
         try:
-            parsed_representation = parser.parse()
+            parsed_representation = yield from engine.call(parser, "parse")
         except Exception:
-            logger.error("Failed to parse an embedded representation")
+            tracing.error(__name__, "Failed to parse an embedded representation")
             raise
 
-        logger.info("Successfully parsed an embedded representation")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed an embedded representation")
         return parsed_representation
 
     def parse_entity(self, data):
@@ -142,15 +188,142 @@ class JSONParser(Parser):
         :param data: serialized entity.
         :returns: parsed entity.
         """
-        logger = logging.getLogger(__name__)
-        logger.debug("Try to parse an entity from data '%s'", data)
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an entity from data '%s'", data)
 
         parser = self.create_entity_parser(data)
         try:
             parsed_entity = parser.parse()
         except Exception:
-            logger.error("Failed to parse an entity")
+            tracing.error(__name__, "Failed to parse an entity")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed an entity")
+        return parsed_entity
+
+    def parse_entity_lazily(self, data):
+        """Parse serialized Siren entity lazily.
+
+        Classes and title of the entity are parsed at once, other members are parsed on the first
+        access. Data must not be changed while the entity is used.
+
+        :param data: serialized entity.
+        :returns: :class:`LazyEntity <lila.serialization.json.lazy.LazyEntity>`.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an entity from data '%s' lazily", data)
+
+        try:
+            parsed_entity = lazy.parse_entity(parser=self, data=data)
+        except Exception:
+            tracing.error(__name__, "Failed to parse an entity lazily")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed top level of an entity")
+        return parsed_entity
+
+    def parse_entity_bytes(self, encoded_data):
+        """Parse Siren entity from JSON bytes with the codec of the parser.
+
+        :param encoded_data: bytes with serialized entity.
+        :returns: parsed entity.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to decode entity data with codec '%s'", self._codec.name)
+
+        try:
+            data = self._codec.decode(encoded_data)
+        except Exception:
+            tracing.error(__name__, "Failed to decode entity data")
             raise
 
-        logger.info("Successfully parsed an entity")
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully decoded entity data")
+        return self.parse_entity(data)
+
+    def _resolve_target(self, data):
+        """Resolve the target of serialized data against the base URL.
+
+        :param data: serialized link, embedded link or action.
+        :returns: data with the absolute target if the base URL is set, otherwise the same data.
+        """
+        url_resolver = self._url_resolver
+        if url_resolver is None or not isinstance(data, dict) or "href" not in data:
+            return data
+
+        return dict(data, href=url_resolver.resolve(str(data["href"])))
+
+    async def parse_entity_async(
+            self,
+            data,
+            yield_interval=aio.DEFAULT_YIELD_INTERVAL,
+            executor_threshold=None,
+            executor=None,
+        ):
+        """Parse serialized Siren entity without blocking the event loop.
+
+        Sub-entities, links and actions of the entity are parsed in chunks and the control is
+        passed back to the loop after each chunk. If the entity has more of them than the
+        threshold, it's parsed in the executor instead. Data for custom parsers are always
+        parsed in the executor.
+
+        :param data: serialized entity.
+        :param yield_interval: number of components to parse before the control is passed back
+            to the loop.
+        :param executor_threshold: optional number of components to parse the entity in the
+            executor.
+        :param executor: optional :class:`concurrent.futures.Executor`. The default executor of
+            the loop is used if it's not passed.
+        :returns: parsed entity.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse an entity from data '%s' asynchronously", data)
+
+        try:
+            parsed_entity = await aio.parse_entity(
+                parser=self,
+                data=data,
+                yield_interval=yield_interval,
+                executor_threshold=executor_threshold,
+                executor=executor,
+                )
+        except Exception:
+            tracing.error(__name__, "Failed to parse an entity asynchronously")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed an entity asynchronously")
         return parsed_entity
+
+    def parse_many(self, datas, executor=None, chunk_size=batch.DEFAULT_CHUNK_SIZE):
+        """Parse several serialized Siren entities.
+
+        Data are split into chunks that are parsed with the executor. A process pool gets a copy
+        of the parser, so the parser must be picklable.
+
+        :param datas: iterable with serialized entities.
+        :param executor: optional :class:`concurrent.futures.Executor`. Entities are parsed
+            in the current thread if it's not passed.
+        :param chunk_size: number of entities to parse in a single task of the executor.
+        :returns: list with parsed entities in the same order as data.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to parse several entities with executor '%s'", executor)
+
+        try:
+            parsed_entities = batch.parse_entities(
+                parser=self,
+                datas=datas,
+                executor=executor,
+                chunk_size=chunk_size,
+                )
+        except Exception:
+            tracing.error(__name__, "Failed to parse several entities")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully parsed %d entities", len(parsed_entities))
+        return parsed_entities
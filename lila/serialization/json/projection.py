@@ -0,0 +1,293 @@
+"""Module with projections to marshal only requested parts of Siren entities."""
+
+from copy import deepcopy
+
+from lila.core.entity import Entity
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+from lila.serialization.json import depth
+
+
+MEMBERS = frozenset(("class", "properties", "entities", "links", "actions", "title"))
+
+
+class Projection:
+    """Class for a specification of requested parts of an entity.
+
+    Parts that are not requested are neither visited nor marshaled. The specification is
+    prepared once and can be reused for many entities.
+
+    :param members: keys of entity members to marshal, e.g. ``["links", "properties"]``.
+        All members are marshaled if it's not passed.
+    :param properties: names of properties to marshal. All properties are marshaled if it's not
+        passed.
+    :param relations: relations of sub-entities to marshal. A sub-entity is marshaled if it has
+        at least one of the relations. All sub-entities are marshaled if it's not passed.
+    :param actions: names of actions to marshal. All actions are marshaled if it's not passed.
+    :param sub_entities: optional :class:`Projection` for embedded representations.
+    """
+
+    def __init__(
+            self,
+            members=None,
+            properties=None,
+            relations=None,
+            actions=None,
+            sub_entities=None,
+        ):
+        # pylint: disable=too-many-arguments
+        if members is not None:
+            members = frozenset(str(member) for member in members)
+            unknown_members = members - MEMBERS
+            if unknown_members:
+                raise ValueError(
+                    "Unknown members of an entity: {0}".format(", ".join(sorted(unknown_members))),
+                    )
+        self._members = members
+
+        self._properties = _create_filter(properties)
+        self._relations = _create_filter(relations)
+        self._actions = _create_filter(actions)
+
+        if sub_entities is not None and not isinstance(sub_entities, Projection):
+            raise ValueError("Projection of sub-entities is of incompatible type")
+        self._sub_entities = sub_entities
+
+    def includes(self, member):
+        """Check if the member of an entity is requested.
+
+        :param member: key of the member, e.g. "links".
+        :returns: True if the member is marshaled.
+        """
+        return self._members is None or member in self._members
+
+    def project(self, entity, max_depth=None):
+        """Create an entity-like view with requested parts of the entity.
+
+        :param entity: Siren entity.
+        :param max_depth: optional number of levels of embedded representations to keep. Deeper
+            representations are replaced with embedded links to their self links before they
+            are projected.
+        :returns: object with the same attributes as the entity.
+        """
+        return _ProjectedEntity(entity, self, max_depth)
+
+    def filter_data(self, data):
+        """Leave out members of marshaled data that are not requested.
+
+        :param data: dictionary with data of the projected entity.
+        :returns: dictionary with requested members.
+        """
+        return self._filter_data(data, is_projected=False)
+
+    def _filter_data(self, data, is_projected):
+        """Leave out members of marshaled data that are not requested.
+
+        :param data: dictionary with marshaled data.
+        :param is_projected: flag that the data are marshaled from a projected entity, so that
+            its properties, sub-entities and actions are already filtered.
+        :returns: dictionary with requested members.
+        """
+        filtered_data = {
+            key: value for key, value in data.items()
+            if key == "rel" or key not in MEMBERS or self.includes(key)
+            }
+
+        names = self._properties
+        properties = filtered_data.get("properties")
+        if not is_projected and names is not None and isinstance(properties, dict):
+            filtered_data["properties"] = {
+                name: value for name, value in properties.items() if name in names
+                }
+
+        sub_entities_projection = self._sub_entities
+        sub_entities = filtered_data.get("entities")
+        if sub_entities_projection is not None and sub_entities is not None:
+            filtered_data["entities"] = [
+                sub_entity if "href" in sub_entity else sub_entities_projection._filter_data(
+                    sub_entity,
+                    is_projected=is_projected,
+                    )
+                for sub_entity in sub_entities
+                ]
+
+        return filtered_data
+
+
+def marshal_entity(marshaler, entity, projection):
+    """Marshal requested parts of Siren entity.
+
+    :param marshaler: JSON marshaler.
+    :param entity: Siren entity.
+    :param projection: :class:`Projection`.
+    :returns: dictionary with data of requested parts of the entity.
+    :raises: :class:ValueError.
+    """
+    # Representations are collapsed before the projection, which may leave out their links.
+    projected_entity = projection.project(entity, max_depth=marshaler.embedding_depth)
+    marshaled_entity = marshaler.marshal_entity(projected_entity)
+    # pylint: disable=protected-access
+    return projection._filter_data(marshaled_entity, is_projected=True)
+
+
+class _ProjectedEntity:
+    """Entity-like view of requested parts of an entity."""
+
+    def __init__(self, entity, projection, max_depth=None):
+        self._entity = entity
+        self._projection = projection
+        self._max_depth = max_depth
+
+    @property
+    def classes(self):
+        """Classes of the entity if they are requested."""
+        if not self._projection.includes("class"):
+            return ()
+
+        return self._entity.classes
+
+    @property
+    def properties(self):
+        """Requested properties of the entity."""
+        projection = self._projection
+        if not projection.includes("properties"):
+            return {}
+
+        entity = self._entity
+        names = projection._properties     # pylint: disable=protected-access
+        if names is None:
+            return entity.properties
+
+        if isinstance(entity, Entity):
+            # Only requested properties are copied.
+            properties = entity._properties    # pylint: disable=protected-access
+            return {
+                name: deepcopy(value) for name, value in properties.items() if name in names
+                }
+
+        properties = entity.properties
+        return {name: value for name, value in properties.items() if name in names}
+
+    @property
+    def entities(self):
+        """Requested sub-entities of the entity."""
+        projection = self._projection
+        if not projection.includes("entities"):
+            return ()
+
+        relations = projection._relations     # pylint: disable=protected-access
+        sub_entities = []
+        for sub_entity in self._entity.entities:
+            if relations is not None and relations.isdisjoint(sub_entity.relations):
+                continue
+
+            if not hasattr(sub_entity, "target"):
+                sub_entity = self._project_representation(sub_entity)
+
+            sub_entities.append(sub_entity)
+
+        return sub_entities
+
+    def _project_representation(self, embedded_representation):
+        """Create a view with requested parts of an embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :returns: representation-like object or embedded link if the representation is
+            deeper than the limit.
+        :raises: :class:ValueError.
+        """
+        max_depth = self._max_depth
+        if max_depth == 0:
+            return depth.collapse_representation(embedded_representation)
+
+        sub_entities_projection = self._projection._sub_entities  # pylint: disable=protected-access
+        if sub_entities_projection is None:
+            return embedded_representation
+
+        if isinstance(embedded_representation, RawEmbeddedRepresentation):
+            return _ProjectedRawEmbeddedRepresentation(
+                embedded_representation,
+                sub_entities_projection,
+                )
+
+        if max_depth is not None:
+            max_depth -= 1
+
+        return _ProjectedEmbeddedRepresentation(
+            embedded_representation,
+            sub_entities_projection,
+            max_depth,
+            )
+
+    @property
+    def links(self):
+        """Links of the entity if they are requested."""
+        if not self._projection.includes("links"):
+            return ()
+
+        return self._entity.links
+
+    @property
+    def actions(self):
+        """Requested actions of the entity."""
+        projection = self._projection
+        if not projection.includes("actions"):
+            return ()
+
+        names = projection._actions    # pylint: disable=protected-access
+        actions = self._entity.actions
+        if names is None:
+            return actions
+
+        return [action for action in actions if action.name in names]
+
+    @property
+    def title(self):
+        """Title of the entity if it's requested."""
+        if not self._projection.includes("title"):
+            return None
+
+        return self._entity.title
+
+
+class _ProjectedEmbeddedRepresentation(_ProjectedEntity):
+    """Representation-like view of requested parts of an embedded representation."""
+
+    @property
+    def relations(self):
+        """Relations of the embedded representation."""
+        return self._entity.relations
+
+
+class _ProjectedRawEmbeddedRepresentation(RawEmbeddedRepresentation):
+    """Embedded representation with requested parts of pre-serialized JSON data."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, embedded_representation, projection):
+        # pylint: disable=protected-access
+        self._raw = embedded_representation._raw
+        self._parser = embedded_representation._parser
+        self._projection = projection
+
+    def load(self):
+        """Decode the fragment and leave out members that are not requested.
+
+        :returns: dictionary with requested data of the embedded representation.
+        :raises: :class:ValueError.
+        """
+        data = super(_ProjectedRawEmbeddedRepresentation, self).load()
+        if not isinstance(data, dict):
+            return data
+
+        return self._projection.filter_data(data)
+
+
+def _create_filter(names):
+    """Create a set of names to filter items.
+
+    :param names: iterable with names or None.
+    :returns: frozenset with string names or None.
+    """
+    if names is None:
+        return None
+
+    return frozenset(str(name) for name in names)
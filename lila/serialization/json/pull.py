@@ -0,0 +1,320 @@
+"""Module with incremental parser of a single Siren entity from a file object.
+
+The whole document is never kept in memory. Members of the entity are produced in the order of
+the document and each sub-entity is produced as soon as it's read::
+
+    from lila.serialization.json import pull
+
+    with open("feed.json", "rb") as stream:
+        for name, value in pull.iterate_entity(JSONParser(), stream):
+            if name == pull.SUB_ENTITY:
+                process(value)
+            else:
+                metadata[name] = value
+
+Memory usage is bounded by the largest member of the entity, e.g. by the largest sub-entity or
+the list of links.
+"""
+
+import re
+import json
+import codecs
+
+from lila.core.entity import Entity
+from lila.serialization.json.entity import EntityParser
+from lila.serialization import tracing
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+CLASSES = "class"
+PROPERTIES = "properties"
+SUB_ENTITY = "entities"
+LINKS = "links"
+ACTIONS = "actions"
+TITLE = "title"
+
+# Members of the entity with the methods of the entity parser and the attributes of the entity.
+_MEMBERS = {
+    CLASSES: ("parse_classes", "classes"),
+    PROPERTIES: ("parse_properties", "properties"),
+    LINKS: ("parse_links", "links"),
+    ACTIONS: ("parse_actions", "actions"),
+    TITLE: ("parse_title", "title"),
+    }
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that may continue a number or a literal, which is cut at the end of the buffer.
+_TOKEN_TAIL_PATTERN = re.compile(r"[0-9.eE+-]*")
+_ESCAPE_TAIL_PATTERN = re.compile(r"u[0-9a-fA-F]{0,4}")
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+def iterate_entity(parser, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parse Siren entity from a file object incrementally.
+
+    Each member of the entity is produced as a tuple of its key and its parsed value, e.g.
+    ``(CLASSES, ("collection", ))`` or ``(LINKS, (link, ))``. Sub-entities are produced one by
+    one as ``(SUB_ENTITY, sub_entity)``. Unknown members are skipped.
+
+    Members are parsed in the same way as by :class:`EntityParser
+    <lila.serialization.json.entity.EntityParser>`, so the same errors are raised. Members that
+    come after an invalid one are not produced.
+
+    :param parser: JSON parser to parse links, actions and sub-entities.
+    :param stream: binary or text file object with the document.
+    :param chunk_size: number of bytes or characters to read from the stream at once.
+    :returns: generator of tuples with keys and values of the members.
+    :raises: :class:ValueError.
+    """
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ValueError("Size of a chunk must be positive")
+
+    return _iterate_members(parser, _Reader(stream, chunk_size))
+
+
+def _iterate_members(parser, reader):
+    """Parse members of the entity.
+
+    :param parser: JSON parser.
+    :param reader: :class:`_Reader` of the document.
+    :returns: generator of tuples with keys and values of the members.
+    :raises: :class:ValueError.
+    """
+    if tracing.enabled:
+        tracing.debug(__name__, "Try to parse an entity incrementally")
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.read_value()
+            if not isinstance(key, str):
+                tracing.error(__name__, "Failed to decode JSON data")
+                raise ValueError("Failed to decode JSON data")
+
+            reader.expect(":")
+            if key == SUB_ENTITY and reader.peek() == "[":
+                yield from _iterate_sub_entities(parser, reader)
+            elif key == SUB_ENTITY:
+                for sub_entity in _parse_member(parser, key, reader.read_value()):
+                    yield key, sub_entity
+            elif key in _MEMBERS:
+                yield key, _parse_member(parser, key, reader.read_value())
+            else:
+                reader.read_value()
+
+            if reader.peek() == "}":
+                reader.expect("}")
+                break
+            reader.expect(",")
+
+    reader.expect_end()
+
+    if tracing.enabled:
+        tracing.info(__name__, "Successfully parsed an entity incrementally")
+
+
+def _iterate_sub_entities(parser, reader):
+    """Parse sub-entities of the entity one by one.
+
+    :param parser: JSON parser.
+    :param reader: :class:`_Reader` positioned at the start of the array with sub-entities.
+    :returns: generator of tuples with the key of sub-entities and a sub-entity.
+    :raises: :class:ValueError.
+    """
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+
+    while True:
+        sub_entity, = _parse_member(parser, SUB_ENTITY, [reader.read_value()])
+        yield SUB_ENTITY, sub_entity
+
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+        reader.expect(",")
+
+
+def _parse_member(parser, key, value):
+    """Parse a member of the entity.
+
+    :param parser: JSON parser.
+    :param key: key of the member.
+    :param value: decoded value of the member.
+    :returns: parsed value.
+    :raises: :class:ValueError.
+    """
+    entity_parser = EntityParser(data={key: value}, parser=parser)
+    if key == SUB_ENTITY:
+        return entity_parser.parse_entities()
+
+    method_name, attribute_name = _MEMBERS[key]
+    parsed_value = getattr(entity_parser, method_name)()
+
+    # Let the entity check the value, e.g. the names of the actions.
+    try:
+        entity = Entity(**{attribute_name: parsed_value})
+    except Exception as error:
+        tracing.error(__name__, "Failed to create an entity with provided data")
+        raise ValueError("Failed to create an entity with provided data") from error
+
+    return getattr(entity, attribute_name)
+
+
+class _Reader:
+    """Reader of JSON values from a file object.
+
+    Data are read by chunks, consumed data are dropped from the buffer.
+    """
+
+    def __init__(self, stream, chunk_size):
+        self._read = stream.read
+        self._chunk_size = chunk_size
+        self._decoder = None
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+        self._raw_decode = json.JSONDecoder().raw_decode
+
+    def peek(self):
+        """Get the next character after whitespace without consuming it.
+
+        :returns: character or empty string if the stream is exhausted.
+        """
+        self._skip_whitespace()
+        return self._buffer[self._position:self._position + 1]
+
+    def expect(self, character):
+        """Consume the expected character after whitespace.
+
+        :param character: expected character.
+        :raises: :class:ValueError if there is another character.
+        """
+        if self.peek() != character:
+            tracing.error(__name__, "Failed to decode JSON data: '%s' is expected", character)
+            raise ValueError("Failed to decode JSON data")
+
+        self._position += 1
+
+    def expect_end(self):
+        """Check that there is only whitespace till the end of the stream.
+
+        :raises: :class:ValueError if there are extra data.
+        """
+        if self.peek():
+            tracing.error(__name__, "Failed to decode JSON data: extra data")
+            raise ValueError("Failed to decode JSON data")
+
+    def read_value(self):
+        """Read and decode the next JSON value.
+
+        :returns: decoded value.
+        :raises: :class:ValueError.
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._raw_decode(self._buffer, self._position)
+            except ValueError as error:
+                # Only a value cut at the end of the buffer may be completed by more data.
+                if not self._is_cut(error) or not self._read_more():
+                    tracing.error(__name__, "Failed to decode JSON data")
+                    raise ValueError("Failed to decode JSON data") from error
+                continue
+
+            # A number may continue in the next chunk.
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and _TOKEN_TAIL_PATTERN.fullmatch(self._buffer, end) and self._read_more():
+                continue
+
+            self._position = end
+            return value
+
+    def _is_cut(self, error):
+        """Check if the error of the decoder may be caused by a value cut at the end of the buffer.
+
+        :param error: :class:`json.JSONDecodeError`.
+        :returns: True if more data may complete the value.
+        """
+        if not isinstance(error, json.JSONDecodeError):
+            return False
+
+        rest = self._buffer[error.pos:]
+        if error.msg.startswith("Unterminated string"):
+            return True
+
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            return bool(_ESCAPE_TAIL_PATTERN.fullmatch(rest))
+
+        # The rest of the buffer is either empty or an incomplete number or literal.
+        if _TOKEN_TAIL_PATTERN.fullmatch(rest):
+            return True
+
+        return any(literal.startswith(rest) for literal in _LITERALS)
+
+    def _skip_whitespace(self):
+        """Skip whitespace, read more data if the buffer is consumed."""
+        while True:
+            buffer = self._buffer
+            position = self._position
+            length = len(buffer)
+            while position < length and buffer[position] in _WHITESPACE:
+                position += 1
+
+            self._position = position
+            if position < length or not self._read_more():
+                return
+
+    def _read_more(self):
+        """Drop consumed data and read more data, so that the rest of the buffer is doubled.
+
+        :returns: False if there are no more data in the stream.
+        """
+        if self._is_exhausted:
+            return False
+
+        rest = self._buffer[self._position:]
+        chunks = [rest]
+        length = len(rest)
+        target_length = length + max(length, self._chunk_size)
+        while length < target_length:
+            chunk = self._read(self._chunk_size)
+            if not chunk:
+                self._is_exhausted = True
+                if self._decoder is not None:
+                    chunk = self._decode(b"", final=True)
+                    chunks.append(chunk)
+                    length += len(chunk)
+                break
+
+            if isinstance(chunk, bytes):
+                chunk = self._decode(chunk)
+            chunks.append(chunk)
+            length += len(chunk)
+
+        self._buffer = "".join(chunks)
+        self._position = 0
+        return length > len(rest)
+
+    def _decode(self, chunk, final=False):
+        """Decode a chunk of bytes.
+
+        :param chunk: bytes.
+        :param final: True if it's the last chunk.
+        :returns: decoded text.
+        :raises: :class:ValueError.
+        """
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+        try:
+            return self._decoder.decode(chunk, final=final)
+        except UnicodeDecodeError as error:
+            tracing.error(__name__, "Failed to decode JSON data")
+            raise ValueError("Failed to decode JSON data") from error
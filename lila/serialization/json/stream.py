@@ -0,0 +1,744 @@
+"""Module with JSON marshaler that encodes Siren objects straight into bytes."""
+
+import json
+from json.encoder import encode_basestring_ascii as _encode_string
+
+from lila.core.action import Method
+from lila.core.field import InputType
+from lila.core.entity import StreamingEntity
+from lila.core.raw import RawJSON
+from lila.serialization.marshaler import Marshaler
+from lila.serialization.json import aio
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+from lila.serialization import tracing
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_BUFFERED_SIZE = 1024 * 1024
+
+_encode_json = json.JSONEncoder().encode
+
+
+class JSONStreamMarshaler(Marshaler):
+    """Class to marshal Siren objects into JSON encoded bytes.
+
+    Siren objects are encoded directly without building intermediate dictionaries. The output
+    is decoded into the same data as the ones of :class:`JSONMarshaler
+    <lila.serialization.json.marshaler.JSONMarshaler>`, except for pre-serialized
+    :class:`RawEmbeddedRepresentation <lila.serialization.json.fragment.RawEmbeddedRepresentation>`
+    and :class:`RawJSON <lila.core.raw.RawJSON>` values of properties, which are embedded
+    verbatim. Members of components are always written in the same order, so the bytes are
+    identical to ``json.dumps`` of the data only if dictionaries keep the insertion order, i.e.
+    since Python 3.6.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self, fragment_cache=None):
+        self._fragment_cache = fragment_cache
+        self._cache_namespace = (type(self), )
+        self._length_namespace = (type(self), "length")
+
+    @property
+    def fragment_cache(self):
+        """Cache for encoded immutable links, embedded links and actions or None."""
+        return self._fragment_cache
+
+    def marshal_field(self, field):
+        """Marshal Siren field.
+
+        :param field: Siren Field.
+        :returns: bytes with JSON encoded field.
+        """
+        return self._marshal(self._encode_field, field, "a field")
+
+    def marshal_action(self, action):
+        """Marshal Siren action.
+
+        :param action: Siren Action.
+        :returns: bytes with JSON encoded action.
+        """
+        return self._marshal(self._encode_action, action, "an action")
+
+    def marshal_link(self, link):
+        """Marshal Siren link.
+
+        :param link: Siren Link.
+        :returns: bytes with JSON encoded link.
+        """
+        return self._marshal(self._encode_link, link, "a link")
+
+    def marshal_embedded_link(self, embedded_link):
+        """Marshal embedded Siren link.
+
+        :param embedded_link: embedded Siren Link.
+        :returns: bytes with JSON encoded embedded link.
+        """
+        return self._marshal(self._encode_embedded_link, embedded_link, "an embedded link")
+
+    def marshal_embedded_representation(self, embedded_representation):
+        """Marshal Siren embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :returns: bytes with JSON encoded embedded representation.
+        """
+        return self._marshal(
+            self._encode_embedded_representation,
+            embedded_representation,
+            "an embedded representation",
+            )
+
+    def marshal_entity(self, entity):
+        """Marshal Siren entity.
+
+        :param entity: Siren entity.
+        :returns: bytes with JSON encoded entity.
+        """
+        return self._marshal(self._encode_entity, entity, "an entity")
+
+    def iter_marshal_entity(self, entity, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Marshal Siren entity into chunks of JSON encoded bytes.
+
+        A chunk is produced as soon as at least chunk_size characters are encoded. Encoding
+        happens lazily, one sub-entity, link or action of the entity at a time, so the memory
+        is bounded by the largest of them rather than by the whole entity. The generator can be
+        passed to WSGI or ASGI servers to stream a response.
+
+        :param entity: Siren entity.
+        :param chunk_size: approximate number of characters in a chunk.
+        :returns: generator of bytes.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal an entity '%s' into chunks", entity)
+
+        encoding = self.encoding
+        parts = []
+        pending_size = 0
+        measured_parts = 0
+        try:
+            for _ in self._iter_entity(entity, parts):
+                pending_size += sum(len(part) for part in parts[measured_parts:])
+                measured_parts = len(parts)
+                if pending_size >= chunk_size:
+                    chunk = "".join(parts).encode(encoding)
+                    del parts[:]
+                    pending_size = 0
+                    measured_parts = 0
+                    yield chunk
+        except Exception:
+            tracing.error(__name__, "Failed to marshal an entity into chunks")
+            raise
+
+        if parts:
+            yield "".join(parts).encode(encoding)
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled an entity into chunks")
+
+    def write_entity(self, entity, stream, buffer_size=DEFAULT_CHUNK_SIZE):
+        """Marshal Siren entity and write it into a binary stream.
+
+        Encoded data are written in chunks as soon as at least buffer_size characters are
+        accumulated. Sockets can be used through their file objects, e.g. ``socket.makefile("wb")``.
+
+        :param entity: Siren entity.
+        :param stream: file-like object opened in binary mode.
+        :param buffer_size: approximate number of characters to accumulate before a write.
+        :raises: :class:ValueError.
+        """
+        write = stream.write
+        for chunk in self.iter_marshal_entity(entity, chunk_size=buffer_size):
+            write(chunk)
+
+    async def write_entity_async(self, entity, writer, buffer_size=DEFAULT_CHUNK_SIZE):
+        """Marshal Siren entity and write it into an asyncio stream.
+
+        The writer is drained after each chunk, so that a slow client doesn't make the data pile
+        up in memory, and the control is passed back to the event loop.
+
+        :param entity: Siren entity.
+        :param writer: :class:`asyncio.StreamWriter`.
+        :param buffer_size: approximate number of characters to accumulate before a write.
+        :raises: :class:ValueError.
+        """
+        await aio.write_entity(marshaler=self, entity=entity, writer=writer, chunk_size=buffer_size)
+
+    def measure_entity(self, entity):
+        """Compute the exact length of JSON encoded entity without producing the bytes.
+
+        The length is the same as the one of bytes returned by :meth:`marshal_entity`, so it
+        can be sent as Content-Length of a streamed response. Lengths of immutable links,
+        embedded links and actions are memoized in the fragment cache if the marshaler has one.
+        Streaming entities can't be measured, since their sub-entities may be iterated over only
+        once.
+
+        :param entity: Siren entity.
+        :returns: number of bytes.
+        :raises: :class:ValueError.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to measure an entity '%s'", entity)
+
+        if isinstance(entity, StreamingEntity):
+            raise _error("Streaming entity can't be measured")
+
+        counter = _LengthCounter(self.encoding)
+        try:
+            self._encode_entity(entity, counter)
+        except Exception:
+            tracing.error(__name__, "Failed to measure an entity")
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully measured an entity: %d bytes", counter.length)
+        return counter.length
+
+    def marshal_entity_body(
+            self,
+            entity,
+            max_buffered_size=DEFAULT_MAX_BUFFERED_SIZE,
+            chunk_size=DEFAULT_CHUNK_SIZE,
+        ):
+        """Marshal Siren entity into a response body with known length.
+
+        Entities that are not larger than max_buffered_size are encoded at once, larger ones are
+        encoded lazily in chunks. The entity must not be changed until the body is consumed.
+        Streaming entities are always encoded in chunks and their length is unknown, so such a
+        body should be sent with chunked transfer encoding.
+
+        :param entity: Siren entity.
+        :param max_buffered_size: maximum number of bytes to encode at once.
+        :param chunk_size: approximate number of characters in a chunk of a streamed body.
+        :returns: tuple with the length of the body in bytes or None if it's unknown and an
+            iterable of bytes.
+        :raises: :class:ValueError.
+        """
+        if isinstance(entity, StreamingEntity):
+            if tracing.enabled:
+                tracing.debug(__name__, "Stream a streaming entity without its length")
+            return None, self.iter_marshal_entity(entity, chunk_size=chunk_size)
+
+        length = self.measure_entity(entity)
+        if length > max_buffered_size:
+            if tracing.enabled:
+                tracing.debug(__name__, "Stream an entity of %d bytes", length)
+            return length, self.iter_marshal_entity(entity, chunk_size=chunk_size)
+
+        return length, [self.marshal_entity(entity)]
+
+    def _marshal(self, encode, component, description):
+        """Encode a component with the encoder.
+
+        :param encode: method to encode the component.
+        :param component: Siren component.
+        :param description: description of the component for logs.
+        :returns: bytes with JSON encoded component.
+        """
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to marshal %s '%s'", description, component)
+
+        parts = []
+        try:
+            encode(component, parts)
+        except Exception:
+            tracing.error(__name__, "Failed to marshal %s", description)
+            raise
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully marshaled %s", description)
+        return "".join(parts).encode(self.encoding)
+
+    def _encode_field(self, field, parts):
+        # pylint: disable=no-self-use
+        """Encode a field.
+
+        :param field: Siren Field.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        name = _get(field, "name", "field's name")
+        classes = _encode_strings(field, "classes", "field's classes")
+        input_type = _get_enum(field, "input_type", "field's input type", InputType)
+        value = _encode_optional_string(field, "value", "field's value")
+        title = _encode_optional_string(field, "title", "field's title")
+
+        parts.append("".join((
+            '{"name": ', _encode_string(str(name)),
+            ', "class": ', classes,
+            ', "type": ', _encode_string(input_type),
+            ', "value": ', value,
+            ', "title": ', title,
+            "}",
+            )))
+
+    def _encode_action(self, action, parts):
+        """Encode an action.
+
+        :param action: Siren Action.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        if self._fragment_cache is not None:
+            self._encode_cached(self._encode_uncached_action, action, parts)
+        else:
+            self._encode_uncached_action(action, parts)
+
+    def _encode_uncached_action(self, action, parts):
+        """Encode an action without the cache.
+
+        :param action: Siren Action.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        name = _get(action, "name", "action's name")
+        classes = _encode_strings(action, "classes", "action's classes")
+        method = _get_enum(action, "method", "action's method", Method)
+        target = _get(action, "target", "action's target")
+        title = _encode_optional_string(action, "title", "action's title")
+        media_type = _encode_optional_string(action, "media_type", "action's media type")
+
+        parts.append("".join((
+            '{"name": ', _encode_string(str(name)),
+            ', "class": ', classes,
+            ', "method": ', _encode_string(method),
+            ', "href": ', _encode_string(str(target)),
+            ', "title": ', title,
+            ', "type": ', media_type,
+            ', "fields": [',
+            )))
+
+        fields = _get_list(action, "fields", "action's fields")
+        encode_field = self._encode_field
+        separator = ""
+        for field in fields:
+            parts.append(separator)
+            try:
+                encode_field(field, parts)
+            except Exception as error:
+                raise _error("Failed to marshal action's fields") from error
+            separator = ", "
+
+        parts.append("]}")
+
+    def _encode_link(self, link, parts):
+        """Encode a link.
+
+        :param link: Siren Link.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        if self._fragment_cache is not None:
+            self._encode_cached(_encode_link, link, parts)
+        else:
+            _encode_link(link, parts)
+
+    def _encode_embedded_link(self, embedded_link, parts):
+        """Encode an embedded link.
+
+        :param embedded_link: embedded Siren Link.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        if self._fragment_cache is not None:
+            self._encode_cached(_encode_embedded_link, embedded_link, parts)
+        else:
+            _encode_embedded_link(embedded_link, parts)
+
+    def _encode_cached(self, encode, component, parts):
+        """Encode a component or take its encoded data or length from the cache.
+
+        :param encode: function to encode the component.
+        :param component: Siren component.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        cache = self._fragment_cache
+        if isinstance(parts, _LengthCounter):
+            length = cache.lookup(self._length_namespace, component)
+            if length is None:
+                counter = _LengthCounter(self.encoding)
+                encode(component, counter)
+                length = counter.length
+                cache.store(self._length_namespace, component, length)
+
+            parts.length += length
+            return
+
+        fragment = cache.lookup(self._cache_namespace, component)
+        if fragment is None:
+            component_parts = []
+            encode(component, component_parts)
+            fragment = "".join(component_parts)
+            cache.store(self._cache_namespace, component, fragment)
+
+        parts.append(fragment)
+
+    def _encode_embedded_representation(self, embedded_representation, parts):
+        """Encode an embedded representation.
+
+        :param embedded_representation: Siren embedded representation.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        if isinstance(embedded_representation, RawEmbeddedRepresentation):
+            _append_raw(parts, embedded_representation.fragment)
+            return
+
+        relations = _encode_strings(
+            embedded_representation,
+            "relations",
+            "relations of the embedded representation",
+            )
+        parts.append('{"rel": ')
+        parts.append(relations)
+        parts.append(", ")
+
+        members = self._iter_entity_members(
+            embedded_representation,
+            parts,
+            _EMBEDDED_REPRESENTATION_MEMBERS,
+            )
+        for _ in members:
+            pass
+
+    def _encode_entity(self, entity, parts):
+        """Encode an entity.
+
+        :param entity: Siren entity.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        for _ in self._iter_entity(entity, parts):
+            pass
+
+    def _iter_entity(self, entity, parts):
+        """Encode an entity step by step.
+
+        The generator yields each time a sub-entity, link or action of the entity is encoded,
+        so that the caller could flush accumulated parts.
+
+        :param entity: Siren entity.
+        :param parts: list to append encoded parts to.
+        :returns: generator of None values.
+        :raises: :class:ValueError.
+        """
+        parts.append("{")
+        yield from self._iter_entity_members(entity, parts, _ENTITY_MEMBERS)
+
+    def _iter_entity_members(self, entity, parts, members):
+        """Encode members of an entity or an embedded representation step by step.
+
+        :param entity: Siren entity or embedded representation.
+        :param parts: list to append encoded parts to.
+        :param members: dictionary with descriptions of the members for error messages.
+        :returns: generator of None values.
+        :raises: :class:ValueError.
+        """
+        classes = _encode_strings(entity, "classes", members["classes"])
+        properties, has_raw_values = _encode_properties(entity, members["properties"])
+        parts.append('"class": ')
+        parts.append(classes)
+        parts.append(', "properties": ')
+        if has_raw_values:
+            _append_raw(parts, properties)
+        else:
+            parts.append(properties)
+
+        parts.append(', "entities": [')
+        sub_entities = _get_iterator(entity, "entities", members["entities"])
+        encode_sub_entity = self._encode_sub_entity
+        separator = ""
+        for sub_entity in sub_entities:
+            parts.append(separator)
+            try:
+                encode_sub_entity(sub_entity, parts)
+            except Exception as error:
+                raise _error("Failed to marshal " + members["entities"]) from error
+            separator = ", "
+            yield
+
+        parts.append('], "links": [')
+        links = _get_list(entity, "links", members["links"])
+        encode_link = self._encode_link
+        separator = ""
+        for link in links:
+            parts.append(separator)
+            try:
+                encode_link(link, parts)
+            except Exception as error:
+                raise _error("Failed to marshal " + members["links"]) from error
+            separator = ", "
+            yield
+
+        parts.append('], "actions": [')
+        actions = _get_list(entity, "actions", members["actions"])
+        encode_action = self._encode_action
+        separator = ""
+        for action in actions:
+            parts.append(separator)
+            try:
+                encode_action(action, parts)
+            except Exception as error:
+                raise _error("Failed to marshal " + members["actions"]) from error
+            separator = ", "
+            yield
+
+        title = _encode_optional_string(entity, "title", members["title"])
+        parts.append('], "title": ')
+        parts.append(title)
+        parts.append("}")
+
+    def _encode_sub_entity(self, sub_entity, parts):
+        """Encode a sub-entity.
+
+        :param sub_entity: either embedded link or embedded representation.
+        :param parts: list to append encoded parts to.
+        :raises: :class:ValueError.
+        """
+        if hasattr(sub_entity, "target"):
+            self._encode_embedded_link(sub_entity, parts)
+        else:
+            self._encode_embedded_representation(sub_entity, parts)
+
+
+class _LengthCounter:
+    """Replacement for a list of encoded parts that only counts their length in bytes.
+
+    Encoded parts contain only ASCII characters, so their length in bytes is the number of
+    characters. Only pre-encoded fragments have to be encoded to be measured.
+    """
+
+    def __init__(self, encoding):
+        self._encoding = encoding
+        self.length = 0
+
+    def append(self, part):
+        """Count the length of the encoded part.
+
+        :param part: string with ASCII encoded part.
+        """
+        self.length += len(part)
+
+    def append_raw(self, fragment):
+        """Count the length of the pre-encoded fragment.
+
+        :param fragment: string with pre-encoded JSON, which may contain any characters.
+        """
+        self.length += len(fragment.encode(self._encoding))
+
+
+_ENTITY_MEMBERS = {
+    "classes": "entity's classes",
+    "properties": "entity's properties",
+    "entities": "sub-entities of the entity",
+    "links": "entity's links",
+    "actions": "entity's actions",
+    "title": "entity's title",
+    }
+
+_EMBEDDED_REPRESENTATION_MEMBERS = {
+    "classes": "classes of the embedded representation",
+    "properties": "properties of the embedded representation",
+    "entities": "sub-entities of the embedded representation",
+    "links": "links of the embedded representation",
+    "actions": "actions of the embedded representation",
+    "title": "title of the embedded representation",
+    }
+
+
+def _append_raw(parts, fragment):
+    """Append a pre-encoded fragment.
+
+    :param parts: list to append encoded parts to.
+    :param fragment: string with pre-encoded JSON.
+    """
+    if isinstance(parts, _LengthCounter):
+        parts.append_raw(fragment)
+    else:
+        parts.append(fragment)
+
+
+def _error(message):
+    """Trace the error message and create an error to raise.
+
+    :param message: error message.
+    :returns: :class:ValueError with the message.
+    """
+    tracing.error(__name__, message)
+    return ValueError(message)
+
+
+def _get(component, attribute, description):
+    """Get an attribute of the component.
+
+    :param component: Siren component.
+    :param attribute: name of the attribute.
+    :param description: description of the attribute for error messages.
+    :returns: value of the attribute.
+    :raises: :class:ValueError.
+    """
+    try:
+        return getattr(component, attribute)
+    except AttributeError as error:
+        raise _error("Failed to get " + description) from error
+
+
+def _get_list(component, attribute, description):
+    """Get an iterable attribute of the component as a list.
+
+    :param component: Siren component.
+    :param attribute: name of the attribute.
+    :param description: description of the attribute for error messages.
+    :returns: list with items of the attribute.
+    :raises: :class:ValueError.
+    """
+    values = _get(component, attribute, description)
+    try:
+        return list(values)
+    except TypeError as error:
+        raise _error("Failed to iterate over " + description) from error
+
+
+def _get_iterator(component, attribute, description):
+    """Get an iterator over an iterable attribute of the component.
+
+    :param component: Siren component.
+    :param attribute: name of the attribute.
+    :param description: description of the attribute for error messages.
+    :returns: iterator over items of the attribute.
+    :raises: :class:ValueError.
+    """
+    values = _get(component, attribute, description)
+    try:
+        return iter(values)
+    except TypeError as error:
+        raise _error("Failed to iterate over " + description) from error
+
+
+def _get_enum(component, attribute, description, enum_class):
+    """Get an attribute of the component as a value of the enumerable.
+
+    :param component: Siren component.
+    :param attribute: name of the attribute.
+    :param description: description of the attribute for error messages.
+    :param enum_class: enumerable with supported values.
+    :returns: string value of the attribute.
+    :raises: :class:ValueError.
+    """
+    value = str(_get(component, attribute, description))
+    try:
+        return enum_class(value).value
+    except ValueError as error:
+        message = "{0} is not supported".format(description)
+        raise _error(message[0].upper() + message[1:]) from error
+
+
+def _encode_strings(component, attribute, description):
+    """Encode an iterable attribute of the component as a list of strings.
+
+    :param component: Siren component.
+    :param attribute: name of the attribute.
+    :param description: description of the attribute for error messages.
+    :returns: JSON encoded list.
+    :raises: :class:ValueError.
+    """
+    values = _get(component, attribute, description)
+    try:
+        encoded_values = [_encode_string(str(value)) for value in values]
+    except TypeError as error:
+        raise _error("Failed to iterate over " + description) from error
+
+    return "[" + ", ".join(encoded_values) + "]"
+
+
+def _encode_optional_string(component, attribute, description):
+    """Encode an optional string attribute of the component.
+
+    :param component: Siren component.
+    :param attribute: name of the attribute.
+    :param description: description of the attribute for error messages.
+    :returns: JSON encoded string or null.
+    :raises: :class:ValueError.
+    """
+    value = _get(component, attribute, description)
+    if value is None:
+        return "null"
+
+    return _encode_string(str(value))
+
+
+def _encode_properties(entity, description):
+    """Encode properties of an entity.
+
+    :param entity: Siren entity or embedded representation.
+    :param description: description of the properties for error messages.
+    :returns: tuple with JSON encoded properties and a flag if they contain raw JSON values.
+    :raises: :class:ValueError.
+    """
+    properties = _get(entity, "properties", description)
+    try:
+        if not isinstance(properties, dict) or not any(
+                isinstance(value, RawJSON) for value in properties.values()
+            ):
+            return _encode_json(properties), False
+
+        members = []
+        for name, value in properties.items():
+            if isinstance(value, RawJSON):
+                encoded_value = value.document
+            else:
+                encoded_value = _encode_json(value)
+            members.append("{0}: {1}".format(_encode_string(str(name)), encoded_value))
+    except TypeError as error:
+        raise _error("Failed to marshal " + description) from error
+
+    return "{" + ", ".join(members) + "}", True
+
+
+def _encode_link(link, parts):
+    """Encode a link.
+
+    :param link: Siren Link.
+    :param parts: list to append encoded parts to.
+    :raises: :class:ValueError.
+    """
+    _encode_link_members(link, parts, "link's {0}")
+
+
+def _encode_embedded_link(embedded_link, parts):
+    """Encode an embedded link.
+
+    :param embedded_link: embedded Siren Link.
+    :param parts: list to append encoded parts to.
+    :raises: :class:ValueError.
+    """
+    _encode_link_members(embedded_link, parts, "{0} of the embedded link")
+
+
+def _encode_link_members(link, parts, description):
+    """Encode a link or an embedded link.
+
+    :param link: Siren link or embedded link.
+    :param parts: list to append encoded parts to.
+    :param description: template to describe members of the link for error messages.
+    :raises: :class:ValueError.
+    """
+    relations = _encode_strings(link, "relations", description.format("relations"))
+    classes = _encode_strings(link, "classes", description.format("classes"))
+    target = _get(link, "target", description.format("target"))
+    title = _encode_optional_string(link, "title", description.format("title"))
+    target_media_type = _encode_optional_string(
+        link,
+        "target_media_type",
+        description.format("target media type"),
+        )
+
+    parts.append("".join((
+        '{"rel": ', relations,
+        ', "class": ', classes,
+        ', "href": ', _encode_string(str(target)),
+        ', "title": ', title,
+        ', "type": ', target_media_type,
+        "}",
+        )))
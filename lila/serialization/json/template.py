@@ -0,0 +1,188 @@
+"""Module with templates to render JSON responses with a shared skeleton.
+
+A template is created from an entity, which contains holes instead of values that differ from
+response to response::
+
+    from lila.core.link import Link
+    from lila.core.entity import Entity
+    from lila.serialization.json.template import EntityTemplate, create_hole
+
+    template = EntityTemplate(Entity(
+        properties={"orderNumber": create_hole("number")},
+        links=[Link(relations=["self"], target="/orders/" + create_hole("number"))],
+        ))
+
+    encoded_entity = template.render({"number": 42})
+
+A property value that consists of a single hole is filled with the JSON encoded value. Other
+holes, e.g. a part of a link target or a whole title, are filled with the string value, as
+members of Siren components are always strings. Holes can't be used in keys of properties.
+"""
+
+import re
+
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization import tracing
+
+
+_HOLE_MARKER = "\x00"
+# Holes in members of Siren components are closed with another marker before encoding.
+_STRING_HOLE_MARKER = "\x01"
+_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_HOLE_PATTERN = re.compile("\x00([A-Za-z_][A-Za-z0-9_]*)\x00")
+# Encoders of JSON escape the markers as \u0000 and \u0001.
+_ENCODED_HOLE_PATTERN = re.compile(br"\\u0000([A-Za-z_][A-Za-z0-9_]*)\\u000([01])")
+
+# Ways to fill a hole.
+_JSON_VALUE = "JSON value"
+_STRING = "string"
+_PART_OF_STRING = "part of a string"
+
+
+def create_hole(name):
+    """Create a placeholder for a value that is filled when a template is rendered.
+
+    :param name: name of the hole. It must be a valid identifier of ASCII characters.
+    :returns: string with the placeholder.
+    :raises: :class:ValueError.
+    """
+    name = str(name)
+    if not _NAME_PATTERN.fullmatch(name):
+        raise ValueError("Invalid name of a hole: '{0}'".format(name))
+
+    return _HOLE_MARKER + name + _HOLE_MARKER
+
+
+class EntityTemplate:
+    """Class for an entity encoded in advance except for its holes.
+
+    The entity is marshaled once with :class:`JSONMarshaler
+    <lila.serialization.json.marshaler.JSONMarshaler>` and its codec. Rendering encodes only the
+    values of the holes and joins them with the static segments. The result is the same as if the
+    entity with the values was marshaled into bytes.
+    """
+
+    def __init__(self, entity, marshaler=None):
+        if marshaler is None:
+            marshaler = JSONMarshaler()
+
+        self._codec = marshaler.codec
+
+        if tracing.enabled:
+            tracing.debug(__name__, "Try to create a template from an entity '%s'", entity)
+
+        try:
+            marshaled_entity = _mark_string_holes(marshaler.marshal_entity(entity))
+        except ValueError:
+            tracing.error(__name__, "Failed to create a template")
+            raise
+
+        encoded_entity = self._codec.encode(marshaled_entity)
+
+        segments = []
+        holes = []
+        position = 0
+        for match in _ENCODED_HOLE_PATTERN.finditer(encoded_entity):
+            start, end = match.span()
+            whole_string = (
+                encoded_entity[start - 1:start] == b'"'
+                and encoded_entity[end:end + 1] == b'"'
+                )
+            if not whole_string:
+                kind = _PART_OF_STRING
+            else:
+                start -= 1
+                end += 1
+                kind = _STRING if match.group(2) == b"1" else _JSON_VALUE
+
+            segments.append(encoded_entity[position:start])
+            holes.append((match.group(1).decode("ascii"), kind))
+            position = end
+
+        segments.append(encoded_entity[position:])
+
+        self._segments = tuple(segments)
+        self._holes = tuple(holes)
+
+        if tracing.enabled:
+            tracing.info(__name__, "Successfully created a template with %d holes", len(holes))
+
+    @property
+    def names(self):
+        """Names of the holes of the template."""
+        return frozenset(name for name, _ in self._holes)
+
+    def render(self, values):
+        """Render the template.
+
+        :param values: mapping with values of the holes. Values of holes that are not whole
+            property values are converted to strings.
+        :returns: bytes with the encoded entity.
+        :raises: :class:ValueError.
+        """
+        segments = self._segments
+        encode = self._codec.encode
+
+        parts = [segments[0]]
+        for (name, kind), segment in zip(self._holes, segments[1:]):
+            try:
+                value = values[name]
+            except KeyError as error:
+                tracing.error(__name__, "Value for the hole '%s' is not passed", name)
+                raise ValueError("Value for the hole '{0}' is not passed".format(name)) from error
+
+            if kind is _JSON_VALUE:
+                parts.append(encode(value))
+            elif kind is _STRING:
+                parts.append(encode(str(value)))
+            else:
+                parts.append(encode(str(value))[1:-1])
+            parts.append(segment)
+
+        return b"".join(parts)
+
+
+def _mark_string_holes(data):
+    """Close holes in members of Siren components with the marker of string holes.
+
+    Marshaled data are copied, so that cached data of the marshaler are not changed.
+
+    :param data: marshaled Siren component or its member.
+    :returns: data with marked holes.
+    :raises: :class:ValueError if a hole is used in a key of properties.
+    """
+    if isinstance(data, str):
+        return _HOLE_PATTERN.sub(_HOLE_MARKER + r"\1" + _STRING_HOLE_MARKER, data)
+
+    if isinstance(data, dict):
+        marked_data = {}
+        for key, value in data.items():
+            if key == "properties":
+                _check_property_keys(value)
+                marked_data[key] = value
+            else:
+                marked_data[key] = _mark_string_holes(value)
+        return marked_data
+
+    if isinstance(data, (list, tuple)):
+        return [_mark_string_holes(value) for value in data]
+
+    return data
+
+
+def _check_property_keys(properties):
+    """Check that holes are not used in keys of properties.
+
+    :param properties: marshaled properties.
+    :raises: :class:ValueError if a hole is used in a key.
+    """
+    stack = [properties]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key in value:
+                if isinstance(key, str) and _HOLE_PATTERN.search(key):
+                    raise ValueError("Holes can't be used in keys of properties")
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
@@ -0,0 +1,63 @@
+"""Module to write targets relative to a base URL and resolve them back."""
+
+import functools
+from urllib.parse import urljoin
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class URLResolver:
+    """Class to convert targets of links and actions between absolute and relative forms.
+
+    A target is written relative to the base URL only if joining it with the base URL gives the
+    original target. Results of joins are memoized, so repeated targets of a page are resolved
+    once.
+
+    :param base_url: absolute base URL, e.g. "https://api.example.com/".
+    :param cache_size: maximal number of memoized targets of each form.
+    """
+
+    def __init__(self, base_url, cache_size=DEFAULT_CACHE_SIZE):
+        self._base_url = str(base_url)
+        self._cache_size = int(cache_size)
+
+        self.resolve = functools.lru_cache(maxsize=self._cache_size)(self._resolve)
+        self.relativize = functools.lru_cache(maxsize=self._cache_size)(self._relativize)
+
+    @property
+    def base_url(self):
+        """Base URL of relative targets."""
+        return self._base_url
+
+    def _resolve(self, target):
+        """Resolve a target against the base URL.
+
+        :param target: string relative or absolute target.
+        :returns: string absolute target.
+        """
+        return urljoin(self._base_url, target)
+
+    def _relativize(self, target):
+        """Write a target relative to the base URL.
+
+        :param target: string absolute target.
+        :returns: string relative target or the original one if it can't be written relative to
+            the base URL.
+        """
+        base_url = self._base_url
+        if not target.startswith(base_url):
+            return target
+
+        relative_target = target[len(base_url):]
+        if self.resolve(relative_target) != target:
+            return target
+
+        return relative_target
+
+    def __getstate__(self):
+        # Memoized functions are recreated in other processes.
+        return {"base_url": self._base_url, "cache_size": self._cache_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
@@ -0,0 +1,128 @@
+"""Module with hooks to trace serialization of Siren objects.
+
+Marshalers and parsers report their progress with the functions of this module. Nothing is done
+unless a hook is installed, and hot paths check :data:`enabled` before they prepare a trace, so
+tracing costs nothing by default. To get log records as before, install a logging hook::
+
+    from lila.serialization import tracing
+
+    tracing.install_hook(tracing.LoggingHook())
+"""
+
+import logging
+import threading
+
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+ERROR = logging.ERROR
+
+# Flag to check before a trace is prepared. It's True only if some hooks are installed.
+enabled = False     # pylint: disable=invalid-name
+
+_hooks = ()
+_lock = threading.Lock()
+
+
+class Hook:
+    """Base class for hooks to trace serialization."""
+
+    def trace(self, source, level, message, args):
+        """Handle a trace.
+
+        :param source: name of the module that emits the trace.
+        :param level: level of the trace, one of DEBUG, INFO and ERROR.
+        :param message: message of the trace in printf-style.
+        :param args: arguments to format the message.
+        """
+        raise NotImplementedError("Hook does not support traces")
+
+
+class LoggingHook(Hook):
+    """Hook to emit traces as log records.
+
+    Records are emitted by the logger with the name of the module that emits the trace.
+    """
+
+    def trace(self, source, level, message, args):
+        """Emit a log record.
+
+        :param source: name of the module that emits the trace.
+        :param level: level of the trace, one of DEBUG, INFO and ERROR.
+        :param message: message of the trace in printf-style.
+        :param args: arguments to format the message.
+        """
+        logging.getLogger(source).log(level, message, *args)
+
+
+def install_hook(hook):
+    """Install a hook.
+
+    :param hook: :class:`Hook`.
+    """
+    global _hooks, enabled     # pylint: disable=global-statement,invalid-name
+
+    with _lock:
+        _hooks = _hooks + (hook, )
+        enabled = True
+
+
+def uninstall_hook(hook):
+    """Uninstall a previously installed hook.
+
+    :param hook: :class:`Hook`.
+    :raises: :class:ValueError if the hook is not installed.
+    """
+    global _hooks, enabled     # pylint: disable=global-statement,invalid-name
+
+    with _lock:
+        hooks = list(_hooks)
+        try:
+            hooks.remove(hook)
+        except ValueError as error:
+            raise ValueError("Hook is not installed") from error
+
+        _hooks = tuple(hooks)
+        enabled = bool(_hooks)
+
+
+def trace(source, level, message, *args):
+    """Pass a trace to the installed hooks.
+
+    :param source: name of the module that emits the trace.
+    :param level: level of the trace, one of DEBUG, INFO and ERROR.
+    :param message: message of the trace in printf-style.
+    :param args: arguments to format the message.
+    """
+    for hook in _hooks:
+        hook.trace(source, level, message, args)
+
+
+def debug(source, message, *args):
+    """Pass a debug trace to the installed hooks.
+
+    :param source: name of the module that emits the trace.
+    :param message: message of the trace in printf-style.
+    :param args: arguments to format the message.
+    """
+    trace(source, DEBUG, message, *args)
+
+
+def info(source, message, *args):
+    """Pass an informational trace to the installed hooks.
+
+    :param source: name of the module that emits the trace.
+    :param message: message of the trace in printf-style.
+    :param args: arguments to format the message.
+    """
+    trace(source, INFO, message, *args)
+
+
+def error(source, message, *args):
+    """Pass an error trace to the installed hooks.
+
+    :param source: name of the module that emits the trace.
+    :param message: message of the trace in printf-style.
+    :param args: arguments to format the message.
+    """
+    trace(source, ERROR, message, *args)
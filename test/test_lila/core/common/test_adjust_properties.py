@@ -5,6 +5,7 @@ from collections import namedtuple
 import pytest
 
 from lila.core.common import adjust_properties
+from lila.core.raw import RawJSON
 
 
 Namedtuple = namedtuple("Namedtuple", "first second")
@@ -111,3 +112,14 @@ def test_invalid_values(invalid_value):
 
     expected_message = "Unsupported value for property '{name}'".format(name=property_name)
     assert error_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_raw_values():
+    """Check that raw JSON values are kept as is.
+
+    1. Create a dictionary with a raw JSON value.
+    2. Pass the dictionary to adjust_properties.
+    3. Check that the same raw value is returned.
+    """
+    raw_value = RawJSON('{"key": [1, 2]}')
+    assert adjust_properties({"raw": raw_value}) == {"raw": raw_value}, "Wrong convertion"
@@ -0,0 +1,79 @@
+"""Test cases for raw JSON values."""
+
+from copy import deepcopy
+
+import pytest
+
+from lila.core.raw import RawJSON, load_raw_json
+
+
+@pytest.mark.parametrize(
+    argnames="document",
+    argvalues=['{"name": "Ünïcode"}', '{"name": "Ünïcode"}'.encode("utf-8")],
+    ids=["String", "Bytes"],
+    )
+def test_document(document):
+    """Check that the document of a raw value is kept as a string.
+
+    1. Create a raw value.
+    2. Check the document.
+    3. Check the decoded value.
+    """
+    raw_value = RawJSON(document)
+    assert raw_value.document == '{"name": "Ünïcode"}', "Wrong document"
+    assert raw_value.load() == {"name": "Ünïcode"}, "Wrong value"
+
+
+def test_invalid_encoding():
+    """Check that ValueError is raised if the document is not encoded in UTF-8.
+
+    1. Try to create a raw value from bytes that are not UTF-8.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        RawJSON(b"\xff")
+
+    assert error_info.value.args[0] == "Raw JSON document must be encoded in UTF-8", "Wrong error"
+
+
+def test_validation():
+    """Check that invalid documents are rejected on creation if validation is requested.
+
+    1. Create a raw value with invalid document without validation.
+    2. Try to create a raw value with invalid document with validation.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    """
+    RawJSON("{", validate=False)
+
+    with pytest.raises(ValueError) as error_info:
+        RawJSON("{", validate=True)
+
+    assert error_info.value.args[0] == "Invalid raw JSON document", "Wrong error"
+
+
+def test_deepcopy():
+    """Check that raw values are not copied.
+
+    1. Create a raw value.
+    2. Copy the value.
+    3. Check that the same object is returned.
+    """
+    raw_value = RawJSON("[]")
+    assert deepcopy(raw_value) is raw_value, "Raw value is copied"
+
+
+@pytest.mark.parametrize(
+    argnames="value",
+    argvalues=[object(), RawJSON("{")],
+    ids=["Not raw value", "Invalid document"],
+    )
+def test_load_invalid_value(value):
+    """Check that TypeError is raised by the hook for values that can't be loaded.
+
+    1. Try to load a value with the hook.
+    2. Check that TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        load_raw_json(value)
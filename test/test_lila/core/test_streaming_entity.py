@@ -0,0 +1,66 @@
+"""Test cases for Siren entities with lazy sub-entities."""
+
+import pytest
+
+from lila.core.entity import StreamingEntity, EmbeddedRepresentation
+from lila.core.link import EmbeddedLink
+
+
+def test_lazy_entities():
+    """Check that sub-entities are taken from the iterable lazily.
+
+    1. Create a streaming entity with a generator of sub-entities.
+    2. Check that the generator is not consumed on creation.
+    3. Iterate over sub-entities.
+    4. Check the sub-entities.
+    """
+    consumed = []
+
+    def _generate_entities():
+        for index in range(3):
+            consumed.append(index)
+            yield EmbeddedLink(relations=["item"], target="/items/{0}".format(index))
+
+    entity = StreamingEntity(entities=_generate_entities())
+    assert not consumed, "Sub-entities are consumed on creation"
+
+    targets = [sub_entity.target for sub_entity in entity.entities]
+    assert targets == ["/items/0", "/items/1", "/items/2"], "Wrong sub-entities"
+
+
+def test_reusable_iterable():
+    """Check that sub-entities can be iterated several times if the iterable allows it.
+
+    1. Create a streaming entity with a list of sub-entities.
+    2. Iterate over sub-entities twice.
+    3. Check that the same sub-entities are produced.
+    """
+    sub_entities = [
+        EmbeddedLink(relations=["item"], target="/item"),
+        EmbeddedRepresentation(relations=["item"]),
+        ]
+    entity = StreamingEntity(entities=sub_entities)
+
+    assert list(entity.entities) == sub_entities, "Wrong sub-entities"
+    assert list(entity.entities) == sub_entities, "Wrong sub-entities on the second iteration"
+
+
+def test_incompatible_entities():
+    """Check that ValueError is raised when a sub-entity of incompatible type is produced.
+
+    1. Create a streaming entity with a sub-entity of incompatible type.
+    2. Iterate over sub-entities.
+    3. Check that valid sub-entities are produced before the error.
+    4. Check that ValueError is raised.
+    5. Check the error message.
+    """
+    valid_entity = EmbeddedLink(relations=["item"], target="/item")
+    iterator = iter(StreamingEntity(entities=[valid_entity, None]).entities)
+
+    assert next(iterator) is valid_entity, "Wrong sub-entity"
+    with pytest.raises(ValueError) as error_info:
+        next(iterator)
+
+    assert error_info.value.args[0] == "Some of the entities are of incompatible type", (
+        "Wrong error"
+        )
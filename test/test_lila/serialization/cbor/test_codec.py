@@ -0,0 +1,149 @@
+"""Test cases for CBOR codec."""
+
+import pytest
+
+from lila.serialization.cbor.codec import Tag, encode, decode
+
+
+@pytest.mark.parametrize(
+    argnames="value,encoded_value",
+    argvalues=[
+        (0, "00"),
+        (23, "17"),
+        (24, "1818"),
+        (1000, "1903e8"),
+        (1000000, "1a000f4240"),
+        (1000000000000, "1b000000e8d4a51000"),
+        (18446744073709551616, "c249010000000000000000"),
+        (-18446744073709551617, "c349010000000000000000"),
+        (-1000, "3903e7"),
+        (1.1, "fb3ff199999999999a"),
+        (False, "f4"),
+        (True, "f5"),
+        (None, "f6"),
+        (b"\x01\x02", "420102"),
+        ("ü", "62c3bc"),
+        ([1, [2, 3]], "8201820203"),
+        ({"a": 1, "b": [2, 3]}, "a26161016162820203"),
+        ],
+    ids=[
+        "Zero",
+        "Tiny integer",
+        "One byte integer",
+        "Two bytes integer",
+        "Four bytes integer",
+        "Eight bytes integer",
+        "Positive bignum",
+        "Negative bignum",
+        "Negative integer",
+        "Float",
+        "False",
+        "True",
+        "Null",
+        "Bytes",
+        "Text",
+        "Nested arrays",
+        "Map",
+        ],
+    )
+def test_encode(value, encoded_value):
+    """Test that values are encoded as in examples of RFC 8949.
+
+    1. Encode a value.
+    2. Check the encoded bytes.
+    3. Decode the bytes.
+    4. Check the decoded value.
+    """
+    encoded_data = encode(value)
+    assert encoded_data == bytes.fromhex(encoded_value), "Wrong encoded data"
+    assert decode(encoded_data) == value, "Wrong decoded data"
+
+
+@pytest.mark.parametrize(
+    argnames="encoded_value,value",
+    argvalues=[
+        ("f93c00", 1.0),
+        ("f9c400", -4.0),
+        ("f97bff", 65504.0),
+        ("f90001", 5.960464477539063e-08),
+        ("f9fc00", float("-inf")),
+        ("fa47c35000", 100000.0),
+        ("f7", None),
+        ("c11a514b67b0", 1363896240),
+        ("5f42010243030405ff", b"\x01\x02\x03\x04\x05"),
+        ("7f657374726561646d696e67ff", "streaming"),
+        ("9f018202039f0405ffff", [1, [2, 3], [4, 5]]),
+        ("bf61610161629f0203ffff", {"a": 1, "b": [2, 3]}),
+        ],
+    ids=[
+        "Half precision float",
+        "Negative half precision float",
+        "Largest half precision float",
+        "Subnormal half precision float",
+        "Half precision infinity",
+        "Single precision float",
+        "Undefined",
+        "Unknown tag",
+        "Indefinite bytes",
+        "Indefinite text",
+        "Indefinite arrays",
+        "Indefinite map",
+        ],
+    )
+def test_decode(encoded_value, value):
+    """Test that items, which are not produced by the encoder, are decoded.
+
+    1. Decode an item from examples of RFC 8949.
+    2. Check the decoded value.
+    """
+    assert decode(bytes.fromhex(encoded_value)) == value, "Wrong decoded data"
+
+
+@pytest.mark.parametrize(
+    argnames="encoded_value",
+    argvalues=["", "1a0000", "6261", "62c328", "8201", "0000", "ff", "9f01", "1c", "f0", "a18101"],
+    ids=[
+        "Empty",
+        "Truncated integer",
+        "Truncated text",
+        "Invalid UTF-8",
+        "Truncated array",
+        "Trailing data",
+        "Break marker",
+        "Missing break marker",
+        "Reserved additional information",
+        "Unsupported simple value",
+        "Unhashable key",
+        ],
+    )
+def test_invalid_data(encoded_value):
+    """Test that ValueError is raised for invalid data.
+
+    1. Try to decode invalid data.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        decode(bytes.fromhex(encoded_value))
+
+
+def test_non_serializable_data():
+    """Test that ValueError is raised for data, which can't be encoded.
+
+    1. Try to encode data with an object.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        encode({"key": object()})
+
+
+def test_tags():
+    """Test that requested tags are kept on decoding.
+
+    1. Encode data with tags.
+    2. Decode the data with a requested tag.
+    3. Check that only the requested tag is kept.
+    """
+    encoded_data = encode([Tag(6, 1), Tag(7, "value")])
+    assert encoded_data == bytes.fromhex("82c601c76576616c7565"), "Wrong encoded data"
+
+    assert decode(encoded_data, tags=[6]) == [Tag(6, 1), "value"], "Wrong decoded data"
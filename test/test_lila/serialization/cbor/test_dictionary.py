@@ -0,0 +1,210 @@
+"""Test cases for dictionary-coded binary format."""
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.cbor.marshaler import CBORMarshaler
+from lila.serialization.cbor.dictionary import DictionaryMarshaler, DictionaryParser
+from lila.serialization.cbor.codec import Tag, encode
+
+
+_LINK = Link(relations=["self"], target="/orders/1", title="Order", target_media_type="x")
+_ACTION = Action(name="pay", target="/orders/1/payment", fields=[Field(name="sum", value=1)])
+_REPRESENTATION = EmbeddedRepresentation(
+    relations=["item"],
+    properties={"price": 5.5, "count": 2, "tags": ["self", "x"]},
+    links=[_LINK],
+    actions=[_ACTION],
+    )
+
+
+def _create_collection(size):
+    """Create an entity with a collection of similar representations.
+
+    :param size: number of representations.
+    :returns: Siren entity.
+    """
+    return Entity(
+        classes=["collection"],
+        entities=[
+            EmbeddedRepresentation(
+                relations=["item"],
+                classes=["order"],
+                properties={"number": number, "status": "pending"},
+                links=[
+                    Link(relations=["self"], target="/orders/{0}".format(number)),
+                    Link(relations=["collection"], target="/orders"),
+                    ],
+                actions=[Action(name="cancel", target="/orders", method="DELETE")],
+                )
+            for number in range(size)
+            ],
+        links=[Link(relations=["self"], target="/orders")],
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="kind,component",
+    argvalues=[
+        ("field", Field(name="sum", value=1)),
+        ("action", _ACTION),
+        ("link", _LINK),
+        ("embedded_link", EmbeddedLink(relations=["item"], target="/items/1")),
+        ("embedded_representation", _REPRESENTATION),
+        ("entity", Entity(
+            properties={"total": 10, "nested": {"values": [None, True, "item"]}},
+            entities=[
+                _REPRESENTATION,
+                EmbeddedLink(relations=["item"], target="/orders/1"),
+                EmbeddedRepresentation(relations=["item"], links=[_LINK], actions=[_ACTION]),
+                ],
+            links=[_LINK],
+            actions=[_ACTION],
+            title="Orders",
+            )),
+        ],
+    ids=["Field", "Action", "Link", "Embedded link", "Embedded representation", "Entity"],
+    )
+def test_roundtrip(kind, component):
+    """Test that components are marshaled into the format and parsed back.
+
+    1. Marshal a component with dictionary marshaler.
+    2. Parse the bytes with dictionary parser.
+    3. Check that the parsed component has the same data as the original one.
+    """
+    encoded_data = getattr(DictionaryMarshaler(), "marshal_" + kind)(component)
+    parsed_component = getattr(DictionaryParser(), "parse_" + kind)(encoded_data)
+
+    marshal = getattr(JSONMarshaler(), "marshal_" + kind)
+    assert marshal(parsed_component) == marshal(component), "Wrong parsed component"
+
+
+def test_shared_objects():
+    """Test that equal strings and components are parsed into shared objects.
+
+    1. Marshal an entity with a collection of similar representations.
+    2. Parse the entity.
+    3. Check that equal links and actions of representations are the same objects.
+    4. Check that equal strings are written once.
+    """
+    entity = _create_collection(size=3)
+    encoded_entity = DictionaryMarshaler().marshal_entity(entity)
+    parsed_entity = DictionaryParser().parse_entity(encoded_entity)
+
+    first_item, second_item, _ = parsed_entity.entities
+    assert first_item.links[1] is second_item.links[1], "Link is not shared"
+    assert first_item.actions[0] is second_item.actions[0], "Action is not shared"
+    assert first_item.links[0] is not second_item.links[0], "Different links are shared"
+
+    assert encoded_entity.count(b"pending") == 1, "String is written several times"
+
+
+def test_size():
+    """Test that the format is smaller than CBOR for collections.
+
+    1. Marshal an entity with a collection of similar representations into the format.
+    2. Marshal the entity into CBOR.
+    3. Check that the format is at least twice as small.
+    """
+    entity = _create_collection(size=100)
+
+    size = len(DictionaryMarshaler().marshal_entity(entity))
+    cbor_size = len(CBORMarshaler().marshal_entity(entity))
+    assert size * 2 < cbor_size, "Format is not compact"
+
+
+@pytest.mark.parametrize(
+    argnames="encoded_data",
+    argvalues=[
+        b"\x9f",
+        encode({"entity": []}),
+        encode([2, [], [], {}]),
+        encode([1, [1], [], {}]),
+        encode([1, ["class"], [], {0: Tag(6, 1)}]),
+        encode([1, ["links"], [], {0: [Tag(7, 0)]}]),
+        encode([1, ["class"], [], {0: Tag(6, -1)}]),
+        encode([1, ["links"], [], {0: 1}]),
+        ],
+    ids=[
+        "Invalid CBOR",
+        "Not a document",
+        "Unsupported version",
+        "Invalid table of strings",
+        "Missing string",
+        "Missing component",
+        "Negative index",
+        "Invalid entity",
+        ],
+    )
+def test_invalid_data(encoded_data):
+    """Test that ValueError is raised for invalid documents.
+
+    1. Try to parse an invalid document.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        DictionaryParser().parse_entity(encoded_data)
+
+
+def test_parser():
+    """Test that the passed JSON parser is used to create Siren objects.
+
+    1. Marshal an entity with a relative link.
+    2. Parse the entity with dictionary parser with a JSON parser with a base URL.
+    3. Check that the target of the link is resolved.
+    4. Check that equal links are still shared.
+    """
+    entity = _create_collection(size=2)
+    encoded_entity = DictionaryMarshaler().marshal_entity(entity)
+
+    parser = DictionaryParser(parser=JSONParser(base_url="https://example.com/api/"))
+    parsed_entity = parser.parse_entity(encoded_entity)
+
+    assert parsed_entity.links[0].target == "https://example.com/orders", "Wrong target"
+    first_item, second_item = parsed_entity.entities
+    assert first_item.links[1] is second_item.links[1], "Link is not shared"
+
+
+def test_component_reference_in_properties():
+    """Test that ValueError is raised if a component is referenced in properties.
+
+    1. Create a document with a chain of components that reference each other twice.
+    2. Try to parse the document with a reference to the last component in properties.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    """
+    components = [[Tag(6, 1)]] + [[Tag(7, index), Tag(7, index)] for index in range(21)]
+    document = encode([1, ["properties", "value"], components, {0: {1: Tag(7, 21)}}])
+
+    with pytest.raises(ValueError) as error_info:
+        DictionaryParser().parse_entity(document)
+
+    assert error_info.value.args[0] == (
+        "Components can be referenced only in links, actions, fields and sub-entities"
+        ), "Wrong error"
+
+
+def test_max_expanded_size():
+    """Test that ValueError is raised if a document with expanded references is too large.
+
+    1. Create a document with a long string referenced many times in properties.
+    2. Try to parse the document with limited expanded size.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    5. Check that the document is parsed with a larger limit.
+    """
+    document = encode([1, ["properties", "value", "x" * 1000], [], {0: {1: [Tag(6, 2)] * 100}}])
+
+    with pytest.raises(ValueError) as error_info:
+        DictionaryParser(max_expanded_size=10000).parse_entity(document)
+
+    expected_message = "Document is too large with expanded references"
+    assert error_info.value.args[0] == expected_message, "Wrong error"
+
+    parsed_entity = DictionaryParser(max_expanded_size=200000).parse_entity(document)
+    assert parsed_entity.properties == {"value": ["x" * 1000] * 100}, "Wrong properties"
@@ -0,0 +1,78 @@
+"""Test cases for CBOR marshaler."""
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.cbor.marshaler import CBORMarshaler
+from lila.serialization.cbor.codec import decode
+
+
+_LINK = Link(relations=["self"], target="/orders/1", title="Order", target_media_type="x")
+_ACTION = Action(name="pay", target="/orders/1/payment", fields=[Field(name="sum", value=1)])
+_REPRESENTATION = EmbeddedRepresentation(
+    relations=["item"],
+    properties={"price": 5.5, "count": 2},
+    links=[_LINK],
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="method_name,component",
+    argvalues=[
+        ("marshal_field", Field(name="sum", value=1)),
+        ("marshal_action", _ACTION),
+        ("marshal_link", _LINK),
+        ("marshal_embedded_link", EmbeddedLink(relations=["item"], target="/items/1")),
+        ("marshal_embedded_representation", _REPRESENTATION),
+        ("marshal_entity", Entity(
+            properties={"total": 10, "nested": {"values": [None, True]}},
+            entities=[_REPRESENTATION],
+            links=[_LINK],
+            actions=[_ACTION],
+            title="Orders",
+            )),
+        ],
+    ids=["Field", "Action", "Link", "Embedded link", "Embedded representation", "Entity"],
+    )
+def test_marshal(method_name, component):
+    """Test that components are marshaled into CBOR with the same data as into JSON.
+
+    1. Marshal a component with CBOR marshaler.
+    2. Decode the bytes.
+    3. Check that decoded data are the same as marshaled with JSON marshaler.
+    """
+    encoded_data = getattr(CBORMarshaler(), method_name)(component)
+    expected_data = getattr(JSONMarshaler(), method_name)(component)
+
+    assert decode(encoded_data) == expected_data, "Wrong marshaled data"
+
+
+def test_custom_marshaler():
+    """Test that the passed JSON marshaler is used to convert components into data.
+
+    1. Create CBOR marshaler with a compact JSON marshaler.
+    2. Marshal a link.
+    3. Check that the data are compact.
+    """
+    marshaler = CBORMarshaler(marshaler=JSONMarshaler(compact=True))
+    encoded_data = marshaler.marshal_link(Link(relations=["self"], target="/self"))
+
+    assert decode(encoded_data) == {"rel": ["self"], "href": "/self"}, "Wrong marshaled data"
+
+
+def test_invalid_entity():
+    """Test that invalid entities are rejected in the same way as by JSON marshaler.
+
+    1. Create an entity with invalid links.
+    2. Try to marshal the entity.
+    3. Check that ValueError is raised.
+    """
+    entity = Entity()
+    entity._links = [None]  # pylint: disable=protected-access
+
+    with pytest.raises(ValueError):
+        CBORMarshaler().marshal_entity(entity)
@@ -0,0 +1,72 @@
+"""Test cases for CBOR parser."""
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.cbor.marshaler import CBORMarshaler
+from lila.serialization.cbor.parser import CBORParser
+from lila.serialization.cbor.codec import encode
+
+
+_LINK = Link(relations=["self"], target="/orders/1", title="Order", target_media_type="x")
+_ACTION = Action(name="pay", target="/orders/1/payment", fields=[Field(name="sum", value=1)])
+_REPRESENTATION = EmbeddedRepresentation(
+    relations=["item"],
+    properties={"price": 5.5, "count": 2},
+    links=[_LINK],
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="kind,component",
+    argvalues=[
+        ("field", Field(name="sum", value=1)),
+        ("action", _ACTION),
+        ("link", _LINK),
+        ("embedded_link", EmbeddedLink(relations=["item"], target="/items/1")),
+        ("embedded_representation", _REPRESENTATION),
+        ("entity", Entity(
+            properties={"total": 10, "nested": {"values": [None, True]}},
+            entities=[_REPRESENTATION, EmbeddedLink(relations=["item"], target="/items/2")],
+            links=[_LINK],
+            actions=[_ACTION],
+            title="Orders",
+            )),
+        ],
+    ids=["Field", "Action", "Link", "Embedded link", "Embedded representation", "Entity"],
+    )
+def test_roundtrip(kind, component):
+    """Test that components marshaled into CBOR are parsed back.
+
+    1. Marshal a component with CBOR marshaler.
+    2. Parse the bytes with CBOR parser.
+    3. Check that the parsed component has the same data as the original one.
+    """
+    encoded_data = getattr(CBORMarshaler(), "marshal_" + kind)(component)
+    parsed_component = getattr(CBORParser(), "parse_" + kind)(encoded_data)
+
+    marshal = getattr(JSONMarshaler(), "marshal_" + kind)
+    assert marshal(parsed_component) == marshal(component), "Wrong parsed component"
+
+
+@pytest.mark.parametrize(
+    argnames="encoded_data",
+    argvalues=[
+        b"\x9f",
+        encode({"class": "not a list", "links": [{"rel": ["self"]}]}),
+        encode([]),
+        ],
+    ids=["Invalid CBOR", "Invalid entity", "Not a map"],
+    )
+def test_invalid_data(encoded_data):
+    """Test that ValueError is raised for invalid data.
+
+    1. Try to parse invalid data.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        CBORParser().parse_entity(encoded_data)
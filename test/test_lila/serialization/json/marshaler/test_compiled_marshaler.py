@@ -0,0 +1,184 @@
+"""Test cases for JSON marshaler with generated functions."""
+
+from collections import namedtuple
+
+import pytest
+
+from lila.core.field import Field, InputType
+from lila.core.action import Action, Method
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation, StreamingEntity
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.compiled import CompiledJSONMarshaler
+
+
+_FIELD = Field(
+    name="field name",
+    classes=("field class", ),
+    input_type=InputType.NUMBER,
+    value="42",
+    title="field title",
+    )
+
+_ACTION = Action(
+    name="action name",
+    target="/action",
+    classes=("action class", ),
+    method=Method.POST,
+    title="action title",
+    fields=(_FIELD, Field(name="second field")),
+    )
+
+_LINK = Link(relations=("self", ), target="/link", title="link title")
+
+_EMBEDDED_LINK = EmbeddedLink(relations=("item", ), target="/embedded/link")
+
+_EMBEDDED_REPRESENTATION = EmbeddedRepresentation(
+    relations=("item", ),
+    classes=("representation class", ),
+    properties={"name": "value", "nested": {"list": [1, 2.5, None, True]}},
+    entities=(_EMBEDDED_LINK, EmbeddedRepresentation(relations=("nested", ))),
+    links=(_LINK, ),
+    actions=(_ACTION, ),
+    title="representation title",
+    )
+
+_ENTITY = Entity(
+    classes=("entity class", ),
+    properties={"key": "value"},
+    entities=(_EMBEDDED_LINK, _EMBEDDED_REPRESENTATION),
+    links=(_LINK, ),
+    actions=(_ACTION, ),
+    title="entity title",
+    )
+
+
+class _TitledLink(Link):
+    """Link with redefined title."""
+
+    @property
+    def title(self):
+        return ["generated", "title"]
+
+
+_DuckLink = namedtuple("_DuckLink", "relations classes target title target_media_type")
+
+
+@pytest.mark.parametrize(
+    argnames="method_name,component",
+    argvalues=[
+        ("marshal_field", _FIELD),
+        ("marshal_action", _ACTION),
+        ("marshal_link", _LINK),
+        ("marshal_link", _TitledLink(relations=["self"], target="/titled")),
+        ("marshal_link", _DuckLink(("self", ), [1], "/duck", None, "application/json")),
+        ("marshal_embedded_link", _EMBEDDED_LINK),
+        ("marshal_embedded_representation", _EMBEDDED_REPRESENTATION),
+        ("marshal_entity", _ENTITY),
+        ("marshal_entity", Entity()),
+        ],
+    ids=[
+        "Field",
+        "Action",
+        "Link",
+        "Sub-class with redefined attribute",
+        "Object of another class",
+        "Embedded link",
+        "Embedded representation",
+        "Entity",
+        "Empty entity",
+        ],
+    )
+def test_marshal(method_name, component):
+    """Test that compiled marshaler produces the same data as JSON marshaler.
+
+    1. Marshal a component with JSON marshaler.
+    2. Marshal the component with compiled marshaler twice.
+    3. Check that data are the same.
+    """
+    expected_data = getattr(JSONMarshaler(), method_name)(component)
+
+    marshaler = CompiledJSONMarshaler()
+    assert getattr(marshaler, method_name)(component) == expected_data, "Wrong data"
+    assert getattr(marshaler, method_name)(component) == expected_data, "Wrong cached data"
+
+
+def test_independent_data():
+    """Test that marshaled data do not share mutable objects with the component.
+
+    1. Marshal an entity with compiled marshaler.
+    2. Modify marshaled properties and classes.
+    3. Marshal the entity again.
+    4. Check that data are not changed.
+    """
+    marshaler = CompiledJSONMarshaler()
+    entity_data = marshaler.marshal_entity(_ENTITY)
+    expected_data = JSONMarshaler().marshal_entity(_ENTITY)
+
+    entity_data["properties"]["key"] = "modified"
+    entity_data["class"].append("modified")
+
+    assert marshaler.marshal_entity(_ENTITY) == expected_data, "Data are shared"
+
+
+_DuckField = namedtuple("_DuckField", "name classes input_type value title")
+_DuckAction = namedtuple("_DuckAction", "name classes method target title media_type fields")
+
+
+@pytest.mark.parametrize(
+    argnames="method_name,component",
+    argvalues=[
+        ("marshal_field", object()),
+        ("marshal_field", _DuckField("name", (), "unknown", None, None)),
+        ("marshal_action", _DuckAction("name", (), "GET", "/", None, None, [None])),
+        ("marshal_link", _DuckLink(None, (), "/", None, None)),
+        ("marshal_entity", None),
+        ("marshal_embedded_representation", _ENTITY),
+        ],
+    ids=[
+        "Field without attributes",
+        "Field with unsupported input type",
+        "Action with invalid field",
+        "Link with non-iterable relations",
+        "None as entity",
+        "Embedded representation without relations",
+        ],
+    )
+def test_invalid_component(method_name, component):
+    """Test that compiled marshaler raises the same errors as JSON marshaler.
+
+    1. Try to marshal an invalid component with JSON marshaler.
+    2. Try to marshal the component with compiled marshaler.
+    3. Check that the same errors are raised.
+    """
+    with pytest.raises(ValueError) as expected_error_info:
+        getattr(JSONMarshaler(), method_name)(component)
+
+    with pytest.raises(ValueError) as actual_error_info:
+        getattr(CompiledJSONMarshaler(), method_name)(component)
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+def test_invalid_streaming_entity():
+    """Test that an error of a streaming entity is raised although its iterator is consumed.
+
+    1. Try to marshal a streaming entity with an iterator of an invalid sub-entity with
+       JSON marshaler.
+    2. Try to marshal the same streaming entity with compiled marshaler.
+    3. Check that the same errors are raised.
+    """
+    def _create_entity():
+        return StreamingEntity(entities=iter([EmbeddedLink(relations=["item"], target="/"), None]))
+
+    with pytest.raises(ValueError) as expected_error_info:
+        JSONMarshaler().marshal_entity(_create_entity())
+
+    with pytest.raises(ValueError) as actual_error_info:
+        CompiledJSONMarshaler().marshal_entity(_create_entity())
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
@@ -1,12 +1,18 @@
 """Test cases for JSON marshaler."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
 import pytest
 
 from lila.core.field import Field
 from lila.core.action import Action
 from lila.core.link import Link, EmbeddedLink
 from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.cache import FragmentCache
 from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.codec import StandardCodec
 from lila.serialization.json.field import FieldMarshaler
 from lila.serialization.json.action import ActionMarshaler
 from lila.serialization.json.link import LinkMarshaler, EmbeddedLinkMarshaler
@@ -349,3 +355,220 @@ def test_invalid_entity():
     assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
         "Wrong error is raised"
         )
+
+
+def test_fragment_cache():
+    """Test that json marshaler uses the fragment cache for links and actions.
+
+    1. Create json marshaler with a fragment cache.
+    2. Marshal an entity with shared link and action twice.
+    3. Check that data are the same as without the cache.
+    4. Check that cached data are not shared between marshaled entities.
+    5. Check statistics of the cache.
+    """
+    link = Link(relations=["self"], target="/link")
+    action = Action(name="action", target="/action")
+    entity = Entity(
+        entities=[EmbeddedLink(relations=["item"], target="/item")],
+        links=[link],
+        actions=[action],
+        )
+    expected_data = JSONMarshaler().marshal_entity(entity)
+
+    cache = FragmentCache()
+    marshaler = JSONMarshaler(fragment_cache=cache)
+    assert marshaler.fragment_cache is cache, "Wrong cache"
+
+    first_data = marshaler.marshal_entity(entity)
+    first_data["links"][0]["rel"].append("modified")
+    second_data = marshaler.marshal_entity(entity)
+
+    assert second_data == expected_data, "Wrong data"
+    assert cache.hits == 3, "Wrong number of hits"
+    assert cache.misses == 3, "Wrong number of misses"
+
+
+@pytest.mark.parametrize(
+    argnames="first_compact",
+    argvalues=[False, True],
+    ids=["Compact second", "Compact first"],
+    )
+def test_shared_fragment_cache(first_compact):
+    """Test that compact and regular marshalers don't share cached data.
+
+    1. Create compact and regular json marshalers with the same fragment cache.
+    2. Marshal an action with both marshalers.
+    3. Check that data are the same as without the cache.
+    """
+    action = Action(name="action", target="/action", fields=[Field(name="field")])
+    cache = FragmentCache()
+    marshalers = [
+        JSONMarshaler(fragment_cache=cache, compact=first_compact),
+        JSONMarshaler(fragment_cache=cache, compact=not first_compact),
+        ]
+
+    for marshaler in marshalers:
+        expected_data = JSONMarshaler(compact=marshaler.compact).marshal_action(action)
+        assert marshaler.marshal_action(action) == expected_data, "Wrong data"
+
+
+@pytest.mark.parametrize(
+    argnames="executor_class",
+    argvalues=[None, ThreadPoolExecutor, ProcessPoolExecutor],
+    ids=["Without executor", "Thread pool", "Process pool"],
+    )
+def test_marshal_many(executor_class):
+    """Test that several entities are marshaled in the same order.
+
+    1. Create json marshaler with a fragment cache.
+    2. Marshal several entities with an executor and small chunks.
+    3. Check that data are the same as for entities marshaled one by one.
+    """
+    link = Link(relations=["self"], target="/link")
+    entities = [Entity(title=index, links=[link]) for index in range(10)]
+    marshaler = JSONMarshaler(fragment_cache=FragmentCache())
+    expected_data = [JSONMarshaler().marshal_entity(entity) for entity in entities]
+
+    if executor_class is None:
+        actual_data = marshaler.marshal_many(entities, chunk_size=3)
+    else:
+        with executor_class(max_workers=2) as executor:
+            actual_data = marshaler.marshal_many(entities, executor=executor, chunk_size=3)
+
+    assert actual_data == expected_data, "Wrong data"
+
+
+def test_marshal_many_invalid_entity():
+    """Test that error is propagated if one of the entities can't be marshaled.
+
+    1. Create json marshaler.
+    2. Try to marshal several entities, one of which is invalid.
+    3. Check that error is raised.
+    4. Check that error is the same as one that is raised for the invalid entity.
+    """
+    marshaler = JSONMarshaler()
+    with pytest.raises(ValueError) as actual_error_info:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            marshaler.marshal_many([Entity(), None, Entity()], executor=executor, chunk_size=1)
+
+    with pytest.raises(ValueError) as expected_error_info:
+        marshaler.marshal_entity(None)
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="codec",
+    argvalues=[None, StandardCodec()],
+    ids=["Default codec", "Standard codec"],
+    )
+def test_marshal_entity_bytes(codec):
+    """Test that an entity is marshaled into JSON bytes.
+
+    1. Create json marshaler with a codec.
+    2. Marshal an entity into bytes.
+    3. Check that decoded bytes are the same as marshaled data.
+    """
+    entity = Entity(
+        classes=["entity"],
+        properties={"name": "Título"},
+        links=[Link(relations=["self"], target="/")],
+        )
+    marshaler = JSONMarshaler(codec=codec)
+
+    encoded_data = marshaler.marshal_entity_bytes(entity)
+
+    assert json.loads(encoded_data.decode("utf-8")) == marshaler.marshal_entity(entity), (
+        "Wrong data"
+        )
+
+
+def test_marshal_entity_bytes_invalid_entity():
+    """Test that error is propagated if the entity can't be marshaled.
+
+    1. Create json marshaler.
+    2. Try to marshal an invalid entity into bytes.
+    3. Check that error is the same as one that is raised by marshal_entity.
+    """
+    marshaler = JSONMarshaler()
+    with pytest.raises(ValueError) as actual_error_info:
+        marshaler.marshal_entity_bytes(None)
+
+    with pytest.raises(ValueError) as expected_error_info:
+        marshaler.marshal_entity(None)
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="method_name,component,expected_data",
+    argvalues=[
+        ("marshal_field", Field(name="field"), {"name": "field"}),
+        (
+            "marshal_field",
+            Field(name="field", classes=["class"], input_type="hidden", value="0", title=""),
+            {"name": "field", "class": ["class"], "type": "hidden", "value": "0", "title": ""},
+            ),
+        (
+            "marshal_action",
+            Action(name="action", target="/action", fields=[Field(name="field")]),
+            {
+                "name": "action",
+                "href": "/action",
+                "type": "application/x-www-form-urlencoded",
+                "fields": [{"name": "field"}],
+                },
+            ),
+        (
+            "marshal_link",
+            Link(relations=["self"], target="/self", target_media_type="application/json"),
+            {"rel": ["self"], "href": "/self", "type": "application/json"},
+            ),
+        (
+            "marshal_embedded_link",
+            EmbeddedLink(relations=["item"], target="/item"),
+            {"rel": ["item"], "href": "/item"},
+            ),
+        (
+            "marshal_embedded_representation",
+            EmbeddedRepresentation(relations=["item"], properties={"key": None}),
+            {"rel": ["item"], "properties": {"key": None}},
+            ),
+        ("marshal_entity", Entity(), {}),
+        (
+            "marshal_entity",
+            Entity(title="entity", links=[Link(relations=["self"], target="/self")]),
+            {"links": [{"rel": ["self"], "href": "/self"}], "title": "entity"},
+            ),
+        ],
+    ids=[
+        "Field with defaults",
+        "Field without defaults",
+        "Action",
+        "Link",
+        "Embedded link",
+        "Embedded representation",
+        "Empty entity",
+        "Entity",
+        ],
+    )
+def test_compact(method_name, component, expected_data, component_validator):
+    """Test that compact marshaler leaves out absent and default members.
+
+    1. Create json marshaler in compact mode.
+    2. Marshal a component.
+    3. Check the marshaled data.
+    4. Parse the data.
+    5. Check that the parsed component is the same as the original one.
+    """
+    data = getattr(JSONMarshaler(compact=True), method_name)(component)
+    assert data == expected_data, "Wrong data"
+
+    parse_method_name = method_name.replace("marshal_", "parse_")
+    parsed_component = getattr(JSONParser(), parse_method_name)(data)
+    validate_method_name = method_name.replace("marshal_", "validate_")
+    getattr(component_validator, validate_method_name)(parsed_component, component)
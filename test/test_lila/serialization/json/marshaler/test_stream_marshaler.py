@@ -0,0 +1,393 @@
+"""Test cases for JSON stream marshaler."""
+
+import io
+import json
+from collections import namedtuple
+
+import pytest
+
+from lila.core.field import Field, InputType
+from lila.core.action import Action, Method
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation, StreamingEntity
+from lila.core.raw import RawJSON
+from lila.serialization.cache import FragmentCache
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.stream import JSONStreamMarshaler
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+
+
+_FIELD = Field(
+    name="field name",
+    classes=("field class", ),
+    input_type=InputType.NUMBER,
+    value="42",
+    title="field title",
+    )
+
+_ACTION = Action(
+    name="action name",
+    target="/action",
+    classes=("action class", ),
+    method=Method.POST,
+    title="action title",
+    fields=(_FIELD, Field(name="second field")),
+    )
+
+_LINK = Link(
+    relations=("self", ),
+    target="/link",
+    classes=("link class", ),
+    title="Link \"title\" with non-ascii character é",
+    target_media_type="application/json",
+    )
+
+_EMBEDDED_LINK = EmbeddedLink(relations=("item", ), target="/embedded/link")
+
+_EMBEDDED_REPRESENTATION = EmbeddedRepresentation(
+    relations=("item", ),
+    classes=("representation class", ),
+    properties={"name": "value", "nested": {"list": [1, 2.5, None, True]}},
+    entities=(_EMBEDDED_LINK, EmbeddedRepresentation(relations=("nested", ))),
+    links=(_LINK, ),
+    actions=(_ACTION, ),
+    title="representation title",
+    )
+
+_ENTITY = Entity(
+    classes=("entity class", ),
+    properties={"key": "value"},
+    entities=(_EMBEDDED_LINK, _EMBEDDED_REPRESENTATION),
+    links=(_LINK, Link(relations=("next", ), target="/next")),
+    actions=(_ACTION, ),
+    title="entity title",
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="method_name,component",
+    argvalues=[
+        ("marshal_field", _FIELD),
+        ("marshal_action", _ACTION),
+        ("marshal_link", _LINK),
+        ("marshal_embedded_link", _EMBEDDED_LINK),
+        ("marshal_embedded_representation", _EMBEDDED_REPRESENTATION),
+        ("marshal_entity", _ENTITY),
+        ("marshal_entity", Entity()),
+        ],
+    ids=[
+        "Field",
+        "Action",
+        "Link",
+        "Embedded link",
+        "Embedded representation",
+        "Entity",
+        "Empty entity",
+        ],
+    )
+def test_marshal(method_name, component):
+    """Test that stream marshaler produces the same data as JSON marshaler.
+
+    1. Marshal a component with JSON marshaler.
+    2. Marshal the component with stream marshaler.
+    3. Check that decoded bytes are the same as the data of JSON marshaler.
+    """
+    expected_data = getattr(JSONMarshaler(), method_name)(component)
+    actual_data = getattr(JSONStreamMarshaler(), method_name)(component)
+    assert json.loads(actual_data.decode("utf-8")) == expected_data, "Wrong data"
+
+
+_InvalidEntity = namedtuple("_InvalidEntity", "classes properties entities links actions title")
+_InvalidLink = namedtuple("_InvalidLink", "relations classes target title target_media_type")
+_InvalidAction = namedtuple("_InvalidAction", "name classes method target title media_type fields")
+_InvalidField = namedtuple("_InvalidField", "name classes input_type value title")
+_PartialLink = namedtuple("_PartialLink", "relations classes target")
+
+
+@pytest.mark.parametrize(
+    argnames="method_name,component",
+    argvalues=[
+        ("marshal_field", object()),
+        ("marshal_field", _InvalidField("name", (), "unknown", None, None)),
+        ("marshal_action", _InvalidAction("name", (), "unknown", "/", None, None, ())),
+        ("marshal_action", _InvalidAction("name", (), "GET", "/", None, None, [None])),
+        ("marshal_link", _InvalidLink(None, (), "/", None, None)),
+        ("marshal_embedded_link", _PartialLink(("item", ), (), "/")),
+        ("marshal_entity", _InvalidEntity((), {"key": object()}, (), (), (), None)),
+        ("marshal_entity", _InvalidEntity((), {}, None, (), (), None)),
+        ("marshal_entity", _InvalidEntity((), {}, [object()], (), (), None)),
+        ("marshal_entity", _InvalidEntity((), {}, (), [object()], (), None)),
+        ("marshal_entity", _InvalidEntity((), {}, (), (), [object()], None)),
+        ("marshal_embedded_representation", _ENTITY),
+        ],
+    ids=[
+        "Field without attributes",
+        "Field with unsupported input type",
+        "Action with unsupported method",
+        "Action with invalid field",
+        "Link with non-iterable relations",
+        "Embedded link without title",
+        "Entity with invalid properties",
+        "Entity with non-iterable sub-entities",
+        "Entity with invalid sub-entity",
+        "Entity with invalid link",
+        "Entity with invalid action",
+        "Embedded representation without relations",
+        ],
+    )
+def test_invalid_component(method_name, component):
+    """Test that stream marshaler raises the same errors as JSON marshaler.
+
+    1. Try to marshal an invalid component with JSON marshaler.
+    2. Try to marshal the component with stream marshaler.
+    3. Check that the same errors are raised.
+    """
+    with pytest.raises(ValueError) as expected_error_info:
+        getattr(JSONMarshaler(), method_name)(component)
+
+    with pytest.raises(ValueError) as actual_error_info:
+        getattr(JSONStreamMarshaler(), method_name)(component)
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+def test_write_entity():
+    """Test that an entity is written into a stream in pieces.
+
+    1. Create a stream that records written pieces.
+    2. Write an entity into the stream with small buffer size.
+    3. Check that data are written in several pieces.
+    4. Check the written data.
+    """
+    class _RecordingStream(io.BytesIO):
+        def __init__(self):
+            super(_RecordingStream, self).__init__()
+            self.pieces = []
+
+        def write(self, data):
+            self.pieces.append(data)
+            return super(_RecordingStream, self).write(data)
+
+    marshaler = JSONStreamMarshaler()
+    stream = _RecordingStream()
+    marshaler.write_entity(entity=_ENTITY, stream=stream, buffer_size=1)
+
+    assert len(stream.pieces) > 1, "Data are written at once"
+    assert stream.getvalue() == marshaler.marshal_entity(_ENTITY), "Wrong data"
+
+
+def test_iter_marshal_entity():
+    """Test that an entity is marshaled into chunks lazily.
+
+    1. Create an entity with sub-entities that record access to their attributes.
+    2. Start to marshal the entity into chunks with small chunk size.
+    3. Get the first chunk.
+    4. Check that only the first sub-entity has been encoded.
+    5. Get the rest of the chunks.
+    6. Check the data.
+    """
+    encoded_targets = []
+
+    class _RecordingLink(EmbeddedLink):
+        @property
+        def relations(self):
+            encoded_targets.append(self.target)
+            return super(_RecordingLink, self).relations
+
+    sub_entities = [_RecordingLink(relations=["item"], target="/{0}".format(i)) for i in range(5)]
+    entity = Entity(entities=sub_entities)
+
+    marshaler = JSONStreamMarshaler()
+    chunks = marshaler.iter_marshal_entity(entity=entity, chunk_size=1)
+
+    first_chunk = next(chunks)
+    assert encoded_targets == ["/0"], "Sub-entities are not encoded lazily"
+
+    data = first_chunk + b"".join(chunks)
+    assert len(encoded_targets) == len(sub_entities), "Not all sub-entities are encoded"
+    assert json.loads(data.decode("utf-8")) == JSONMarshaler().marshal_entity(entity), (
+        "Wrong data"
+        )
+
+
+def test_fragment_cache():
+    """Test that stream marshaler uses the fragment cache for links and actions.
+
+    1. Create stream marshaler with a fragment cache.
+    2. Marshal an entity twice.
+    3. Check that data are the same as without the cache.
+    4. Check statistics of the cache.
+    """
+    expected_data = JSONStreamMarshaler().marshal_entity(_ENTITY)
+
+    cache = FragmentCache()
+    marshaler = JSONStreamMarshaler(fragment_cache=cache)
+    assert marshaler.fragment_cache is cache, "Wrong cache"
+
+    assert marshaler.marshal_entity(_ENTITY) == expected_data, "Wrong data"
+    assert marshaler.marshal_entity(_ENTITY) == expected_data, "Wrong cached data"
+    assert cache.hits > 0, "Cache is not used"
+
+
+@pytest.mark.parametrize(
+    argnames="entity",
+    argvalues=[
+        Entity(),
+        _ENTITY,
+        Entity(
+            title="Tïtle",
+            properties={"raw": RawJSON('{"ключ": "значение"}')},
+            entities=[RawEmbeddedRepresentation('{"rel": ["item"], "title": "Élément"}')],
+            ),
+        Entity(
+            properties={"text": "ünïcode"},
+            entities=[
+                EmbeddedRepresentation(
+                    relations=["item"],
+                    properties={"raw": RawJSON('["中文", 1]'), "text": "中文"},
+                    ),
+                ],
+            ),
+        ],
+    ids=["Empty entity", "Entity", "Raw fragments", "Nested raw properties"],
+    )
+@pytest.mark.parametrize(
+    argnames="fragment_cache",
+    argvalues=[None, FragmentCache()],
+    ids=["Without cache", "With cache"],
+    )
+def test_measure_entity(entity, fragment_cache):
+    """Test that the length of the encoded entity is computed exactly.
+
+    1. Create stream marshaler.
+    2. Measure an entity twice.
+    3. Check that both lengths are equal to the length of the marshaled entity.
+    """
+    marshaler = JSONStreamMarshaler(fragment_cache=fragment_cache)
+    expected_length = len(marshaler.marshal_entity(entity))
+
+    assert marshaler.measure_entity(entity) == expected_length, "Wrong length"
+    assert marshaler.measure_entity(entity) == expected_length, "Wrong memoized length"
+
+
+def test_memoized_lengths():
+    """Test that lengths of immutable components are memoized in the fragment cache.
+
+    1. Create stream marshaler with a fragment cache.
+    2. Measure an entity twice.
+    3. Check that lengths of the second measurement are taken from the cache.
+    """
+    fragment_cache = FragmentCache()
+    marshaler = JSONStreamMarshaler(fragment_cache=fragment_cache)
+
+    marshaler.measure_entity(_ENTITY)
+    misses = fragment_cache.misses
+    assert misses, "Lengths are not looked up in the cache"
+
+    marshaler.measure_entity(_ENTITY)
+    assert fragment_cache.misses == misses, "Lengths are not memoized"
+
+
+@pytest.mark.parametrize(
+    argnames="max_buffered_size,expected_chunks",
+    argvalues=[(10 ** 6, 1), (10, 6)],
+    ids=["Buffered", "Streamed"],
+    )
+def test_marshal_entity_body(max_buffered_size, expected_chunks):
+    """Test that the body is buffered or streamed depending on its size.
+
+    1. Create stream marshaler.
+    2. Marshal an entity into a body.
+    3. Check the number of chunks.
+    4. Check the length and the content of the body.
+    """
+    marshaler = JSONStreamMarshaler()
+    length, body = marshaler.marshal_entity_body(
+        _ENTITY,
+        max_buffered_size=max_buffered_size,
+        chunk_size=1,
+        )
+    chunks = list(body)
+
+    assert len(chunks) == expected_chunks, "Wrong number of chunks"
+    assert length == len(b"".join(chunks)), "Wrong length"
+    assert b"".join(chunks) == marshaler.marshal_entity(_ENTITY), "Wrong body"
+
+
+def test_streaming_entity():
+    """Test that sub-entities of a streaming entity are encoded as they are produced.
+
+    1. Create a streaming entity with a generator of sub-entities.
+    2. Marshal the entity into small chunks.
+    3. Check that the first chunk is produced before the generator is consumed.
+    4. Check that the output is the same as for the materialized entity.
+    """
+    produced = []
+
+    def _generate_entities():
+        for index in range(5):
+            produced.append(index)
+            yield EmbeddedLink(relations=["item"], target="/items/{0}".format(index))
+
+    marshaler = JSONStreamMarshaler()
+    chunks = marshaler.iter_marshal_entity(
+        StreamingEntity(entities=_generate_entities(), links=[_LINK]),
+        chunk_size=1,
+        )
+
+    first_chunk = next(chunks)
+    assert len(produced) == 1, "Sub-entities are not encoded lazily"
+
+    expected_entity = Entity(
+        entities=[
+            EmbeddedLink(relations=["item"], target="/items/{0}".format(index))
+            for index in range(5)
+            ],
+        links=[_LINK],
+        )
+    assert first_chunk + b"".join(chunks) == marshaler.marshal_entity(expected_entity), (
+        "Wrong data"
+        )
+
+
+def test_streaming_entity_body():
+    """Test that a body of a streaming entity is streamed without its length.
+
+    1. Create a streaming entity with a generator of sub-entities.
+    2. Marshal the entity into a body.
+    3. Check that the length is unknown.
+    4. Check that the body contains all sub-entities.
+    """
+    sub_entities = [
+        EmbeddedLink(relations=["item"], target="/items/{0}".format(index)) for index in range(5)
+        ]
+
+    marshaler = JSONStreamMarshaler()
+    length, body = marshaler.marshal_entity_body(
+        StreamingEntity(entities=iter(sub_entities)),
+        max_buffered_size=10 ** 6,
+        )
+
+    assert length is None, "Wrong length"
+    assert b"".join(body) == marshaler.marshal_entity(Entity(entities=sub_entities)), (
+        "Wrong body"
+        )
+
+
+def test_measure_streaming_entity():
+    """Test that ValueError is raised on attempt to measure a streaming entity.
+
+    1. Create a streaming entity with an iterator of sub-entities.
+    2. Try to measure the entity.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    5. Check that sub-entities are not consumed.
+    """
+    sub_entities = iter([_EMBEDDED_LINK])
+    with pytest.raises(ValueError) as error_info:
+        JSONStreamMarshaler().measure_entity(StreamingEntity(entities=sub_entities))
+
+    assert error_info.value.args[0] == "Streaming entity can't be measured", "Wrong error"
+    assert list(sub_entities) == [_EMBEDDED_LINK], "Sub-entities are consumed"
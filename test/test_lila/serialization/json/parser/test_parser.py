@@ -1,8 +1,12 @@
 """Test cases for JSON parser."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
 import pytest
 
 from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.codec import StandardCodec
 from lila.serialization.json.field import FieldParser
 from lila.serialization.json.action import ActionParser
 from lila.serialization.json.link import LinkParser, EmbeddedLinkParser
@@ -333,3 +337,84 @@ def test_invalid_entity():
     assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
         "Wrong error is raised"
         )
+
+
+@pytest.mark.parametrize(
+    argnames="executor_class",
+    argvalues=[None, ThreadPoolExecutor, ProcessPoolExecutor],
+    ids=["Without executor", "Thread pool", "Process pool"],
+    )
+def test_parse_many(executor_class, component_validator):
+    """Test that several entities are parsed in the same order.
+
+    1. Create json parser.
+    2. Parse several entities with an executor and small chunks.
+    3. Check that entities are the same as ones parsed one by one.
+    """
+    datas = [{"title": index, "links": [{"rel": ["self"], "href": "/"}]} for index in range(10)]
+    parser = JSONParser()
+    expected_entities = [parser.parse_entity(data) for data in datas]
+
+    if executor_class is None:
+        actual_entities = parser.parse_many(datas, chunk_size=3)
+    else:
+        with executor_class(max_workers=2) as executor:
+            actual_entities = parser.parse_many(datas, executor=executor, chunk_size=3)
+
+    assert len(actual_entities) == len(expected_entities), "Wrong number of entities"
+    for actual_entity, expected_entity in zip(actual_entities, expected_entities):
+        component_validator.validate_entity(actual_entity, expected_entity)
+
+
+@pytest.mark.parametrize(
+    argnames="chunk_size",
+    argvalues=[0, -1],
+    ids=["Zero", "Negative"],
+    )
+def test_parse_many_invalid_chunk_size(chunk_size):
+    """Test that ValueError is raised if size of chunks is not positive.
+
+    1. Create json parser.
+    2. Try to parse several entities with non-positive size of chunks.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            JSONParser().parse_many([{}], executor=executor, chunk_size=chunk_size)
+
+    assert error_info.value.args[0] == "Size of a chunk must be positive", "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="codec",
+    argvalues=[None, StandardCodec()],
+    ids=["Default codec", "Standard codec"],
+    )
+def test_parse_entity_bytes(codec, component_validator):
+    """Test that an entity is parsed from JSON bytes.
+
+    1. Create json parser with a codec.
+    2. Parse an entity from JSON bytes.
+    3. Check that the entity is the same as one parsed from decoded data.
+    """
+    data = {"class": ["entity"], "links": [{"rel": ["self"], "href": "/"}], "title": "Título"}
+    parser = JSONParser(codec=codec)
+
+    actual_entity = parser.parse_entity_bytes(json.dumps(data).encode("utf-8"))
+
+    component_validator.validate_entity(actual_entity, parser.parse_entity(data))
+
+
+def test_parse_invalid_entity_bytes():
+    """Test that ValueError is raised if bytes can't be decoded.
+
+    1. Create json parser.
+    2. Try to parse an entity from invalid JSON bytes.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        JSONParser().parse_entity_bytes(b"{")
+
+    assert error_info.value.args[0] == "Failed to decode JSON data", "Wrong error"
@@ -0,0 +1,335 @@
+"""Test cases for asyncio helpers of JSON serialization."""
+
+import asyncio
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation, StreamingEntity
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.stream import JSONStreamMarshaler
+
+
+_ENTITY = Entity(
+    classes=["collection"],
+    properties={"count": 10},
+    entities=[
+        EmbeddedLink(relations=["item"], target="/items/{0}".format(index)) for index in range(5)
+        ] + [EmbeddedRepresentation(relations=["info"], title="info")],
+    links=[Link(relations=["self"], target="/items")],
+    actions=[Action(name="add", target="/items", fields=[Field(name="name")])],
+    title="Items",
+    )
+
+
+def _run(coroutine):
+    """Run the coroutine in a new event loop and count iterations of the loop.
+
+    :param coroutine: coroutine to run.
+    :returns: tuple with the result of the coroutine and the number of iterations.
+    """
+    loop = asyncio.new_event_loop()
+    iterations = []
+
+    async def _count_iterations():
+        while True:
+            iterations.append(None)
+            await asyncio.sleep(0)
+
+    counter = loop.create_task(_count_iterations())
+    try:
+        result = loop.run_until_complete(coroutine)
+    finally:
+        counter.cancel()
+        loop.run_until_complete(asyncio.gather(counter, return_exceptions=True))
+        loop.close()
+
+    return result, len(iterations)
+
+
+@pytest.mark.parametrize(
+    argnames="executor_threshold",
+    argvalues=[None, 0],
+    ids=["Cooperative", "Executor"],
+    )
+def test_marshal_entity(executor_threshold):
+    """Test that an entity is marshaled asynchronously with the same result.
+
+    1. Marshal an entity asynchronously.
+    2. Check that the data are the same as marshaled synchronously.
+    3. Check that the control was passed to the loop.
+    """
+    marshaler = JSONMarshaler()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        data, iterations = _run(marshaler.marshal_entity_async(
+            _ENTITY,
+            yield_interval=2,
+            executor_threshold=executor_threshold,
+            executor=executor,
+            ))
+
+    assert data == marshaler.marshal_entity(_ENTITY), "Wrong data"
+    assert iterations > 1, "Control is not passed to the loop"
+
+
+@pytest.mark.parametrize(
+    argnames="executor_threshold",
+    argvalues=[None, 0],
+    ids=["Cooperative", "Executor"],
+    )
+def test_parse_entity(executor_threshold, component_validator):
+    """Test that an entity is parsed asynchronously with the same result.
+
+    1. Parse an entity asynchronously.
+    2. Check that the entity is the same as parsed synchronously.
+    3. Check that the control was passed to the loop.
+    """
+    data = JSONMarshaler().marshal_entity(_ENTITY)
+    parser = JSONParser()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        entity, iterations = _run(parser.parse_entity_async(
+            data,
+            yield_interval=2,
+            executor_threshold=executor_threshold,
+            executor=executor,
+            ))
+
+    component_validator.validate_entity(entity, parser.parse_entity(data))
+    assert iterations > 1, "Control is not passed to the loop"
+
+
+_InvalidEntity = namedtuple("_InvalidEntity", "classes properties entities links actions title")
+_EntityWithoutTitle = namedtuple("_EntityWithoutTitle", "classes properties entities links actions")
+
+
+@pytest.mark.parametrize(
+    argnames="entity",
+    argvalues=[
+        _InvalidEntity(
+            classes=[],
+            properties={},
+            entities=[EmbeddedLink(relations=["item"], target="/item"), None],
+            links=[],
+            actions=[],
+            title=None,
+            ),
+        _InvalidEntity(classes=[], properties={}, entities=[], links=None, actions=[], title=None),
+        _EntityWithoutTitle(classes=[], properties={}, entities=[], links=[], actions=[]),
+        ],
+    ids=["Invalid sub-entity", "Non-iterable links", "Without title"],
+    )
+def test_marshal_invalid_entity(entity):
+    """Test that errors of asynchronous marshaling are the same as of synchronous one.
+
+    1. Try to marshal an invalid entity asynchronously.
+    2. Check that ValueError is raised.
+    3. Check that the error is the same as one of synchronous marshaling.
+    """
+    marshaler = JSONMarshaler()
+    with pytest.raises(ValueError) as actual_error_info:
+        _run(marshaler.marshal_entity_async(entity, yield_interval=1))
+
+    with pytest.raises(ValueError) as expected_error_info:
+        marshaler.marshal_entity(entity)
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="data",
+    argvalues=[
+        {"entities": [{"rel": ["item"]}, {"href": "/missing/relations"}]},
+        {"links": None},
+        {"actions": [{"name": "action", "href": "/action"}] * 2},
+        {"class": None},
+        ],
+    ids=["Invalid sub-entity", "Non-iterable links", "Duplicated actions", "Invalid classes"],
+    )
+def test_parse_invalid_entity(data):
+    """Test that errors of asynchronous parsing are the same as of synchronous one.
+
+    1. Try to parse invalid data asynchronously.
+    2. Check that ValueError is raised.
+    3. Check that the error is the same as one of synchronous parsing.
+    """
+    parser = JSONParser()
+    with pytest.raises(ValueError) as actual_error_info:
+        _run(parser.parse_entity_async(data, yield_interval=1))
+
+    with pytest.raises(ValueError) as expected_error_info:
+        parser.parse_entity(data)
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+def test_invalid_yield_interval():
+    """Test that ValueError is raised if the interval to yield is not positive.
+
+    1. Try to marshal an entity with zero interval.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        _run(JSONMarshaler().marshal_entity_async(_ENTITY, yield_interval=0))
+
+    assert error_info.value.args[0] == "Interval to yield must be positive", "Wrong error"
+
+
+class _Writer:
+    """Writer to record written data and drains."""
+
+    def __init__(self):
+        self.chunks = []
+        self.drains = 0
+
+    def write(self, data):
+        """Record the data."""
+        self.chunks.append(data)
+
+    async def drain(self):
+        """Record the drain."""
+        self.drains += 1
+
+
+def test_write_entity_async():
+    """Test that an entity is written into an asyncio stream with drains.
+
+    1. Write an entity into a writer asynchronously in small chunks.
+    2. Check that the writer is drained after each chunk.
+    3. Check the written data.
+    """
+    marshaler = JSONStreamMarshaler()
+    writer = _Writer()
+    _run(marshaler.write_entity_async(_ENTITY, writer, buffer_size=1))
+
+    assert len(writer.chunks) > 1, "Data are not written in chunks"
+    assert writer.drains == len(writer.chunks), "Writer is not drained after each chunk"
+    assert b"".join(writer.chunks) == marshaler.marshal_entity(_ENTITY), "Wrong data"
+
+
+def test_compact_marshal_entity():
+    """Test that asynchronous marshaling respects compact mode of the marshaler.
+
+    1. Marshal an entity asynchronously with compact marshaler.
+    2. Check that the data are the same as marshaled synchronously.
+    """
+    marshaler = JSONMarshaler(compact=True)
+    data, _ = _run(marshaler.marshal_entity_async(_ENTITY, yield_interval=2))
+
+    assert data == marshaler.marshal_entity(_ENTITY), "Wrong data"
+
+
+def test_marshal_streaming_entity():
+    """Test that sub-entities of a streaming entity are consumed chunk by chunk.
+
+    1. Create a streaming entity with a generator of sub-entities.
+    2. Marshal the entity asynchronously and record the number of produced sub-entities
+       each time the loop gets the control.
+    3. Check that the data are the same as marshaled synchronously.
+    4. Check that the loop got the control before all sub-entities were produced.
+    """
+    sub_entities = [
+        EmbeddedLink(relations=["item"], target="/items/{0}".format(index)) for index in range(6)
+        ]
+    produced = []
+
+    def _produce():
+        for sub_entity in sub_entities:
+            produced.append(sub_entity)
+            yield sub_entity
+
+    marshaler = JSONMarshaler()
+    loop = asyncio.new_event_loop()
+    observed = []
+
+    async def _observe():
+        while True:
+            observed.append(len(produced))
+            await asyncio.sleep(0)
+
+    observer = loop.create_task(_observe())
+    try:
+        data = loop.run_until_complete(marshaler.marshal_entity_async(
+            StreamingEntity(entities=_produce(), title="Items"),
+            yield_interval=2,
+            ))
+    finally:
+        observer.cancel()
+        loop.run_until_complete(asyncio.gather(observer, return_exceptions=True))
+        loop.close()
+
+    expected_data = marshaler.marshal_entity(StreamingEntity(entities=sub_entities, title="Items"))
+    assert data == expected_data, "Wrong data"
+    assert any(0 < count < len(sub_entities) for count in observed), (
+        "Sub-entities are not consumed chunk by chunk"
+        )
+
+
+def test_marshal_non_iterable_streaming_entity():
+    """Test that errors of asynchronous marshaling of a streaming entity are the same.
+
+    1. Try to marshal a streaming entity with non-iterable sub-entities asynchronously.
+    2. Check that ValueError is raised.
+    3. Check that the error is the same as one of synchronous marshaling.
+    """
+    marshaler = JSONMarshaler()
+    with pytest.raises(ValueError) as actual_error_info:
+        _run(marshaler.marshal_entity_async(StreamingEntity(entities=None)))
+
+    with pytest.raises(ValueError) as expected_error_info:
+        marshaler.marshal_entity(StreamingEntity(entities=None))
+
+    assert actual_error_info.value.args[0] == expected_error_info.value.args[0], (
+        "Wrong error is raised"
+        )
+
+
+class _CustomEntityMarshaler(JSONMarshaler):
+    """Marshaler with a custom entity marshaler, which records its thread."""
+
+    def __init__(self):
+        super(_CustomEntityMarshaler, self).__init__()
+        self.threads = []
+
+    def marshal_entity(self, entity):
+        self.threads.append(threading.current_thread())
+        return super(_CustomEntityMarshaler, self).marshal_entity(entity)
+
+    def create_entity_marshaler(self, entity):
+        entity_marshaler = super(_CustomEntityMarshaler, self).create_entity_marshaler(entity)
+        return _CustomEntityMarshalerWrapper(entity_marshaler)
+
+
+class _CustomEntityMarshalerWrapper:
+    """Custom entity marshaler, which delegates marshaling to the default one."""
+
+    def __init__(self, entity_marshaler):
+        self._entity_marshaler = entity_marshaler
+
+    def __getattr__(self, name):
+        return getattr(self._entity_marshaler, name)
+
+
+def test_custom_marshaler_in_executor():
+    """Test that entities with custom marshalers are marshaled in the executor.
+
+    1. Marshal an entity asynchronously with a custom entity marshaler without a threshold.
+    2. Check that the data are the same as marshaled synchronously.
+    3. Check that the entity was marshaled in the thread of the executor.
+    """
+    marshaler = _CustomEntityMarshaler()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        data, _ = _run(marshaler.marshal_entity_async(_ENTITY, executor=executor))
+
+    assert data == JSONMarshaler().marshal_entity(_ENTITY), "Wrong data"
+    assert marshaler.threads[0] is not threading.main_thread(), "Entity is marshaled in the loop"
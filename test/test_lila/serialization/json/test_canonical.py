@@ -0,0 +1,131 @@
+"""Test cases for canonical JSON."""
+
+import json
+
+import pytest
+
+from lila.core.link import Link
+from lila.core.entity import Entity
+from lila.serialization.json.canonical import encode_canonical, format_number
+from lila.serialization.json.codec import StandardCodec
+from lila.serialization.json.marshaler import JSONMarshaler
+
+
+@pytest.mark.parametrize(
+    argnames="number,expected_text",
+    argvalues=[
+        (0, "0"),
+        (-0.0, "0"),
+        (1.0, "1"),
+        (-42, "-42"),
+        (123.456, "123.456"),
+        (1e-7, "1e-7"),
+        (0.00001, "0.00001"),
+        (1e20, "100000000000000000000"),
+        (1e21, "1e+21"),
+        (-1.5e22, "-1.5e+22"),
+        (5e-324, "5e-324"),
+        (1.7976931348623157e308, "1.7976931348623157e+308"),
+        (333333333.3333333, "333333333.3333333"),
+        ],
+    ids=[
+        "Zero",
+        "Negative zero",
+        "Integral float",
+        "Integer",
+        "Fraction",
+        "Small exponent",
+        "Small fraction",
+        "Large integral float",
+        "Large exponent",
+        "Negative exponent",
+        "Minimal float",
+        "Maximal float",
+        "Many digits",
+        ],
+    )
+def test_format_number(number, expected_text):
+    """Test that numbers are formatted as in ECMAScript.
+
+    1. Format a number.
+    2. Check the text.
+    """
+    assert format_number(number) == expected_text, "Wrong formatted number"
+
+
+@pytest.mark.parametrize(
+    argnames="number",
+    argvalues=[float("nan"), float("inf"), float("-inf")],
+    ids=["NaN", "Infinity", "Negative infinity"],
+    )
+def test_invalid_number(number):
+    """Test that ValueError is raised for numbers, which can't be represented in JSON.
+
+    1. Try to encode a number, which can't be represented in JSON.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        encode_canonical([number])
+
+
+def test_sorted_keys():
+    """Test that keys are sorted by UTF-16 code units in nested objects.
+
+    1. Encode an object with nested objects.
+    2. Check the encoded document.
+    """
+    data = {"b": {"y": None, "x": [True, False]}, "\ufb2c": 3, "\U0001f600": 2, "a": "\n"}
+
+    assert encode_canonical(data) == (
+        '{"a":"\\n","b":{"x":[true,false],"y":null},"\U0001f600":2,"\ufb2c":3}'
+        ), "Wrong encoded document"
+
+
+@pytest.mark.parametrize(
+    argnames="data",
+    argvalues=[{1: "value"}, {"key": object()}],
+    ids=["Non-string key", "Non-serializable value"],
+    )
+def test_invalid_data(data):
+    """Test that ValueError is raised for data, which can't be encoded.
+
+    1. Try to encode invalid data.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        encode_canonical(data)
+
+
+def test_canonical_entity():
+    """Test that the same logical entity is always encoded into the same bytes.
+
+    1. Create two equal entities with different order of properties and types of numbers.
+    2. Encode the entities with a canonical marshaler.
+    3. Check that the bytes are the same.
+    4. Check that the bytes are decoded into the data of the entity.
+    """
+    links = [Link(relations=["self"], target="/orders/1")]
+    entity = Entity(properties={"total": 10, "items": {"count": 2, "price": 5.5}}, links=links)
+    other_entity = Entity(
+        properties={"items": {"price": 5.5, "count": 2.0}, "total": 10.0},
+        links=links,
+        )
+
+    marshaler = JSONMarshaler(canonical=True)
+    assert marshaler.canonical, "Marshaler is not canonical"
+
+    encoded_entity = marshaler.marshal_entity_bytes(entity)
+    assert marshaler.marshal_entity_bytes(other_entity) == encoded_entity, "Different bytes"
+    assert json.loads(encoded_entity.decode("utf-8")) == marshaler.marshal_entity(entity), (
+        "Wrong encoded data"
+        )
+
+
+def test_canonical_with_codec():
+    """Test that a codec can't be passed to a canonical marshaler.
+
+    1. Try to create a canonical marshaler with a codec.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        JSONMarshaler(codec=StandardCodec(), canonical=True)
@@ -0,0 +1,169 @@
+"""Test cases for JSON codecs."""
+
+import sys
+import json
+import math
+
+import pytest
+
+from lila.serialization.json.codec import (
+    CODEC_CLASSES,
+    StandardCodec,
+    OrjsonCodec,
+    create_codec,
+    create_default_codec,
+    )
+
+
+_AVAILABLE_CODEC_CLASSES = [
+    codec_class for codec_class in CODEC_CLASSES if codec_class.is_available()
+    ]
+
+_DATA = {
+    "class": ["entity"],
+    "properties": {"text": "Юникод", "number": 1.5, "flag": True, "empty": None},
+    "entities": [{"rel": ["self"], "href": "/self"}],
+    }
+
+
+@pytest.mark.parametrize(
+    argnames="codec_class",
+    argvalues=_AVAILABLE_CODEC_CLASSES,
+    ids=[codec_class.name for codec_class in _AVAILABLE_CODEC_CLASSES],
+    )
+def test_roundtrip(codec_class):
+    """Test that codecs encode data into UTF-8 JSON and decode it back.
+
+    1. Encode data with the codec.
+    2. Check that encoded data are the same JSON document.
+    3. Decode the data.
+    4. Check the decoded data.
+    """
+    codec = codec_class()
+    encoded_data = codec.encode(_DATA)
+
+    assert json.loads(encoded_data.decode("utf-8")) == _DATA, "Wrong encoded data"
+    assert codec.decode(encoded_data) == _DATA, "Wrong decoded data"
+
+
+@pytest.mark.parametrize(
+    argnames="codec_class",
+    argvalues=_AVAILABLE_CODEC_CLASSES,
+    ids=[codec_class.name for codec_class in _AVAILABLE_CODEC_CLASSES],
+    )
+@pytest.mark.parametrize(
+    argnames="encoded_data",
+    argvalues=[b"{", b"\xff", b""],
+    ids=["Invalid JSON", "Invalid UTF-8", "Empty"],
+    )
+def test_invalid_encoded_data(codec_class, encoded_data):
+    """Test that ValueError is raised if data can't be decoded.
+
+    1. Try to decode invalid data.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        codec_class().decode(encoded_data)
+
+    assert error_info.value.args[0] == "Failed to decode JSON data", "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="codec_class",
+    argvalues=_AVAILABLE_CODEC_CLASSES,
+    ids=[codec_class.name for codec_class in _AVAILABLE_CODEC_CLASSES],
+    )
+def test_non_serializable_data(codec_class):
+    """Test that ValueError is raised if data can't be encoded.
+
+    1. Try to encode data that are not JSON serializable.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        codec_class().encode({"key": object()})
+
+    assert error_info.value.args[0] == "Failed to encode JSON data", "Wrong error"
+
+
+def test_create_codec():
+    """Test that a codec can be created by the name of its backend.
+
+    1. Create a codec with the name of the standard backend.
+    2. Check the codec.
+    """
+    assert isinstance(create_codec("json"), StandardCodec), "Wrong codec"
+
+
+def test_unknown_backend():
+    """Test that ValueError is raised for unknown backend.
+
+    1. Try to create a codec with unknown backend.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        create_codec("unknown")
+
+    assert error_info.value.args[0] == "Unknown backend 'unknown'", "Wrong error"
+
+
+def test_default_codec(monkeypatch):
+    """Test that the fastest available backend is used by default.
+
+    1. Make orjson available.
+    2. Check that orjson codec is created by default.
+    3. Make orjson unavailable.
+    4. Check that orjson codec is not created by default.
+    """
+    monkeypatch.setattr(OrjsonCodec, "is_available", classmethod(lambda cls: True))
+    assert isinstance(create_default_codec(), OrjsonCodec), "Wrong default codec"
+
+    monkeypatch.setattr(OrjsonCodec, "is_available", classmethod(lambda cls: False))
+    assert not isinstance(create_default_codec(), OrjsonCodec), "Wrong default codec"
+
+
+def test_deeply_nested_data():
+    """Test that ValueError is raised for data nested deeper than the recursion limit.
+
+    1. Try to decode deeply nested data with the standard codec.
+    2. Check that ValueError is raised.
+    """
+    depth = sys.getrecursionlimit() * 2
+    with pytest.raises(ValueError):
+        StandardCodec().decode(b"[" * depth + b"]" * depth)
+
+
+@pytest.mark.skipif(not OrjsonCodec.is_available(), reason="orjson is not installed")
+@pytest.mark.parametrize(
+    argnames="data",
+    argvalues=[
+        {"number": 2**70},
+        {"numbers": [1.5, float("nan")]},
+        {"number": float("inf"), "empty": None},
+        {1: "integer key"},
+        ],
+    ids=["Big integer", "NaN", "Infinity", "Integer key"],
+    )
+def test_orjson_unsupported_data(data):
+    """Test that orjson codec encodes unsupported data in the same way as the standard codec.
+
+    1. Encode data with orjson codec.
+    2. Encode data with the standard codec.
+    3. Check that encoded data are the same.
+    """
+    encoded_data = OrjsonCodec().encode(data)
+    assert encoded_data == StandardCodec().encode(data), "Wrong encoded data"
+
+
+@pytest.mark.skipif(not OrjsonCodec.is_available(), reason="orjson is not installed")
+def test_orjson_non_finite_floats_decoding():
+    """Test that orjson codec decodes non-finite floats in the same way as the standard codec.
+
+    1. Decode data with NaN and infinity with orjson codec.
+    2. Check the decoded data.
+    """
+    decoded_data = OrjsonCodec().decode(b'{"nan": NaN, "infinity": -Infinity}')
+    assert math.isnan(decoded_data["nan"]), "Wrong NaN"
+    assert decoded_data["infinity"] == float("-inf"), "Wrong infinity"
@@ -0,0 +1,187 @@
+"""Test cases for compression with a preset dictionary."""
+
+import zlib
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link
+from lila.core.entity import Entity
+from lila.serialization.json.codec import StandardCodec
+from lila.serialization.json.compression import (
+    CompressedCodec,
+    Compressor,
+    MAX_DICTIONARY_SIZE,
+    train_dictionary,
+    )
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+
+
+def _create_order(number):
+    """Create a small entity of an order.
+
+    :param number: number of the order.
+    :returns: Siren entity.
+    """
+    target = "https://api.example.com/orders/{0}".format(number)
+    return Entity(
+        classes=["order"],
+        properties={"orderNumber": number, "status": "pending", "customer": "N{0}".format(number)},
+        links=[
+            Link(relations=["self"], target=target),
+            Link(relations=["customer"], target="https://api.example.com/customers/1"),
+            ],
+        actions=[
+            Action(name="cancel", target=target, method="DELETE"),
+            Action(
+                name="pay",
+                target=target + "/payment",
+                method="POST",
+                fields=[Field(name="amount", input_type="number")],
+                ),
+            ],
+        )
+
+
+def _encode(entity):
+    """Encode an entity into JSON bytes.
+
+    :param entity: Siren entity.
+    :returns: bytes with JSON document.
+    """
+    return JSONMarshaler(codec=StandardCodec()).marshal_entity_bytes(entity)
+
+
+def test_default_dictionary():
+    """Test that the default dictionary improves compression of a small document.
+
+    1. Compress a small document with zlib without a dictionary.
+    2. Compress the document with the default dictionary.
+    3. Check that the document is compressed better with the dictionary.
+    4. Check that the document is decompressed back.
+    """
+    document = _encode(_create_order(1))
+    compressor = Compressor()
+
+    compressed_document = compressor.compress(document)
+    assert len(compressed_document) < len(zlib.compress(document)), "Dictionary doesn't help"
+    assert compressor.decompress(compressed_document) == document, "Wrong decompressed data"
+
+
+def test_trained_dictionary():
+    """Test that a trained dictionary improves compression of similar documents.
+
+    1. Train a dictionary from sample documents.
+    2. Compress a new document with the trained and the default dictionaries.
+    3. Check that the trained dictionary gives smaller data.
+    4. Check that the size of the dictionary is limited.
+    """
+    dictionary = train_dictionary((_encode(_create_order(number)) for number in range(50)))
+    document = _encode(_create_order(1000))
+
+    trained_size = len(Compressor(dictionary).compress(document))
+    default_size = len(Compressor().compress(document))
+    assert trained_size < default_size, "Trained dictionary doesn't help"
+
+    small_dictionary = train_dictionary([_encode(_create_order(1))] * 2, size=100)
+    assert 0 < len(small_dictionary) <= 100, "Wrong size of the dictionary"
+
+
+def test_compressed_codec(component_validator):
+    """Test that compressed codec plugs into byte-level methods of marshaler and parser.
+
+    1. Create compressed codec with a trained dictionary.
+    2. Marshal an entity into bytes with the codec.
+    3. Check that the bytes are compressed.
+    4. Parse the bytes with the codec.
+    5. Check the parsed entity.
+    """
+    dictionary = train_dictionary((_encode(_create_order(number)) for number in range(10)))
+    codec = CompressedCodec(codec=StandardCodec(), compressor=Compressor(dictionary))
+    entity = _create_order(1)
+
+    encoded_entity = JSONMarshaler(codec=codec).marshal_entity_bytes(entity)
+    assert len(encoded_entity) < len(_encode(entity)), "Entity is not compressed"
+
+    parsed_entity = JSONParser(codec=codec).parse_entity_bytes(encoded_entity)
+    component_validator.validate_entity(parsed_entity, entity)
+
+
+@pytest.mark.parametrize(
+    argnames="compressed_data",
+    argvalues=[
+        b"invalid",
+        zlib.compress(b"{}")[:-2],
+        zlib.compress(b"{}") + b"trailing",
+        Compressor(b"another dictionary").compress(b"{}"),
+        ],
+    ids=["Invalid data", "Truncated data", "Trailing data", "Another dictionary"],
+    )
+def test_invalid_data(compressed_data):
+    """Test that ValueError is raised for data, which can't be decompressed.
+
+    1. Try to decompress invalid data.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        Compressor().decompress(compressed_data)
+
+
+@pytest.mark.parametrize(
+    argnames="size",
+    argvalues=[1024, 1025, 10 ** 7],
+    ids=["One byte larger", "Two bytes larger", "Bomb"],
+    )
+def test_max_size(size):
+    """Test that ValueError is raised if decompressed data are larger than the maximum size.
+
+    1. Compress data larger than the maximum size.
+    2. Try to decompress the data.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    5. Check that data of the maximum size are decompressed.
+    """
+    compressor = Compressor(max_size=1023)
+    with pytest.raises(ValueError) as error_info:
+        compressor.decompress(compressor.compress(b" " * size))
+
+    assert error_info.value.args[0] == "Decompressed data are larger than 1023 bytes", (
+        "Wrong error"
+        )
+    assert compressor.decompress(compressor.compress(b" " * 1023)) == b" " * 1023, "Wrong data"
+
+
+@pytest.mark.parametrize(
+    argnames="kwargs",
+    argvalues=[
+        {"dictionary": b" " * (MAX_DICTIONARY_SIZE + 1)},
+        {"level": 10},
+        {"max_size": 0},
+        ],
+    ids=["Large dictionary", "Invalid level", "Invalid maximum size"],
+    )
+def test_invalid_compressor(kwargs):
+    """Test that ValueError is raised for invalid arguments of a compressor.
+
+    1. Try to create a compressor with invalid arguments.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        Compressor(**kwargs)
+
+
+@pytest.mark.parametrize(
+    argnames="size",
+    argvalues=[0, MAX_DICTIONARY_SIZE + 1],
+    ids=["Zero", "Too large"],
+    )
+def test_invalid_dictionary_size(size):
+    """Test that ValueError is raised for invalid size of a dictionary.
+
+    1. Try to train a dictionary of invalid size.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        train_dictionary([b"{}"], size=size)
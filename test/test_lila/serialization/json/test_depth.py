@@ -0,0 +1,191 @@
+"""Test cases for limited depth of embedded representations."""
+
+import asyncio
+
+import pytest
+
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.depth import collapse_representation
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+
+
+def _create_representation(level, depth):
+    """Create a chain of nested embedded representations.
+
+    :param level: level of the representation.
+    :param depth: number of nested levels.
+    :returns: Siren embedded representation.
+    """
+    sub_entities = []
+    if level < depth:
+        sub_entities.append(_create_representation(level + 1, depth))
+
+    return EmbeddedRepresentation(
+        relations=["child"],
+        classes=["level"],
+        properties={"level": level},
+        entities=sub_entities,
+        links=[Link(relations=["self"], target="/level/{0}".format(level), target_media_type="x")],
+        title="Level {0}".format(level),
+        )
+
+
+class _ForbiddenRepresentation:
+    """Representation-like object, which sub-entities must not be visited."""
+
+    relations = ("child", )
+    classes = ()
+    title = None
+    links = (Link(relations=["self"], target="/forbidden"), )
+
+    @property
+    def entities(self):
+        """Sub-entities of the representation."""
+        raise AssertionError("Sub-entities of a collapsed representation are visited")
+
+
+@pytest.mark.parametrize(
+    argnames="embedding_depth",
+    argvalues=[0, 1, 3],
+    ids=["Zero", "One", "Three"],
+    )
+def test_depth(embedding_depth):
+    """Test that representations beyond the depth are marshaled as embedded links.
+
+    1. Create an entity with 5 levels of nested representations.
+    2. Marshal the entity with a limited embedding depth.
+    3. Check that the representation at the depth is replaced with an embedded link.
+    4. Check that other levels are the same as marshaled without the limit.
+    """
+    entity = Entity(entities=[_create_representation(level=1, depth=5)])
+
+    marshaled_entity = JSONMarshaler(embedding_depth=embedding_depth).marshal_entity(entity)
+    full_data = JSONMarshaler().marshal_entity(entity)
+
+    data, expected_data = marshaled_entity, full_data
+    for _ in range(embedding_depth):
+        data, expected_data = data["entities"][0], expected_data["entities"][0]
+        assert {key: value for key, value in data.items() if key != "entities"} == {
+            key: value for key, value in expected_data.items() if key != "entities"
+            }, "Wrong data of a representation"
+
+    collapsed_level = embedding_depth + 1
+    assert data["entities"] == [{
+        "rel": ["child"],
+        "href": "/level/{0}".format(collapsed_level),
+        "class": ["level"],
+        "title": "Level {0}".format(collapsed_level),
+        "type": "x",
+        }], "Wrong data of a collapsed representation"
+
+
+def test_collapsed_subtree():
+    """Test that sub-entities of collapsed representations are not visited.
+
+    1. Create an entity with a representation, which fails on access to its sub-entities.
+    2. Marshal the entity with zero embedding depth.
+    3. Check that the representation is marshaled as an embedded link.
+    """
+    entity = Entity(entities=[_create_representation(level=1, depth=1)])
+    entity._entities = [_ForbiddenRepresentation()]     # pylint: disable=protected-access
+
+    marshaled_entity = JSONMarshaler(embedding_depth=0).marshal_entity(entity)
+    assert marshaled_entity["entities"] == [{
+        "rel": ["child"],
+        "href": "/forbidden",
+        "class": [],
+        "title": None,
+        "type": None,
+        }], "Wrong data of a collapsed representation"
+
+
+def test_raw_representation():
+    """Test that raw representations within the depth are marshaled as they are.
+
+    1. Create an entity with a raw embedded representation with nested representations.
+    2. Marshal the entity with embedding depth 1.
+    3. Check that data of the fragment are not changed.
+    """
+    fragment = (
+        '{"rel":["child"],"entities":[{"rel":["child"],"properties":{"nested":true}}],'
+        '"links":[{"rel":["self"],"href":"/raw"}]}'
+        )
+    entity = Entity(entities=[RawEmbeddedRepresentation(fragment)])
+
+    marshaled_entity = JSONMarshaler(embedding_depth=1).marshal_entity(entity)
+    assert marshaled_entity == JSONMarshaler().marshal_entity(entity), "Wrong marshaled data"
+
+
+def test_async_marshal_entity():
+    """Test that embedding depth is taken into account by asynchronous marshaling.
+
+    1. Create an entity with nested representations.
+    2. Marshal the entity asynchronously with a limited embedding depth.
+    3. Check that the result is the same as of synchronous marshaling.
+    """
+    entity = Entity(entities=[_create_representation(level=1, depth=3)] * 3)
+    marshaler = JSONMarshaler(embedding_depth=1)
+
+    loop = asyncio.new_event_loop()
+    try:
+        marshaled_entity = loop.run_until_complete(
+            marshaler.marshal_entity_async(entity, yield_interval=2),
+            )
+    finally:
+        loop.close()
+
+    assert marshaled_entity == marshaler.marshal_entity(entity), "Wrong marshaled data"
+
+
+def test_collapse_representation(component_validator):
+    """Test that a representation is collapsed into an embedded link to its self link.
+
+    1. Create an embedded representation with several links.
+    2. Collapse the representation.
+    3. Check the embedded link.
+    """
+    representation = EmbeddedRepresentation(
+        relations=["item"],
+        classes=["order"],
+        links=[
+            Link(relations=["next"], target="/next"),
+            Link(relations=["alternate", "self"], target="/self", target_media_type="x"),
+            ],
+        title="Order",
+        )
+
+    component_validator.validate_embedded_link(
+        collapse_representation(representation),
+        EmbeddedLink(
+            relations=["item"],
+            classes=["order"],
+            target="/self",
+            title="Order",
+            target_media_type="x",
+            ),
+        )
+
+
+def test_missing_self_link():
+    """Test that ValueError is raised if a representation beyond the depth has no self link.
+
+    1. Create an entity with a representation without a self link.
+    2. Try to marshal the entity with zero embedding depth.
+    3. Check that ValueError is raised.
+    """
+    entity = Entity(entities=[EmbeddedRepresentation(relations=["item"])])
+
+    with pytest.raises(ValueError):
+        JSONMarshaler(embedding_depth=0).marshal_entity(entity)
+
+
+def test_negative_depth():
+    """Test that ValueError is raised for negative embedding depth.
+
+    1. Try to create a marshaler with negative embedding depth.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        JSONMarshaler(embedding_depth=-1)
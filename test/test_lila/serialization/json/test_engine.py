@@ -0,0 +1,169 @@
+"""Test cases for the engine to parse and marshal nested components."""
+
+import sys
+
+import pytest
+
+from lila.core.link import Link
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json import engine
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+
+
+_DEPTH = sys.getrecursionlimit() * 2
+
+
+def _count_steps(depth):
+    """Get steps to count nested levels.
+
+    :param depth: number of nested levels.
+    :returns: generator with steps that returns the number of levels.
+    """
+    if depth == 0:
+        return 0
+
+    return (yield _count_steps(depth - 1)) + 1
+
+
+def _failing_steps(depth):
+    """Get steps that fail at the deepest level and wrap the error at each level.
+
+    :param depth: number of nested levels.
+    :returns: generator with steps.
+    """
+    if depth == 0:
+        raise KeyError("deepest")
+
+    try:
+        yield _failing_steps(depth - 1)
+    except Exception as error:
+        raise ValueError(depth) from error
+
+
+def test_run():
+    """Test that nested steps are run with an explicit stack.
+
+    1. Run steps nested deeper than the recursion limit.
+    2. Check the result.
+    """
+    assert engine.run(_count_steps(_DEPTH)) == _DEPTH, "Wrong result"
+
+
+def test_run_error():
+    """Test that errors of nested steps are thrown into the outer steps.
+
+    1. Run nested steps, which fail at the deepest level.
+    2. Check that the error of the outermost steps is raised.
+    3. Check the chain of errors.
+    """
+    with pytest.raises(ValueError) as error_info:
+        engine.run(_failing_steps(3))
+
+    error = error_info.value
+    assert error.args == (3, ), "Wrong error"
+    assert error.__cause__.args == (2, ), "Wrong cause"
+    assert error.__cause__.__cause__.__cause__.args == ("deepest", ), "Wrong original error"
+
+
+def _create_deep_entity(depth):
+    """Create an entity with nested embedded representations.
+
+    :param depth: number of nested embedded representations.
+    :returns: Siren entity.
+    """
+    representation = EmbeddedRepresentation(
+        relations=["item"],
+        links=[Link(relations=["self"], target="/deepest")],
+        )
+    for level in range(depth - 1):
+        representation = EmbeddedRepresentation(
+            relations=["item"],
+            entities=[representation],
+            title=str(level),
+            )
+
+    return Entity(entities=[representation])
+
+
+def _get_deepest_data(data):
+    """Get data of the deepest embedded representation.
+
+    :param data: marshaled entity.
+    :returns: data of the deepest embedded representation.
+    """
+    while data["entities"]:
+        data = data["entities"][0]
+
+    return data
+
+
+def test_deep_entity():
+    """Test that an entity nested deeper than the recursion limit is marshaled and parsed.
+
+    1. Marshal an entity with deeply nested embedded representations.
+    2. Check the data of the deepest representation.
+    3. Parse the data.
+    4. Check the number of levels of the parsed entity.
+    5. Check the deepest representation.
+    """
+    data = JSONMarshaler().marshal_entity(_create_deep_entity(_DEPTH))
+
+    deepest_data = _get_deepest_data(data)
+    assert deepest_data["links"][0]["href"] == "/deepest", "Wrong data of the deepest level"
+
+    representation = JSONParser().parse_entity(data)
+    depth = 0
+    while representation.entities:
+        representation, = representation.entities
+        depth += 1
+
+    assert depth == _DEPTH, "Wrong number of levels"
+    assert representation.links[0].target == "/deepest", "Wrong deepest representation"
+
+
+def test_deep_error():
+    """Test that an error at the deepest level is wrapped at each level.
+
+    1. Marshal an entity with deeply nested embedded representations.
+    2. Break the data of the deepest representation.
+    3. Try to parse the data.
+    4. Check the chain of errors.
+    """
+    data = JSONMarshaler().marshal_entity(_create_deep_entity(_DEPTH))
+    _get_deepest_data(data)["links"] = [{}]
+
+    with pytest.raises(ValueError) as error_info:
+        JSONParser().parse_entity(data)
+
+    messages = []
+    error = error_info.value
+    while error is not None:
+        messages.append(str(error))
+        error = error.__cause__
+
+    expected_messages = ["Failed to parse entity's sub-entities"]
+    expected_messages += ["Failed to parse sub-entities of the embedded representation"] * (
+        _DEPTH - 1
+        )
+    expected_messages += [
+        "Failed to parse links of the embedded representation",
+        "Link data do not have required 'rel' key",
+        "'rel'",
+        ]
+    assert messages == expected_messages, "Wrong chain of errors"
+
+
+def test_overridden_method():
+    """Test that overridden methods of marshaler are called for nested components.
+
+    1. Create a marshaler with overridden marshal_embedded_representation.
+    2. Marshal an entity with nested embedded representations.
+    3. Check that the overridden method is called.
+    """
+    class _TitleMarshaler(JSONMarshaler):
+        def marshal_embedded_representation(self, embedded_representation):
+            return {"title": embedded_representation.title}
+
+    data = _TitleMarshaler().marshal_entity(_create_deep_entity(3))
+    assert data["entities"] == [{"title": "1"}], "Overridden method is not called"
@@ -0,0 +1,117 @@
+"""Test cases for pre-serialized JSON fragments."""
+
+import json
+
+import pytest
+
+from lila.core.raw import RawJSON
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.compiled import CompiledJSONMarshaler
+from lila.serialization.json.stream import JSONStreamMarshaler
+from lila.serialization.json.parser import JSONParser
+
+
+_FRAGMENT = '{"rel":["item"],"class":["cached"],"properties":{"name":"Ünïcode"},"links":[]}'
+
+
+def test_lazy_attributes(component_validator):
+    """Test that attributes of a raw representation are parsed from the fragment.
+
+    1. Create a raw embedded representation.
+    2. Check that its attributes are the same as of the parsed representation.
+    """
+    raw_representation = RawEmbeddedRepresentation(_FRAGMENT.encode("utf-8"))
+    expected_representation = JSONParser().parse_embedded_representation(json.loads(_FRAGMENT))
+
+    component_validator.validate_embedded_representation(
+        raw_representation,
+        expected_representation,
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="fragment",
+    argvalues=["{", '{"class": ["no relations"]}'],
+    ids=["Invalid JSON", "Invalid representation"],
+    )
+def test_validation(fragment):
+    """Test that invalid fragments are rejected on creation if validation is requested.
+
+    1. Create a raw embedded representation with invalid fragment without validation.
+    2. Try to create a raw embedded representation with invalid fragment with validation.
+    3. Check that ValueError is raised.
+    """
+    RawEmbeddedRepresentation(fragment)
+
+    with pytest.raises(ValueError):
+        RawEmbeddedRepresentation(fragment, validate=True)
+
+
+@pytest.mark.parametrize(
+    argnames="marshaler",
+    argvalues=[JSONMarshaler(), CompiledJSONMarshaler()],
+    ids=["JSONMarshaler", "CompiledJSONMarshaler"],
+    )
+def test_decoded_fragments(marshaler):
+    """Test that marshalers of data decode raw fragments and values.
+
+    1. Create an entity with a raw embedded representation and a raw property.
+    2. Marshal the entity.
+    3. Check the marshaled data.
+    """
+    entity = Entity(
+        properties={"raw": RawJSON('{"key": [1, 2]}'), "plain": 1},
+        entities=[
+            RawEmbeddedRepresentation(_FRAGMENT),
+            EmbeddedLink(relations=["next"], target="/next"),
+            ],
+        )
+
+    data = marshaler.marshal_entity(entity)
+
+    assert data["properties"] == {"raw": {"key": [1, 2]}, "plain": 1}, "Wrong properties"
+    assert data["entities"] == [
+        json.loads(_FRAGMENT),
+        {"rel": ["next"], "class": [], "href": "/next", "title": None, "type": None},
+        ], "Wrong sub-entities"
+
+
+def test_verbatim_fragments():
+    """Test that stream marshaler embeds raw fragments and values verbatim.
+
+    1. Create an entity with a raw embedded representation and a raw property.
+    2. Marshal the entity with stream marshaler.
+    3. Check that fragments are embedded as is.
+    4. Check that the output is the same JSON document as the data of JSONMarshaler.
+    """
+    entity = Entity(
+        properties={"raw": RawJSON('{"key":[1,2]}')},
+        entities=[RawEmbeddedRepresentation(_FRAGMENT)],
+        links=[Link(relations=["self"], target="/self")],
+        )
+
+    encoded_entity = JSONStreamMarshaler().marshal_entity(entity)
+
+    assert b'{"raw": {"key":[1,2]}}' in encoded_entity, "Raw property is not embedded"
+    assert _FRAGMENT.encode("utf-8") in encoded_entity, "Fragment is not embedded"
+    assert json.loads(encoded_entity.decode("utf-8")) == JSONMarshaler().marshal_entity(entity), (
+        "Wrong data"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="fragment",
+    argvalues=["{", "[]"],
+    ids=["Invalid JSON", "Not an object"],
+    )
+def test_invalid_fragment(fragment):
+    """Test that ValueError is raised if a fragment can't be decoded.
+
+    1. Try to marshal an embedded representation with invalid fragment.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        JSONMarshaler().marshal_embedded_representation(RawEmbeddedRepresentation(fragment))
@@ -0,0 +1,239 @@
+"""Test cases for the single pass JSON parser."""
+
+import sys
+import json
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.codec import Codec
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.fused import FusedJSONParser
+
+
+def _create_entity():
+    """Create an entity with all kinds of components.
+
+    :returns: Siren entity.
+    """
+    return Entity(
+        title="Order",
+        classes=["order"],
+        properties={"number": 42, "items": [{"name": "book", "price": 9.5}], "note": None},
+        entities=[
+            EmbeddedLink(relations=["customer"], target="/customers/1", target_media_type="json"),
+            EmbeddedRepresentation(
+                relations=["item"],
+                classes=["item"],
+                properties={"name": "book"},
+                links=[Link(relations=["self"], target="/items/1")],
+                entities=[EmbeddedLink(relations=["author"], target="authors/2")],
+                ),
+            ],
+        links=[
+            Link(relations=["self"], target="/orders/42", title="Self", classes=["order"]),
+            Link(relations=[], target="/orders"),
+            ],
+        actions=[
+            Action(name="cancel", target="/orders/42", method="DELETE"),
+            Action(
+                name="pay",
+                target="/orders/42/payment",
+                method="POST",
+                title="Pay",
+                fields=[
+                    Field(name="amount", input_type="number", value=10, classes=["money"]),
+                    Field(name="comment", title="Comment"),
+                    ],
+                ),
+            ],
+        )
+
+
+def _parse_with_both_parsers(encoded_data, base_url=None):
+    """Parse data with the regular and the single pass parsers.
+
+    :param encoded_data: bytes with serialized entity.
+    :param base_url: optional base URL of the parsers.
+    :returns: tuple with results of the regular and the single pass parsers. A result is either
+        marshaled entity or a list with messages of the raised error and its causes.
+    """
+    marshaler = JSONMarshaler()
+    results = []
+    for parser_class in (JSONParser, FusedJSONParser):
+        parser = parser_class(base_url=base_url)
+        try:
+            entity = parser.parse_entity_bytes(encoded_data)
+        except ValueError as error:
+            messages = []
+            while error is not None:
+                messages.append(str(error))
+                error = error.__cause__
+            results.append(messages)
+        else:
+            results.append((type(entity), marshaler.marshal_entity(entity)))
+
+    return tuple(results)
+
+
+@pytest.mark.parametrize(
+    argnames="base_url",
+    argvalues=[None, "https://example.com/api/"],
+    ids=["Without base URL", "With base URL"],
+    )
+def test_parse(base_url, component_validator):
+    """Test that an entity is parsed in the same way as by the regular parser.
+
+    1. Marshal an entity into bytes.
+    2. Parse the bytes with the single pass parser.
+    3. Check the entity.
+    4. Check that the same entity is parsed by the regular parser.
+    """
+    entity = _create_entity()
+    encoded_entity = JSONMarshaler().marshal_entity_bytes(entity)
+
+    parsed_entity = FusedJSONParser(base_url=base_url).parse_entity_bytes(encoded_entity)
+    if base_url is None:
+        component_validator.validate_entity(parsed_entity, entity)
+
+    regular_result, fused_result = _parse_with_both_parsers(encoded_entity, base_url=base_url)
+    assert fused_result == regular_result, "Wrong entity"
+
+
+def test_components():
+    """Test that components of the parsed entity are of the proper classes.
+
+    1. Parse an entity with the single pass parser.
+    2. Check classes of the components.
+    3. Check the default media type of the action with fields.
+    """
+    encoded_entity = JSONMarshaler().marshal_entity_bytes(_create_entity())
+    parsed_entity = FusedJSONParser().parse_entity_bytes(encoded_entity)
+
+    embedded_link, representation = parsed_entity.entities
+    assert parsed_entity.__class__ is Entity, "Wrong class of the entity"
+    assert isinstance(embedded_link, EmbeddedLink), "Wrong class of the embedded link"
+    assert isinstance(representation, EmbeddedRepresentation), "Wrong class of the representation"
+    assert representation.relations == ("item", ), "Wrong relations of the representation"
+
+    field = parsed_entity.actions[1].fields[0]
+    assert isinstance(field, Field), "Wrong class of the field"
+    assert field.value == "10", "Wrong value of the field"
+    assert parsed_entity.actions[1].media_type == "application/x-www-form-urlencoded", (
+        "Wrong media type"
+        )
+
+
+_DOCUMENTS = [
+    {"class": "order", "title": 1},
+    {"class": {"order": 1}},
+    {"properties": [["name", "value"]]},
+    {"properties": None},
+    {"class": None},
+    {"links": [{"rel": "self", "href": 1}]},
+    {"links": [{"rel": ["self"]}]},
+    {"links": {"rel": ["self"]}},
+    {"links": ["self"]},
+    {"entities": [{"rel": [], "href": "/"}]},
+    {"entities": [{"rel": []}]},
+    {"entities": [{"class": ["item"]}]},
+    {"entities": [{"rel": ["item"], "entities": [{"rel": "item", "href": None}]}]},
+    {"actions": [{"name": "a", "href": "/"}, {"name": "a", "href": "/"}]},
+    {"actions": [{"name": "a", "href": "/", "method": "get"}]},
+    {"actions": [{"name": "a", "href": "/", "method": ["GET"]}]},
+    {"actions": [{"name": "a", "href": "/", "fields": [{"name": "f"}, {"name": "f"}]}]},
+    {"actions": [{"name": "a", "href": "/", "fields": [{"name": "f", "type": "unknown"}]}]},
+    {"actions": [{"name": "a", "href": "/", "fields": [{"type": "text"}]}]},
+    {"actions": [{"name": "a", "href": "/", "fields": [{"name": "f", "class": "a"}]}]},
+    {"actions": [{"href": "/"}]},
+    [],
+    "entity",
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames="data",
+    argvalues=_DOCUMENTS,
+    ids=[
+        "String classes",
+        "Dictionary classes",
+        "List of property items",
+        "Null properties",
+        "Null classes",
+        "String relations of a link",
+        "Link without target",
+        "Dictionary of links",
+        "String link",
+        "Embedded link without relations",
+        "Representation without relations",
+        "Representation without 'rel' key",
+        "Nested string relations",
+        "Duplicate actions",
+        "Lowercase method",
+        "List method",
+        "Duplicate fields",
+        "Unknown input type",
+        "Field without name",
+        "String classes of a field",
+        "Action without name",
+        "List",
+        "String",
+        ],
+    )
+def test_uncommon_data(data):
+    """Test that uncommon and invalid data give the same results as with the regular parser.
+
+    1. Encode data into bytes.
+    2. Parse the bytes with the regular and the single pass parsers.
+    3. Check that the results are the same.
+    """
+    encoded_data = json.dumps(data).encode("utf-8")
+    regular_result, fused_result = _parse_with_both_parsers(encoded_data)
+    assert fused_result == regular_result, "Wrong result"
+
+
+def test_invalid_json():
+    """Test that ValueError is raised for invalid JSON.
+
+    1. Try to parse invalid JSON with the single pass parser.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        FusedJSONParser().parse_entity_bytes(b"{")
+
+
+class _DecodedDataCodec(Codec):
+    """Codec that passes already decoded data through."""
+
+    name = "decoded"
+
+    def decode(self, encoded_data):
+        return encoded_data
+
+
+def test_deeply_nested_data():
+    """Test that data nested deeper than the recursion limit are parsed.
+
+    1. Create data with embedded representations nested deeper than the recursion limit.
+    2. Parse the data with the single pass parser.
+    3. Check the number of levels of the parsed entity.
+    """
+    depth = sys.getrecursionlimit() * 2
+    data = {"entities": []}
+    representation_data = data
+    for _ in range(depth):
+        nested_data = {"rel": ["item"], "entities": []}
+        representation_data["entities"].append(nested_data)
+        representation_data = nested_data
+
+    representation = FusedJSONParser(codec=_DecodedDataCodec()).parse_entity_bytes(data)
+    parsed_depth = 0
+    while representation.entities:
+        representation, = representation.entities
+        parsed_depth += 1
+
+    assert parsed_depth == depth, "Wrong number of levels"
@@ -0,0 +1,174 @@
+"""Test cases for lazy entities."""
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+from lila.serialization.json.lazy import LazyEntity, LazyEmbeddedRepresentation
+
+
+class _CountingParser(JSONParser):
+    """JSON parser that counts parsed links, embedded links and actions."""
+
+    def __init__(self):
+        super(_CountingParser, self).__init__()
+        self.parsed_components = []
+
+    def parse_link(self, data):
+        self.parsed_components.append("link")
+        return super(_CountingParser, self).parse_link(data)
+
+    def parse_embedded_link(self, data):
+        self.parsed_components.append("embedded_link")
+        return super(_CountingParser, self).parse_embedded_link(data)
+
+    def parse_action(self, data):
+        self.parsed_components.append("action")
+        return super(_CountingParser, self).parse_action(data)
+
+
+def _create_entity():
+    """Create an entity with all kinds of members.
+
+    :returns: Siren entity.
+    """
+    return Entity(
+        title="Orders",
+        classes=["collection"],
+        properties={"total": 2, "tags": ["a", "b"]},
+        entities=[
+            EmbeddedLink(relations=["item"], target="/orders/1"),
+            EmbeddedRepresentation(
+                relations=["item"],
+                classes=["order"],
+                properties={"number": 2},
+                links=[Link(relations=["self"], target="/orders/2")],
+                actions=[Action(name="cancel", target="/orders/2", method="DELETE")],
+                ),
+            ],
+        links=[Link(relations=["self"], target="/orders")],
+        actions=[
+            Action(name="add", target="/orders", method="POST", fields=[Field(name="number")]),
+            ],
+        )
+
+
+def test_parse():
+    """Test that a lazy entity has the same members as the parsed one.
+
+    1. Marshal an entity.
+    2. Parse the data lazily.
+    3. Check the class of the lazy entity.
+    4. Check that the lazy entity is marshaled in the same way as the original one.
+    """
+    marshaler = JSONMarshaler()
+    data = marshaler.marshal_entity(_create_entity())
+
+    lazy_entity = JSONParser().parse_entity_lazily(data)
+    assert isinstance(lazy_entity, LazyEntity), "Wrong class of the entity"
+    assert marshaler.marshal_entity(lazy_entity) == data, "Wrong marshaled data"
+
+
+def test_lazy_members():
+    """Test that members are parsed on the first access and cached.
+
+    1. Parse an entity lazily.
+    2. Check that no components are parsed.
+    3. Access links of the entity twice.
+    4. Check that only the link is parsed once.
+    5. Access sub-entities of the entity.
+    6. Check that the embedded representation is lazy.
+    7. Check that its members are not parsed.
+    """
+    parser = _CountingParser()
+    entity = parser.parse_entity_lazily(JSONMarshaler().marshal_entity(_create_entity()))
+    assert entity.title == "Orders", "Wrong title"
+    assert entity.classes == ("collection", ), "Wrong classes"
+    assert parser.parsed_components == [], "Components are parsed eagerly"
+
+    assert entity.links == entity.links, "Wrong links"
+    assert parser.parsed_components == ["link"], "Wrong parsed components"
+
+    _, representation = entity.entities
+    assert isinstance(representation, LazyEmbeddedRepresentation), "Representation is not lazy"
+    assert isinstance(representation, EmbeddedRepresentation), "Wrong class of representation"
+    assert representation.relations == ("item", ), "Wrong relations"
+    assert parser.parsed_components == ["link", "embedded_link"], "Wrong parsed components"
+
+    assert representation.actions[0].name == "cancel", "Wrong action"
+    assert parser.parsed_components == ["link", "embedded_link", "action"], (
+        "Wrong parsed components"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="data",
+    argvalues=[
+        [],
+        {"class": 1},
+        {"title": "a", "class": None},
+        ],
+    ids=["List", "Invalid classes", "Null classes"],
+    )
+def test_invalid_top_level(data):
+    """Test that the top level of an entity is validated at once.
+
+    1. Try to parse invalid data with JSON parser.
+    2. Try to parse the data lazily.
+    3. Check that the error messages are the same.
+    """
+    with pytest.raises(ValueError) as regular_error_info:
+        JSONParser().parse_entity(data)
+
+    with pytest.raises(ValueError) as error_info:
+        JSONParser().parse_entity_lazily(data)
+
+    assert error_info.value.args == regular_error_info.value.args, "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="data,member",
+    argvalues=[
+        ({"properties": 1}, "properties"),
+        ({"properties": [1]}, "properties"),
+        ({"entities": 1}, "entities"),
+        ({"entities": [{"href": "/"}]}, "entities"),
+        ({"entities": [{"rel": []}]}, "entities"),
+        ({"entities": [{"rel": ["item"], "class": 1}]}, "entities"),
+        ({"links": [{}]}, "links"),
+        ({"actions": [{"name": "a", "href": "/"}, {"name": "a", "href": "/"}]}, "actions"),
+        ],
+    ids=[
+        "Invalid properties",
+        "List properties",
+        "Invalid sub-entities",
+        "Invalid embedded link",
+        "Representation without relations",
+        "Invalid classes of representation",
+        "Invalid link",
+        "Duplicate actions",
+        ],
+    )
+def test_invalid_member(data, member):
+    """Test that errors of a member are raised on the first access.
+
+    1. Try to parse invalid data with JSON parser.
+    2. Parse the data lazily.
+    3. Try to access the invalid member.
+    4. Check that the error messages are the same.
+    """
+    with pytest.raises(ValueError) as regular_error_info:
+        JSONParser().parse_entity(data)
+
+    entity = JSONParser().parse_entity_lazily(data)
+    with pytest.raises(ValueError) as error_info:
+        getattr(entity, member)
+
+    assert error_info.value.args == regular_error_info.value.args, "Wrong error"
+    assert error_info.value.__cause__.args == regular_error_info.value.__cause__.args, (
+        "Wrong cause of the error"
+        )
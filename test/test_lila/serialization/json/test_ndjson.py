@@ -0,0 +1,184 @@
+"""Test cases for NDJSON helpers."""
+
+import io
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import pytest
+
+from lila.core.link import Link
+from lila.core.entity import Entity
+from lila.serialization.json import ndjson
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+
+
+def _create_entities(number):
+    """Create sample entities.
+
+    :param number: number of entities.
+    :returns: list with Siren entities.
+    """
+    return [
+        Entity(
+            properties={"index": index, "text": "line\nbreak"},
+            links=[Link(relations=["self"], target="/items/{0}".format(index))],
+            )
+        for index in range(number)
+        ]
+
+
+@pytest.mark.parametrize(
+    argnames="stream_class",
+    argvalues=[io.BytesIO, io.StringIO],
+    ids=["Binary stream", "Text stream"],
+    )
+def test_roundtrip(stream_class, component_validator):
+    """Test that entities are written as NDJSON and read back.
+
+    1. Write entities into a stream.
+    2. Check that each entity is written into a single line.
+    3. Read entities from the stream.
+    4. Check the entities.
+    """
+    entities = _create_entities(5)
+    stream = stream_class()
+
+    assert ndjson.write_entities(JSONMarshaler(), entities, stream) == 5, "Wrong number"
+    assert len(stream.getvalue().splitlines()) == 5, "Wrong number of lines"
+
+    stream.seek(0)
+    parsed_entities = list(ndjson.read_entities(JSONParser(), stream))
+
+    assert len(parsed_entities) == len(entities), "Wrong number of entities"
+    for parsed_entity, entity in zip(parsed_entities, entities):
+        component_validator.validate_entity(parsed_entity, entity)
+
+
+@pytest.mark.parametrize(
+    argnames="executor_class",
+    argvalues=[None, ThreadPoolExecutor, ProcessPoolExecutor],
+    ids=["Without executor", "Thread pool", "Process pool"],
+    )
+def test_parallel_decode(executor_class, component_validator):
+    """Test that lines are decoded with an executor in the same order.
+
+    1. Encode entities into lines.
+    2. Read the entities with an executor and small chunks.
+    3. Check the entities.
+    """
+    entities = _create_entities(10)
+    lines = list(ndjson.encode_entities(JSONMarshaler(), entities))
+
+    if executor_class is None:
+        parsed_entities = list(ndjson.read_entities(JSONParser(), lines, chunk_size=3))
+    else:
+        with executor_class(max_workers=2) as executor:
+            parsed_entities = list(ndjson.read_entities(
+                JSONParser(),
+                lines,
+                executor=executor,
+                chunk_size=3,
+                max_pending_chunks=2,
+                ))
+
+    assert len(parsed_entities) == len(entities), "Wrong number of entities"
+    for parsed_entity, entity in zip(parsed_entities, entities):
+        component_validator.validate_entity(parsed_entity, entity)
+
+
+def test_bounded_reading():
+    """Test that only a limited number of lines is read ahead.
+
+    1. Create an infinite iterator over lines.
+    2. Read an entity with an executor.
+    3. Check that the number of consumed lines is limited by the chunks.
+    """
+    line = next(ndjson.encode_entities(JSONMarshaler(), _create_entities(1)))
+    consumed_lines = []
+
+    def _generate_lines():
+        while True:
+            consumed_lines.append(line)
+            yield line
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        entities = ndjson.read_entities(
+            JSONParser(),
+            _generate_lines(),
+            executor=executor,
+            chunk_size=5,
+            max_pending_chunks=2,
+            )
+        next(entities)
+        entities.close()
+
+    assert len(consumed_lines) <= 10, "Too many lines are read"
+
+
+_INVALID_LINES = [
+    b'{"title": "first"}\n',
+    b"\n",
+    b"{\n",
+    b'{"title": "second"}\n',
+    b'{"links": [{}]}\n',
+    ]
+
+
+def test_raise_errors():
+    """Test that ValueError with the number of the invalid line is raised by default.
+
+    1. Try to read entities from lines with an invalid line.
+    2. Check that entities before the line are read.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    """
+    entities = ndjson.read_entities(JSONParser(), iter(_INVALID_LINES))
+    assert next(entities).title == "first", "Wrong entity"
+
+    with pytest.raises(ValueError) as error_info:
+        next(entities)
+
+    assert error_info.value.args[0] == "Failed to parse line 3", "Wrong error"
+
+
+def test_skip_errors():
+    """Test that invalid and blank lines are skipped with skip policy.
+
+    1. Read entities from lines with invalid and blank lines.
+    2. Check the entities.
+    """
+    entities = ndjson.read_entities(JSONParser(), _INVALID_LINES, errors=ndjson.ERRORS_SKIP)
+    assert [entity.title for entity in entities] == ["first", "second"], "Wrong entities"
+
+
+def test_error_handler():
+    """Test that a callable policy is called for invalid lines.
+
+    1. Read entities from lines with invalid lines and an error handler.
+    2. Check the entities.
+    3. Check that the handler is called with numbers of invalid lines and errors.
+    """
+    handled_errors = []
+    entities = list(ndjson.read_entities(
+        JSONParser(),
+        _INVALID_LINES,
+        errors=lambda line_number, error: handled_errors.append((line_number, type(error))),
+        ))
+
+    assert [entity.title for entity in entities] == ["first", "second"], "Wrong entities"
+    assert handled_errors == [(3, ValueError), (5, ValueError)], "Wrong handled errors"
+
+
+@pytest.mark.parametrize(
+    argnames="kwargs",
+    argvalues=[{"errors": "ignore"}, {"chunk_size": 0}, {"max_pending_chunks": 0}],
+    ids=["Unknown policy", "Chunk size", "Pending chunks"],
+    )
+def test_invalid_arguments(kwargs):
+    """Test that ValueError is raised for invalid arguments.
+
+    1. Try to read entities with invalid arguments.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        ndjson.read_entities(JSONParser(), [], **kwargs)
@@ -0,0 +1,269 @@
+"""Test cases for projections of entities."""
+
+import pytest
+
+from lila.core.link import Link, EmbeddedLink
+from lila.core.action import Action
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json.fragment import RawEmbeddedRepresentation
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.projection import Projection
+
+
+def _create_entity():
+    """Create an entity with all kinds of members.
+
+    :returns: Siren entity.
+    """
+    items = [
+        EmbeddedRepresentation(
+            relations=["item"],
+            classes=["order"],
+            properties={"number": number, "status": "pending", "total": 10 * number},
+            links=[Link(relations=["self"], target="/orders/{0}".format(number))],
+            actions=[Action(name="cancel", target="/orders/{0}".format(number), method="DELETE")],
+            title="Order {0}".format(number),
+            )
+        for number in range(2)
+        ]
+    return Entity(
+        classes=["orders"],
+        properties={"count": 2, "owner": "John"},
+        entities=items + [EmbeddedLink(relations=["customer"], target="/customer")],
+        links=[Link(relations=["self"], target="/orders")],
+        actions=[
+            Action(name="add", target="/orders", method="POST"),
+            Action(name="clear", target="/orders", method="DELETE"),
+            ],
+        title="Orders",
+        )
+
+
+class _ForbiddenEntity:
+    """Entity-like object without any members but relations."""
+
+    relations = ("skipped", )
+
+    def __getattr__(self, name):
+        raise AttributeError(name)
+
+
+def test_default_projection():
+    """Test that default projection marshals the whole entity.
+
+    1. Create an entity.
+    2. Marshal the entity with a projection without filters.
+    3. Check that marshaled data is the same as of the whole entity.
+    """
+    marshaler = JSONMarshaler()
+    entity = _create_entity()
+
+    marshaled_entity = marshaler.marshal_sparse_entity(entity, Projection())
+    assert marshaled_entity == marshaler.marshal_entity(entity), "Wrong marshaled data"
+
+
+def test_sparse_fieldsets():
+    """Test that only requested parts of an entity are marshaled.
+
+    1. Create an entity.
+    2. Marshal the entity with a projection of links and properties of items.
+    3. Check marshaled data.
+    """
+    marshaler = JSONMarshaler()
+    entity = _create_entity()
+
+    entity_projection = Projection(
+        members=["entities", "links", "actions"],
+        relations=["item"],
+        actions=["add"],
+        sub_entities=Projection(members=["properties", "links"], properties=["number", "total"]),
+        )
+    marshaled_entity = marshaler.marshal_sparse_entity(entity, entity_projection)
+
+    full_data = marshaler.marshal_entity(entity)
+    expected_data = {
+        "entities": [
+            {
+                "rel": ["item"],
+                "properties": {"number": number, "total": 10 * number},
+                "links": full_data["entities"][number]["links"],
+                }
+            for number in range(2)
+            ],
+        "links": full_data["links"],
+        "actions": full_data["actions"][:1],
+        }
+    assert marshaled_entity == expected_data, "Wrong marshaled data"
+
+
+def test_unrequested_members():
+    """Test that members that are not requested are not accessed.
+
+    1. Create an entity with a sub-entity, which fails on access to its members.
+    2. Marshal the entity with a projection that skips the sub-entity and the actions.
+    3. Check that marshaled data contain only requested members.
+    """
+    embedded_link = EmbeddedLink(relations=["item"], target="/item")
+    entity = Entity(
+        properties={"name": "value"},
+        entities=[embedded_link],
+        links=[Link(relations=["self"], target="/self")],
+        )
+    entity._entities = [_ForbiddenEntity(), embedded_link]  # pylint: disable=protected-access
+    entity_projection = Projection(members=["entities", "properties"], relations=["item"])
+
+    marshaled_entity = JSONMarshaler().marshal_sparse_entity(entity, entity_projection)
+    assert marshaled_entity == {
+        "properties": {"name": "value"},
+        "entities": [{"rel": ["item"], "href": "/item", "class": [], "title": None, "type": None}],
+        }, "Wrong marshaled data"
+
+
+class _UncopyableValue:
+    """Value of a property, which fails on copying."""
+
+    def __deepcopy__(self, memo):
+        raise AssertionError("Value is copied")
+
+
+def test_unrequested_properties():
+    """Test that properties that are not requested are not copied.
+
+    1. Create an entity with a property, which fails on copying.
+    2. Marshal the entity with a projection that skips the property.
+    3. Check that marshaled data contain only requested properties.
+    """
+    entity = Entity(properties={"name": "value"})
+    entity._properties["skipped"] = _UncopyableValue()    # pylint: disable=protected-access
+    entity_projection = Projection(members=["properties"], properties=["name"])
+
+    marshaled_entity = JSONMarshaler().marshal_sparse_entity(entity, entity_projection)
+    assert marshaled_entity == {"properties": {"name": "value"}}, "Wrong marshaled data"
+
+
+def test_raw_representation():
+    """Test that projection of sub-entities is applied to raw embedded representations.
+
+    1. Create an entity with a raw embedded representation.
+    2. Marshal the entity with a projection of sub-entities.
+    3. Check that data of the fragment are filtered.
+    """
+    fragment = '{"rel":["item"],"class":["raw"],"properties":{"a":1,"b":2},"links":[]}'
+    entity = Entity(entities=[RawEmbeddedRepresentation(fragment)])
+    entity_projection = Projection(
+        members=["entities"],
+        sub_entities=Projection(members=["properties"], properties=["b"]),
+        )
+
+    marshaled_entity = JSONMarshaler().marshal_sparse_entity(entity, entity_projection)
+    assert marshaled_entity == {
+        "entities": [{"rel": ["item"], "properties": {"b": 2}}],
+        }, "Wrong marshaled data"
+
+
+def test_compact_marshaler():
+    """Test that projection is applied to data of a compact marshaler.
+
+    1. Create an entity.
+    2. Marshal the entity with a compact marshaler and a projection.
+    3. Check marshaled data.
+    """
+    entity = _create_entity()
+    entity_projection = Projection(members=["properties", "title"], properties=["count"])
+
+    marshaled_entity = JSONMarshaler(compact=True).marshal_sparse_entity(entity, entity_projection)
+    assert marshaled_entity == {"properties": {"count": 2}, "title": "Orders"}, (
+        "Wrong marshaled data"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="embedding_depth",
+    argvalues=[0, 1],
+    ids=["Collapsed items", "Collapsed nested representations"],
+    )
+def test_limited_depth(embedding_depth):
+    """Test that representations are collapsed even if the projection leaves out their links.
+
+    1. Create an entity with nested embedded representations.
+    2. Marshal the entity with a limited depth and a projection without links of sub-entities.
+    3. Check that collapsed representations are the same as without the projection.
+    4. Check that other members of representations are filtered.
+    """
+    nested_representation = EmbeddedRepresentation(
+        relations=["customer"],
+        properties={"name": "John"},
+        links=[Link(relations=["self"], target="/customer")],
+        )
+    entity = Entity(
+        entities=[
+            EmbeddedRepresentation(
+                relations=["item"],
+                properties={"number": 1, "status": "pending"},
+                entities=[nested_representation],
+                links=[Link(relations=["self"], target="/orders/1")],
+                ),
+            ],
+        )
+    entity_projection = Projection(
+        members=["entities"],
+        sub_entities=Projection(
+            members=["properties", "entities"],
+            properties=["number"],
+            sub_entities=Projection(members=["properties"]),
+            ),
+        )
+
+    marshaler = JSONMarshaler(embedding_depth=embedding_depth)
+    marshaled_entity = marshaler.marshal_sparse_entity(entity, entity_projection)
+
+    full_data = marshaler.marshal_entity(entity)
+    if embedding_depth == 0:
+        expected_data = {"entities": full_data["entities"]}
+    else:
+        expected_data = {
+            "entities": [
+                {
+                    "rel": ["item"],
+                    "properties": {"number": 1},
+                    "entities": full_data["entities"][0]["entities"],
+                    },
+                ],
+            }
+
+    assert marshaled_entity == expected_data, "Wrong marshaled data"
+
+
+@pytest.mark.parametrize(
+    argnames="kwargs",
+    argvalues=[
+        {"members": ["links", "items"]},
+        {"sub_entities": {"members": ["links"]}},
+        ],
+    ids=[
+        "Unknown member",
+        "Invalid projection of sub-entities",
+        ],
+    )
+def test_invalid_projection(kwargs):
+    """Test that ValueError is raised for invalid projections.
+
+    1. Try to create a projection with invalid arguments.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        Projection(**kwargs)
+
+
+def test_marshal_error():
+    """Test that errors of the marshaler are propagated.
+
+    1. Create an entity with a requested sub-entity, which fails on access to its members.
+    2. Try to marshal the entity with a projection.
+    3. Check that ValueError is raised.
+    """
+    entity = Entity(entities=[EmbeddedLink(relations=["item"], target="/item")])
+    entity._entities = [_ForbiddenEntity()]    # pylint: disable=protected-access
+
+    with pytest.raises(ValueError):
+        JSONMarshaler().marshal_sparse_entity(entity, Projection(members=["entities"]))
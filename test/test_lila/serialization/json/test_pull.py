@@ -0,0 +1,244 @@
+"""Test cases for the incremental parser of entities."""
+
+import io
+import json
+
+import pytest
+
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.json import pull
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+
+
+def _create_entity(number):
+    """Create an entity of a collection.
+
+    :param number: number of sub-entities.
+    :returns: Siren entity.
+    """
+    return Entity(
+        title="Collection é中",
+        classes=["collection"],
+        properties={"total": number, "note": "ünicode \U0001f600"},
+        entities=[
+            EmbeddedRepresentation(
+                relations=["item"],
+                properties={"index": index, "name": "élément"},
+                links=[Link(relations=["self"], target="/items/{0}".format(index))],
+                )
+            if index % 2 else EmbeddedLink(relations=["item"], target="/items/{0}".format(index))
+            for index in range(number)
+            ],
+        links=[Link(relations=["self"], target="/items")],
+        actions=[Action(name="add", target="/items", method="POST")],
+        )
+
+
+class _TrackedStream(io.BytesIO):
+    """Binary stream that tracks the number of read bytes."""
+
+    read_size = 0
+
+    def read(self, size=-1):
+        chunk = super(_TrackedStream, self).read(size)
+        self.read_size += len(chunk)
+        return chunk
+
+
+@pytest.mark.parametrize(
+    argnames="stream_class,chunk_size",
+    argvalues=[
+        (io.BytesIO, 1),
+        (io.BytesIO, 7),
+        (io.StringIO, 5),
+        (io.BytesIO, pull.DEFAULT_CHUNK_SIZE),
+        ],
+    ids=["Single byte", "Small binary chunks", "Small text chunks", "Default chunks"],
+    )
+def test_iterate_entity(stream_class, chunk_size, component_validator):
+    """Test that members of an entity are produced in the order of the document.
+
+    1. Marshal an entity with JSON marshaler.
+    2. Parse the entity incrementally.
+    3. Check the order of the members.
+    4. Check the parsed values.
+    """
+    entity = _create_entity(5)
+    document = json.dumps(JSONMarshaler().marshal_entity(entity), indent=2)
+    if stream_class is io.BytesIO:
+        document = document.encode("utf-8")
+
+    members = list(pull.iterate_entity(JSONParser(), stream_class(document), chunk_size))
+
+    expected_keys = ["class", "properties"] + ["entities"] * 5 + ["links", "actions", "title"]
+    assert [key for key, _ in members] == expected_keys, "Wrong order of the members"
+
+    parsed_members = dict(members)
+    parsed_entity = Entity(
+        classes=parsed_members["class"],
+        properties=parsed_members["properties"],
+        entities=[value for key, value in members if key == pull.SUB_ENTITY],
+        links=parsed_members["links"],
+        actions=parsed_members["actions"],
+        title=parsed_members["title"],
+        )
+    component_validator.validate_entity(parsed_entity, entity)
+
+
+def test_incremental_reading():
+    """Test that sub-entities are produced before the whole document is read.
+
+    1. Create a stream with a large entity.
+    2. Parse the first sub-entity.
+    3. Check that only a part of the stream is read.
+    """
+    document = JSONMarshaler().marshal_entity_bytes(_create_entity(1000))
+    stream = _TrackedStream(document)
+
+    members = pull.iterate_entity(JSONParser(), stream, chunk_size=1024)
+    for key, _ in members:
+        if key == pull.SUB_ENTITY:
+            break
+
+    assert stream.read_size <= 2048, "Too much data is read"
+
+
+def test_cut_values():
+    """Test that values cut at any position by the chunks are read.
+
+    1. Create a document with numbers, literals and escaped characters.
+    2. Parse the document incrementally with chunks of different sizes.
+    3. Check that the same members are produced for all sizes.
+    """
+    document = json.dumps({
+        "properties": {
+            "numbers": [-1.5e-3, 12345, -2.5E+10, 1e300],
+            "literals": [True, False, None],
+            "text": "é\"\\\n\u0001 \U0001f600",
+            },
+        "title": -12.75,
+        }).encode("utf-8")
+
+    expected_members = list(pull.iterate_entity(JSONParser(), io.BytesIO(document)))
+    for chunk_size in range(1, len(document) + 1):
+        members = list(pull.iterate_entity(JSONParser(), io.BytesIO(document), chunk_size))
+        assert members == expected_members, "Wrong members for chunks of {0}".format(chunk_size)
+
+
+def test_early_invalid_value():
+    """Test that an invalid value is reported without reading the rest of the stream.
+
+    1. Create a stream with an invalid value at the start of a large document.
+    2. Try to parse the document incrementally.
+    3. Check that ValueError is raised.
+    4. Check that only a part of the stream is read.
+    """
+    document = b'{"properties": {"flag": tru}, "title": "' + b"x" * 100000 + b'"}'
+    stream = _TrackedStream(document)
+
+    with pytest.raises(ValueError):
+        list(pull.iterate_entity(JSONParser(), stream, chunk_size=64))
+
+    assert stream.read_size <= 128, "Too much data is read"
+
+
+def test_unknown_members():
+    """Test that unknown members are skipped.
+
+    1. Parse an entity with unknown members.
+    2. Check the produced members.
+    """
+    stream = io.BytesIO(b'{"unknown": {"a": [1, 2]}, "title": 12, "other": 1.5e3}')
+    members = list(pull.iterate_entity(JSONParser(), stream, chunk_size=2))
+    assert members == [(pull.TITLE, "12")], "Wrong members"
+
+
+def test_empty_entity():
+    """Test that an empty entity produces no members.
+
+    1. Parse an empty entity.
+    2. Check that no members are produced.
+    """
+    members = list(pull.iterate_entity(JSONParser(), io.BytesIO(b' { } \n')))
+    assert members == [], "Wrong members"
+
+
+@pytest.mark.parametrize(
+    argnames="data",
+    argvalues=[
+        {"class": 1},
+        {"properties": [1]},
+        {"entities": [{}]},
+        {"entities": 1},
+        {"links": [{"href": "/"}]},
+        {"actions": [{"name": "a", "href": "/"}, {"name": "a", "href": "/"}]},
+        ],
+    ids=[
+        "Invalid classes",
+        "Invalid properties",
+        "Invalid sub-entity",
+        "Invalid sub-entities",
+        "Invalid link",
+        "Duplicate actions",
+        ],
+    )
+def test_invalid_members(data):
+    """Test that the same errors are raised as by JSON parser.
+
+    1. Try to parse invalid data with JSON parser.
+    2. Try to parse the data incrementally.
+    3. Check that the error messages are the same.
+    """
+    with pytest.raises(ValueError) as regular_error_info:
+        JSONParser().parse_entity(data)
+
+    with pytest.raises(ValueError) as error_info:
+        list(pull.iterate_entity(JSONParser(), io.BytesIO(json.dumps(data).encode("utf-8"))))
+
+    assert error_info.value.args == regular_error_info.value.args, "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="document",
+    argvalues=[
+        b"",
+        b"[]",
+        b'{"title": "a"',
+        b'{"title": "a"} {}',
+        b'{"title" "a"}',
+        b'{1: "a"}',
+        b'{"entities": [{"rel": ["item"], "href": "/"}',
+        b'{"title": "\xff"}',
+        ],
+    ids=[
+        "Empty",
+        "Array",
+        "Truncated",
+        "Extra data",
+        "Missing colon",
+        "Number key",
+        "Truncated sub-entities",
+        "Invalid UTF-8",
+        ],
+    )
+def test_invalid_json(document):
+    """Test that ValueError is raised for invalid JSON.
+
+    1. Try to parse invalid JSON incrementally.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        list(pull.iterate_entity(JSONParser(), io.BytesIO(document), chunk_size=3))
+
+
+def test_invalid_chunk_size():
+    """Test that ValueError is raised for invalid size of a chunk.
+
+    1. Try to parse an entity with zero size of a chunk.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        pull.iterate_entity(JSONParser(), io.BytesIO(b"{}"), chunk_size=0)
@@ -0,0 +1,177 @@
+"""Test cases for templates of JSON responses."""
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link
+from lila.core.entity import Entity
+from lila.serialization.json.codec import CODEC_CLASSES
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.template import EntityTemplate, create_hole
+
+
+_AVAILABLE_CODEC_CLASSES = [
+    codec_class for codec_class in CODEC_CLASSES if codec_class.is_available()
+    ]
+
+
+def _create_entity(number, status, name):
+    """Create an entity with the passed values.
+
+    :param number: number of an order.
+    :param status: status of the order.
+    :param name: name of a customer.
+    :returns: Siren entity.
+    """
+    return Entity(
+        classes=["order"],
+        title="Order of " + name,
+        properties={"orderNumber": number, "status": status, "fixed": [1, 2]},
+        links=[Link(relations=["self"], target="/orders/" + number)],
+        actions=[
+            Action(
+                name="add-item",
+                target="/orders/" + number + "/items",
+                fields=[Field(name="orderNumber", value=number)],
+                ),
+            ],
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="codec_class",
+    argvalues=_AVAILABLE_CODEC_CLASSES,
+    ids=[codec_class.name for codec_class in _AVAILABLE_CODEC_CLASSES],
+    )
+@pytest.mark.parametrize(
+    argnames="values",
+    argvalues=[
+        {"number": "42", "status": "pending", "name": "Peter"},
+        {"number": "43", "status": {"code": 1}, "name": "Jüri \"Quoted\""},
+        ],
+    ids=["Strings", "Objects and escaped strings"],
+    )
+def test_render(codec_class, values):
+    """Test that a rendered template is the same as the marshaled entity.
+
+    1. Create a template from an entity with holes.
+    2. Render the template.
+    3. Check that the result is the same as bytes of the entity with values.
+    """
+    marshaler = JSONMarshaler(codec=codec_class())
+    template = EntityTemplate(
+        _create_entity(create_hole("number"), create_hole("status"), create_hole("name")),
+        marshaler=marshaler,
+        )
+
+    expected_data = marshaler.marshal_entity_bytes(
+        _create_entity(values["number"], values["status"], values["name"]),
+        )
+    assert template.render(values) == expected_data, "Wrong rendered data"
+
+
+def test_names():
+    """Test that names of holes are collected.
+
+    1. Create a template from an entity with holes.
+    2. Check the names of the holes.
+    """
+    template = EntityTemplate(
+        _create_entity(create_hole("number"), create_hole("status"), "Peter"),
+        )
+    assert template.names == frozenset(("number", "status")), "Wrong names"
+
+
+def test_missing_value():
+    """Test that ValueError is raised if a value of a hole is not passed.
+
+    1. Create a template from an entity with holes.
+    2. Try to render the template without a value.
+    3. Check that ValueError is raised.
+    4. Check the error message.
+    """
+    template = EntityTemplate(Entity(properties={"key": create_hole("value")}))
+    with pytest.raises(ValueError) as error_info:
+        template.render({})
+
+    assert error_info.value.args[0] == "Value for the hole 'value' is not passed", "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="name",
+    argvalues=["", "1name", "name with spaces", "имя"],
+    ids=["Empty", "Leading digit", "Spaces", "Non-ASCII"],
+    )
+def test_invalid_name(name):
+    """Test that ValueError is raised for invalid names of holes.
+
+    1. Try to create a hole with invalid name.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        create_hole(name)
+
+    assert error_info.value.args[0] == "Invalid name of a hole: '{0}'".format(name), "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="codec_class",
+    argvalues=_AVAILABLE_CODEC_CLASSES,
+    ids=[codec_class.name for codec_class in _AVAILABLE_CODEC_CLASSES],
+    )
+@pytest.mark.parametrize(
+    argnames="value",
+    argvalues=[5, {"key": "value"}, ["a", 1]],
+    ids=["Number", "Dictionary", "List"],
+    )
+def test_string_members(codec_class, value):
+    """Test that holes in members of Siren components are filled with string values.
+
+    1. Create a template from an entity with holes that fill whole members of components.
+    2. Render the template with a non-string value.
+    3. Check that the result is the same as bytes of the entity with the value.
+    """
+    def _create(hole_value):
+        return Entity(
+            title=hole_value,
+            classes=[hole_value],
+            properties={"value": hole_value},
+            links=[Link(relations=[hole_value], target=hole_value, title=hole_value)],
+            actions=[
+                Action(
+                    name=hole_value,
+                    target=hole_value,
+                    fields=[Field(name=hole_value, value=hole_value)],
+                    ),
+                ],
+            )
+
+    marshaler = JSONMarshaler(codec=codec_class())
+    template = EntityTemplate(_create(create_hole("value")), marshaler=marshaler)
+
+    expected_data = marshaler.marshal_entity_bytes(_create(value))
+    assert template.render({"value": value}) == expected_data, "Wrong rendered data"
+
+
+@pytest.mark.parametrize(
+    argnames="properties",
+    argvalues=[
+        {create_hole("key"): 1},
+        {"prefix " + create_hole("key"): 1},
+        {"nested": [{create_hole("key"): 1}]},
+        ],
+    ids=["Key", "Part of a key", "Nested key"],
+    )
+def test_hole_in_key(properties):
+    """Test that ValueError is raised if a hole is used in a key of properties.
+
+    1. Try to create a template from an entity with a hole in a key of properties.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        EntityTemplate(Entity(properties=properties))
+
+    assert error_info.value.args[0] == "Holes can't be used in keys of properties", "Wrong error"
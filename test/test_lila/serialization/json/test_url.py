@@ -0,0 +1,162 @@
+"""Test cases for targets relative to a base URL."""
+
+import pickle
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity, EmbeddedRepresentation
+from lila.serialization.cache import FragmentCache
+from lila.serialization.json.url import URLResolver
+from lila.serialization.json.marshaler import JSONMarshaler
+from lila.serialization.json.parser import JSONParser
+
+
+_BASE_URL = "https://api.example.com/v1/"
+
+
+@pytest.mark.parametrize(
+    argnames="target,expected_target",
+    argvalues=[
+        ("https://api.example.com/v1/orders/1", "orders/1"),
+        ("https://api.example.com/v1/", ""),
+        ("https://api.example.com/v1/?page=2", "?page=2"),
+        ("https://api.example.com/v2/orders", "https://api.example.com/v2/orders"),
+        ("https://api.example.com/v1//orders", "https://api.example.com/v1//orders"),
+        ("https://api.example.com/v1/a:b", "https://api.example.com/v1/a:b"),
+        ("/v1/orders", "/v1/orders"),
+        ],
+    ids=[
+        "Nested path",
+        "Base URL",
+        "Query",
+        "Other path",
+        "Network path",
+        "Scheme-like path",
+        "Relative target",
+        ],
+    )
+def test_relativize(target, expected_target):
+    """Test that targets are written relative to the base URL only if they resolve back.
+
+    1. Create a URL resolver.
+    2. Write a target relative to the base URL.
+    3. Check the relative target.
+    4. Check that the target is resolved back if it is relative.
+    """
+    resolver = URLResolver(_BASE_URL)
+
+    relative_target = resolver.relativize(target)
+    assert relative_target == expected_target, "Wrong relative target"
+
+    if target.startswith("https:"):
+        assert resolver.resolve(relative_target) == target, "Target is not resolved back"
+
+
+def test_memoized_resolution():
+    """Test that resolved targets are memoized.
+
+    1. Create a URL resolver.
+    2. Resolve the same target several times.
+    3. Check that the target is joined with the base URL only once.
+    """
+    resolver = URLResolver(_BASE_URL)
+
+    for _ in range(3):
+        assert resolver.resolve("orders") == _BASE_URL + "orders", "Wrong resolved target"
+
+    cache_info = resolver.resolve.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1), "Resolved target is not memoized"
+
+
+def test_pickle():
+    """Test that URL resolver can be pickled.
+
+    1. Create a URL resolver and resolve a target.
+    2. Pickle and unpickle the resolver.
+    3. Check the base URL and that the resolver works.
+    """
+    resolver = URLResolver(_BASE_URL)
+    resolver.resolve("orders")
+
+    unpickled_resolver = pickle.loads(pickle.dumps(resolver))
+    assert unpickled_resolver.base_url == _BASE_URL, "Wrong base URL"
+    assert unpickled_resolver.resolve("orders") == _BASE_URL + "orders", "Wrong resolved target"
+
+
+def test_relative_entity(component_validator):
+    """Test that an entity is marshaled with relative targets and parsed back.
+
+    1. Create an entity with links, embedded links and actions.
+    2. Marshal the entity with a base URL.
+    3. Check the targets of marshaled data.
+    4. Parse the data with the same base URL.
+    5. Check that parsed entity is the same as the original one.
+    """
+    entity = Entity(
+        entities=[
+            EmbeddedLink(relations=["customer"], target=_BASE_URL + "customers/1"),
+            EmbeddedRepresentation(
+                relations=["item"],
+                links=[Link(relations=["self"], target=_BASE_URL + "items/1")],
+                ),
+            ],
+        links=[
+            Link(relations=["self"], target=_BASE_URL + "orders/1"),
+            Link(relations=["help"], target="https://docs.example.com/orders"),
+            ],
+        actions=[
+            Action(name="pay", target=_BASE_URL + "orders/1/payment", fields=[Field(name="sum")]),
+            ],
+        )
+
+    marshaled_entity = JSONMarshaler(base_url=_BASE_URL).marshal_entity(entity)
+    targets = [
+        marshaled_entity["entities"][0]["href"],
+        marshaled_entity["entities"][1]["links"][0]["href"],
+        marshaled_entity["links"][0]["href"],
+        marshaled_entity["links"][1]["href"],
+        marshaled_entity["actions"][0]["href"],
+        ]
+    assert targets == [
+        "customers/1",
+        "items/1",
+        "orders/1",
+        "https://docs.example.com/orders",
+        "orders/1/payment",
+        ], "Wrong targets"
+
+    parsed_entity = JSONParser(base_url=_BASE_URL).parse_entity(marshaled_entity)
+    component_validator.validate_entity(parsed_entity, entity)
+
+
+def test_cached_fragments():
+    """Test that fragment cache keeps absolute targets.
+
+    1. Create a marshaler with a fragment cache and a base URL.
+    2. Marshal a link twice.
+    3. Check that both results have relative targets.
+    4. Marshal the link with another base URL and the same cache.
+    5. Check that the target is relative to the other base URL.
+    """
+    cache = FragmentCache()
+    link = Link(relations=["self"], target=_BASE_URL + "orders")
+    marshaler = JSONMarshaler(fragment_cache=cache, base_url=_BASE_URL)
+
+    assert marshaler.marshal_link(link)["href"] == "orders", "Wrong target"
+    assert marshaler.marshal_link(link)["href"] == "orders", "Wrong target of cached data"
+
+    other_marshaler = JSONMarshaler(fragment_cache=cache, base_url="https://api.example.com/")
+    assert other_marshaler.marshal_link(link)["href"] == "v1/orders", "Wrong target"
+
+
+def test_parse_without_target():
+    """Test that errors of data without targets are not changed by the base URL.
+
+    1. Try to parse a link without a target with a base URL.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        JSONParser(base_url=_BASE_URL).parse_link({"rel": ["self"]})
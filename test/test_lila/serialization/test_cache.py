@@ -0,0 +1,160 @@
+"""Test cases for cache of marshaled fragments."""
+
+import pytest
+
+from lila.core.field import Field
+from lila.core.action import Action
+from lila.core.link import Link, EmbeddedLink
+from lila.core.entity import Entity
+from lila.serialization.cache import FragmentCache
+
+
+@pytest.mark.parametrize(
+    argnames="max_size",
+    argvalues=[0, -1],
+    ids=["Zero", "Negative"],
+    )
+def test_invalid_size(max_size):
+    """Test that ValueError is raised if size of the cache is not positive.
+
+    1. Try to create a cache with non-positive size.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        FragmentCache(max_size=max_size)
+
+    assert error_info.value.args[0] == "Size of the cache must be positive", "Wrong error"
+
+
+@pytest.mark.parametrize(
+    argnames="component",
+    argvalues=[
+        Link(relations=["self"], target="/link"),
+        EmbeddedLink(relations=["item"], target="/embedded/link"),
+        Action(name="action", target="/action", fields=[Field(name="field")]),
+        ],
+    ids=[
+        "Link",
+        "Embedded link",
+        "Action",
+        ],
+    )
+def test_lookup(component):
+    """Test that stored fragments are found.
+
+    1. Create a cache.
+    2. Lookup a fragment for a component.
+    3. Check that fragment is not found.
+    4. Store a fragment for the component.
+    5. Lookup a fragment for the component.
+    6. Check the fragment.
+    7. Check statistics of the cache.
+    """
+    cache = FragmentCache()
+    assert cache.lookup("namespace", component) is None, "Fragment is found in empty cache"
+
+    cache.store("namespace", component, "fragment")
+    assert cache.lookup("namespace", component) == "fragment", "Wrong fragment"
+    assert cache.lookup("another namespace", component) is None, "Namespaces are not separated"
+
+    assert cache.size == 1, "Wrong size"
+    assert cache.hits == 1, "Wrong number of hits"
+    assert cache.misses == 2, "Wrong number of misses"
+    assert cache.hit_rate == pytest.approx(1 / 3), "Wrong hit rate"
+
+
+def test_mutable_components():
+    """Test that mutable components are not cached.
+
+    1. Create a cache.
+    2. Store fragments for an entity and an instance of a sub-class of the link.
+    3. Check that fragments are not found.
+    4. Check that lookups are not counted.
+    """
+    class _Link(Link):
+        pass
+
+    cache = FragmentCache()
+    components = (
+        Entity(),
+        _Link(relations=["self"], target="/link"),
+        Action(name="action", target="/action", fields=[type("_Field", (Field, ), {})("field")]),
+        )
+    for component in components:
+        cache.store("namespace", component, "fragment")
+        assert cache.lookup("namespace", component) is None, "Mutable component is cached"
+
+    assert cache.size == 0, "Wrong size"
+    assert cache.hits + cache.misses == 0, "Lookups of mutable components are counted"
+    assert cache.hit_rate == 0, "Wrong hit rate"
+
+
+def test_eviction():
+    """Test that least recently used fragments are evicted.
+
+    1. Create a cache of size 2.
+    2. Store fragments for 2 links.
+    3. Lookup the first link.
+    4. Store a fragment for the third link.
+    5. Check that fragment of the second link is evicted.
+    """
+    links = [Link(relations=["self"], target="/{0}".format(index)) for index in range(3)]
+
+    cache = FragmentCache(max_size=2)
+    cache.store("namespace", links[0], "first")
+    cache.store("namespace", links[1], "second")
+    cache.lookup("namespace", links[0])
+    cache.store("namespace", links[2], "third")
+
+    assert cache.size == 2, "Wrong size"
+    assert cache.lookup("namespace", links[0]) == "first", "Recently used fragment is evicted"
+    assert cache.lookup("namespace", links[1]) is None, "Fragment is not evicted"
+    assert cache.lookup("namespace", links[2]) == "third", "New fragment is not stored"
+
+
+@pytest.mark.parametrize(
+    argnames="fingerprint,expected_fragment",
+    argvalues=[
+        (False, None),
+        (True, "fragment"),
+        ],
+    ids=[
+        "Identity",
+        "Fingerprint",
+        ],
+    )
+def test_fingerprint(fingerprint, expected_fragment):
+    """Test that equal components share a fragment only if fingerprints are used.
+
+    1. Create a cache.
+    2. Store a fragment for an action.
+    3. Lookup a fragment for an equal action.
+    4. Check the fragment.
+    """
+    cache = FragmentCache(fingerprint=fingerprint)
+    create_action = lambda: Action(name="action", target="/action", fields=[Field(name="field")])
+
+    cache.store("namespace", create_action(), "fragment")
+    assert cache.lookup("namespace", create_action()) == expected_fragment, "Wrong fragment"
+
+
+def test_clear():
+    """Test that cache can be cleared.
+
+    1. Create a cache.
+    2. Store and lookup a fragment.
+    3. Clear the cache.
+    4. Check that fragment is not found.
+    5. Check statistics.
+    """
+    link = Link(relations=["self"], target="/link")
+    cache = FragmentCache()
+    cache.store("namespace", link, "fragment")
+    cache.lookup("namespace", link)
+
+    cache.clear()
+
+    assert cache.size == 0, "Wrong size"
+    assert cache.hits == 0, "Wrong number of hits"
+    assert cache.lookup("namespace", link) is None, "Fragment is not removed"
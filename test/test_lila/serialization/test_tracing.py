@@ -0,0 +1,121 @@
+"""Test cases for tracing hooks of serialization."""
+
+import logging
+
+import pytest
+
+from lila.core.link import Link
+from lila.serialization import tracing
+from lila.serialization.json.marshaler import JSONMarshaler
+
+
+class _RecordingHook(tracing.Hook):
+    """Hook to record traces."""
+
+    def __init__(self):
+        self.traces = []
+
+    def trace(self, source, level, message, args):
+        self.traces.append((source, level, message % args))
+
+
+@pytest.fixture
+def recording_hook():
+    """Install a recording hook for a test."""
+    hook = _RecordingHook()
+    tracing.install_hook(hook)
+    yield hook
+    tracing.uninstall_hook(hook)
+
+
+def test_disabled_by_default():
+    """Test that tracing is disabled if no hooks are installed.
+
+    1. Check that tracing is disabled.
+    """
+    assert not tracing.enabled, "Tracing is enabled without hooks"
+
+
+def test_install_hook():
+    """Test that tracing is enabled while a hook is installed.
+
+    1. Install a hook.
+    2. Check that tracing is enabled.
+    3. Uninstall the hook.
+    4. Check that tracing is disabled.
+    """
+    hook = _RecordingHook()
+
+    tracing.install_hook(hook)
+    try:
+        assert tracing.enabled, "Tracing is not enabled"
+    finally:
+        tracing.uninstall_hook(hook)
+
+    assert not tracing.enabled, "Tracing is still enabled"
+
+
+def test_uninstall_unknown_hook():
+    """Test that ValueError is raised on attempt to uninstall a hook that is not installed.
+
+    1. Try to uninstall a hook that is not installed.
+    2. Check that ValueError is raised.
+    3. Check the error message.
+    """
+    with pytest.raises(ValueError) as error_info:
+        tracing.uninstall_hook(_RecordingHook())
+
+    assert error_info.value.args[0] == "Hook is not installed", "Wrong error"
+
+
+def test_traces(recording_hook):
+    # pylint: disable=redefined-outer-name
+    """Test that traces of marshaling are passed to the installed hook.
+
+    1. Install a hook.
+    2. Marshal a link.
+    3. Check the traces.
+    """
+    JSONMarshaler().marshal_link(Link(relations=["self"], target="/self"))
+
+    assert [(source, level) for source, level, _ in recording_hook.traces] == [
+        ("lila.serialization.json.marshaler", tracing.DEBUG),
+        ("lila.serialization.json.link", tracing.DEBUG),
+        ("lila.serialization.json.link", tracing.INFO),
+        ("lila.serialization.json.marshaler", tracing.INFO),
+        ], "Wrong traces"
+
+
+def test_error_traces(recording_hook):
+    # pylint: disable=redefined-outer-name
+    """Test that an error trace is passed to the hook when marshaling fails.
+
+    1. Install a hook.
+    2. Try to marshal an object without link attributes.
+    3. Check that an error trace is passed to the hook.
+    """
+    with pytest.raises(ValueError):
+        JSONMarshaler().marshal_link(object())
+
+    levels = [level for _, level, _ in recording_hook.traces]
+    assert tracing.ERROR in levels, "Error is not traced"
+
+
+def test_logging_hook(caplog):
+    """Test that logging hook emits log records.
+
+    1. Install a logging hook.
+    2. Pass a trace to the hooks.
+    3. Check the log record.
+    """
+    hook = tracing.LoggingHook()
+    tracing.install_hook(hook)
+    try:
+        with caplog.at_level(logging.DEBUG, logger="lila"):
+            tracing.debug("lila.serialization.test", "Trace %s", "message")
+    finally:
+        tracing.uninstall_hook(hook)
+
+    assert [(record.name, record.levelno, record.getMessage()) for record in caplog.records] == [
+        ("lila.serialization.test", logging.DEBUG, "Trace message"),
+        ], "Wrong log records"